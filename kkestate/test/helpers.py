@@ -0,0 +1,25 @@
+"""
+test/ のスクリプト形式のテストで共通に使う補助関数
+"""
+
+from kklogger import set_logger
+
+
+__all__ = [
+    "check",
+]
+
+
+LOGGER = set_logger(__name__)
+
+
+def check(name: str, is_ok: bool, detail: str = "") -> int:
+    """
+    結果を判定し、失敗の場合はログに出力する
+
+    Returns:
+        int: 失敗の場合は1、成功の場合は0（failed_tests に加算する）
+    """
+    if not is_ok:
+        LOGGER.info(f"  FAIL: {name} {detail}", color=["BOLD", "RED"])
+    return 0 if is_ok else 1
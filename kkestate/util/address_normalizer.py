@@ -0,0 +1,76 @@
+"""
+住所の正規化キー
+json_cleaner の _clean_address_string（複数住所・括弧・不要な文字列の除去）の後に、表記の揺れをまとめた住所を作る
+estate_mst_location（緯度経度）はこのキーで登録し、元の住所 -> キーの対応は estate_mst_location_key に保存する
+
+正規化の内容:
+  - NFKC（全角数字・全角ハイフン・全角英字を半角に）、"ヶ" / "ヵ" -> "ケ" / "カ"
+  - 漢数字の丁目を数字に（"六本木一丁目" -> "六本木1丁目"）
+  - "丁目" / "番地" / "番" / "号" / 数字の間の "の" やハイフンの異体字を "-" に（"1丁目2番3号" -> "1-2-3"）
+  - 最初の「番地-号」（"-" でつながる数字が3つまで）より後ろの建物名・部屋番号を除く
+
+例:
+    normalize_address("東京都港区六本木一丁目２番３号　六本木ビル205号室") -> "東京都港区六本木1-2-3"
+"""
+
+import unicodedata
+from typing import Dict, Optional, List
+from .json_cleaner import _clean_address_string
+from .patterns import (
+    RE_ADDRESS_KEY_KANJI_CHOME, RE_ADDRESS_KEY_HYPHEN, RE_ADDRESS_KEY_CHOME,
+    RE_ADDRESS_KEY_BANCHI, RE_ADDRESS_KEY_GO, RE_ADDRESS_KEY_NUMBER_BLOCK
+)
+
+
+# 正規化済みの住所（元の住所 -> キー、プロセス内のキャッシュ）
+_ADDRESS_KEY_CACHE: Dict[str, Optional[str]] = {}
+
+_KANJI_DIGITS = {x: i for i, x in enumerate("〇一二三四五六七八九")}
+
+
+def kanji_to_int(text: str) -> int:
+    """
+    漢数字（九十九まで）を整数に変換（例: "十五" -> 15, "二十" -> 20）
+    """
+    if "十" not in text:
+        return _KANJI_DIGITS[text]
+    tens, _, ones = text.partition("十")
+    return (_KANJI_DIGITS[tens] if tens else 1) * 10 + (_KANJI_DIGITS[ones] if ones else 0)
+
+def _normalize_address(address: str) -> Optional[str]:
+    address = _clean_address_string(address.strip())
+    address = unicodedata.normalize("NFKC", address).replace("ヶ", "ケ").replace("ヵ", "カ")
+    address = RE_ADDRESS_KEY_KANJI_CHOME.sub(lambda x: f"{kanji_to_int(x.group(1))}丁目", address)
+    address = RE_ADDRESS_KEY_HYPHEN.sub("-", address)
+    address = RE_ADDRESS_KEY_CHOME.sub(r"\1-", address)
+    address = RE_ADDRESS_KEY_BANCHI.sub(r"\1-", address)
+    address = RE_ADDRESS_KEY_GO.sub(r"\1", address)
+    match   = RE_ADDRESS_KEY_NUMBER_BLOCK.match(address)
+    if match:
+        address = match.group(1)
+    address = address.rstrip("-")
+    return address if address != "" else None
+
+def normalize_address(address: str) -> Optional[str]:
+    """
+    住所の正規化キー（同じ住所はキャッシュから返す）
+
+    Args:
+        address (str): 住所（クレンジング前・後のどちらでもよい）
+
+    Returns:
+        Optional[str]: 正規化キー、空の住所は None
+    """
+    if not isinstance(address, str) or address.strip() == "":
+        return None
+    key = _ADDRESS_KEY_CACHE.get(address)
+    if key is None and address not in _ADDRESS_KEY_CACHE:
+        key = _normalize_address(address)
+        _ADDRESS_KEY_CACHE[address] = key
+    return key
+
+def normalize_addresses(addresses: List[str]) -> Dict[str, Optional[str]]:
+    """
+    複数の住所の正規化キー（元の住所 -> キー、重複する住所は1回だけ正規化）
+    """
+    return {x: normalize_address(x) for x in dict.fromkeys(addresses)}
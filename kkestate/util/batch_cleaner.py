@@ -0,0 +1,158 @@
+"""
+クレンジング関数の一括（列単位）処理
+値のリスト・pandas.Series をまとめてクレンジングし、入力と同じ並び（indexも同じ）の結果を返す
+  1. 同じ入力（値, 期別, キー名）は1回だけ処理する
+  2. よく現れる定型の値（例: "3980万円"、"65.5m2"、"128戸"）は str.extract でまとめて変換する
+  3. それ以外は1値ずつのクレンジング関数にフォールバックする
+定型の変換結果は1値ずつのクレンジング関数と同じ辞書（キーの順序も同じ）になる
+"""
+
+import pandas as pd
+from typing import Dict, Any, Optional, List, Tuple, Callable, Union
+from .patterns import RE_BATCH_PRICE_MAN, RE_BATCH_AREA_SQM, RE_BATCH_NUMBER_UNIT
+from .json_cleaner import clean_price_to_json, clean_area_to_json, clean_number_to_json
+
+
+# raw_key引数が必要なクレンジング関数
+RAW_KEY_FUNCTIONS = ['clean_units_to_json', 'clean_price_band_to_json', 'clean_management_fee_to_json']
+
+
+# ============================================================================
+# 定型の値の一括変換
+# ============================================================================
+def _to_number(text: str, converter: Callable[[str], Union[int, float]]) -> Optional[Union[int, float]]:
+    """
+    Python の int() / float() で1値ずつ変換（int64 の範囲を超える値も1値ずつのクレンジング関数と同じ結果）
+    変換できない場合は None（1値ずつのクレンジング関数にフォールバックする）
+    """
+    try:
+        return converter(text)
+    except (ValueError, OverflowError):
+        return None
+
+def _build_price_man(df: pd.DataFrame) -> List[Optional[Dict[str, Any]]]:
+    """
+    "3,980万円" -> {"unit": "万円", "value": 3980.0}
+    """
+    values = [_to_number(x.replace(",", ""), float) for x in df["man"].tolist()]
+    return [None if x is None else {"unit": "万円", "value": x} for x in values]
+
+def _build_area_sqm(df: pd.DataFrame) -> List[Optional[Dict[str, Any]]]:
+    """
+    "65.5m2" -> {"unit": "m^2", "value": 65.5}
+    """
+    values = [_to_number(x, float) for x in df["area"].tolist()]
+    return [None if x is None else {"unit": "m^2", "value": x} for x in values]
+
+def _build_number_unit(df: pd.DataFrame) -> List[Optional[Dict[str, Any]]]:
+    """
+    "128戸" -> {"value": 128, "unit": "戸"}
+    """
+    values = [_to_number(x, int) for x in df["number"].tolist()]
+    return [None if x is None else {"value": x, "unit": y} for x, y in zip(values, df["unit"].tolist())]
+
+# クレンジング関数名 -> (定型パターン, 変換関数)
+# 変換関数は定型パターンに一致した行ごとの結果を返す（None の行は1値ずつのクレンジング関数で処理する）
+BATCH_FAST_PATHS: Dict[str, Tuple[Any, Callable[[pd.DataFrame], List[Optional[Dict[str, Any]]]]]] = {
+    "clean_price_to_json":  (RE_BATCH_PRICE_MAN,   _build_price_man),
+    "clean_area_to_json":   (RE_BATCH_AREA_SQM,    _build_area_sqm),
+    "clean_number_to_json": (RE_BATCH_NUMBER_UNIT, _build_number_unit),
+}
+
+
+# ============================================================================
+# 一括処理
+# ============================================================================
+def _to_list(x: Any, size: int) -> List[Any]:
+    """
+    スカラー・リスト・Seriesを長さsizeのリストに揃える
+    """
+    if isinstance(x, pd.Series):
+        x = x.tolist()
+    elif not isinstance(x, (list, tuple)):
+        return [x] * size
+    assert len(x) == size, f"length mismatch: {len(x)} != {size}"
+    return [None if (y is not None and not isinstance(y, str) and pd.isna(y)) else y for y in x]
+
+def clean_series(
+    values: Union[pd.Series, List[str]], clean_function: Callable, periods: Optional[Union[pd.Series, List[Optional[int]], int]] = None,
+    raw_keys: Optional[Union[pd.Series, List[str], str]] = None, errors: str = "raise"
+) -> pd.Series:
+    """
+    クレンジング関数を値の列にまとめて適用
+
+    Args:
+        values (Union[pd.Series, List[str]]): 生の値（文字列）の列
+        clean_function (Callable): 1値ずつのクレンジング関数（例: clean_price_to_json）
+        periods (Optional[Union[pd.Series, List[Optional[int]], int]]): 期別番号の列、または全値共通の期別番号
+        raw_keys (Optional[Union[pd.Series, List[str], str]]): キー名の列、または全値共通のキー名（RAW_KEY_FUNCTIONS のみ使用）
+        errors (str): "raise" の場合は例外をそのまま送出、"coerce" の場合は {"value": 元の値, "error": エラー内容} を返す
+
+    Returns:
+        pd.Series: クレンジング済みJSON辞書の列（valuesがSeriesの場合は同じindex）
+            同じ入力の結果は同じ辞書オブジェクトを共有するため、変更する場合はコピーすること
+    """
+    assert errors in ["raise", "coerce"]
+    index  = values.index if isinstance(values, pd.Series) else None
+    values = values.tolist() if isinstance(values, pd.Series) else list(values)
+    size   = len(values)
+    periods  = _to_list(periods, size)
+    periods  = [None if x is None else int(x) for x in periods]
+    use_raw_key = clean_function.__name__ in RAW_KEY_FUNCTIONS
+    raw_keys = _to_list(raw_keys if use_raw_key else None, size)
+
+    # 同じ入力を1つにまとめる
+    unique_keys: Dict[Tuple[Any, Optional[int], Optional[str]], int] = {}
+    codes = [unique_keys.setdefault(key, len(unique_keys)) for key in zip(values, periods, raw_keys)]
+    unique_keys = list(unique_keys.keys())
+    results: List[Optional[Dict[str, Any]]] = [None] * len(unique_keys)
+
+    # 定型の値を str.extract でまとめて変換
+    fast_path = BATCH_FAST_PATHS.get(clean_function.__name__)
+    if fast_path is not None and len(unique_keys) > 0:
+        pattern, builder = fast_path
+        se_value = pd.Series([x[0] for x in unique_keys], dtype=object)
+        se_value = se_value.loc[se_value.map(type) == str]
+        df_ext = se_value.str.strip().str.extract(pattern) if len(se_value) > 0 else pd.DataFrame()
+        df_ext = df_ext.loc[df_ext.notna().all(axis=1)]
+        if not df_ext.empty:
+            for i, result in zip(df_ext.index.tolist(), builder(df_ext)):
+                if result is None:
+                    continue
+                if unique_keys[i][1] is not None:
+                    result["period"] = unique_keys[i][1]
+                results[i] = result
+
+    # それ以外は1値ずつ処理
+    for i, (value, period, raw_key) in enumerate(unique_keys):
+        if results[i] is not None:
+            continue
+        try:
+            if use_raw_key:
+                results[i] = clean_function(value, raw_key=raw_key, period=period)
+            else:
+                results[i] = clean_function(value, period=period)
+        except Exception as e:
+            if errors == "raise":
+                raise
+            results[i] = {"value": value, "error": str(e)}
+
+    return pd.Series([results[i] for i in codes], index=index, dtype=object)
+
+def clean_price_series(values: Union[pd.Series, List[str]], periods: Optional[Union[pd.Series, List[Optional[int]], int]] = None) -> pd.Series:
+    """
+    価格情報の列をまとめてクレンジング（clean_price_to_json の一括版）
+    """
+    return clean_series(values, clean_price_to_json, periods=periods)
+
+def clean_area_series(values: Union[pd.Series, List[str]], periods: Optional[Union[pd.Series, List[Optional[int]], int]] = None) -> pd.Series:
+    """
+    面積情報の列をまとめてクレンジング（clean_area_to_json の一括版）
+    """
+    return clean_series(values, clean_area_to_json, periods=periods)
+
+def clean_number_series(values: Union[pd.Series, List[str]], periods: Optional[Union[pd.Series, List[Optional[int]], int]] = None) -> pd.Series:
+    """
+    数値の列をまとめてクレンジング（clean_number_to_json の一括版）
+    """
+    return clean_series(values, clean_number_to_json, periods=periods)
@@ -0,0 +1,175 @@
+"""
+citycode（全国地方公共団体コード）の検索
+kkestate/master/citycode.csv の「都道府県名+市区町村名」から文字単位のトライ木を構築し、
+住所文字列に対する最長前方一致を len(address) に比例する計算量で行う
+"""
+
+import csv
+import os
+from typing import Dict, Any, Optional, List, Tuple
+
+
+# トライ木のノードで値を保持するキー（1文字のキーとは衝突しない）
+_TRIE_VALUE_KEY = ""
+
+# citycode.csvから作成したマッピング辞書とインデックス（グローバル変数）
+_CITYCODE_MAP = None
+_CITYCODE_INDEX = None
+
+
+class PrefixIndex:
+    """
+    文字単位のトライ木による最長前方一致インデックス
+
+    例:
+        index = PrefixIndex()
+        index.add("東京都港区", "13103")
+        index.longest_prefix("東京都港区六本木1-2-3") -> ("東京都港区", "13103")
+    """
+    def __init__(self):
+        self.root: Dict[str, Any] = {}
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, key: str, value: Any):
+        """
+        キーと値を登録（同じキーは後から登録した値で上書き）
+        """
+        assert isinstance(key, str) and key != ""
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        if _TRIE_VALUE_KEY not in node:
+            self.size += 1
+        node[_TRIE_VALUE_KEY] = value
+
+    def longest_prefix(self, text: str) -> Optional[Tuple[str, Any]]:
+        """
+        textの先頭に一致する登録キーのうち最長のものを返す
+
+        Args:
+            text (str): 検索対象の文字列
+
+        Returns:
+            Optional[Tuple[str, Any]]: (一致したキー, 値)、一致しない場合はNone
+        """
+        if not text:
+            return None
+        node = self.root
+        best_length = 0
+        best_value = None
+        for i, char in enumerate(text):
+            node = node.get(char)
+            if node is None:
+                break
+            if _TRIE_VALUE_KEY in node:
+                best_length = i + 1
+                best_value = node[_TRIE_VALUE_KEY]
+        if best_length == 0:
+            return None
+        return text[:best_length], best_value
+
+    def all_prefixes(self, text: str) -> List[Tuple[str, Any]]:
+        """
+        textの先頭に一致する登録キーを短い順にすべて返す
+
+        Args:
+            text (str): 検索対象の文字列
+
+        Returns:
+            List[Tuple[str, Any]]: (一致したキー, 値)のリスト
+        """
+        results = []
+        if not text:
+            return results
+        node = self.root
+        for i, char in enumerate(text):
+            node = node.get(char)
+            if node is None:
+                break
+            if _TRIE_VALUE_KEY in node:
+                results.append((text[:i + 1], node[_TRIE_VALUE_KEY]))
+        return results
+
+
+def load_citycode_map() -> Dict[str, str]:
+    """
+    citycode.csvを読み込んで「都道府県名+市区町村名」-> citycode のマッピング辞書を作成
+
+    Returns:
+        Dict[str, str]: マッピング辞書（読み込めない場合は空の辞書）
+    """
+    global _CITYCODE_MAP
+    if _CITYCODE_MAP is not None:
+        return _CITYCODE_MAP
+
+    _CITYCODE_MAP = {}
+    citycode_path = os.path.join(os.path.dirname(__file__), "../master/citycode.csv")
+
+    if os.path.exists(citycode_path):
+        try:
+            with open(citycode_path, 'r', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                for row in reader:
+                    if len(row) >= 6:
+                        citycode = row[0].strip('"')
+                        city_name = row[1].strip('"')
+                        pref_name = row[5].strip('"')
+
+                        # 都道府県名+市区町村名をキーにしてcitycodeをマッピング
+                        full_name = pref_name + city_name
+                        _CITYCODE_MAP[full_name] = citycode
+        except Exception:
+            pass
+
+    return _CITYCODE_MAP
+
+def load_citycode_index() -> PrefixIndex:
+    """
+    citycodeマッピング辞書から最長前方一致インデックスを作成（初回のみ構築）
+
+    Returns:
+        PrefixIndex: 「都道府県名+市区町村名」-> citycode のインデックス
+    """
+    global _CITYCODE_INDEX
+    if _CITYCODE_INDEX is not None:
+        return _CITYCODE_INDEX
+
+    index = PrefixIndex()
+    for full_name, citycode in load_citycode_map().items():
+        if full_name:
+            index.add(full_name, citycode)
+    _CITYCODE_INDEX = index
+    return _CITYCODE_INDEX
+
+def lookup_city(address: str) -> Optional[Tuple[str, str]]:
+    """
+    住所文字列の先頭に最長一致する「都道府県名+市区町村名」とcitycodeを取得
+
+    Args:
+        address (str): 住所文字列（例: "東京都港区六本木1-2-3"）
+
+    Returns:
+        Optional[Tuple[str, str]]: (一致した都道府県名+市区町村名, citycode)、見つからない場合はNone
+    """
+    if not address:
+        return None
+    return load_citycode_index().longest_prefix(address)
+
+def get_citycode_from_address(address: str) -> Optional[str]:
+    """
+    住所文字列からcitycodeを取得
+    都道府県名+市区町村名で最長前方一致検索
+
+    Args:
+        address (str): 住所文字列
+
+    Returns:
+        Optional[str]: 見つかったcitycode、見つからない場合はNone
+    """
+    result = lookup_city(address)
+    if result is None:
+        return None
+    return result[1]
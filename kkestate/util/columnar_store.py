@@ -0,0 +1,220 @@
+"""
+reinfolib_land / reinfolib_estate の列指向のローカルキャッシュ（Parquet、Hive 形式のパーティション）
+main/collect/reinfolib.py の uploadland / uploadestate で DB への投入と同時に保存し、分析（main/analyze/ana.py）から読み込む
+
+ディレクトリ構成:
+    {root}/reinfolib_land/year=2024/prefecture_code=13/part-00000.parquet
+    {root}/reinfolib_estate/year=2024/period=4/prefecture_code=13/part-00000.parquet
+
+  - 列の型は STORE_DATASETS のスキーマに揃える（整数・小数・日付は型付き、繰り返しの多い文字列は辞書型）
+  - パーティションのキー（year, prefecture_code, period）はパスから復元するため、ファイルには含めない
+  - 書き込みは PartitionWriter で "." 始まりの一時ディレクトリに保存し、commit でパーティションごと入れ替える
+    （DB のステージングテーブルと同じく、途中で失敗しても既存のパーティションは残る）
+  - 読み込みは pyarrow.dataset をメモリマップで開き、列の選択・条件（パーティションと row group の統計）で読む範囲を絞る
+
+例:
+    df = read_store("./store", "reinfolib_land", columns=["location", "price_per_sqm"], filters={"year": 2024, "prefecture_code": "13"})
+"""
+
+import os
+import shutil
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import fs
+from typing import Dict, Any, Optional, List, Union
+
+
+# 辞書型の文字列（同じ値が多い列）
+_DICT = pa.dictionary(pa.int32(), pa.string())
+
+# データセット名 -> パーティションのキーと列のスキーマ（DB のテーブル定義 schema.reinfolib.sql に対応、numeric は float64）
+STORE_DATASETS: Dict[str, Dict[str, pa.Schema]] = {
+    "reinfolib_land": {
+        "partitioning": pa.schema([("year", pa.int16()), ("prefecture_code", pa.string())]),
+        "schema": pa.schema([
+            ("category",             _DICT),
+            ("reference_number",     pa.string()),
+            ("survey_date",          pa.date32()),
+            ("location",             pa.string()),
+            ("residential_address",  pa.string()),
+            ("price_per_sqm",        pa.int32()),
+            ("station_name",         _DICT),
+            ("station_distance",     pa.int32()),
+            ("land_area",            pa.int32()),
+            ("land_shape",           _DICT),
+            ("land_use_category",    _DICT),
+            ("building_structure",   _DICT),
+            ("building_floors",      _DICT),
+            ("current_use",          _DICT),
+            ("utilities",            _DICT),
+            ("surrounding_use",      pa.string()),
+            ("front_road_direction", _DICT),
+            ("front_road_width",     pa.float64()),
+            ("front_road_type",      _DICT),
+            ("front_road_pavement",  _DICT),
+            ("other_road_direction", _DICT),
+            ("other_road_category",  _DICT),
+            ("use_district",         _DICT),
+            ("height_district",      _DICT),
+            ("fire_prevention_area", _DICT),
+            ("coverage_ratio",       pa.int16()),
+            ("floor_area_ratio",     pa.int16()),
+            ("city_planning_area",   _DICT),
+            ("forest_park_law",      _DICT),
+            ("appraisal_report",     _DICT),
+            ("appraisal_report_url", pa.string()),
+        ]),
+    },
+    "reinfolib_estate": {
+        "partitioning": pa.schema([("year", pa.int16()), ("period", pa.int8()), ("prefecture_code", pa.string())]),
+        "schema": pa.schema([
+            ("property_type",            _DICT),
+            ("price_info_category",      _DICT),
+            ("region",                   _DICT),
+            ("municipality_code",        _DICT),
+            ("prefecture_name",          _DICT),
+            ("municipality_name",        _DICT),
+            ("district_name",            _DICT),
+            ("nearest_station_name",     _DICT),
+            ("nearest_station_distance", pa.int32()),
+            ("transaction_price",        pa.int64()),
+            ("price_per_tsubo",          pa.int32()),
+            ("floor_plan",               _DICT),
+            ("area_sqm",                 pa.float64()),
+            ("price_per_sqm",            pa.int32()),
+            ("land_shape",               _DICT),
+            ("frontage",                 pa.float64()),
+            ("floor_area_sqm",           pa.float64()),
+            ("building_year",            pa.int16()),
+            ("building_structure",       _DICT),
+            ("use",                      _DICT),
+            ("future_use",               _DICT),
+            ("front_road_direction",     _DICT),
+            ("front_road_type",          _DICT),
+            ("front_road_width",         pa.float64()),
+            ("city_planning",            _DICT),
+            ("coverage_ratio",           pa.int16()),
+            ("floor_area_ratio",         pa.int16()),
+            ("transaction_period",       _DICT),
+            ("renovation",               _DICT),
+            ("transaction_notes",        _DICT),
+        ]),
+    },
+}
+
+
+def partition_path(root: str, dataset: str, keys: Dict[str, Any]) -> str:
+    """
+    パーティションのディレクトリ（keys はパーティションのキーの先頭から順に指定）
+    """
+    names = STORE_DATASETS[dataset]["partitioning"].names
+    assert list(keys.keys()) == names[:len(keys)], f"partition keys must be a prefix of {names}: {list(keys.keys())}"
+    return os.path.join(root, dataset, *[f"{x}={y}" for x, y in keys.items()])
+
+def to_table(df: pd.DataFrame, dataset: str) -> pa.Table:
+    """
+    DataFrame をデータセットのスキーマ（パーティションのキーを除く列）の Table に変換（存在しない列はすべて null）
+    """
+    schema = STORE_DATASETS[dataset]["schema"]
+    arrays = []
+    for field in schema:
+        if field.name not in df.columns:
+            arrays.append(pa.nulls(len(df), type=field.type))
+            continue
+        values = df[field.name]
+        values = values.astype(object).where(values.notna(), None) if pa.types.is_dictionary(field.type) or pa.types.is_string(field.type) else values
+        arrays.append(pa.array(values, type=field.type, from_pandas=True))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+class PartitionWriter:
+    """
+    1パーティション（例: year=2024/period=4）を一時ディレクトリに書き込み、commit で既存のパーティションと入れ替える
+
+    例:
+        writer = PartitionWriter("./store", "reinfolib_estate", {"year": 2024, "period": 4})
+        for df in chunks:
+            writer.write(df)      # 残りのキー（prefecture_code）ごとに part-XXXXX.parquet を追加
+        writer.commit()
+    """
+    def __init__(self, root: str, dataset: str, keys: Dict[str, Any]):
+        self.dataset  = dataset
+        self.path     = partition_path(root, dataset, keys)
+        self.path_tmp = os.path.join(os.path.dirname(self.path), f".{os.path.basename(self.path)}.tmp")
+        self.subkeys  = STORE_DATASETS[dataset]["partitioning"].names[len(keys):]
+        self.n_parts  = {}
+        self.n_rows   = 0
+        if os.path.exists(self.path_tmp):
+            shutil.rmtree(self.path_tmp)
+        os.makedirs(self.path_tmp)
+
+    def write(self, df: pd.DataFrame):
+        """
+        DataFrame を書き込む（残りのパーティションのキーの列で分けて、それぞれ新しいファイルにする）
+        """
+        groups = df.groupby(self.subkeys, sort=True, dropna=False) if len(self.subkeys) > 0 else [((), df)]
+        for values, dfwk in groups:
+            values = values if isinstance(values, tuple) else (values,)
+            path   = os.path.join(self.path_tmp, *[f"{x}={y}" for x, y in zip(self.subkeys, values)])
+            n_part = self.n_parts.get(path, 0)
+            os.makedirs(path, exist_ok=True)
+            pq.write_table(to_table(dfwk, self.dataset), os.path.join(path, f"part-{n_part:05d}.parquet"), compression="zstd")
+            self.n_parts[path] = n_part + 1
+            self.n_rows += len(dfwk)
+
+    def commit(self) -> int:
+        """
+        既存のパーティションを削除し、一時ディレクトリを置き換える
+
+        Returns:
+            int: 書き込んだ行数
+        """
+        if os.path.exists(self.path):
+            path_old = f"{self.path_tmp}.old"
+            os.replace(self.path, path_old)
+            os.replace(self.path_tmp, self.path)
+            shutil.rmtree(path_old)
+        else:
+            os.replace(self.path_tmp, self.path)
+        return self.n_rows
+
+    def abort(self):
+        """
+        一時ディレクトリを削除（既存のパーティションはそのまま）
+        """
+        shutil.rmtree(self.path_tmp, ignore_errors=True)
+
+
+def open_store(root: str, dataset: str) -> ds.Dataset:
+    """
+    データセットをメモリマップで開く（"." 始まりの書き込み中の一時ディレクトリは含まない）
+    """
+    return ds.dataset(
+        os.path.join(root, dataset), format="parquet", filesystem=fs.LocalFileSystem(use_mmap=True),
+        partitioning=ds.partitioning(STORE_DATASETS[dataset]["partitioning"], flavor="hive"),
+        schema=pa.unify_schemas([STORE_DATASETS[dataset]["schema"], STORE_DATASETS[dataset]["partitioning"]]),
+    )
+
+def to_expression(filters: Optional[Union[Dict[str, Any], ds.Expression]]) -> Optional[ds.Expression]:
+    """
+    {列名: 値 または 値のリスト} を pyarrow.dataset の条件（AND）に変換
+    """
+    if filters is None or isinstance(filters, ds.Expression):
+        return filters
+    expression = None
+    for x, y in filters.items():
+        expr = ds.field(x).isin(list(y)) if isinstance(y, (list, tuple, set)) else (ds.field(x) == y)
+        expression = expr if expression is None else (expression & expr)
+    return expression
+
+def read_store(root: str, dataset: str, columns: Optional[List[str]] = None, filters: Optional[Union[Dict[str, Any], ds.Expression]] = None) -> pd.DataFrame:
+    """
+    データセットから列・条件を絞って読み込む（辞書型の列は pandas の category になる）
+
+    Args:
+        columns (Optional[List[str]]): 読み込む列（パーティションのキーも指定可）、None の場合は全列
+        filters (Optional[Union[Dict[str, Any], ds.Expression]]): 条件（例: {"year": 2024, "prefecture_code": ["13", "14"]}）
+    """
+    return open_store(root, dataset).to_table(columns=columns, filter=to_expression(filters)).to_pandas()
@@ -0,0 +1,68 @@
+"""
+reinfolib の差分アップロード（main/collect/reinfolib.py の uploadland / uploadestate）で使うチェックサムと行ハッシュ
+  - file_checksum: ダウンロードしたファイルの内容の SHA-256（reinfolib_file_manifest に保存し、同じ内容のファイルは読み込まずにスキップする）
+  - row_hashes: 行の内容のハッシュ（reinfolib_land / reinfolib_estate の row_hash 列、DB の行との差分の比較に使う）
+
+行ハッシュは列の型の揺れ（欠損の有無で int64 / float64 / Int64 が変わる、文字列が object / str）に影響されないように、
+数値は float64、それ以外は文字列に揃えてから pandas の hash_pandas_object でまとめて計算する
+同じ内容の行が複数ある場合は出現順の番号も含めるため、1ファイル内の行ハッシュは重複しない
+
+例:
+    counts = {}
+    for df in chunks:
+        df["row_hash"] = row_hashes(df, columns, counts=counts)
+"""
+
+import hashlib
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+
+def file_checksum(path: str, chunksize: int = 1024 * 1024) -> str:
+    """
+    ファイルの内容の SHA-256（16進数の文字列）
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunksize), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _to_hash_frame(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """
+    行ハッシュ用に型を揃えた DataFrame（数値・真偽値以外の列は str() の文字列、欠損は None）
+    """
+    frame = {}
+    for x in columns:
+        values = df[x]
+        if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+            frame[x] = pd.Series(pd.to_numeric(values).astype(float).to_numpy(), index=df.index)
+        else:
+            # 重複を除いた値だけを文字列にする（欠損（codes = -1）は末尾に追加した None になる）
+            codes, uniques = pd.factorize(values.astype(object))
+            uniques  = np.array([str(y) for y in uniques] + [None], dtype=object)
+            frame[x] = pd.Series(uniques[codes], index=df.index, dtype=object)
+    return pd.DataFrame(frame, index=df.index)
+
+def row_hashes(df: pd.DataFrame, columns: List[str], counts: Optional[Dict[int, int]] = None) -> np.ndarray:
+    """
+    行の内容（columns の列）のハッシュ（DB の bigint 列に保存するため int64）
+
+    Args:
+        counts (Optional[Dict[int, int]]): 内容のハッシュ -> それまでの出現回数、チャンクごとに呼び出す場合に同じ dict を渡す（更新される）
+
+    Returns:
+        np.ndarray: 行ハッシュ（int64）
+    """
+    if len(df) == 0:
+        return np.array([], dtype=np.int64)
+    base       = pd.util.hash_pandas_object(_to_hash_frame(df, columns), index=False, categorize=True).to_numpy(dtype=np.uint64)
+    occurrence = pd.Series(base).groupby(base).cumcount().to_numpy(dtype=np.int64)
+    if counts is not None:
+        occurrence = occurrence + pd.Series(base).map(counts).fillna(0).to_numpy(dtype=np.int64)
+        uniques, n = np.unique(base, return_counts=True)
+        for x, y in zip(uniques.tolist(), n.tolist()):
+            counts[x] = counts.get(x, 0) + y
+    hashes = pd.util.hash_pandas_object(pd.DataFrame({"base": base, "occurrence": occurrence}), index=False)
+    return hashes.to_numpy(dtype=np.uint64).view(np.int64)
@@ -0,0 +1,136 @@
+"""
+ローカルの町丁目インデックス（gazetteer）による住所のジオコーディング
+AddressSearch API（geocoder.py）を呼ぶ前に、町丁目単位の代表座標から緯度経度を引き、見つからない住所だけを API に送る
+
+住所は正規化キー（address_normalizer.py）にした上で parse_address_structure で「都道府県+市区町村」と残りに分け、残りを町名と最初の番号（丁目、丁目がない地域は番地）に分けて
+"{都道府県+市区町村+町名}/{番号}/" のキーにする（例: "千葉県我孫子市柴崎台３-16-23" -> "千葉県我孫子市柴崎台/3/"）
+条・線・地割・番町の付く数字は町名に含める（例: "北海道札幌市中央区北1条西2丁目" -> "北海道札幌市中央区北1条西/2/"）
+キーは citycode.py の PrefixIndex に登録し、"{町名まで}/" と "{町名まで}/{番号}/" のうち長い方に一致したものを使う
+
+インデックスの作成元:
+  - estate_mst_location の取得済みの住所: 同じキーの住所の緯度経度の中央値（add_locations）
+  - 国土交通省「位置参照情報」大字・町丁目レベルの CSV: 大字町丁目ごとの代表点（add_town_csv）
+
+例:
+    gazetteer = Gazetteer()
+    gazetteer.add_locations(df_location)
+    gazetteer.add_town_csv("./13000-17.0b/13_2023.csv")
+    result = gazetteer.lookup("東京都港区六本木一丁目2-3")
+"""
+
+import pandas as pd
+from typing import Dict, Any, Optional, Tuple, List
+from .address_normalizer import normalize_address
+from .citycode import PrefixIndex
+from .geocoder import make_result
+from .parser import parse_address_structure
+from .patterns import RE_GAZETTEER_TOWN
+
+
+# 位置参照情報（大字・町丁目レベル）の列
+TOWN_CSV_COLUMNS = {"都道府県名": "prefecture", "市区町村名": "city", "大字町丁目名": "town", "緯度": "latitude", "経度": "longitude"}
+
+# 一致の細かさ（lookup の level）
+GAZETTEER_LEVELS = ["town", "chome"]
+
+
+def split_address_key(address: str) -> Optional[Tuple[str, str]]:
+    """
+    住所を町丁目キーの (都道府県+市区町村+町名, 番号) に分ける（番号がない場合は ""）
+
+    Returns:
+        Optional[Tuple[str, str]]: 市区町村より後ろの町名が取れない場合は None
+    """
+    address = normalize_address(address)
+    if address is None:
+        return None
+    structure = parse_address_structure(address)
+    if structure is None or structure["secondary_division"] is None or structure["remaining"] is None:
+        return None
+    match = RE_GAZETTEER_TOWN.match(structure["remaining"])
+    if match is None:
+        return None
+    prefix = address[:len(address) - len(structure["remaining"])]
+    chome  = str(int(match.group(2))) if match.group(2) else ""
+    return prefix + match.group(1), chome
+
+def to_key_frame(locations: List[str], longitude: pd.Series, latitude: pd.Series) -> pd.DataFrame:
+    """
+    住所と緯度経度を town, chome, longitude, latitude の DataFrame に変換（キーが取れない住所の town は None）
+    """
+    keys = [split_address_key(x) for x in locations]
+    return pd.DataFrame({
+        "town":      [x[0] if x is not None else None for x in keys],
+        "chome":     [x[1] if x is not None else ""   for x in keys],
+        "longitude": pd.to_numeric(longitude, errors="coerce").to_numpy(dtype=float),
+        "latitude":  pd.to_numeric(latitude,  errors="coerce").to_numpy(dtype=float),
+    })
+
+
+class Gazetteer:
+    """
+    町丁目キー -> (経度, 緯度, 件数) の最長前方一致インデックス
+    """
+    def __init__(self):
+        self.index = PrefixIndex()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _add_frame(self, df: pd.DataFrame, is_overwrite: bool) -> int:
+        """
+        town, chome, longitude, latitude の列を町名・番号ごとに中央値でまとめて登録
+        is_overwrite が False の場合、登録済みのキーは上書きしない
+
+        Returns:
+            int: 登録したキーの数
+        """
+        n_add = 0
+        df    = df.loc[df["town"].notna() & df["longitude"].notna() & df["latitude"].notna()]
+        for columns, is_chome in [(["town"], False), (["town", "chome"], True)]:
+            dfwk = df.loc[df["chome"] != ""] if is_chome else df
+            dfwk = dfwk.groupby(columns).agg(longitude=("longitude", "median"), latitude=("latitude", "median"), n=("longitude", "size")).reset_index()
+            for x in dfwk.itertuples(index=False):
+                key = f"{x.town}/{x.chome}/" if is_chome else f"{x.town}/"
+                if not is_overwrite and (self.index.longest_prefix(key) or ("", None))[0] == key:
+                    continue
+                self.index.add(key, (float(x.longitude), float(x.latitude), int(x.n)))
+                n_add += 1
+        return n_add
+
+    def add_locations(self, df: pd.DataFrame, is_overwrite: bool = False) -> int:
+        """
+        取得済みの住所（location, longitude, latitude の列、estate_mst_location）から登録
+        """
+        return self._add_frame(to_key_frame(df["location"].tolist(), df["longitude"], df["latitude"]), is_overwrite)
+
+    def add_town_csv(self, path: str, encoding: str = "cp932", is_overwrite: bool = True) -> int:
+        """
+        位置参照情報（大字・町丁目レベル）の CSV から登録（同じキーは取得済みの住所より優先する）
+        """
+        df   = pd.read_csv(path, encoding=encoding, usecols=list(TOWN_CSV_COLUMNS.keys()), dtype=str).rename(columns=TOWN_CSV_COLUMNS)
+        locations = (df["prefecture"].fillna("") + df["city"].fillna("") + df["town"].fillna("")).tolist()
+        return self._add_frame(to_key_frame(locations, df["longitude"], df["latitude"]), is_overwrite)
+
+    def lookup(self, location: str, level: str = "chome") -> Optional[Dict[str, Any]]:
+        """
+        住所の緯度経度を町丁目キーの最長前方一致で取得
+
+        Args:
+            location (str): 住所
+            level (str): "chome" は番号（丁目）まで一致した場合のみ、"town" は町名までの一致も使う
+
+        Returns:
+            Optional[Dict[str, Any]]: geocoder.make_result の形式（source="gazetteer"）、見つからない場合は None
+        """
+        assert level in GAZETTEER_LEVELS
+        key = split_address_key(location)
+        if key is None:
+            return None
+        town, chome = key
+        query = f"{town}/{chome}/" if chome else f"{town}/"
+        hit   = self.index.longest_prefix(query)
+        if hit is None or (level == "chome" and hit[0] != query):
+            return None
+        longitude, latitude, _ = hit[1]
+        return make_result(location, "ok", longitude, latitude, source="gazetteer")
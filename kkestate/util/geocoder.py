@@ -0,0 +1,148 @@
+"""
+国土地理院 AddressSearch API による住所のジオコーディング（並列・レート制限・リトライ付き）
+  - スレッドごとに requests.Session を保持し、接続を再利用する（Keep-Alive）
+  - 同時に処理する住所は workers 件まで、リクエストの間隔は全スレッド合計で rate 件/秒 まで
+  - 接続エラー・タイムアウト・429・5xx は指数バックオフ（Retry-After があればその秒数）でリトライし、回数を超えた場合は status="error"
+  - 200 でも想定外の形式（配列でない、座標がない・数値でない）の応答は例外にせず status="error"
+
+例:
+    geocoder = GsiGeocoder(workers=4, rate=5.0)
+    for result in geocoder.geocode_many(locations):
+        print(result["location"], result["status"], result["longitude"], result["latitude"])
+"""
+
+import math
+import random
+import threading
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait, as_completed
+from typing import Dict, Any, Optional, Iterable, Iterator
+from requests.adapters import HTTPAdapter
+
+
+GSI_ADDRESS_SEARCH_URL = "https://msearch.gsi.go.jp/address-search/AddressSearch"
+
+# リトライするステータスコード
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def make_result(location: str, status: str, longitude: Optional[float] = None, latitude: Optional[float] = None, n_retry: int = 0, error: Optional[str] = None, source: str = "gsi") -> Dict[str, Any]:
+    """
+    1住所のジオコーディング結果
+    status: "ok"（座標あり）, "notfound"（該当なし・複数該当）, "error"（リトライ回数を超えて失敗）
+    source: "gsi"（AddressSearch API）, "gazetteer"（ローカルの町丁目インデックス、gazetteer.py）
+    """
+    return {"location": location, "status": status, "longitude": longitude, "latitude": latitude, "n_retry": n_retry, "error": error, "source": source}
+
+
+class RateLimiter:
+    """
+    全スレッド合計で rate 件/秒 を超えないようにリクエストの開始時刻を割り当てる
+    """
+    def __init__(self, rate: float):
+        self.interval  = 1.0 / rate if rate > 0 else 0.0
+        self.time_next = time.monotonic()
+        self.lock      = threading.Lock()
+
+    def wait(self):
+        with self.lock:
+            time_now       = time.monotonic()
+            time_start     = max(self.time_next, time_now)
+            self.time_next = time_start + self.interval
+        if time_start > time_now:
+            time.sleep(time_start - time_now)
+
+
+class GsiGeocoder:
+    """
+    国土地理院 AddressSearch API のクライアント
+    """
+    def __init__(self, workers: int = 4, rate: float = 5.0, retries: int = 4, backoff: float = 1.0, timeout: float = 10.0, url: str = GSI_ADDRESS_SEARCH_URL):
+        """
+        Args:
+            workers (int): 同時に処理する住所の数（スレッド数）
+            rate (float): 全スレッド合計のリクエスト数の上限 [件/秒]、0以下の場合は制限なし
+            retries (int): 1住所あたりのリトライ回数
+            backoff (float): リトライの待ち時間の基準 [秒]（backoff * 2^n、最大60秒）
+            timeout (float): 1リクエストのタイムアウト [秒]
+        """
+        self.workers = workers
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.url     = url
+        self.limiter = RateLimiter(rate)
+        self.local   = threading.local()
+
+    def get_session(self) -> requests.Session:
+        """
+        スレッドごとの Session（初回使用時に作成）
+        """
+        session = getattr(self.local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+            self.local.session = session
+        return session
+
+    def _wait_retry(self, n_retry: int, res: Optional[requests.Response] = None):
+        wait_sec = min(self.backoff * (2 ** n_retry), 60.0) * (0.5 + random.random())
+        if res is not None and res.headers.get("Retry-After", "").isdigit():
+            wait_sec = max(wait_sec, float(res.headers["Retry-After"]))
+        time.sleep(wait_sec)
+
+    def geocode(self, location: str) -> Dict[str, Any]:
+        """
+        1住所のジオコーディング（該当が1件のみの場合に座標を返す）
+        """
+        error, res_retry = None, None
+        for n_retry in range(self.retries + 1):
+            if n_retry > 0:
+                self._wait_retry(n_retry - 1, res_retry)
+            self.limiter.wait()
+            res_retry = None
+            try:
+                res = self.get_session().get(self.url, params={"q": location}, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                error = f"{type(e).__name__}: {e}"
+                continue
+            if res.status_code in RETRY_STATUS_CODES:
+                error, res_retry = f"status code {res.status_code}", res
+                continue
+            if res.status_code != 200:
+                return make_result(location, "error", n_retry=n_retry, error=f"status code {res.status_code}")
+            try:
+                data = res.json()
+            except ValueError as e:
+                error = f"invalid json: {e}"
+                continue
+            if not isinstance(data, list):
+                return make_result(location, "error", n_retry=n_retry, error=f"unexpected response: {type(data).__name__}")
+            if len(data) != 1:
+                return make_result(location, "notfound", n_retry=n_retry)
+            try:
+                longitude, latitude = data[0]["geometry"]["coordinates"]
+                longitude, latitude = float(longitude), float(latitude)
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                return make_result(location, "error", n_retry=n_retry, error=f"unexpected response: {type(e).__name__}: {e}")
+            if not (math.isfinite(longitude) and math.isfinite(latitude)):
+                return make_result(location, "error", n_retry=n_retry, error=f"unexpected response: coordinates {longitude}, {latitude}")
+            return make_result(location, "ok", longitude, latitude, n_retry=n_retry)
+        return make_result(location, "error", n_retry=self.retries, error=error)
+
+    def geocode_many(self, locations: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        複数の住所を workers 件ずつ並列にジオコーディングし、完了した順に返す
+        （未完了の住所は workers * 2 件まで、locations は逐次読み込む）
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = set()
+            for location in locations:
+                pending.add(executor.submit(self.geocode, location))
+                if len(pending) >= self.workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in as_completed(pending):
+                yield future.result()
@@ -3,10 +3,30 @@ JSON形式でのクレンジング処理
 estate_detailの生データをJSONオブジェクトに変換
 """
 
-import re
-import csv
-import os
 from typing import Dict, Any, Optional, List, Tuple
+from .patterns import (
+    COMPANY_NAME_PATTERNS, MEMBERSHIP_PATTERNS, OTHER_EXPENSE_PATTERNS, RE_ACCESS_BUS,
+    RE_ACCESS_CAR, RE_ACCESS_STATION, RE_ADDRESS_NUMBER_LIST, RE_ADDRESS_PAREN,
+    RE_ADDRESS_QUOTE, RE_ADDRESS_SQUARE_BRACKET, RE_ADDRESS_TRAILING_NOISE, RE_AMOUNT_MAN,
+    RE_AMOUNT_MAN_YEN, RE_AMOUNT_YEN, RE_AREA_LIST_SEP, RE_AREA_MONTHLY_FEE,
+    RE_AREA_MONTHLY_FEE_ALT, RE_AREA_USAGE_FEE, RE_BAND_ITEM, RE_BAND_ITEM_STRICT,
+    RE_BAND_MULTI_EACH, RE_BAND_OKU, RE_BAND_OKU_MAN, RE_BAND_OKU_MAN_RANGE,
+    RE_BAND_RANGE, RE_BAND_SINGLE, RE_BAND_SINGLE_NO_PAREN, RE_BAND_SINGLE_WITH_NOTE,
+    RE_BEFORE_PAREN, RE_CLOSE_PAREN, RE_COMMA_SEP, RE_COMMA_SEP_SIMPLE,
+    RE_COMPANY_ADDRESS, RE_COMPANY_CONSTRUCTION_PERMIT, RE_COMPANY_NAME_NUMBER_NOISE, RE_COMPANY_NAME_PAREN_NOISE,
+    RE_COMPANY_ROLE, RE_COMPANY_ROLE_BLOCK, RE_DATE_SLASH, RE_DATE_YM,
+    RE_DATE_YMD, RE_DELIVERY_AFTER_CONTRACT, RE_DIGIT, RE_DIGITS,
+    RE_FEE_AMOUNT, RE_FEE_BREAKDOWN, RE_FEE_FROM_PERIOD, RE_FEE_MAN_PART,
+    RE_FEE_PERIOD_SPECIAL, RE_FEE_SPECIAL, RE_FEE_STAGED, RE_LAYOUT_PLUS_NOTE,
+    RE_LAYOUT_ROOM_NOTE, RE_LAYOUT_SIMPLE, RE_LAYOUT_TOKEN, RE_LAYOUT_TOKEN_NO_F,
+    RE_LAYOUT_VALID, RE_LAYOUT_VALID_NO_F, RE_LEADING_NUMBER, RE_LICENSE_GOVERNOR,
+    RE_LICENSE_MINISTER, RE_LIST_SEP, RE_NAKAGURO_SEP, RE_NON_DIGITS,
+    RE_NON_WORD, RE_NOTE, RE_NUMBER, RE_NUMBER_WITH_COMMA,
+    RE_PAREN_BLOCK, RE_PAREN_CONTENT, RE_PAREN_CONTENT_LAZY, RE_PAREN_TAIL,
+    RE_PERIOD_SUFFIX, RE_PRICE_MAN_WITHOUT_OKU, RE_PRICE_MAN_YEN, RE_PRICE_OKU_MAN,
+    RE_RANGE_SEP, RE_RATING, RE_SLASH_SEP, RE_TAB_NEWLINE_SEP,
+    RE_UTILITY_RANGE, RE_UTILITY_SINGLE, RE_WHITESPACE, RE_YEAR
+)
 from .parser import (
     parse_address_structure,
     clean_surrounding_facilities_to_json,
@@ -22,36 +42,39 @@ from .parser import (
     get_structure_analysis_schema,
     get_reform_analysis_schema
 )
+from .citycode import get_citycode_from_address
+from .matcher import AhoCorasick
 
-# citycode.csvからマッピング辞書を作成（グローバル変数）
-_CITYCODE_MAP = None
-
-def _load_citycode_map():
-    """citycode.csvを読み込んでマッピング辞書を作成"""
-    global _CITYCODE_MAP
-    if _CITYCODE_MAP is not None:
-        return _CITYCODE_MAP
-    
-    _CITYCODE_MAP = {}
-    citycode_path = os.path.join(os.path.dirname(__file__), "../master/citycode.csv")
-    
-    if os.path.exists(citycode_path):
-        try:
-            with open(citycode_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if len(row) >= 6:
-                        citycode = row[0].strip('"')
-                        city_name = row[1].strip('"')
-                        pref_name = row[5].strip('"')
-                        
-                        # 都道府県名+市区町村名をキーにしてcitycodeをマッピング
-                        full_name = pref_name + city_name
-                        _CITYCODE_MAP[full_name] = citycode
-        except Exception:
-            pass
-    
-    return _CITYCODE_MAP
+# 分析に重要でないパターン（含まれる場合は null にする）
+UNIMPORTANT_PATTERNS = [
+    "■支払い例",
+    "■ローンのご案内",
+    "提携ローン",
+    "※ローンは一定要件該当者が対象",
+    "※金利は",
+    "融資限度額",
+    "事務手数料",
+    "保証料",
+    "適用される金利は融資実行時",
+    "お申込みの際には、お認印",
+    "収入証明書",
+    "本人確認書類",
+    "運転免許証",
+    "健康保険証",
+    "パスポート",
+    "先着順販売のため販売済の場合",
+    "販売開始まで契約または予約の申し込み",
+    "申し込み順位の確保につながる行為は一切できません",
+    "確定情報は新規分譲広告において明示",
+    "物件データは第",
+    "期以降の全販売対象住戸",
+    "のものを表記",
+    "受付時間／",
+    "定休日／",
+    "受付場所／",
+    "マンションギャラリー",
+]
+_UNIMPORTANT_MATCHER = AhoCorasick(UNIMPORTANT_PATTERNS)
 
 def _should_nullify_text(value: str) -> bool:
     """
@@ -65,49 +88,15 @@ def _should_nullify_text(value: str) -> bool:
     if value.strip() in ["-", "－", "ー", "未定", "未設定", "なし", "無し", "N/A", ""]:
         return True
     
-    # 分析に重要でないパターン
-    unimportant_patterns = [
-        "■支払い例",
-        "■ローンのご案内",
-        "提携ローン",
-        "※ローンは一定要件該当者が対象",
-        "※金利は",
-        "融資限度額",
-        "事務手数料",
-        "保証料",
-        "適用される金利は融資実行時",
-        "お申込みの際には、お認印",
-        "収入証明書",
-        "本人確認書類",
-        "運転免許証",
-        "健康保険証",
-        "パスポート",
-        "先着順販売のため販売済の場合",
-        "販売開始まで契約または予約の申し込み",
-        "申し込み順位の確保につながる行為は一切できません",
-        "確定情報は新規分譲広告において明示",
-        "物件データは第",
-        "期以降の全販売対象住戸",
-        "のものを表記",
-        "受付時間／",
-        "定休日／",
-        "受付場所／",
-        "マンションギャラリー",
-    ]
-    
-    # いずれかのパターンに一致する場合は null にする
-    for pattern in unimportant_patterns:
-        if pattern in value:
-            return True
-    
-    return False
+    # 分析に重要でないパターンのいずれかに一致する場合は null にする
+    return _UNIMPORTANT_MATCHER.contains_any(value)
 
 def extract_period_from_key(key_name: str) -> Tuple[str, Optional[int]]:
     """
     キー名から期別情報を抽出
     例: "価格_第4期" -> ("価格", 4)
     """
-    phase_match = re.search(r'_第(\d+)期$', key_name)
+    phase_match = RE_PERIOD_SUFFIX.search(key_name)
     if phase_match:
         base_key = key_name.replace(phase_match.group(0), '')
         period = int(phase_match.group(1))
@@ -151,7 +140,7 @@ def clean_price_to_json(value: str, period: Optional[int] = None) -> Dict[str, A
         return result
     
     # 括弧内の価格は注記として扱い、主価格は括弧外から抽出
-    main_text = re.sub(r'[（(][^）)]*[）)]', '', value)  # 括弧を除去
+    main_text = RE_PAREN_BLOCK.sub('', value)  # 括弧を除去
     
     # 億円を含む価格の処理
     if "億" in main_text:
@@ -159,14 +148,14 @@ def clean_price_to_json(value: str, period: Optional[int] = None) -> Dict[str, A
         prices_in_man = []
         
         # 億と万を含む価格を処理（例：1億2300万円）
-        for match in re.finditer(r'(\d+(?:\.\d+)?)億(?:(\d+(?:\.\d+)?)万)?', main_text):
+        for match in RE_PRICE_OKU_MAN.finditer(main_text):
             oku = float(match.group(1))
             man = float(match.group(2)) if match.group(2) else 0
             total_man = oku * 10000 + man  # 億を万に変換して合計
             prices_in_man.append(total_man)
         
         # 万円のみの価格も抽出（億と組み合わさっていないもの）
-        for match in re.finditer(r'(?<![億\d])(\d+(?:,\d{3})*(?:\.\d+)?)万', main_text):
+        for match in RE_PRICE_MAN_WITHOUT_OKU.finditer(main_text):
             man = float(match.group(1).replace(',', ''))
             prices_in_man.append(man)
         
@@ -186,7 +175,7 @@ def clean_price_to_json(value: str, period: Optional[int] = None) -> Dict[str, A
         # 万円パターンの処理（例：3989万5000円）
         if "万" in main_text:
             # パターン1: 「3989万5000円」のような形式
-            man_yen_pattern = re.findall(r'(\d+(?:,\d{3})*)万(\d+(?:,\d{3})*)円', main_text)
+            man_yen_pattern = RE_PRICE_MAN_YEN.findall(main_text)
             for man_part, yen_part in man_yen_pattern:
                 man_val = float(man_part.replace(',', ''))
                 yen_val = float(yen_part.replace(',', ''))
@@ -195,7 +184,7 @@ def clean_price_to_json(value: str, period: Optional[int] = None) -> Dict[str, A
                 prices_in_unit.append(total_man)
             
             # パターン2: 「万円」のみ（例：3989万円）
-            man_only_pattern = re.findall(r'(\d+(?:,\d{3})*)万円', main_text)
+            man_only_pattern = RE_AMOUNT_MAN.findall(main_text)
             for man_str in man_only_pattern:
                 # 既にパターン1で処理されていないかチェック
                 already_processed = False
@@ -210,7 +199,7 @@ def clean_price_to_json(value: str, period: Optional[int] = None) -> Dict[str, A
             result["unit"] = "万円"
         else:
             # 通常の数値抽出
-            numbers = re.findall(r'(\d+(?:,\d{3})*(?:\.\d+)?)', value)
+            numbers = RE_NUMBER_WITH_COMMA.findall(value)
             if not numbers:
                 result["value"] = value
                 if period is not None:
@@ -250,7 +239,7 @@ def clean_price_to_json(value: str, period: Optional[int] = None) -> Dict[str, A
                 result["value"] = (result["min"] + result["max"]) / 2
     
     # 括弧内の注記を抽出
-    note_match = re.search(r'[（(]([^）)]*)[）)]', value)
+    note_match = RE_PAREN_CONTENT.search(value)
     if note_match:
         note_text = note_match.group(1).strip()
         # 支払いシミュレーションなどの不要な情報は除外
@@ -293,23 +282,23 @@ def clean_price_band_to_json(value: str, raw_key: str, period: Optional[int] = N
     # 価格帯と戸数のパターンを厳密にチェック
     
     # パターン1: "5500万円台（2戸）"、"1200万円台（4区画）"、"5000万円台（9戸）※1000万円単位" - 単一価格帯で括弧内に戸数/区画数
-    single_pattern_match = re.match(r'^(\d+(?:,\d{3})*(?:\.\d+)?)万円台(?:（予定）)?（(\d+)(?:戸|区画)）(?:※.*)?$', value.strip())
+    single_pattern_match = RE_BAND_SINGLE.match(value.strip())
     
     # 億円台パターン: "1億円台（4戸）" -> 1億円を10000万円に変換
-    oku_pattern_match = re.match(r'^(\d+(?:\.\d+)?)億円台（(\d+)(?:戸|区画)）$', value.strip())
+    oku_pattern_match = RE_BAND_OKU.match(value.strip())
     
     # パターン1-2: "8000万円台 2区画 ※1000万円単位" - 括弧なしで戸数/区画数（※注記は無視）
-    single_no_paren_match = re.match(r'^(\d+(?:,\d{3})*(?:\.\d+)?)万円台\s+(\d+)(?:戸|区画)(?:\s+※.*)?$', value.strip())
+    single_no_paren_match = RE_BAND_SINGLE_NO_PAREN.match(value.strip())
     
     # パターン2: "5700万円台・5900万円台（各1戸）" または "5700万円台・5900万円台（各1区画）" - 複数価格帯で「各X戸/区画」
-    multi_pattern_match = re.match(r'^(.+?)（各(\d+)(?:戸|区画)）$', value.strip())
+    multi_pattern_match = RE_BAND_MULTI_EACH.match(value.strip())
     
     # パターン3: 範囲指定価格帯（括弧内注記は無視）
     # 「8900万円台～1億2900万円台」のような億万円混合範囲パターン
-    oku_man_range_match = re.match(r'^(\d+(?:,\d{3})*(?:\.\d+)?)万円台～(\d+(?:\.\d+)?)億(\d+(?:,\d{3})*)万円台$', value.strip())
+    oku_man_range_match = RE_BAND_OKU_MAN_RANGE.match(value.strip())
     
     # 「2700万円台～4400万円台（うちモデルルーム価格4476万円、予定）」のような万円のみ範囲パターン
-    range_pattern_match = re.match(r'^(\d+(?:,\d{3})*(?:\.\d+)?)万円台～(\d+(?:,\d{3})*(?:\.\d+)?)万円台(?:[（(].*?[）)])?(?:※.*)?$', value.strip())
+    range_pattern_match = RE_BAND_RANGE.match(value.strip())
     
     if oku_man_range_match:
         # 億万円混合範囲パターン: 8900万円台～1億2900万円台
@@ -366,7 +355,7 @@ def clean_price_band_to_json(value: str, raw_key: str, period: Optional[int] = N
             price_items = price_part.split('・')
             valid_prices = []
             for item in price_items:
-                price_match = re.match(r'(\d+(?:,\d{3})*(?:\.\d+)?)万円台$', item.strip())
+                price_match = RE_BAND_ITEM.match(item.strip())
                 if price_match:
                     price = float(price_match.group(1).replace(',', ''))
                     valid_prices.append(price)
@@ -391,7 +380,7 @@ def clean_price_band_to_json(value: str, raw_key: str, period: Optional[int] = N
         price_items = value.strip().split('・')
         valid_prices = []
         for item in price_items:
-            price_match = re.match(r'^(\d+(?:,\d{3})*(?:\.\d+)?)万円台$', item.strip())
+            price_match = RE_BAND_ITEM_STRICT.match(item.strip())
             if price_match:
                 price = float(price_match.group(1).replace(',', ''))
                 valid_prices.append(price)
@@ -425,7 +414,7 @@ def clean_price_band_to_json(value: str, raw_key: str, period: Optional[int] = N
         # パターン5: 単一価格帯（戸数情報なし）
         
         # 億万円台パターン（例：「1億1000万円台※1000万円単位」）
-        oku_man_band_match = re.match(r'^(\d+(?:\.\d+)?)億(\d+(?:,\d{3})*)万円台(?:※.*)?$', value.strip())
+        oku_man_band_match = RE_BAND_OKU_MAN.match(value.strip())
         if oku_man_band_match:
             oku_str = oku_man_band_match.group(1)
             man_str = oku_man_band_match.group(2)
@@ -435,7 +424,7 @@ def clean_price_band_to_json(value: str, raw_key: str, period: Optional[int] = N
             result["values"].append({"price": price_in_man, "count": 1})
         else:
             # 万円台パターン（例：「3900万円台」）
-            single_band_match = re.match(r'^(\d+(?:,\d{3})*(?:\.\d+)?)万円台(?:※.*)?$', value.strip())
+            single_band_match = RE_BAND_SINGLE_WITH_NOTE.match(value.strip())
             if single_band_match:
                 price_str = single_band_match.group(1)
                 price = float(price_str.replace(',', ''))
@@ -487,7 +476,7 @@ def clean_area_to_json(value: str, period: Optional[int] = None) -> Dict[str, An
     result = {}
     
     # 数値を抽出
-    numbers = re.findall(r'(\d+(?:\.\d+)?)', value)
+    numbers = RE_NUMBER.findall(value)
     if not numbers:
         result["value"] = value
         if period is not None:
@@ -515,10 +504,10 @@ def clean_area_to_json(value: str, period: Optional[int] = None) -> Dict[str, An
         
         if result["unit"] == "m^2":
             # m^2の値を抽出（～の前後）
-            range_parts = re.split(r'[～〜]', value)
+            range_parts = RE_RANGE_SEP.split(value)
             for part in range_parts:
                 if any(unit in part for unit in ["㎡", "m²", "m2"]):
-                    area_match = re.search(r'(\d+(?:\.\d+)?)', part)
+                    area_match = RE_NUMBER.search(part)
                     if area_match:
                         area_numbers.append(float(area_match.group(1)))
         
@@ -570,7 +559,7 @@ def clean_multiple_area_to_json(value: str, period: Optional[int] = None) -> Dic
     result = {"areas": []}
     
     # 「、」や全角スペースで分割して各面積項目を処理
-    parts = re.split(r'[,、，　\s]+', value)
+    parts = RE_AREA_LIST_SEP.split(value)
     
     for part in parts:
         part = part.strip()
@@ -590,7 +579,7 @@ def clean_multiple_area_to_json(value: str, period: Optional[int] = None) -> Dic
             area_value = part
         
         # 数値を抽出
-        numbers = re.findall(r'(\d+(?:\.\d+)?)', area_value)
+        numbers = RE_NUMBER.findall(area_value)
         if not numbers:
             continue
             
@@ -609,11 +598,11 @@ def clean_multiple_area_to_json(value: str, period: Optional[int] = None) -> Dic
         
         # 使用料を抽出
         # パターン1: 使用料1500円
-        usage_fee_match = re.search(r'使用料[：:]?(\d+)円', area_value)
+        usage_fee_match = RE_AREA_USAGE_FEE.search(area_value)
         # パターン2: （2000円／月）
-        monthly_fee_match = re.search(r'[（(](\d+)円[／/]月[）)]', area_value)
+        monthly_fee_match = RE_AREA_MONTHLY_FEE.search(area_value)
         # パターン3: （利用料：月額1500円）または（使用料：月額3000円）
-        monthly_fee_match2 = re.search(r'[（(][利使]用料[：:]?月額(\d+)円[）)]', area_value)
+        monthly_fee_match2 = RE_AREA_MONTHLY_FEE_ALT.search(area_value)
         
         if usage_fee_match:
             area_info["monthly_fee"] = int(usage_fee_match.group(1))
@@ -666,7 +655,7 @@ def clean_layout_to_json(value: str, period: Optional[int] = None) -> Dict[str,
     original_value = value
     
     # 括弧内の説明を除去（+S（納戸）→+S）
-    value = re.sub(r'([+＋][A-Z]+)[（(][^）)]*[）)]', r'\1', value)
+    value = RE_LAYOUT_PLUS_NOTE.sub(r'\1', value)
     
     result = {}
     
@@ -676,17 +665,17 @@ def clean_layout_to_json(value: str, period: Optional[int] = None) -> Dict[str,
     # 範囲表現（～）がある場合の処理
     if '～' in value or '〜' in value:
         # 範囲を～で分割
-        range_parts = re.split(r'[～〜]', value)
+        range_parts = RE_RANGE_SEP.split(value)
         
         if len(range_parts) == 2:
             # 各部分から間取りを抽出
             for part in range_parts:
                 part = part.strip()
-                layout_match = re.search(r'(\d+(?:[LDKSRF]+)(?:[+＋]\d*[LDKSRF]*)*)', part.upper())
+                layout_match = RE_LAYOUT_TOKEN.search(part.upper())
                 if layout_match:
                     matched_layout = layout_match.group(1)
                     # 間取りパターンとして有効な場合のみ追加（+で終わるパターンを除外）
-                    if len(matched_layout) <= 10 and re.match(r'^\d+[LDKSRF]+(?:[+＋]\d*[LDKSRF]+)*$', matched_layout) and not matched_layout.endswith(('+', '＋')):
+                    if len(matched_layout) <= 10 and RE_LAYOUT_VALID.match(matched_layout) and not matched_layout.endswith(('+', '＋')):
                         layout_items.append(matched_layout)
             
             # 簡単な展開が可能な場合のみ展開（例：1LDK～3LDK）
@@ -695,8 +684,8 @@ def clean_layout_to_json(value: str, period: Optional[int] = None) -> Dict[str,
                 second_layout = layout_items[1]
                 
                 # 単純なパターン（数字+同じ文字列）の場合のみ展開
-                first_match = re.match(r'^(\d+)([LDKSRF]+)$', first_layout)
-                second_match = re.match(r'^(\d+)([LDKSRF]+)$', second_layout)
+                first_match = RE_LAYOUT_SIMPLE.match(first_layout)
+                second_match = RE_LAYOUT_SIMPLE.match(second_layout)
                 
                 if first_match and second_match:
                     start_num = int(first_match.group(1))
@@ -717,30 +706,30 @@ def clean_layout_to_json(value: str, period: Optional[int] = None) -> Dict[str,
                             layout_items.append(f"{i}LDK")
         else:
             # 複雑な範囲パターンは通常の処理に任せる
-            all_layouts = re.findall(r'(\d+(?:[LDKSRF]+)(?:[+＋]\d*[LDKSRF]*)*)', value.upper())
+            all_layouts = RE_LAYOUT_TOKEN.findall(value.upper())
             for layout in all_layouts:
-                if len(layout) <= 10 and re.match(r'^\d+[LDKSRF]+(?:[+＋]\d*[LDKSRF]+)*$', layout) and not layout.endswith(('+', '＋')):
+                if len(layout) <= 10 and RE_LAYOUT_VALID.match(layout) and not layout.endswith(('+', '＋')):
                     layout_items.append(layout)
         
         # 範囲処理後に括弧内の詳細情報からも間取りを抽出
-        bracket_content = re.findall(r'[（(]([^）)]*)[）)]', value)
+        bracket_content = RE_PAREN_CONTENT.findall(value)
         for bracket in bracket_content:
             # 括弧内を・で分割してさらに間取りを抽出
-            bracket_parts = re.split(r'[・]', bracket)
+            bracket_parts = RE_NAKAGURO_SEP.split(bracket)
             for bracket_part in bracket_parts:
                 bracket_part = bracket_part.strip()
                 # サービスルーム等の説明文を除去
-                bracket_part = re.sub(r'[（(][^）)]*(?:サービスルーム|ファミリークロゼット|シューズインクローク|納戸)[^）)]*[）)]', '', bracket_part)
-                bracket_layout_match = re.search(r'(\d+(?:[LDKSRF]+)(?:[+＋]\d*[LDKSRF]*)*)', bracket_part.upper())
+                bracket_part = RE_LAYOUT_ROOM_NOTE.sub('', bracket_part)
+                bracket_layout_match = RE_LAYOUT_TOKEN.search(bracket_part.upper())
                 if bracket_layout_match:
                     bracket_matched_layout = bracket_layout_match.group(1)
-                    if len(bracket_matched_layout) <= 10 and re.match(r'^\d+[LDKSRF]+(?:[+＋]\d*[LDKSRF]+)*$', bracket_matched_layout) and not bracket_matched_layout.endswith(('+', '＋')):
+                    if len(bracket_matched_layout) <= 10 and RE_LAYOUT_VALID.match(bracket_matched_layout) and not bracket_matched_layout.endswith(('+', '＋')):
                         # 重複チェック
                         if bracket_matched_layout not in layout_items:
                             layout_items.append(bracket_matched_layout)
     else:
         # ・（中点）で分割
-        parts = re.split(r'[・]', value)
+        parts = RE_NAKAGURO_SEP.split(value)
         
         for part in parts:
             part = part.strip()
@@ -748,39 +737,39 @@ def clean_layout_to_json(value: str, period: Optional[int] = None) -> Dict[str,
                 # 括弧がある場合は括弧内の詳細情報も処理
                 if '(' in part or '（' in part:
                     # 括弧外の間取りを抽出
-                    main_part = re.sub(r'[（(][^）)]*[）)]', '', part)
+                    main_part = RE_PAREN_BLOCK.sub('', part)
                     # 余分な括弧を除去
-                    main_part = re.sub(r'[）)]', '', main_part)
-                    layout_match = re.search(r'(\d+(?:[LDKSR]+)(?:[+＋]\d*[LDKSRF]*)*)', main_part.upper())
+                    main_part = RE_CLOSE_PAREN.sub('', main_part)
+                    layout_match = RE_LAYOUT_TOKEN_NO_F.search(main_part.upper())
                     if layout_match:
                         matched_layout = layout_match.group(1)
                         # +で終わるパターンや不完全なパターンを除外
-                        if len(matched_layout) <= 10 and re.match(r'^\d+[LDKSR]+(?:[+＋]\d*[LDKSRF]+)*$', matched_layout) and not matched_layout.endswith(('+', '＋')):
+                        if len(matched_layout) <= 10 and RE_LAYOUT_VALID_NO_F.match(matched_layout) and not matched_layout.endswith(('+', '＋')):
                             layout_items.append(matched_layout)
                     
                     # 括弧内の間取りも抽出（・で分割されている可能性）
-                    bracket_content = re.findall(r'[（(]([^）)]*)[）)]', part)
+                    bracket_content = RE_PAREN_CONTENT.findall(part)
                     for bracket in bracket_content:
                         # 括弧内を・で分割してさらに間取りを抽出
-                        bracket_parts = re.split(r'[・]', bracket)
+                        bracket_parts = RE_NAKAGURO_SEP.split(bracket)
                         for bracket_part in bracket_parts:
                             bracket_part = bracket_part.strip()
                             # サービスルーム等の説明文を除去
-                            bracket_part = re.sub(r'[（(][^）)]*(?:サービスルーム|ファミリークロゼット|シューズインクローク|納戸)[^）)]*[）)]', '', bracket_part)
-                            bracket_layout_match = re.search(r'(\d+(?:[LDKSRF]+)(?:[+＋]\d*[LDKSRF]*)*)', bracket_part.upper())
+                            bracket_part = RE_LAYOUT_ROOM_NOTE.sub('', bracket_part)
+                            bracket_layout_match = RE_LAYOUT_TOKEN.search(bracket_part.upper())
                             if bracket_layout_match:
                                 bracket_matched_layout = bracket_layout_match.group(1)
-                                if len(bracket_matched_layout) <= 10 and re.match(r'^\d+[LDKSRF]+(?:[+＋]\d*[LDKSRF]+)*$', bracket_matched_layout) and not bracket_matched_layout.endswith(('+', '＋')):
+                                if len(bracket_matched_layout) <= 10 and RE_LAYOUT_VALID.match(bracket_matched_layout) and not bracket_matched_layout.endswith(('+', '＋')):
                                     layout_items.append(bracket_matched_layout)
                 else:
                     # 各部分から間取りパターンを抽出
                     # より厳密な間取りパターン: 数字 + L/D/K/S/R/F の組み合わせ
-                    layout_match = re.search(r'(\d+(?:[LDKSRF]+)(?:[+＋]\d*[LDKSRF]*)*)', part.upper())
+                    layout_match = RE_LAYOUT_TOKEN.search(part.upper())
                     if layout_match:
                         # マッチした部分が間取りとして妥当かチェック
                         matched_layout = layout_match.group(1)
                         # 間取りパターンとして有効な場合のみ追加（LDKSRFのみを含み、長すぎない、+で終わらない）
-                        if len(matched_layout) <= 10 and re.match(r'^\d+[LDKSRF]+(?:[+＋]\d*[LDKSRF]+)*$', matched_layout) and not matched_layout.endswith(('+', '＋')):
+                        if len(matched_layout) <= 10 and RE_LAYOUT_VALID.match(matched_layout) and not matched_layout.endswith(('+', '＋')):
                             layout_items.append(matched_layout)
     
     # ワンルームの正規化の場合は特別処理
@@ -793,7 +782,7 @@ def clean_layout_to_json(value: str, period: Optional[int] = None) -> Dict[str,
         # 間取りの適切な順序でソート（2LDK → 2LDK+S → 2LDK+1S → 3LDK → ...）
         def layout_sort_key(layout):
             # 数字を抽出
-            num_match = re.match(r'^(\d+)', layout)
+            num_match = RE_LEADING_NUMBER.match(layout)
             if num_match:
                 num = int(num_match.group(1))
                 # Rの場合は特別に小さい値を設定
@@ -805,7 +794,7 @@ def clean_layout_to_json(value: str, period: Optional[int] = None) -> Dict[str,
                         # +の後の内容でさらにソート（S が 1S より先）
                         plus_part = layout.split('+')[1] if '+' in layout else layout.split('＋')[1]
                         # 数字のないもの（S）を数字があるもの（1S）より先にソート
-                        has_number_after_plus = re.search(r'\d', plus_part)
+                        has_number_after_plus = RE_DIGIT.search(plus_part)
                         if has_number_after_plus:
                             return (num, 1, 2, layout)  # 2LDK+1S → (2, 1, 2, "2LDK+1S")
                         else:
@@ -855,7 +844,7 @@ def clean_date_to_json(value: str, period: Optional[int] = None) -> Dict[str, An
     result = {}
     
     # 年月日を抽出（日付がある場合）
-    year_month_day_match = re.search(r'(\d{4})年(\d{1,2})月(\d{1,2})日', value)
+    year_month_day_match = RE_DATE_YMD.search(value)
     if year_month_day_match:
         year = int(year_month_day_match.group(1))
         month = int(year_month_day_match.group(2))
@@ -866,7 +855,7 @@ def clean_date_to_json(value: str, period: Optional[int] = None) -> Dict[str, An
         result["estimated_date"] = f"{year}-{month:02d}-{day:02d}"
     else:
         # 年月を抽出
-        year_month_match = re.search(r'(\d{4})年(\d{1,2})月', value)
+        year_month_match = RE_DATE_YM.search(value)
         if year_month_match:
             year = int(year_month_match.group(1))
             month = int(year_month_match.group(2))
@@ -964,12 +953,12 @@ def clean_management_fee_to_json(value: str, raw_key: str = "", period: Optional
         note_part = value[note_idx+1:].strip()
         
         # メイン部分から金額を抽出
-        amount_match = re.search(r'(\d+(?:万\d+)?(?:,\d{3})*)円', main_part)
+        amount_match = RE_FEE_AMOUNT.search(main_part)
         if amount_match:
             amount_str = amount_match.group(1)
             # 金額をパース
             if '万' in amount_str:
-                man_match = re.match(r'(\d+)万(\d+)', amount_str)
+                man_match = RE_FEE_MAN_PART.match(amount_str)
                 if man_match:
                     amount = int(man_match.group(1)) * 10000 + int(man_match.group(2))
                 else:
@@ -987,14 +976,14 @@ def clean_management_fee_to_json(value: str, raw_key: str = "", period: Optional
             return result
     
     # 特殊パターン1.5：「当初月額X円／月、段階増額方式」のようなパターン
-    stage_pattern = re.match(r'^当初月額(\d+(?:万\d+)?(?:,\d{3})*)円／月、(.+)$', value)
+    stage_pattern = RE_FEE_STAGED.match(value)
     if stage_pattern:
         amount_str = stage_pattern.group(1)
         note_text = stage_pattern.group(2)
         
         # 金額をパース
         if '万' in amount_str:
-            man_match = re.match(r'(\d+)万(\d+)', amount_str)
+            man_match = RE_FEE_MAN_PART.match(amount_str)
             if man_match:
                 amount = int(man_match.group(1)) * 10000 + int(man_match.group(2))
             else:
@@ -1012,7 +1001,7 @@ def clean_management_fee_to_json(value: str, raw_key: str = "", period: Optional
         return result
     
     # 特殊パターン2：「X円／月（Y年目のみZ円／月）」のような期間限定特別料金パターン
-    period_special_pattern = re.match(r'^(\d+(?:万\d+)?(?:,\d{3})*)円／月（([^）]+のみ\d+(?:万\d+)?(?:,\d{3})*円／月)）$', value)
+    period_special_pattern = RE_FEE_PERIOD_SPECIAL.match(value)
     if period_special_pattern:
         # メインの金額を値として取る（期間限定は注記扱い）
         main_amount_str = period_special_pattern.group(1)
@@ -1020,7 +1009,7 @@ def clean_management_fee_to_json(value: str, raw_key: str = "", period: Optional
         
         # 金額をパース
         if '万' in main_amount_str:
-            man_match = re.match(r'(\d+)万(\d+)', main_amount_str)
+            man_match = RE_FEE_MAN_PART.match(main_amount_str)
             if man_match:
                 main_amount = int(man_match.group(1)) * 10000 + int(man_match.group(2))
             else:
@@ -1038,7 +1027,7 @@ def clean_management_fee_to_json(value: str, raw_key: str = "", period: Optional
         return result
     
     # 特殊パターン2.5：「X円／月（契約時）、Y」のような形式の処理
-    special_pattern = re.match(r'^(\d+(?:万\d+)?(?:,\d{3})*)円／月（([^）]+)）(.*)$', value)
+    special_pattern = RE_FEE_SPECIAL.match(value)
     if special_pattern and '、' in value:
         # 最初の金額を値として取る
         first_amount_str = special_pattern.group(1)
@@ -1047,7 +1036,7 @@ def clean_management_fee_to_json(value: str, raw_key: str = "", period: Optional
         
         # 金額をパース
         if '万' in first_amount_str:
-            man_match = re.match(r'(\d+)万(\d+)', first_amount_str)
+            man_match = RE_FEE_MAN_PART.match(first_amount_str)
             if man_match:
                 first_amount = int(man_match.group(1)) * 10000 + int(man_match.group(2))
             else:
@@ -1065,14 +1054,14 @@ def clean_management_fee_to_json(value: str, raw_key: str = "", period: Optional
         return result
     
     # 特殊パターン3：括弧内に期間変更情報がある場合（年目より、年後より、など）
-    paren_match = re.search(r'(\d+(?:万\d+)?(?:,\d{3})*)円／月[（(]([^）)]*(?:年目|年後|カ月目|カ月後)より[^）)]*)[）)]', value)
+    paren_match = RE_FEE_FROM_PERIOD.search(value)
     if paren_match:
         amount_str = paren_match.group(1)
         note_text = paren_match.group(2)
         
         # 金額をパース
         if '万' in amount_str:
-            man_match = re.match(r'(\d+)万(\d+)', amount_str)
+            man_match = RE_FEE_MAN_PART.match(amount_str)
             if man_match:
                 amount = int(man_match.group(1)) * 10000 + int(man_match.group(2))
             else:
@@ -1129,7 +1118,7 @@ def clean_management_fee_to_json(value: str, raw_key: str = "", period: Optional
             for part in parts:
                 part = part.strip()
                 # 複数の括弧がある場合は最後の括弧を取得
-                paren_matches = re.findall(r'[（(]([^）)]*)[）)]', part)
+                paren_matches = RE_PAREN_CONTENT.findall(part)
                 if paren_matches:
                     # 最後の括弧内容を注記として使用
                     note_text = paren_matches[-1]
@@ -1146,13 +1135,13 @@ def clean_management_fee_to_json(value: str, raw_key: str = "", period: Optional
                 part = part.strip()
                 # 各パートから金額を抽出
                 # パターン1: 「1万7744円」のような形式
-                man_pattern = re.findall(r'(\d+)万(\d+)円', part)
+                man_pattern = RE_AMOUNT_MAN_YEN.findall(part)
                 for man_part, remaining_part in man_pattern:
                     total_amount = int(man_part) * 10000 + int(remaining_part)
                     all_amounts.append(total_amount)
                 
                 # パターン2: 「万円」単位（「10万円」など）
-                man_only_pattern = re.findall(r'(\d+(?:,\d{3})*)万円', part)
+                man_only_pattern = RE_AMOUNT_MAN.findall(part)
                 for man_str in man_only_pattern:
                     # 既にパターン1で処理されていないかチェック
                     already_processed = False
@@ -1164,7 +1153,7 @@ def clean_management_fee_to_json(value: str, raw_key: str = "", period: Optional
                         all_amounts.append(int(man_str.replace(',', '')) * 10000)
                 
                 # パターン3: 通常の円表記
-                yen_pattern = re.findall(r'(\d+(?:,\d{3})*)円', part)
+                yen_pattern = RE_AMOUNT_YEN.findall(part)
                 for yen_str in yen_pattern:
                     # 万円パターンに含まれていない場合のみ追加
                     already_processed = False
@@ -1182,7 +1171,7 @@ def clean_management_fee_to_json(value: str, raw_key: str = "", period: Optional
     else:
         # 単一項目の場合は注記処理を実行
         # 括弧内の追加情報を抽出（管理体制・勤務形態・一括払い以外）
-        paren_matches = re.findall(r'[（(]([^）)]*)[）)]', value)
+        paren_matches = RE_PAREN_CONTENT.findall(value)
         for note_text in paren_matches:
             # 管理体制・勤務形態・一括払い情報でない場合はnoteとして保存
             is_excluded = any(keyword in note_text for keyword in 
@@ -1191,7 +1180,7 @@ def clean_management_fee_to_json(value: str, raw_key: str = "", period: Optional
                 result["note"] = note_text.strip()
         
         # 内訳がある場合は分離して処理
-        breakdown_match = re.search(r'【内訳】(.+)$', value)
+        breakdown_match = RE_FEE_BREAKDOWN.search(value)
         if breakdown_match:
             main_part = value[:breakdown_match.start()].strip()
             breakdown_part = breakdown_match.group(1)
@@ -1220,13 +1209,13 @@ def clean_management_fee_to_json(value: str, raw_key: str = "", period: Optional
         amounts = []
         
         # パターン1: 「1万7744円」のような形式
-        man_pattern = re.findall(r'(\d+)万(\d+)円', main_part)
+        man_pattern = RE_AMOUNT_MAN_YEN.findall(main_part)
         for man_part, remaining_part in man_pattern:
             total_amount = int(man_part) * 10000 + int(remaining_part)
             amounts.append(total_amount)
         
         # パターン2: 「万円」単位（「10万円」など）
-        man_only_pattern = re.findall(r'(\d+(?:,\d{3})*)万円', main_part)
+        man_only_pattern = RE_AMOUNT_MAN.findall(main_part)
         for man_str in man_only_pattern:
             # 既にパターン1で処理されていないかチェック
             already_processed = False
@@ -1238,7 +1227,7 @@ def clean_management_fee_to_json(value: str, raw_key: str = "", period: Optional
                 amounts.append(int(man_str.replace(',', '')) * 10000)
         
         # パターン3: 通常の円表記
-        yen_pattern = re.findall(r'(\d+(?:,\d{3})*)円', main_part)
+        yen_pattern = RE_AMOUNT_YEN.findall(main_part)
         for yen_str in yen_pattern:
             # 万円パターンに含まれていない場合のみ追加
             already_processed = False
@@ -1297,7 +1286,7 @@ def clean_number_to_json(value: str, period: Optional[int] = None) -> Dict[str,
     result = {}
     
     # 数値を抽出
-    number_match = re.search(r'(\d+(?:\.\d+)?)', value.replace(',', ''))
+    number_match = RE_NUMBER.search(value.replace(',', ''))
     if number_match:
         num_str = number_match.group(1)
         if '.' in num_str:
@@ -1306,7 +1295,7 @@ def clean_number_to_json(value: str, period: Optional[int] = None) -> Dict[str,
             result["value"] = int(num_str)
         
         # 単位を抽出
-        unit_match = re.search(r'(\D+)', value.replace(',', '').replace(num_str, ''))
+        unit_match = RE_NON_DIGITS.search(value.replace(',', '').replace(num_str, ''))
         if unit_match:
             unit = unit_match.group(1).strip()
             if unit:
@@ -1335,7 +1324,7 @@ def clean_units_to_json(value: str, raw_key: str, period: Optional[int] = None)
     result = {}
     
     # 数値を抽出
-    number_match = re.search(r'(\d+(?:\.\d+)?)', value.replace(',', ''))
+    number_match = RE_NUMBER.search(value.replace(',', ''))
     if number_match:
         num_str = number_match.group(1)
         if '.' in num_str:
@@ -1346,14 +1335,14 @@ def clean_units_to_json(value: str, raw_key: str, period: Optional[int] = None)
         # 単位を抽出（括弧の前まで）
         # 数値の後から括弧または文末までの間の文字を取得
         after_number = value[value.find(num_str) + len(num_str):]
-        unit_match = re.match(r'^([^（(]+)', after_number)
+        unit_match = RE_BEFORE_PAREN.match(after_number)
         if unit_match:
             unit = unit_match.group(1).strip()
             if unit:
                 result["unit"] = unit
         
         # 括弧内の追加情報を抽出
-        paren_match = re.search(r'[（(](.+?)[）)]', value)
+        paren_match = RE_PAREN_CONTENT_LAZY.search(value)
         if paren_match:
             result["note"] = paren_match.group(1)
     else:
@@ -1442,7 +1431,7 @@ def clean_access_to_json(value: str, period: Optional[int] = None) -> Dict[str,
     
     # タブや改行で分割してルートを抽出
     routes = []
-    parts = re.split(r'[\t\n]', value)
+    parts = RE_TAB_NEWLINE_SEP.split(value)
     
     for part in parts:
         part = part.strip()
@@ -1450,7 +1439,7 @@ def clean_access_to_json(value: str, period: Optional[int] = None) -> Dict[str,
             continue
         
         # パターン: 路線名「駅名」移動手段+数字分
-        match = re.match(r'(.+?)「(.+?)」(.+?)(\d+)分', part)
+        match = RE_ACCESS_STATION.match(part)
         if match:
             line = match.group(1).strip()
             station = match.group(2).strip()
@@ -1466,7 +1455,7 @@ def clean_access_to_json(value: str, period: Optional[int] = None) -> Dict[str,
         else:
             # バス路線などの特殊ケース
             # 例: "バス10分（バス停「○○」まで歩5分）"
-            bus_match = re.match(r'バス(\d+)分.*?バス停「(.+?)」.*?歩(\d+)分', part)
+            bus_match = RE_ACCESS_BUS.match(part)
             if bus_match:
                 routes.append({
                     "line": "バス",
@@ -1477,7 +1466,7 @@ def clean_access_to_json(value: str, period: Optional[int] = None) -> Dict[str,
                 })
             # 車のケース
             elif "車" in part:
-                car_match = re.search(r'車(\d+)分', part)
+                car_match = RE_ACCESS_CAR.search(part)
                 if car_match:
                     routes.append({
                         "line": "車",
@@ -1514,7 +1503,7 @@ def clean_zoning_to_json(value: str, period: Optional[int] = None) -> Dict[str,
     
     # カンマや読点で分割
     zones = []
-    parts = re.split(r'[,、，]', value)
+    parts = RE_COMMA_SEP.split(value)
     
     for part in parts:
         part = part.strip()
@@ -1571,25 +1560,8 @@ def clean_other_expenses_to_json(value: str, period: Optional[int] = None) -> Di
     result = {"expenses": []}
     
     # カンマで分割して各項目を処理
-    items = [item.strip() for item in re.split(r'[、,]', value)]
-    
-    # 抽出対象のキーワードパターン
-    target_patterns = {
-        "駐車場": r'(.*駐車場[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?',
-        "地代": r'(.*地代)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?',
-        "敷金": r'(敷金)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?',
-        "保証金": r'(.*保証金[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?',
-        "解体": r'(.*解体[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?',
-        "災害積立": r'(災害積立[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?',
-        "メンテナンス": r'(.*メンテナンス[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?',
-        "通信費": r'(.*(?:インターネット|ネット|ＣＡＴＶ|CATV|TV|テレビ|フレッツ)[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?',
-        "管理費": r'(管理一時金[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?',
-        "利用料": r'(.*(?:利用料|使用料|専用利用料)[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?',
-        "自治会費": r'(.*(?:町会費|町内会費|自治会費)[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?',
-        "セキュリティ": r'(.*(?:セキュリティ|防犯|警備)[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?',
-        "コミュニティ": r'(.*(?:コミュニティ|会費)[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?',
-        "サービス": r'(.*(?:サービス)[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?'
-    }
+    items = [item.strip() for item in RE_COMMA_SEP_SIMPLE.split(value)]
+    
     
     found_any = False
     
@@ -1597,8 +1569,8 @@ def clean_other_expenses_to_json(value: str, period: Optional[int] = None) -> Di
         if not item.strip():
             continue
             
-        for category, pattern in target_patterns.items():
-            match = re.match(pattern, item.strip(), re.IGNORECASE)
+        for category, pattern in OTHER_EXPENSE_PATTERNS.items():
+            match = pattern.match(item.strip())
             if match:
                 item_name = match.group(1).strip()
                 amount_str = match.group(2).strip()
@@ -1647,7 +1619,7 @@ def clean_other_expenses_to_json(value: str, period: Optional[int] = None) -> Di
                 # 範囲の場合（「1万940円～1万4080円」など）
                 if '～' in amount_str or '〜' in amount_str:
                     # すべての万円パターンを抽出
-                    man_patterns = re.findall(r'(\d+)万(\d+)円', amount_str)
+                    man_patterns = RE_AMOUNT_MAN_YEN.findall(amount_str)
                     for man_part, yen_part in man_patterns:
                         amounts.append(int(man_part) * 10000 + int(yen_part))
                     
@@ -1657,7 +1629,7 @@ def clean_other_expenses_to_json(value: str, period: Optional[int] = None) -> Di
                     for man_part, yen_part in man_patterns:
                         temp_str = temp_str.replace(f'{man_part}万{yen_part}円', '')
                     
-                    man_only_patterns = re.findall(r'(\d+(?:,\d{3})*)万円', temp_str)
+                    man_only_patterns = RE_AMOUNT_MAN.findall(temp_str)
                     for man_str in man_only_patterns:
                         amount_val = int(man_str.replace(',', '')) * 10000
                         amounts.append(amount_val)
@@ -1667,7 +1639,7 @@ def clean_other_expenses_to_json(value: str, period: Optional[int] = None) -> Di
                     for man_str in man_only_patterns:
                         temp_str2 = temp_str2.replace(f'{man_str}万円', '')
                     
-                    yen_patterns = re.findall(r'(\d+(?:,\d{3})*)円', temp_str2)
+                    yen_patterns = RE_AMOUNT_YEN.findall(temp_str2)
                     for yen_str in yen_patterns:
                         amount_val = int(yen_str.replace(',', ''))
                         if amount_val not in amounts and amount_val < 1000000:  # 100万円未満の円
@@ -1677,19 +1649,19 @@ def clean_other_expenses_to_json(value: str, period: Optional[int] = None) -> Di
                     amount = 0
                     
                     # パターン1: 「1万5000円」のような形式
-                    man_pattern = re.search(r'(\d+)万(\d+)円', amount_str)
+                    man_pattern = RE_AMOUNT_MAN_YEN.search(amount_str)
                     if man_pattern:
                         man_part = int(man_pattern.group(1))
                         yen_part = int(man_pattern.group(2))
                         amount = man_part * 10000 + yen_part
                     else:
                         # パターン2: 「10万円」のような形式
-                        man_only = re.search(r'(\d+(?:,\d{3})*)万円', amount_str)
+                        man_only = RE_AMOUNT_MAN.search(amount_str)
                         if man_only:
                             amount = int(man_only.group(1).replace(',', '')) * 10000
                         else:
                             # パターン3: 通常の円表記
-                            yen_match = re.search(r'(\d+(?:,\d{3})*)円', amount_str)
+                            yen_match = RE_AMOUNT_YEN.search(amount_str)
                             if yen_match:
                                 amount = int(yen_match.group(1).replace(',', ''))
                     
@@ -1710,7 +1682,7 @@ def clean_other_expenses_to_json(value: str, period: Optional[int] = None) -> Di
                     if frequency_str:
                         # 最初の単語のみを見る（括弧や注記は無視）
                         first_word = frequency_str.split()[0] if frequency_str.split() else frequency_str
-                        first_word = re.sub(r'[（(].*', '', first_word)  # 括弧以降を削除
+                        first_word = RE_PAREN_TAIL.sub('', first_word)  # 括弧以降を削除
                         
                         if "一括" in first_word:
                             expense_item["frequency"] = "一括"
@@ -1760,7 +1732,7 @@ def clean_restrictions_to_json(value: str, period: Optional[int] = None) -> Dict
     result = {"restrictions": []}
     
     # 「、」や「・」で分割して各制限項目を処理
-    parts = re.split(r'[,、，・]', value)
+    parts = RE_LIST_SEP.split(value)
     
     for part in parts:
         part = part.strip()
@@ -1802,7 +1774,7 @@ def clean_expiry_date_to_json(value: str, period: Optional[int] = None) -> Dict[
     result = {}
     
     # 日本語日付形式をパース（例: "2025年3月26日"）
-    date_match = re.search(r'(\d{4})年(\d{1,2})月(\d{1,2})日', value)
+    date_match = RE_DATE_YMD.search(value)
     if date_match:
         year = date_match.group(1)
         month = date_match.group(2).zfill(2)  # 0埋め
@@ -1810,7 +1782,7 @@ def clean_expiry_date_to_json(value: str, period: Optional[int] = None) -> Dict[
         result["date"] = f"{year}-{month}-{day}"
     else:
         # スラッシュ形式をパース（例: "2024/03/31"）
-        slash_date_match = re.search(r'(\d{4})/(\d{1,2})/(\d{1,2})', value)
+        slash_date_match = RE_DATE_SLASH.search(value)
         if slash_date_match:
             year = slash_date_match.group(1)
             month = slash_date_match.group(2).zfill(2)  # 0埋め
@@ -1859,23 +1831,18 @@ def clean_company_info_to_json(value: str, period: Optional[int] = None) -> Dict
         company_info = {}
         
         # 役割を抽出（＜＞で囲まれた部分）
-        role_match = re.search(r'＜([^＞]+)＞', block)
+        role_match = RE_COMPANY_ROLE.search(block)
         if role_match:
             company_info["role"] = role_match.group(1)
             # 役割部分を除去
-            block = re.sub(r'＜[^＞]+＞', '', block).strip()
+            block = RE_COMPANY_ROLE_BLOCK.sub('', block).strip()
         
         # 免許番号を抽出
-        license_patterns = [
-            r'国土交通大臣\s*\（(\d+)\）\s*第(\d+)\s*号',
-            r'([^知事]*?)知事\s*\（(\d+)\）\s*第(\d+)\s*号'
-        ]
-        
         licenses = []
-        for pattern in license_patterns:
-            matches = re.finditer(pattern, block)
+        for pattern in [RE_LICENSE_MINISTER, RE_LICENSE_GOVERNOR]:
+            matches = pattern.finditer(block)
             for match in matches:
-                if "国土交通大臣" in pattern:
+                if pattern is RE_LICENSE_MINISTER:
                     licenses.append(f"国土交通大臣（{match.group(1)}）第{match.group(2)}号")
                 else:
                     licenses.append(f"{match.group(1)}知事（{match.group(2)}）第{match.group(3)}号")
@@ -1884,20 +1851,14 @@ def clean_company_info_to_json(value: str, period: Optional[int] = None) -> Dict
             company_info["licenses"] = licenses
         
         # 建設業許可を抽出
-        construction_matches = re.findall(r'建設業許可[/／]([^　\s]+)', block)
+        construction_matches = RE_COMPANY_CONSTRUCTION_PERMIT.findall(block)
         if construction_matches:
             company_info["construction_permits"] = construction_matches
         
         # 協会・団体会員情報を抽出
         memberships = []
-        membership_patterns = [
-            r'\(公社\)([^　\s会員]+)会員',
-            r'\(一社\)([^　\s会員]+)会員',
-            r'([^　\s（）]+)協議会加盟'
-        ]
-        
-        for pattern in membership_patterns:
-            matches = re.findall(pattern, block)
+        for pattern in MEMBERSHIP_PATTERNS:
+            matches = pattern.findall(block)
             for match in matches:
                 if match not in memberships:
                     memberships.append(match)
@@ -1906,25 +1867,18 @@ def clean_company_info_to_json(value: str, period: Optional[int] = None) -> Dict
             company_info["memberships"] = memberships
         
         # 会社名を抽出（株式会社等を含む）
-        company_name_patterns = [
-            r'(株式会社[^〒\n\t　]+)',
-            r'([^株式会社]*株式会社[^〒\n\t　]*)',
-            r'([^〒\n\t　]+株式会社)',
-            r'([^〒\n\t　]*会社[^〒\n\t　]*)'
-        ]
-        
-        for pattern in company_name_patterns:
-            match = re.search(pattern, block)
+        for pattern in COMPANY_NAME_PATTERNS:
+            match = pattern.search(block)
             if match:
                 name = match.group(1).strip()
                 # ノイズ除去
-                name = re.sub(r'[（）\(\)].*?[（）\(\)]', '', name)
-                name = re.sub(r'第\d+.*', '', name)
+                name = RE_COMPANY_NAME_PAREN_NOISE.sub('', name)
+                name = RE_COMPANY_NAME_NUMBER_NOISE.sub('', name)
                 company_info["name"] = name.strip()
                 break
         
         # 住所を抽出（〒以降）
-        address_match = re.search(r'〒(\d{3}-\d{4})\s*([^〒]+?)(?=株式会社|$)', block)
+        address_match = RE_COMPANY_ADDRESS.search(block)
         if address_match:
             company_info["postal_code"] = address_match.group(1)
             company_info["address"] = address_match.group(2).strip()
@@ -1970,7 +1924,7 @@ def clean_delivery_date_to_json(value: str, period: Optional[int] = None) -> Dic
         if "諸手続" in value or "手続" in value:
             result["note"] = "諸手続き完了後"
         elif "※" in value:
-            note_match = re.search(r'※(.+)', value)
+            note_match = RE_NOTE.search(value)
             if note_match:
                 result["note"] = note_match.group(1).strip()
         if period is not None:
@@ -1985,7 +1939,7 @@ def clean_delivery_date_to_json(value: str, period: Optional[int] = None) -> Dic
         return result
     
     # 契約後パターン
-    contract_match = re.search(r'契約後(\d+(?:\.\d+)?)ヶ月', value)
+    contract_match = RE_DELIVERY_AFTER_CONTRACT.search(value)
     if contract_match:
         result["type"] = "after_contract"
         result["months"] = float(contract_match.group(1))
@@ -1994,7 +1948,7 @@ def clean_delivery_date_to_json(value: str, period: Optional[int] = None) -> Dic
         return result
     
     # 完全な日付パターン（年月日）
-    full_date_match = re.search(r'(\d{4})年(\d{1,2})月(\d{1,2})日', value)
+    full_date_match = RE_DATE_YMD.search(value)
     if full_date_match:
         year = int(full_date_match.group(1))
         month = int(full_date_match.group(2))
@@ -2008,7 +1962,7 @@ def clean_delivery_date_to_json(value: str, period: Optional[int] = None) -> Dic
         return result
     
     # 年月パターン（日なし） - 「予定」も含む
-    year_month_match = re.search(r'(\d{4})年(\d{1,2})月', value)
+    year_month_match = RE_DATE_YM.search(value)
     if year_month_match:
         year = int(year_month_match.group(1))
         month = int(year_month_match.group(2))
@@ -2207,10 +2161,10 @@ def create_type_schema(base_key: str, sample_values: List[str]) -> Dict[str, Any
     
     # サンプルデータの分析
     has_range = any("～" in str(v) for v in sample_values[:10] if v)
-    has_numeric = any(re.search(r'\d+', str(v)) for v in sample_values[:10] if v)
+    has_numeric = any(RE_DIGITS.search(str(v)) for v in sample_values[:10] if v)
     has_boolean_words = any(any(word in str(v) for word in ["有", "無", "あり", "なし", "可", "不可", "○", "×"]) 
                            for v in sample_values[:10] if v)
-    has_date = any(re.search(r'\d{4}年', str(v)) for v in sample_values[:10] if v)
+    has_date = any(RE_YEAR.search(str(v)) for v in sample_values[:10] if v)
     
     # サンプルデータによる自動判定でも詳細なtype生成関数を使用
     if has_boolean_words and not has_numeric:
@@ -2351,8 +2305,6 @@ def _clean_address_string(address: str) -> str:
     if not address:
         return address
     
-    import re
-    
     # 1. 複数住所の分離（「、」で区切り）
     address_parts = [part.strip() for part in address.split('、')]
     
@@ -2372,30 +2324,25 @@ def _clean_address_string(address: str) -> str:
     # 例: 「平岸三条１４-68・72・73」→「平岸三条１４-68」
     if '・' in selected_address:
         # 「・」で分割されている番号の最初の部分のみ取得
-        selected_address = re.sub(r'・[\d・]+', '', selected_address)
+        selected_address = RE_ADDRESS_NUMBER_LIST.sub('', selected_address)
     
     # 4. 括弧内情報の除去
     # 丸括弧の除去: （地番）、（エアリー・地番）など
-    selected_address = re.sub(r'（[^）]*）', '', selected_address)
+    selected_address = RE_ADDRESS_PAREN.sub('', selected_address)
     
     # 角括弧の除去: 【角部屋】など
-    selected_address = re.sub(r'【[^】]*】', '', selected_address)
+    selected_address = RE_ADDRESS_SQUARE_BRACKET.sub('', selected_address)
     
     # かぎ括弧の除去: 「物件価格+諸費用+おまとめ」など
-    selected_address = re.sub(r'「[^」]*」', '', selected_address)
+    selected_address = RE_ADDRESS_QUOTE.sub('', selected_address)
     
     # 5. 住所の後の不要な文字列を除去
     # 番地の後に続く住所と関係ない文字列を除去
     # スペースありなし両方の月日表記や不要文字列を除去
-    selected_address = re.sub(
-        r'(-?\d+(?:-\d+)?(?:号室)?)'  # 番地部分
-        r'(\s*\d+月\d+日.*|\s*価格更新.*|\s*頭金.*|\s*物件.*|\s*諸費用.*|\s*おまとめ.*)',  # 日付表記以降や不要文字列（スペースあり・なし両方）
-        r'\1', 
-        selected_address
-    )
+    selected_address = RE_ADDRESS_TRAILING_NOISE.sub(r'\1', selected_address)
     
     # 6. 不要な空白や記号の整理
-    selected_address = re.sub(r'\s+', '', selected_address)  # 連続する空白を削除
+    selected_address = RE_WHITESPACE.sub('', selected_address)  # 連続する空白を削除
     selected_address = selected_address.strip()
     
     return selected_address
@@ -2410,19 +2357,11 @@ def _get_citycode_from_address(address: str) -> Optional[str]:
         
     Returns:
         Optional[str]: 見つかったcitycode、見つからない場合はNone
+
+    Note:
+        検索は kkestate.util.citycode のトライ木インデックスで行う
     """
-    citycode_map = _load_citycode_map()
-    
-    # 最長一致でcitycodeを検索
-    best_match = ""
-    best_citycode = None
-    
-    for full_name, citycode in citycode_map.items():
-        if address.startswith(full_name) and len(full_name) > len(best_match):
-            best_match = full_name
-            best_citycode = citycode
-    
-    return best_citycode
+    return get_citycode_from_address(address)
 
 def generate_address_simple_type_schema() -> Dict[str, Any]:
     """
@@ -3292,8 +3231,7 @@ def clean_utility_cost_to_json(value: str, raw_key: str = "", period: Optional[i
     
     # 価格範囲の抽出
     # パターン1: 「約18.8万円～19万円/年」
-    range_pattern = r'約?(\d+(?:\.\d+)?)万円～(\d+(?:\.\d+)?)万円'
-    range_match = re.search(range_pattern, value)
+    range_match = RE_UTILITY_RANGE.search(value)
     
     if range_match:
         min_val = float(range_match.group(1))
@@ -3303,8 +3241,7 @@ def clean_utility_cost_to_json(value: str, raw_key: str = "", period: Optional[i
         result["unit"] = "万円"
     else:
         # パターン2: 「約18.6万円/年」
-        single_pattern = r'約?(\d+(?:\.\d+)?)万円'
-        single_match = re.search(single_pattern, value)
+        single_match = RE_UTILITY_SINGLE.search(value)
         
         if single_match:
             val = float(single_match.group(1))
@@ -3320,53 +3257,177 @@ def clean_utility_cost_to_json(value: str, raw_key: str = "", period: Optional[i
     
     return result
 
-def clean_feature_pickup_to_json(value: str, raw_key: str = "", period: Optional[int] = None) -> Dict[str, Any]:
+# 特徴ピックアップの分類ルール（キーワード, タグ, 構造化データの更新内容）
+# 上から順に評価し、最初に一致したルールのみを適用する（部分一致のため順序に意味がある）
+# 更新内容は (カテゴリ, キー, 値)。更新先がリストの場合は値を追加する
+FEATURE_PICKUP_RULES = [
+    # 認証・評価書系
+    (("設計住宅性能評価書",), "design_performance_cert", [("certifications", "design_performance_evaluation", True)]),
+    (("建設住宅性能評価書",), "construction_performance_cert", [("certifications", "construction_performance_evaluation", True)]),
+    (("長期優良住宅認定通知書",), "long_term_excellent", [("certifications", "long_term_excellent_housing", True)]),
+    (("フラット３５", "フラット35"), "flat35_s", [("certifications", "flat35_s", True)]),
+    (("bels", "省エネ基準適合認定書"), "bels", [("certifications", "bels", True)]),
+    (("瑕疵保証",), "defect_warranty", [("certifications", "defect_warranty", True)]),
+    # 建物仕様系
+    (("２階建", "2階建"), "2_story", [("building_specs", "stories", 2)]),
+    (("３階建以上", "3階建以上"), "3_story_plus", [("building_specs", "stories", 3)]),
+    (("南向き",), "south_facing", [("building_specs", "orientation", "south")]),
+    (("東南向き",), "southeast_facing", [("building_specs", "orientation", "southeast")]),
+    (("全室南向き",), "all_rooms_south", [("building_specs", "all_rooms_south", True)]),
+    (("陽当り良好",), "good_sunlight", [("building_specs", "good_sunlight", True)]),
+    # LDK面積
+    (("ＬＤＫ１５畳以上", "LDK15畳以上"), "ldk_15tatami_plus", [("building_specs", "ldk_size_tatami", {"min": 15})]),
+    (("ＬＤＫ１８畳以上", "LDK18畳以上"), "ldk_18tatami_plus", [("building_specs", "ldk_size_tatami", {"min": 18})]),
+    (("ＬＤＫ２０畳以上", "LDK20畳以上"), "ldk_20tatami_plus", [("building_specs", "ldk_size_tatami", {"min": 20})]),
+    # 設備系 - キッチン
+    (("システムキッチン",), "system_kitchen", [("equipment", "kitchen", "system")]),
+    (("対面式キッチン",), "counter_kitchen", [("equipment", "kitchen", "counter_facing")]),
+    (("ＩＨクッキングヒーター", "IHクッキングヒーター"), "ih_cooktop", [("equipment", "kitchen", "ih_cooktop")]),
+    (("食器洗乾燥機",), "dishwasher", [("equipment", "kitchen", "dishwasher")]),
+    (("浄水器",), "water_purifier", [("equipment", "kitchen", "water_purifier")]),
+    # 設備系 - 浴室
+    (("浴室乾燥機",), "bathroom_dryer", [("equipment", "bathroom", "dryer")]),
+    (("浴室１坪以上", "浴室1坪以上"), "bathroom_1tsubo_plus", [("building_specs", "bathroom_size_tsubo", {"min": 1})]),
+    (("浴室に窓",), "bathroom_window", [("equipment", "bathroom", "window")]),
+    (("オートバス",), "auto_bath", [("equipment", "bathroom", "auto_bath")]),
+    # 設備系 - 暖房・冷房
+    (("床暖房",), "floor_heating", [("equipment", "heating_cooling", "floor_heating")]),
+    (("省エネルギー対策",), "energy_saving", [("equipment", "heating_cooling", "energy_saving")]),
+    (("省エネ給湯器",), "energy_saving_heater", [("equipment", "heating_cooling", "energy_saving_water_heater")]),
+    # 設備系 - ユーティリティ
+    (("オール電化",), "all_electric", [("equipment", "utilities", "all_electric")]),
+    (("都市ガス",), "city_gas", [("equipment", "utilities", "city_gas")]),
+    (("エレベーター",), "elevator", [("equipment", "utilities", "elevator")]),
+    (("複層ガラス",), "double_glazing", [("equipment", "utilities", "double_glazing")]),
+    # 設備系 - セキュリティ
+    (("セキュリティ充実",), "security_enhanced", [("equipment", "security", "enhanced")]),
+    (("ＴＶモニタ付インターホン", "TVモニタ付インターホン"), "tv_intercom", [("equipment", "security", "tv_intercom")]),
+    (("スマートキー",), "smart_key", [("equipment", "security", "smart_key")]),
+    # 立地・アクセス系
+    (("スーパー 徒歩10分以内", "スーパー徒歩10分以内"), "supermarket_walk_10min", [("location_access", "supermarket_walk_min", {"max": 10})]),
+    (("小学校 徒歩10分以内", "小学校徒歩10分以内"), "school_walk_10min", [("location_access", "elementary_school_walk_min", {"max": 10})]),
+    (("駅まで平坦",), "station_flat", [("location_access", "station_flat_access", True)]),
+    (("閑静な住宅地",), "quiet_area", [("location_access", "quiet_residential", True)]),
+    (("緑豊かな住宅地",), "green_area", [("location_access", "green_residential", True)]),
+    (("２沿線以上利用可", "2沿線以上利用可"), "multiple_lines", [("parking_transport", "multiple_rail_lines", True)]),
+    # 土地特徴系
+    (("土地50坪以上", "土地５０坪以上"), "land_50tsubo_plus", [("land_features", "area_tsubo", {"min": 50})]),
+    (("角地",), "corner_lot", [("land_features", "corner_lot", True)]),
+    (("南側道路面す",), "south_road", [("land_features", "south_facing_road", True)]),
+    (("前道６ｍ以上", "前道6m以上"), "road_6m_plus", [("land_features", "road_width_m", {"min": 6})]),
+    (("整形地",), "regular_shape", [("land_features", "regular_shape", True)]),
+    (("平坦地",), "flat_land", [("land_features", "flat_land", True)]),
+    # 駐車場・交通系
+    (("駐車２台可", "駐車2台可"), "parking_2cars", [("parking_transport", "parking_capacity", 2)]),
+    (("駐車３台以上可", "駐車3台以上可"), "parking_3cars_plus", [("parking_transport", "parking_capacity", 3)]),
+    # 室内特徴系（複合パターンを先に処理）
+    (("最上階角住戸",), "top_floor_corner", [("room_features", "corner_unit", True), ("room_features", "top_floor", True)]),
+    (("角住戸",), "corner_unit", [("room_features", "corner_unit", True)]),
+    (("最上階",), "top_floor", [("room_features", "top_floor", True)]),
+    (("全居室収納",), "all_rooms_storage", [("room_features", "all_rooms_storage", True)]),
+    (("ウォークインクローゼット",), "walk_in_closet", [("room_features", "walk_in_closet", True)]),
+    (("トイレ２ヶ所", "トイレ2ヶ所"), "2_toilets", [("room_features", "toilets_count", 2)]),
+    (("和室",), "japanese_room", [("room_features", "japanese_room", True)]),
+    (("ペット相談",), "pet_ok", [("room_features", "pet_negotiable", True)]),
+    # メンテナンス・リフォーム系
+    (("内装リフォーム",), "interior_reform", [("maintenance", "interior_reform", True)]),
+    (("外装リフォーム",), "exterior_reform", [("maintenance", "exterior_reform", True)]),
+    (("内外装リフォーム",), "full_reform", [("maintenance", "full_reform", True)]),
+    # 価格・販売関連情報
+    (("分譲時の価格帯",), "original_sale_price", []),
+]
+
+# 大文字小文字を区別せずに判定するキーワード
+FEATURE_PICKUP_IGNORE_CASE_KEYWORDS = {"bels"}
+
+def _build_feature_pickup_matchers() -> Tuple[AhoCorasick, List[int], AhoCorasick, List[int]]:
     """
-    特徴ピックアップをJSON形式で構造化
-    例: "土地50坪以上/角地/都市ガス" -> 構造化されたJSON
+    FEATURE_PICKUP_RULES のキーワードからマッチャーを作成
+    キーワードIDはルール順に採番するため、最小のキーワードIDが最優先のルールに対応する
+
+    Returns:
+        Tuple: (大文字小文字を区別するマッチャー, キーワードID -> ルール番号,
+                大文字小文字を区別しないマッチャー, キーワードID -> ルール番号)
+    """
+    keywords, rule_indexes = [], []
+    keywords_ic, rule_indexes_ic = [], []
+    for rule_index, (rule_keywords, _, _) in enumerate(FEATURE_PICKUP_RULES):
+        for keyword in rule_keywords:
+            if keyword in FEATURE_PICKUP_IGNORE_CASE_KEYWORDS:
+                keywords_ic.append(keyword)
+                rule_indexes_ic.append(rule_index)
+            else:
+                keywords.append(keyword)
+                rule_indexes.append(rule_index)
+    return AhoCorasick(keywords), rule_indexes, AhoCorasick(keywords_ic, ignore_case=True), rule_indexes_ic
+
+_FEATURE_PICKUP_MATCHER, _FEATURE_PICKUP_RULE_INDEXES, _FEATURE_PICKUP_MATCHER_IC, _FEATURE_PICKUP_RULE_INDEXES_IC = _build_feature_pickup_matchers()
+
+def _search_feature_pickup_rule(feature: str) -> Optional[int]:
+    """
+    特徴ピックアップの1項目に最初に一致するルール番号をマッチャーで検索
+
+    Args:
+        feature (str): 特徴の1項目（例: "システムキッチン"）
+
+    Returns:
+        Optional[int]: FEATURE_PICKUP_RULES のインデックス、一致しない場合はNone
+    """
+    rule_index = None
+    keyword_id = _FEATURE_PICKUP_MATCHER.first_id(feature)
+    if keyword_id is not None:
+        rule_index = _FEATURE_PICKUP_RULE_INDEXES[keyword_id]
+    keyword_id = _FEATURE_PICKUP_MATCHER_IC.first_id(feature)
+    if keyword_id is not None:
+        rule_index_ic = _FEATURE_PICKUP_RULE_INDEXES_IC[keyword_id]
+        if rule_index is None or rule_index_ic < rule_index:
+            rule_index = rule_index_ic
+    return rule_index
+
+def _build_feature_pickup_exact_index() -> Dict[str, int]:
+    """
+    キーワードと完全一致する項目に適用されるルール番号を事前に計算
+    キーワード自身より前のルールに部分一致する場合（例: "全室南向き" は "南向き" のルール）も
+    マッチャーと同じ結果になるよう、マッチャーで検索した結果を登録する
+
+    Returns:
+        Dict[str, int]: 項目 -> FEATURE_PICKUP_RULES のインデックス
+    """
+    exact_index = {}
+    for rule_keywords, _, _ in FEATURE_PICKUP_RULES:
+        for keyword in rule_keywords:
+            exact_index[keyword] = _search_feature_pickup_rule(keyword)
+    return exact_index
+
+_FEATURE_PICKUP_EXACT_INDEX = _build_feature_pickup_exact_index()
+
+def _match_feature_pickup_rule(feature: str) -> Optional[int]:
+    """
+    特徴ピックアップの1項目に適用するルール番号を取得
+    キーワードそのものの項目（"都市ガス"、"角地" など大半の項目）は辞書引きで決定し、
+    それ以外はマッチャーで検索する
+
+    Args:
+        feature (str): 特徴の1項目（例: "システムキッチン"）
+
+    Returns:
+        Optional[int]: FEATURE_PICKUP_RULES のインデックス、一致しない場合はNone
+    """
+    rule_index = _FEATURE_PICKUP_EXACT_INDEX.get(feature)
+    if rule_index is None:
+        rule_index = _search_feature_pickup_rule(feature)
+    return rule_index
+
+def classify_feature_pickup(features: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    特徴ピックアップの各項目を FEATURE_PICKUP_RULES に従って構造化データとタグに分類
+
+    Args:
+        features (List[str]): 特徴の項目リスト（例: ["角地", "都市ガス", "システムキッチン"]）
+
+    Returns:
+        Tuple[Dict[str, Any], List[str]]: (構造化データ（空のカテゴリは除く）, タグのリスト)
     """
-    if not value or value.strip() == "":
-        result = {"value": None}
-        if period is not None:
-            result["period"] = period
-        return result
-    
-    value = value.strip()
-    
-    # 特徴ピックアップは長いリストになることがあるため、長さ制限をスキップ
-    # その他の無効データパターンのみチェック
-    if value.strip() in ["-", "－", "ー", "未定", "未設定", "なし", "無し", "N/A", ""]:
-        result = {"value": None}
-        if period is not None:
-            result["period"] = period
-        return result
-    
-    # 分析に重要でないパターンのチェック
-    unimportant_patterns = [
-        "■支払い例", "■ローンのご案内", "提携ローン", "※ローンは一定要件該当者が対象",
-        "※金利は", "融資限度額", "事務手数料", "保証料", "適用される金利は融資実行時",
-        "お申込みの際には、お認印", "収入証明書", "本人確認書類", "運転免許証",
-        "健康保険証", "パスポート", "先着順販売のため販売済の場合",
-        "販売開始まで契約または予約の申し込み", "申し込み順位の確保につながる行為は一切できません",
-        "確定情報は新規分譲広告において明示", "物件データは第", "期以降の全販売対象住戸",
-        "のものを表記", "受付時間／", "定休日／", "受付場所／", "マンションギャラリー"
-    ]
-    
-    for pattern in unimportant_patterns:
-        if pattern in value:
-            result = {"value": None}
-            if period is not None:
-                result["period"] = period
-            return result
-    
-    # スラッシュ区切りで特徴を分割（前後の空白も含めて）
-    features = [f.strip() for f in re.split(r'\s*/\s*', value) if f.strip()]
-    if not features:
-        result = {"value": None}
-        if period is not None:
-            result["period"] = period
-        return result
-    
     # 構造化データの初期化
     structured_features = {
         "certifications": {},
@@ -3389,220 +3450,21 @@ def clean_feature_pickup_to_json(value: str, raw_key: str = "", period: Optional
     feature_tags = []
     
     for feature in features:
-        feature_lower = feature.lower()
-        
-        # 認証・評価書系
-        if "設計住宅性能評価書" in feature:
-            structured_features["certifications"]["design_performance_evaluation"] = True
-            feature_tags.append("design_performance_cert")
-        elif "建設住宅性能評価書" in feature:
-            structured_features["certifications"]["construction_performance_evaluation"] = True
-            feature_tags.append("construction_performance_cert")
-        elif "長期優良住宅認定通知書" in feature:
-            structured_features["certifications"]["long_term_excellent_housing"] = True
-            feature_tags.append("long_term_excellent")
-        elif "フラット３５" in feature or "フラット35" in feature:
-            structured_features["certifications"]["flat35_s"] = True
-            feature_tags.append("flat35_s")
-        elif "bels" in feature_lower or "省エネ基準適合認定書" in feature:
-            structured_features["certifications"]["bels"] = True
-            feature_tags.append("bels")
-        elif "瑕疵保証" in feature:
-            structured_features["certifications"]["defect_warranty"] = True
-            feature_tags.append("defect_warranty")
-        
-        # 建物仕様系
-        elif "２階建" in feature or "2階建" in feature:
-            structured_features["building_specs"]["stories"] = 2
-            feature_tags.append("2_story")
-        elif "３階建以上" in feature or "3階建以上" in feature:
-            structured_features["building_specs"]["stories"] = 3
-            feature_tags.append("3_story_plus")
-        elif "南向き" in feature:
-            structured_features["building_specs"]["orientation"] = "south"
-            feature_tags.append("south_facing")
-        elif "東南向き" in feature:
-            structured_features["building_specs"]["orientation"] = "southeast"
-            feature_tags.append("southeast_facing")
-        elif "全室南向き" in feature:
-            structured_features["building_specs"]["all_rooms_south"] = True
-            feature_tags.append("all_rooms_south")
-        elif "陽当り良好" in feature:
-            structured_features["building_specs"]["good_sunlight"] = True
-            feature_tags.append("good_sunlight")
-        
-        # LDK面積
-        elif "ＬＤＫ１５畳以上" in feature or "LDK15畳以上" in feature:
-            structured_features["building_specs"]["ldk_size_tatami"] = {"min": 15}
-            feature_tags.append("ldk_15tatami_plus")
-        elif "ＬＤＫ１８畳以上" in feature or "LDK18畳以上" in feature:
-            structured_features["building_specs"]["ldk_size_tatami"] = {"min": 18}
-            feature_tags.append("ldk_18tatami_plus")
-        elif "ＬＤＫ２０畳以上" in feature or "LDK20畳以上" in feature:
-            structured_features["building_specs"]["ldk_size_tatami"] = {"min": 20}
-            feature_tags.append("ldk_20tatami_plus")
-        
-        # 設備系 - キッチン
-        elif "システムキッチン" in feature:
-            structured_features["equipment"]["kitchen"].append("system")
-            feature_tags.append("system_kitchen")
-        elif "対面式キッチン" in feature:
-            structured_features["equipment"]["kitchen"].append("counter_facing")
-            feature_tags.append("counter_kitchen")
-        elif "ＩＨクッキングヒーター" in feature or "IHクッキングヒーター" in feature:
-            structured_features["equipment"]["kitchen"].append("ih_cooktop")
-            feature_tags.append("ih_cooktop")
-        elif "食器洗乾燥機" in feature:
-            structured_features["equipment"]["kitchen"].append("dishwasher")
-            feature_tags.append("dishwasher")
-        elif "浄水器" in feature:
-            structured_features["equipment"]["kitchen"].append("water_purifier")
-            feature_tags.append("water_purifier")
-        
-        # 設備系 - 浴室
-        elif "浴室乾燥機" in feature:
-            structured_features["equipment"]["bathroom"].append("dryer")
-            feature_tags.append("bathroom_dryer")
-        elif "浴室１坪以上" in feature or "浴室1坪以上" in feature:
-            structured_features["building_specs"]["bathroom_size_tsubo"] = {"min": 1}
-            feature_tags.append("bathroom_1tsubo_plus")
-        elif "浴室に窓" in feature:
-            structured_features["equipment"]["bathroom"].append("window")
-            feature_tags.append("bathroom_window")
-        elif "オートバス" in feature:
-            structured_features["equipment"]["bathroom"].append("auto_bath")
-            feature_tags.append("auto_bath")
-        
-        # 設備系 - 暖房・冷房
-        elif "床暖房" in feature:
-            structured_features["equipment"]["heating_cooling"].append("floor_heating")
-            feature_tags.append("floor_heating")
-        elif "省エネルギー対策" in feature:
-            structured_features["equipment"]["heating_cooling"].append("energy_saving")
-            feature_tags.append("energy_saving")
-        elif "省エネ給湯器" in feature:
-            structured_features["equipment"]["heating_cooling"].append("energy_saving_water_heater")
-            feature_tags.append("energy_saving_heater")
-        
-        # 設備系 - ユーティリティ
-        elif "オール電化" in feature:
-            structured_features["equipment"]["utilities"].append("all_electric")
-            feature_tags.append("all_electric")
-        elif "都市ガス" in feature:
-            structured_features["equipment"]["utilities"].append("city_gas")
-            feature_tags.append("city_gas")
-        elif "エレベーター" in feature:
-            structured_features["equipment"]["utilities"].append("elevator")
-            feature_tags.append("elevator")
-        elif "複層ガラス" in feature:
-            structured_features["equipment"]["utilities"].append("double_glazing")
-            feature_tags.append("double_glazing")
-        
-        # 設備系 - セキュリティ
-        elif "セキュリティ充実" in feature:
-            structured_features["equipment"]["security"].append("enhanced")
-            feature_tags.append("security_enhanced")
-        elif "ＴＶモニタ付インターホン" in feature or "TVモニタ付インターホン" in feature:
-            structured_features["equipment"]["security"].append("tv_intercom")
-            feature_tags.append("tv_intercom")
-        elif "スマートキー" in feature:
-            structured_features["equipment"]["security"].append("smart_key")
-            feature_tags.append("smart_key")
-        
-        # 立地・アクセス系
-        elif "スーパー 徒歩10分以内" in feature or "スーパー徒歩10分以内" in feature:
-            structured_features["location_access"]["supermarket_walk_min"] = {"max": 10}
-            feature_tags.append("supermarket_walk_10min")
-        elif "小学校 徒歩10分以内" in feature or "小学校徒歩10分以内" in feature:
-            structured_features["location_access"]["elementary_school_walk_min"] = {"max": 10}
-            feature_tags.append("school_walk_10min")
-        elif "駅まで平坦" in feature:
-            structured_features["location_access"]["station_flat_access"] = True
-            feature_tags.append("station_flat")
-        elif "閑静な住宅地" in feature:
-            structured_features["location_access"]["quiet_residential"] = True
-            feature_tags.append("quiet_area")
-        elif "緑豊かな住宅地" in feature:
-            structured_features["location_access"]["green_residential"] = True
-            feature_tags.append("green_area")
-        elif "２沿線以上利用可" in feature or "2沿線以上利用可" in feature:
-            structured_features["parking_transport"]["multiple_rail_lines"] = True
-            feature_tags.append("multiple_lines")
-        
-        # 土地特徴系
-        elif "土地50坪以上" in feature or "土地５０坪以上" in feature:
-            structured_features["land_features"]["area_tsubo"] = {"min": 50}
-            feature_tags.append("land_50tsubo_plus")
-        elif "角地" in feature:
-            structured_features["land_features"]["corner_lot"] = True
-            feature_tags.append("corner_lot")
-        elif "南側道路面す" in feature:
-            structured_features["land_features"]["south_facing_road"] = True
-            feature_tags.append("south_road")
-        elif "前道６ｍ以上" in feature or "前道6m以上" in feature:
-            structured_features["land_features"]["road_width_m"] = {"min": 6}
-            feature_tags.append("road_6m_plus")
-        elif "整形地" in feature:
-            structured_features["land_features"]["regular_shape"] = True
-            feature_tags.append("regular_shape")
-        elif "平坦地" in feature:
-            structured_features["land_features"]["flat_land"] = True
-            feature_tags.append("flat_land")
-        
-        # 駐車場・交通系
-        elif "駐車２台可" in feature or "駐車2台可" in feature:
-            structured_features["parking_transport"]["parking_capacity"] = 2
-            feature_tags.append("parking_2cars")
-        elif "駐車３台以上可" in feature or "駐車3台以上可" in feature:
-            structured_features["parking_transport"]["parking_capacity"] = 3
-            feature_tags.append("parking_3cars_plus")
-        
-        # 室内特徴系（複合パターンを先に処理）
-        elif "最上階角住戸" in feature:
-            structured_features["room_features"]["corner_unit"] = True
-            structured_features["room_features"]["top_floor"] = True
-            feature_tags.append("top_floor_corner")
-        elif "角住戸" in feature:
-            structured_features["room_features"]["corner_unit"] = True
-            feature_tags.append("corner_unit")
-        elif "最上階" in feature:
-            structured_features["room_features"]["top_floor"] = True
-            feature_tags.append("top_floor")
-        elif "全居室収納" in feature:
-            structured_features["room_features"]["all_rooms_storage"] = True
-            feature_tags.append("all_rooms_storage")
-        elif "ウォークインクローゼット" in feature:
-            structured_features["room_features"]["walk_in_closet"] = True
-            feature_tags.append("walk_in_closet")
-        elif "トイレ２ヶ所" in feature or "トイレ2ヶ所" in feature:
-            structured_features["room_features"]["toilets_count"] = 2
-            feature_tags.append("2_toilets")
-        elif "和室" in feature:
-            structured_features["room_features"]["japanese_room"] = True
-            feature_tags.append("japanese_room")
-        elif "ペット相談" in feature:
-            structured_features["room_features"]["pet_negotiable"] = True
-            feature_tags.append("pet_ok")
-        
-        # メンテナンス・リフォーム系
-        elif "内装リフォーム" in feature:
-            structured_features["maintenance"]["interior_reform"] = True
-            feature_tags.append("interior_reform")
-        elif "外装リフォーム" in feature:
-            structured_features["maintenance"]["exterior_reform"] = True
-            feature_tags.append("exterior_reform")
-        elif "内外装リフォーム" in feature:
-            structured_features["maintenance"]["full_reform"] = True
-            feature_tags.append("full_reform")
-        
-        # 価格・販売関連情報
-        elif "分譲時の価格帯" in feature:
-            feature_tags.append("original_sale_price")
+        rule_index = _match_feature_pickup_rule(feature)
+        if rule_index is not None:
+            _, tag, updates = FEATURE_PICKUP_RULES[rule_index]
+            for category, key, value in updates:
+                target = structured_features[category]
+                if isinstance(target.get(key), list):
+                    target[key].append(value)
+                else:
+                    target[key] = dict(value) if isinstance(value, dict) else value
+            feature_tags.append(tag)
         
         # その他の特徴をタグとして保存
         else:
             # 特殊文字を除去してタグ化
-            tag = re.sub(r'[^\w\d]', '_', feature).lower()
+            tag = RE_NON_WORD.sub('_', feature).lower()
             if tag and tag not in feature_tags:
                 feature_tags.append(tag)
     
@@ -3612,6 +3474,47 @@ def clean_feature_pickup_to_json(value: str, raw_key: str = "", period: Optional
         if category in structured_features:
             structured_features[category] = {k: v for k, v in structured_features[category].items() if v}
     
+    return structured_features, feature_tags
+
+def clean_feature_pickup_to_json(value: str, raw_key: str = "", period: Optional[int] = None) -> Dict[str, Any]:
+    """
+    特徴ピックアップをJSON形式で構造化
+    例: "土地50坪以上/角地/都市ガス" -> 構造化されたJSON
+    """
+    if not value or value.strip() == "":
+        result = {"value": None}
+        if period is not None:
+            result["period"] = period
+        return result
+    
+    value = value.strip()
+    
+    # 特徴ピックアップは長いリストになることがあるため、長さ制限をスキップ
+    # その他の無効データパターンのみチェック
+    if value.strip() in ["-", "－", "ー", "未定", "未設定", "なし", "無し", "N/A", ""]:
+        result = {"value": None}
+        if period is not None:
+            result["period"] = period
+        return result
+    
+    # 分析に重要でないパターンのチェック
+    if _UNIMPORTANT_MATCHER.contains_any(value):
+        result = {"value": None}
+        if period is not None:
+            result["period"] = period
+        return result
+    
+    # スラッシュ区切りで特徴を分割（前後の空白も含めて）
+    features = [f.strip() for f in RE_SLASH_SEP.split(value) if f.strip()]
+    if not features:
+        result = {"value": None}
+        if period is not None:
+            result["period"] = period
+        return result
+    
+    # 各項目を構造化データとタグに分類
+    structured_features, feature_tags = classify_feature_pickup(features)
+    
     # 期待される形式に合わせて、feature_tagsを日本語のままにする
     result = {
         "feature_tags": features,  # 元の日本語テキストをそのまま使用
@@ -3638,8 +3541,7 @@ def clean_rating_to_json(value: str, raw_key: str = "", period: Optional[int] =
     result = {}
     
     # 「X段階/Y段階中」のパターンをマッチ
-    rating_pattern = r'(\d+)段階/(\d+)段階中'
-    match = re.match(rating_pattern, value)
+    match = RE_RATING.match(value)
     
     if match:
         current = int(match.group(1))
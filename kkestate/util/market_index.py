@@ -0,0 +1,144 @@
+"""
+reinfolib の取引価格（reinfolib_estate）と suumo の掲載価格（estate_cleaned_numeric）の市区町村・種類・四半期ごとの集計（market_index テーブル）
+main/process/make_market_index.py で変更のあった四半期だけを再集計して入れ替え、分析（main/analyze/ana.py）や web は
+(citycode, property_type, year, quarter) の主キー、または (prefecture_code, year, quarter) のインデックスで集計済みの行を読み込む
+
+  - 種類は suumo の building_type（mansion, house, land）に揃える
+    （reinfolib の 中古マンション等 -> mansion、宅地(土地と建物) -> house、宅地(土地) -> land、農地・林地は対象外）
+  - 単価（円/m^2）は mansion は専有面積、house は延床面積（suumo は建物面積）、land は土地面積で割る
+    （reinfolib の土地は ㎡単価の列がある場合はその値）
+  - suumo は四半期内で最後の run（is_ref）の価格を使い、価格未定・面積のない物件は除く
+  - 集計は (citycode, property_type, year, quarter) の groupby で件数と 25% / 50% / 75% 点を一括で計算し、2つのソースを外部結合する
+
+例:
+    df_transaction = to_transaction_frame(df_estate)      # reinfolib_estate の行
+    df_listing     = to_listing_frame(df_suumo)           # make_numeric_frame で展開した suumo の run
+    df_market      = make_market_index(df_transaction, df_listing)
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Tuple
+
+
+# reinfolib_estate.property_type -> market_index.property_type（suumo の building_type）
+REINFOLIB_PROPERTY_TYPES: Dict[str, str] = {
+    "中古マンション等": "mansion",
+    "宅地(土地と建物)": "house",
+    "宅地(土地)":       "land",
+    "土地と建物":       "house",
+    "土地":             "land",
+}
+
+# suumo の building_type -> 単価の計算に使う面積の列（make_numeric_frame の列）
+LISTING_AREA_COLUMNS: Dict[str, str] = {
+    "mansion": "area_ms",
+    "house":   "area_building",
+    "land":    "area_land",
+}
+
+# 集計のキーと分位点（列名の接尾辞 -> 分位）
+MARKET_KEYS = ["citycode", "property_type", "year", "quarter"]
+MARKET_QUANTILES: Dict[str, float] = {"p25": 0.25, "p50": 0.50, "p75": 0.75}
+
+# market_index の列（prefecture_code は DB の生成列）
+MARKET_COLUMNS = MARKET_KEYS + \
+    ["n_transaction"] + [f"transaction_{x}" for x in MARKET_QUANTILES] + \
+    ["n_listing"]     + [f"listing_{x}"     for x in MARKET_QUANTILES]
+
+
+def _empty_frame() -> pd.DataFrame:
+    """
+    to_transaction_frame / to_listing_frame の0行の DataFrame
+    """
+    return pd.DataFrame({
+        "citycode": pd.Series(dtype=object), "property_type": pd.Series(dtype=object),
+        "year": pd.Series(dtype=int), "quarter": pd.Series(dtype=int), "price_per_sqm": pd.Series(dtype=float),
+    })
+
+def _to_float(values: pd.Series) -> np.ndarray:
+    """
+    数値の配列（float64、Int64 や numeric（Decimal）の欠損・数値以外は NaN）
+    """
+    return pd.to_numeric(values, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+
+def to_transaction_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    reinfolib_estate の行（municipality_code, property_type, year, period, transaction_price, area_sqm, floor_area_sqm, price_per_sqm）を
+    集計のキーと単価（price_per_sqm）の DataFrame に変換（対象外の種類・単価が求められない行は除く）
+    """
+    if df.shape[0] == 0:
+        return _empty_frame()
+    ptype = df["property_type"].astype(object).map(REINFOLIB_PROPERTY_TYPES)
+    area  = np.where(ptype == "house", _to_float(df["floor_area_sqm"]), _to_float(df["area_sqm"]))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = _to_float(df["transaction_price"]) / area
+    unit  = _to_float(df["price_per_sqm"])
+    value = np.where((ptype == "land") & (unit > 0), unit, value)
+    dfwk  = pd.DataFrame({
+        "citycode":      df["municipality_code"].astype(object).to_numpy(),
+        "property_type": ptype.to_numpy(),
+        "year":          df["year"].to_numpy(dtype=int),
+        "quarter":       df["period"].to_numpy(dtype=int),
+        "price_per_sqm": value,
+    })
+    return dfwk.loc[dfwk["citycode"].notna() & dfwk["property_type"].notna() & np.isfinite(value) & (value > 0)].reset_index(drop=True)
+
+def to_listing_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    suumo の run（citycode, building_type, timestamp と make_numeric_frame の price, area_ms, area_land, area_building）を
+    集計のキーと単価（price_per_sqm）の DataFrame に変換（価格未定（-1）・面積のない行は除く）
+    """
+    if df.shape[0] == 0:
+        return _empty_frame()
+    price = _to_float(df["price"])
+    area  = np.full(df.shape[0], np.nan)
+    for x, y in LISTING_AREA_COLUMNS.items():
+        area = np.where(df["building_type"] == x, _to_float(df[y]), area)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = price * 10000 / area
+    timestamp = pd.to_datetime(df["timestamp"])
+    dfwk = pd.DataFrame({
+        "citycode":      df["citycode"].astype(object).to_numpy(),
+        "property_type": df["building_type"].astype(object).to_numpy(),
+        "year":          timestamp.dt.year.to_numpy(dtype=int),
+        "quarter":       timestamp.dt.quarter.to_numpy(dtype=int),
+        "price_per_sqm": value,
+    })
+    return dfwk.loc[dfwk["citycode"].notna() & dfwk["property_type"].isin(list(LISTING_AREA_COLUMNS)) & (price > 0) & np.isfinite(value) & (value > 0)].reset_index(drop=True)
+
+def aggregate_market(df: pd.DataFrame, prefix: str) -> pd.DataFrame:
+    """
+    (citycode, property_type, year, quarter) ごとの件数（n_{prefix}）と単価の分位点（{prefix}_p25, {prefix}_p50, {prefix}_p75）
+
+    Args:
+        df (pd.DataFrame): to_transaction_frame / to_listing_frame の DataFrame
+        prefix (str): 列名の接頭辞（transaction, listing）
+    """
+    columns = MARKET_KEYS + [f"n_{prefix}"] + [f"{prefix}_{x}" for x in MARKET_QUANTILES]
+    if df.shape[0] == 0:
+        return pd.DataFrame(columns=columns)
+    group = df.groupby(MARKET_KEYS, sort=True)["price_per_sqm"]
+    dfwk  = group.quantile(list(MARKET_QUANTILES.values())).unstack()
+    dfwk.columns = [f"{prefix}_{x}" for x in MARKET_QUANTILES]
+    dfwk.insert(0, f"n_{prefix}", group.size())
+    return dfwk.reset_index()[columns]
+
+def make_market_index(df_transaction: pd.DataFrame, df_listing: pd.DataFrame) -> pd.DataFrame:
+    """
+    reinfolib と suumo の集計を外部結合した market_index の行（片方にしかない場合、もう片方の件数は0・分位点は NaN）
+    """
+    df = pd.merge(aggregate_market(df_transaction, "transaction"), aggregate_market(df_listing, "listing"), how="outer", on=MARKET_KEYS)
+    for x in ["n_transaction", "n_listing"]:
+        df[x] = df[x].fillna(0).astype(int)
+    for x in ["year", "quarter"]:
+        df[x] = df[x].astype(int)
+    return df.sort_values(MARKET_KEYS, ignore_index=True)[MARKET_COLUMNS]
+
+def quarter_range(year: int, quarter: int) -> Tuple[str, str]:
+    """
+    四半期の開始日と翌四半期の開始日（"YYYY-MM-DD"、SQL の timestamp >= 開始 and timestamp < 終了 に使う）
+    """
+    assert 1 <= quarter <= 4
+    start = pd.Timestamp(year=year, month=3 * (quarter - 1) + 1, day=1)
+    return start.strftime("%Y-%m-%d"), (start + pd.DateOffset(months=3)).strftime("%Y-%m-%d")
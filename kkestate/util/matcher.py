@@ -0,0 +1,162 @@
+"""
+複数キーワードの同時検索（Aho–Corasick法）
+登録したキーワード群を一度だけオートマトンに構築し、文字列を1回走査するだけで
+一致したキーワードのIDをすべて取得する。キーワード数が増えても1回の検索コストは
+文字列長にほぼ比例したままとなる
+"""
+
+import re
+from typing import Dict, Optional, List, Tuple
+
+
+# この文字数以下の文字列は読み飛ばしを行わずに走査する
+_SHORT_TEXT_LENGTH = 32
+
+class AhoCorasick:
+    """
+    Aho–Corasick法による複数キーワードマッチャー
+    キーワードのIDは登録順のインデックス（0始まり）
+
+    例:
+        matcher = AhoCorasick(["提携ローン", "保証料", "ローン"])
+        matcher.find_ids("提携ローンの保証料")  -> [0, 1, 2]
+        matcher.contains_any("システムキッチン")  -> False
+    """
+    def __init__(self, patterns: List[str], ignore_case: bool = False):
+        """
+        Args:
+            patterns (List[str]): キーワードのリスト（空文字列は不可）
+            ignore_case (bool): Trueの場合はキーワードと検索文字列を小文字化して比較する
+        """
+        assert isinstance(patterns, (list, tuple))
+        assert all(isinstance(x, str) and x != "" for x in patterns)
+        self.patterns = list(patterns)
+        self.ignore_case = ignore_case
+        # goto関数（ノード毎の 文字 -> 次ノード）、failure関数、ノード毎の出力ID、遷移表
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+        self._build()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _build(self):
+        """
+        トライ木を作成し、幅優先探索でfailureリンクと出力を設定する
+        """
+        outputs: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(self.patterns):
+            if self.ignore_case:
+                pattern = pattern.lower()
+            node = 0
+            for char in pattern:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append([])
+                    self._goto[node][char] = next_node
+                node = next_node
+            outputs[node].append(pattern_id)
+
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, next_node in self._goto[node].items():
+                queue.append(next_node)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[next_node] = fail
+                outputs[next_node].extend(outputs[fail])
+        self._output = [tuple(sorted(set(x))) for x in outputs]
+
+        # failureリンクを展開した遷移表（DFA）を作成し、走査時の failure 辿りを不要にする
+        # 遷移表に無い文字はルートへの遷移とみなす
+        self._delta: List[Dict[str, int]] = [None] * len(self._goto)
+        self._delta[0] = dict(self._goto[0])
+        for node in queue:
+            delta = dict(self._delta[self._fail[node]])
+            delta.update(self._goto[node])
+            self._delta[node] = delta
+
+        # ルートにいる間は、キーワードの先頭文字が現れる位置まで正規表現（C実装）で読み飛ばす
+        if len(self._delta[0]) > 0:
+            self._root_skip = re.compile("[" + "".join(re.escape(char) for char in sorted(self._delta[0])) + "]")
+        else:
+            self._root_skip = None
+
+    def _iter_outputs(self, text: str):
+        """
+        textを1回走査し、一致が発生したノードの出力IDタプルを順に返す
+        """
+        if self.ignore_case:
+            text = text.lower()
+        if self._root_skip is None:
+            return
+        delta, output = self._delta, self._output
+        if len(text) <= _SHORT_TEXT_LENGTH:
+            # 短い文字列は読み飛ばしの呼び出しコストの方が大きいため1文字ずつ遷移する
+            node = 0
+            for char in text:
+                node = delta[node].get(char, 0)
+                if output[node]:
+                    yield output[node]
+            return
+        skip = self._root_skip.search
+        node, i, length = 0, 0, len(text)
+        while i < length:
+            if node == 0:
+                match = skip(text, i)
+                if match is None:
+                    return
+                i = match.start()
+            node = delta[node].get(text[i], 0)
+            if output[node]:
+                yield output[node]
+            i += 1
+
+    def find_ids(self, text: str) -> List[int]:
+        """
+        textに含まれるキーワードのIDをすべて返す
+
+        Args:
+            text (str): 検索対象の文字列
+
+        Returns:
+            List[int]: 一致したキーワードIDの昇順リスト（重複なし）
+        """
+        if not text:
+            return []
+        matched = set()
+        for ids in self._iter_outputs(text):
+            matched.update(ids)
+        return sorted(matched)
+
+    def first_id(self, text: str) -> Optional[int]:
+        """
+        textに含まれるキーワードのうち最小のID（登録順で最優先のもの）を返す
+
+        Args:
+            text (str): 検索対象の文字列
+
+        Returns:
+            Optional[int]: 一致したキーワードIDの最小値、一致しない場合はNone
+        """
+        best = None
+        for ids in self._iter_outputs(text or ""):
+            if best is None or ids[0] < best:
+                best = ids[0]
+                if best == 0:
+                    break
+        return best
+
+    def contains_any(self, text: str) -> bool:
+        """
+        textにいずれかのキーワードが含まれるかを判定（最初の一致で走査を打ち切る）
+        """
+        for _ in self._iter_outputs(text or ""):
+            return True
+        return False
@@ -0,0 +1,257 @@
+"""
+処理段階（stage）ごとの処理時間・件数の計測
+スクリプトのメインループで HTTP / parse / DB読込 / クレンジング / DB書込 などの段階ごとに時間を記録し、
+一定間隔で件数・rows/sec・p50/p95 をログに出力する（任意でJSON Lines形式のメトリクスファイルにも出力）
+  - 処理時間は対数スケールのヒストグラム（1桁を10分割、1us-10000s）で保持するため、メモリは段階数に比例するのみ
+  - p50/p95 はヒストグラムのビンの上端で近似する（相対誤差 26% 以内）
+  - configure を呼んだ場合、終了時（sys.exit・例外を含む）に atexit で close する（最終のサマリーとメトリクスファイルの出力）
+
+例:
+    METRICS = StageMetrics("suumo", log_function=LOGGER.info)
+    METRICS.configure(interval=60, output="metrics.jsonl")
+    with METRICS.timer("db_read", n=len(df)):
+        df = DB.select_sql(...)
+    watch = METRICS.stopwatch()
+    html  = requests.get(url)
+    watch.lap("http")
+    soup  = bs4.BeautifulSoup(html.content, 'html.parser')
+    watch.lap("parse")
+    METRICS.count("success")
+    METRICS.report_if_due()
+    METRICS.close()
+"""
+
+import atexit
+import datetime
+import json
+import math
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, List, Callable
+
+
+# ヒストグラムのビン: [_HISTOGRAM_MIN * 10^(i/10), _HISTOGRAM_MIN * 10^((i+1)/10)) 秒
+_HISTOGRAM_MIN  = 1e-6
+_HISTOGRAM_BINS_PER_DECADE = 10
+_HISTOGRAM_SIZE = 100
+
+
+class LatencyHistogram:
+    """
+    処理時間 [秒] の対数スケールのヒストグラム
+    """
+    __slots__ = ("counts", "n", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * _HISTOGRAM_SIZE
+        self.n      = 0
+        self.total  = 0.0
+        self.max    = 0.0
+
+    def add(self, seconds: float):
+        if seconds > _HISTOGRAM_MIN:
+            index = min(int(math.log10(seconds / _HISTOGRAM_MIN) * _HISTOGRAM_BINS_PER_DECADE), _HISTOGRAM_SIZE - 1)
+        else:
+            index = 0
+        self.counts[index] += 1
+        self.n     += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """
+        分位点（ビンの上端、ただし最大値を超えない）
+
+        Args:
+            q (float): 0-1 の分位（0.5 の場合は p50）
+        """
+        if self.n == 0:
+            return 0.0
+        target = q * self.n
+        cumsum = 0
+        for i, count in enumerate(self.counts):
+            cumsum += count
+            if cumsum >= target and count > 0:
+                return min(_HISTOGRAM_MIN * 10 ** ((i + 1) / _HISTOGRAM_BINS_PER_DECADE), self.max)
+        return self.max
+
+
+class Stopwatch:
+    """
+    直前の lap（または作成時）からの経過時間を段階ごとに記録する
+    """
+    __slots__ = ("metrics", "time_last")
+
+    def __init__(self, metrics: "StageMetrics"):
+        self.metrics   = metrics
+        self.time_last = time.perf_counter()
+
+    def lap(self, stage: str, n: int = 1) -> float:
+        """
+        直前の lap からの経過時間を stage に記録
+
+        Returns:
+            float: 経過時間 [秒]
+        """
+        time_now = time.perf_counter()
+        elapsed  = time_now - self.time_last
+        self.time_last = time_now
+        self.metrics.add(stage, elapsed, n=n)
+        return elapsed
+
+    def reset(self):
+        """
+        記録せずに計測の起点を現在に戻す
+        """
+        self.time_last = time.perf_counter()
+
+
+class StageMetrics:
+    """
+    処理段階ごとの処理時間・件数とカウンタの集計
+    """
+    def __init__(self, name: str, log_function: Optional[Callable[[str], Any]] = print, interval: float = 60.0, output: Optional[str] = None):
+        """
+        Args:
+            name (str): 集計の名前（スクリプト名など）
+            log_function (Optional[Callable]): サマリーの出力先（例: LOGGER.info）、Noneの場合は出力しない
+            interval (float): report_if_due でサマリーを出力する間隔 [秒]
+            output (Optional[str]): メトリクスファイル（JSON Lines）、Noneの場合は出力しない
+        """
+        self.name         = name
+        self.log_function = log_function
+        self.interval     = interval
+        self.output       = output
+        self.stages: Dict[str, LatencyHistogram] = {}
+        self.rows:   Dict[str, int] = {}
+        self.counters: Dict[str, int] = {}
+        self.time_start  = time.perf_counter()
+        self.time_report = self.time_start
+        self.is_closed   = False
+        self.is_atexit   = False
+
+    def configure(self, interval: Optional[float] = None, output: Optional[str] = None):
+        """
+        コマンドライン引数などからサマリーの出力間隔・メトリクスファイルを設定し、終了時の close を atexit に登録
+        （途中の sys.exit や例外で終了した場合も最終のサマリーを出力する）
+        """
+        if interval is not None:
+            self.interval = interval
+        if output is not None:
+            self.output = output
+        if not self.is_atexit:
+            self.is_atexit = True
+            atexit.register(self.close)
+
+    def add(self, stage: str, seconds: float, n: int = 1):
+        """
+        stage の処理時間と件数を記録
+        """
+        histogram = self.stages.get(stage)
+        if histogram is None:
+            histogram = self.stages[stage] = LatencyHistogram()
+            self.rows[stage] = 0
+        histogram.add(seconds)
+        self.rows[stage] += n
+
+    @contextmanager
+    def timer(self, stage: str, n: int = 1):
+        """
+        with 文のブロックの処理時間を stage に記録（例外が発生した場合も記録する）
+        """
+        time_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - time_start, n=n)
+
+    def stopwatch(self) -> Stopwatch:
+        """
+        連続する処理を lap で区切って記録するストップウォッチを作成
+        """
+        return Stopwatch(self)
+
+    def count(self, name: str, n: int = 1):
+        """
+        カウンタを加算（例: success, failed, skipped）
+        """
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        開始からの累積の集計結果
+
+        Returns:
+            Dict[str, Any]: {"name", "datetime", "elapsed", "stages": stage -> {calls, rows, total_sec, rows_per_sec, p50, p95, max}, "counters"}
+        """
+        stages = {}
+        for stage, histogram in self.stages.items():
+            rows = self.rows[stage]
+            stages[stage] = {
+                "calls": histogram.n,
+                "rows": rows,
+                "total_sec": histogram.total,
+                "rows_per_sec": rows / histogram.total if histogram.total > 0 else None,
+                "p50": histogram.quantile(0.50),
+                "p95": histogram.quantile(0.95),
+                "max": histogram.max,
+            }
+        return {
+            "name": self.name,
+            "datetime": datetime.datetime.now().isoformat(timespec="seconds"),
+            "elapsed": time.perf_counter() - self.time_start,
+            "stages": stages,
+            "counters": dict(self.counters),
+        }
+
+    def format_summary(self, summary: Dict[str, Any]) -> List[str]:
+        """
+        集計結果をログ出力用の行に変換
+        """
+        elapsed = summary["elapsed"]
+        lines = [f"[METRICS] {self.name}: elapsed {elapsed:.1f} sec"]
+        for stage, x in sorted(summary["stages"].items(), key=lambda x: -x[1]["total_sec"]):
+            ratio = x["total_sec"] / elapsed * 100 if elapsed > 0 else 0.0
+            rows_per_sec = f"{x['rows_per_sec']:,.1f}" if x["rows_per_sec"] is not None else "-"
+            lines.append(
+                f"[METRICS]   {stage:<12} calls={x['calls']:>8,} rows={x['rows']:>10,} total={x['total_sec']:9.2f}s ({ratio:5.1f}%) "
+                f"rows/sec={rows_per_sec:>10} p50={x['p50'] * 1e3:9.2f}ms p95={x['p95'] * 1e3:9.2f}ms max={x['max'] * 1e3:9.2f}ms"
+            )
+        if len(summary["counters"]) > 0:
+            lines.append("[METRICS]   counters: " + ", ".join(f"{x}={y:,}" for x, y in sorted(summary["counters"].items())))
+        return lines
+
+    def report(self, is_final: bool = False):
+        """
+        サマリーをログ・メトリクスファイルに出力
+        """
+        summary = self.summary()
+        summary["final"] = is_final
+        if self.log_function is not None:
+            for line in self.format_summary(summary):
+                self.log_function(line)
+        if self.output is not None:
+            with open(self.output, "a", encoding="utf-8") as f:
+                f.write(json.dumps(summary, ensure_ascii=False) + "\n")
+        self.time_report = time.perf_counter()
+
+    def report_if_due(self) -> bool:
+        """
+        前回の出力から interval 秒以上経過している場合のみサマリーを出力
+
+        Returns:
+            bool: 出力した場合はTrue
+        """
+        if time.perf_counter() - self.time_report >= self.interval:
+            self.report()
+            return True
+        return False
+
+    def close(self):
+        """
+        最終のサマリーを出力（2回目以降は何もしない）
+        """
+        if not self.is_closed:
+            self.is_closed = True
+            self.report(is_final=True)
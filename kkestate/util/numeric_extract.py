@@ -0,0 +1,135 @@
+"""
+クレンジング済みJSON（estate_cleaned.value_cleaned）から価格・面積の数値を取り出す
+  - 価格は万円（price_man）、面積は m^2（area_sqm）に単位を揃えて estate_cleaned_numeric に保存する
+  - 分析（ana.py など）は JSON を展開せずに数値の列だけを1回のクエリで読み込める
+対象は NUMERIC_CLEANED_NAMES の項目のみ（その他面積のような複数値の項目は対象外）
+"""
+
+import json
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Optional, List, Tuple
+
+
+# 項目名（estate_mst_cleaned.name） -> 数値の種類
+NUMERIC_CLEANED_NAMES: Dict[str, str] = {
+    "価格":     "price",
+    "価格帯":   "price",
+    "専有面積": "area",
+    "土地面積": "area",
+    "建物面積": "area",
+    "面積":     "area",
+}
+
+# 単位 -> 万円 / m^2 への換算係数
+PRICE_UNIT_TO_MAN: Dict[str, float] = {"万円": 1.0, "円": 1e-4, "千円": 1e-1, "億円": 1e4}
+AREA_UNIT_TO_SQM:  Dict[str, float] = {"m^2": 1.0, "坪": 400 / 121}
+
+# estate_cleaned_numeric の列
+NUMERIC_COLUMNS = ["id_run", "id_key", "id_cleaned", "price_man", "area_sqm", "unit", "is_undefined"]
+
+# estate_mst_cleaned.name -> 分析用の列名（make_numeric_frame で run ごとに展開する項目）
+NUMERIC_NAMES = {
+    "価格":     "price",
+    "専有面積": "area_ms",
+    "土地面積": "area_land",
+    "建物面積": "area_building",
+}
+
+
+def extract_numeric_value(cleaned_name: str, value_cleaned: Any) -> Optional[Dict[str, Any]]:
+    """
+    1値のクレンジング済みJSONから数値を取り出す
+
+    Args:
+        cleaned_name (str): 項目名（例: "価格", "専有面積"）
+        value_cleaned (Any): クレンジング済みJSON（dict または JSON文字列）
+
+    Returns:
+        Optional[Dict[str, Any]]: {"price_man", "area_sqm", "unit", "is_undefined"}、数値も未定フラグもない場合はNone
+            例: ("価格", {"value": 3980, "unit": "万円"}) -> {"price_man": 3980.0, "area_sqm": None, "unit": "万円", "is_undefined": False}
+            例: ("専有面積", {"value": 20, "unit": "坪"}) -> {"price_man": None, "area_sqm": 66.11..., "unit": "坪", "is_undefined": False}
+    """
+    kind = NUMERIC_CLEANED_NAMES.get(cleaned_name)
+    if kind is None:
+        return None
+    if isinstance(value_cleaned, str):
+        try:
+            value_cleaned = json.loads(value_cleaned)
+        except json.JSONDecodeError:
+            return None
+    if not isinstance(value_cleaned, dict):
+        return None
+    is_undefined = value_cleaned.get("is_undefined") == True
+    unit  = value_cleaned.get("unit")
+    value = value_cleaned.get("value")
+    dict_unit = PRICE_UNIT_TO_MAN if kind == "price" else AREA_UNIT_TO_SQM
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or unit not in dict_unit:
+        value = None
+    else:
+        value = float(value) * dict_unit[unit]
+    if value is None and not is_undefined:
+        return None
+    return {
+        "price_man": value if kind == "price" else None,
+        "area_sqm":  value if kind == "area"  else None,
+        "unit": unit if isinstance(unit, str) else None,
+        "is_undefined": is_undefined,
+    }
+
+def extract_numeric_frame(df: pd.DataFrame, value_column: str = "value_cleaned", name_column: str = "name") -> pd.DataFrame:
+    """
+    estate_cleaned の行（id_run, id_key, id_cleaned, 項目名, value_cleaned）から estate_cleaned_numeric の行を作成
+
+    Args:
+        df (pd.DataFrame): id_run, id_key, id_cleaned, name_column, value_column を持つ DataFrame
+
+    Returns:
+        pd.DataFrame: NUMERIC_COLUMNS の列を持つ DataFrame（数値のない行は含まない）
+    """
+    if df.shape[0] == 0:
+        return pd.DataFrame(columns=NUMERIC_COLUMNS)
+    df   = df.loc[df[name_column].isin(list(NUMERIC_CLEANED_NAMES.keys()))]
+    list_row: List[Tuple] = []
+    for id_run, id_key, id_cleaned, name, value in df[["id_run", "id_key", "id_cleaned", name_column, value_column]].itertuples(index=False):
+        numeric = extract_numeric_value(name, value)
+        if numeric is not None:
+            list_row.append((id_run, id_key, id_cleaned, numeric["price_man"], numeric["area_sqm"], numeric["unit"], numeric["is_undefined"]))
+    dfwk = pd.DataFrame(list_row, columns=NUMERIC_COLUMNS)
+    for x in ["price_man", "area_sqm"]:
+        dfwk[x] = dfwk[x].astype(float)
+    return dfwk
+
+def make_numeric_frame(df_numeric: pd.DataFrame, df_run: pd.DataFrame) -> pd.DataFrame:
+    """
+    estate_cleaned_numeric の行（id_run, id_run_ref, id_key, name, price_man, area_sqm, is_undefined）を run ごとの列に展開
+    同じ項目が複数ある場合（期別など）は参照先の run が新しいものを使う。価格未定は -1
+    """
+    assert isinstance(df_numeric, pd.DataFrame)
+    assert isinstance(df_run,     pd.DataFrame)
+    df = df_numeric.sort_values(["id_run", "id_run_ref", "id_key"]).drop_duplicates(["id_run", "name"], keep="last")
+    df = df.assign(value=np.where(df["name"] == "価格", df["price_man"], df["area_sqm"]).astype(float))
+    df.loc[(df["name"] == "価格") & (df["is_undefined"] == True), "value"] = -1
+    df = df.pivot(index="id_run", columns="name", values="value").rename(columns=NUMERIC_NAMES)
+    df = df.reindex(columns=list(NUMERIC_NAMES.values())).reset_index()
+    return pd.merge(df_run, df, how="left", on="id_run")
+
+def to_numeric_insert_sql(id_run: int, id_key: int, id_cleaned: int, numeric: Dict[str, Any]) -> str:
+    """
+    estate_cleaned_numeric への UPSERT 文を作成（save_cleaned_data の INSERT と同じトランザクションで実行する）
+    """
+    def _sql(x):
+        if x is None:
+            return "NULL"
+        if isinstance(x, bool):
+            return "TRUE" if x else "FALSE"
+        if isinstance(x, str):
+            return "'" + x.replace("'", "''") + "'"
+        return repr(float(x))
+    return (
+        f"INSERT INTO estate_cleaned_numeric (id_run, id_key, id_cleaned, price_man, area_sqm, unit, is_undefined) "
+        f"VALUES ({id_run}, {id_key}, {id_cleaned}, {_sql(numeric['price_man'])}, {_sql(numeric['area_sqm'])}, {_sql(numeric['unit'])}, {_sql(numeric['is_undefined'])}) "
+        f"ON CONFLICT (id_run, id_key) DO UPDATE SET "
+        f"id_cleaned = EXCLUDED.id_cleaned, price_man = EXCLUDED.price_man, area_sqm = EXCLUDED.area_sqm, "
+        f"unit = EXCLUDED.unit, is_undefined = EXCLUDED.is_undefined"
+    )
@@ -13,8 +13,20 @@
 - 建ぺい率・容積率パーサー (building_coverage_parser)
 """
 
-import re
 from typing import Dict, Any, Optional, List, Tuple
+from .patterns import (
+    AREA_PATTERNS, CITY_PATTERNS, HOKKAIDO_OFFICE_PATTERNS, PARKING_FEE_PATTERNS,
+    PARKING_RANGE_PATTERNS, PREFECTURE_PATTERNS, RE_ADDRESS_GUN, RE_ADDRESS_WARD,
+    RE_BUILDING_STRUCTURE_1, RE_BUILDING_STRUCTURE_2, RE_BUILDING_STRUCTURE_3, RE_BUILDING_STRUCTURE_4,
+    RE_BUILDING_STRUCTURE_5, RE_BUILDING_STRUCTURE_6, RE_BUILDING_STRUCTURE_7, RE_COVERAGE_1,
+    RE_COVERAGE_2, RE_COVERAGE_3, RE_COVERAGE_4, RE_COVERAGE_5,
+    RE_COVERAGE_6, RE_COVERAGE_7, RE_COVERAGE_8, RE_COVERAGE_9,
+    RE_EXTERIOR_MATERIAL, RE_FACILITY_DISTANCE_ONLY, RE_FACILITY_INFO, RE_FACILITY_WITH_CATEGORY,
+    RE_FLOOR_STRUCTURE, RE_LAND_USE_PREFIX, RE_NOTE_TAIL, RE_NOTE_TAIL_BLOCK,
+    RE_PARKING_ZERO_YEN, RE_PARTIAL_STRUCTURE, RE_PRICE_MAN_DECIMAL, RE_PRICE_WITH_UNIT,
+    RE_REFORM_DATE, RE_REFORM_INTERIOR, RE_REFORM_OTHER, RE_REFORM_WATER,
+    RE_TABS, RE_ZENKAKU_PAREN_CONTENT, TOWN_VILLAGE_PATTERNS
+)
 
 
 # ============================================================================
@@ -51,19 +63,12 @@ def parse_address_structure(address: str) -> Optional[Dict[str, Any]]:
         "remaining": None
     }
     
-    # 都道府県パターン
-    pref_patterns = [
-        r'^(東京都)',
-        r'^(北海道)', 
-        r'^(京都府|大阪府)',
-        r'^(.{2,3}県)'
-    ]
-    
     prefecture = None
     remaining = address
     
-    for pattern in pref_patterns:
-        match = re.match(pattern, address)
+    # 都道府県パターン
+    for pattern in PREFECTURE_PATTERNS:
+        match = pattern.match(address)
         if match:
             prefecture = match.group(1)
             remaining = address[len(prefecture):]
@@ -76,7 +81,7 @@ def parse_address_structure(address: str) -> Optional[Dict[str, Any]]:
     
     # 東京都の特別区処理
     if prefecture == "東京都":
-        special_ward_match = re.match(r'^(.+?区)', remaining)
+        special_ward_match = RE_ADDRESS_WARD.match(remaining)
         if special_ward_match:
             result["secondary_division"] = special_ward_match.group(1)
             result["secondary_type"] = "特別区"
@@ -85,12 +90,8 @@ def parse_address_structure(address: str) -> Optional[Dict[str, Any]]:
     
     # 北海道の支庁・振興局処理
     if prefecture == "北海道":
-        office_patterns = [
-            r'^(.+?支庁)',
-            r'^(.+?振興局)'
-        ]
-        for pattern in office_patterns:
-            office_match = re.match(pattern, remaining)
+        for pattern in HOKKAIDO_OFFICE_PATTERNS:
+            office_match = pattern.match(remaining)
             if office_match:
                 result["secondary_division"] = office_match.group(1)
                 result["secondary_type"] = "支庁・振興局"
@@ -98,19 +99,15 @@ def parse_address_structure(address: str) -> Optional[Dict[str, Any]]:
                 break
     
     # 郡の処理（郡 -> 町/村）
-    gun_match = re.match(r'^(.+?郡)', remaining)
+    gun_match = RE_ADDRESS_GUN.match(remaining)
     if gun_match:
         result["secondary_division"] = gun_match.group(1)
         result["secondary_type"] = "郡"
         remaining = remaining[len(result["secondary_division"]):]
         
         # 郡の下の町・村を抽出
-        town_village_patterns = [
-            r'^(.+?町)',
-            r'^(.+?村)'
-        ]
-        for pattern in town_village_patterns:
-            tv_match = re.match(pattern, remaining)
+        for pattern in TOWN_VILLAGE_PATTERNS:
+            tv_match = pattern.match(remaining)
             if tv_match:
                 result["tertiary_division"] = tv_match.group(1)
                 result["tertiary_type"] = "町" if "町" in tv_match.group(1) else "村"
@@ -118,15 +115,8 @@ def parse_address_structure(address: str) -> Optional[Dict[str, Any]]:
                 break
     else:
         # 市区町村の処理（郡以外）
-        city_patterns = [
-            r'^(.+?市)',
-            r'^(.+?区)',  # 政令指定都市の区
-            r'^(.+?町)',  # 町（単独）
-            r'^(.+?村)'   # 村（単独）
-        ]
-        
-        for pattern in city_patterns:
-            city_match = re.match(pattern, remaining)
+        for pattern in CITY_PATTERNS:
+            city_match = pattern.match(remaining)
             if city_match:
                 division = city_match.group(1)
                 result["secondary_division"] = division
@@ -290,8 +280,7 @@ def parse_floor_structure_to_json(value: str, period: Optional[int] = None) -> D
     value = value.strip()
     
     # 基本パターン: {所在階}階/{構造}{総階数}階{地下情報}建{オプション}
-    pattern = r'^(\d+)階/(.+?)(\d+)階(?:地下(\d+)階)?建(.*)$'
-    match = re.match(pattern, value)
+    match = RE_FLOOR_STRUCTURE.match(value)
     
     if not match:
         # パースできない場合は元の値を保持
@@ -318,7 +307,7 @@ def parse_floor_structure_to_json(value: str, period: Optional[int] = None) -> D
     
     # 一部構造の処理
     if "一部" in option_part:
-        partial_match = re.search(r'一部(.+?)(?:$|\s)', option_part)
+        partial_match = RE_PARTIAL_STRUCTURE.search(option_part)
         if partial_match:
             partial_structure = normalize_structure_code(partial_match.group(1))
             result["partial_structure"] = partial_structure
@@ -354,32 +343,25 @@ def parse_building_structure_to_json(value: str, period: Optional[int] = None) -
     # 複数のパターンを試行（具体的なパターンから先に試行）
     
     # パターン1: X階/構造Y階建 形式（物件の階数が先頭にある）- 具体的パターンのため先に評価
-    pattern1 = r'^(\d+)階/(.+?)(\d+)階(?:地下(\d+)階)?建.*?$'
-    match1 = re.match(pattern1, value)
+    match1 = RE_BUILDING_STRUCTURE_1.match(value)
     
     # パターン2: 基本パターン {構造}{数字}階{地下情報}建{追加情報}
-    pattern2 = r'^(.+?)(\d+)階(?:地下(\d+)階)?建.*?$'
-    match2 = re.match(pattern2, value)
+    match2 = RE_BUILDING_STRUCTURE_2.match(value)
     
     # パターン3: 地下から始まるパターン（地上X階　構造）
-    pattern3 = r'^地上(\d+)階.*?(.+)$'
-    match3 = re.match(pattern3, value)
+    match3 = RE_BUILDING_STRUCTURE_3.match(value)
     
     # パターン4: 構造：xxx 地上階：x階 形式
-    pattern4 = r'^構造：(.+?)\s+工法：.*?\s+地上階：(\d+)階.*?$'
-    match4 = re.match(pattern4, value)
+    match4 = RE_BUILDING_STRUCTURE_4.match(value)
     
     # パターン5: 構造/地上x階 形式
-    pattern5 = r'^(.+?)/地上(\d+)階.*?$'
-    match5 = re.match(pattern5, value)
+    match5 = RE_BUILDING_STRUCTURE_5.match(value)
     
     # パターン6: 構造　地上x階 形式（全角スペース）
-    pattern6 = r'^(.+?)\u3000地上(\d+)階.*?$'
-    match6 = re.match(pattern6, value)
+    match6 = RE_BUILDING_STRUCTURE_6.match(value)
     
     # パターン7: 構造、x階建 形式
-    pattern7 = r'^(.+?)、\s*(\d+)階建.*?$'
-    match7 = re.match(pattern7, value)
+    match7 = RE_BUILDING_STRUCTURE_7.match(value)
     
     structure_part = None
     total_floors = None
@@ -440,7 +422,7 @@ def parse_building_structure_to_json(value: str, period: Optional[int] = None) -
     
     # 一部構造の処理（例: "木造2階地下1階建一部RC"）
     if "一部" in value:
-        partial_match = re.search(r'一部(.+?)(?:$|\s)', value)
+        partial_match = RE_PARTIAL_STRUCTURE.search(value)
         if partial_match:
             partial_structure = normalize_structure_code(partial_match.group(1))
             result["partial_structure"] = partial_structure
@@ -448,13 +430,13 @@ def parse_building_structure_to_json(value: str, period: Optional[int] = None) -
     # その他の詳細情報がある場合はnoteに保存
     extra_info = ""
     if "（" in value and "）" in value:
-        bracket_content = re.findall(r'（(.+?)）', value)
+        bracket_content = RE_ZENKAKU_PAREN_CONTENT.findall(value)
         if bracket_content:
             extra_info = "、".join(bracket_content)
     
     # 外装材などの詳細情報
     if any(keyword in value for keyword in ["サイディング", "シングル", "タイル", "モルタル", "リシン"]):
-        exterior_match = re.search(r'(サイディング貼|アスファルトシングル葺|タイル貼|モルタル塗|リシン掻落)', value)
+        exterior_match = RE_EXTERIOR_MATERIAL.search(value)
         if exterior_match:
             if extra_info:
                 extra_info += "、" + exterior_match.group(1)
@@ -692,7 +674,7 @@ def parse_reform_to_json(value: str, period: Optional[int] = None) -> Dict[str,
     
     # 完了日付の抽出
     completion_date = None
-    date_match = re.search(r'(\d{4})年(\d{1,2})月(?:(?:完了)|(?:リフォーム完了))', value)
+    date_match = RE_REFORM_DATE.search(value)
     if date_match:
         year = int(date_match.group(1))
         month = int(date_match.group(2))
@@ -709,19 +691,19 @@ def parse_reform_to_json(value: str, period: Optional[int] = None) -> Dict[str,
     }
     
     # 水回り設備交換の抽出
-    water_match = re.search(r'水回り設備交換[：:]([^　]+)', value)
+    water_match = RE_REFORM_WATER.search(value)
     if water_match:
         water_items = water_match.group(1).replace('・', ',').split(',')
         reform_areas["water_facilities"] = [item.strip() for item in water_items if item.strip()]
     
     # 内装リフォームの抽出
-    interior_match = re.search(r'内装リフォーム[：:]([^　※]+)', value)
+    interior_match = RE_REFORM_INTERIOR.search(value)
     if interior_match:
         interior_items = interior_match.group(1).replace('・', ',').split(',')
         reform_areas["interior"] = [item.strip() for item in interior_items if item.strip()]
     
     # その他の抽出
-    other_match = re.search(r'その他[：:]([^※]+)', value)
+    other_match = RE_REFORM_OTHER.search(value)
     if other_match:
         other_items = other_match.group(1).replace('・', ',').replace('/', ',').split(',')
         reform_areas["other"] = [item.strip() for item in other_items if item.strip()]
@@ -729,7 +711,7 @@ def parse_reform_to_json(value: str, period: Optional[int] = None) -> Dict[str,
     # 注記の抽出
     note = None
     if "※" in value:
-        note_match = re.search(r'※(.+)$', value)
+        note_match = RE_NOTE_TAIL.search(value)
         if note_match:
             note = note_match.group(1).strip()
     
@@ -934,7 +916,7 @@ def parse_land_use_to_json(value: str, period: Optional[int] = None) -> Dict[str
     
     # 括弧内の情報を抽出
     if "（" in value and "）" in value:
-        bracket_matches = re.findall(r'（(.+?)）', value)
+        bracket_matches = RE_ZENKAKU_PAREN_CONTENT.findall(value)
         if bracket_matches:
             note_parts = []
             for match in bracket_matches:
@@ -944,16 +926,16 @@ def parse_land_use_to_json(value: str, period: Optional[int] = None) -> Dict[str
     
     # ※記号での注記
     if "※" in value:
-        note_match = re.search(r'※(.+)$', value)
+        note_match = RE_NOTE_TAIL.search(value)
         if note_match:
             if note:
                 note += "、" + note_match.group(1)
             else:
                 note = note_match.group(1)
-            clean_value = re.sub(r'※.+$', '', clean_value)
+            clean_value = RE_NOTE_TAIL_BLOCK.sub('', clean_value)
     
     # 「地目：」プレフィックスの除去
-    clean_value = re.sub(r'^地目：', '', clean_value)
+    clean_value = RE_LAND_USE_PREFIX.sub('', clean_value)
     
     clean_value = clean_value.strip()
     
@@ -1157,18 +1139,8 @@ def parse_surrounding_facilities_to_json(value: str, period: Optional[int] = Non
         "facilities": []
     }
     
-    # 施設パターンの正規表現
-    # パターン1: カテゴリ 施設名：徒歩X分（YYYｍ）
-    pattern1 = r'([^\s]+)\s+([^：]+)：徒歩(\d+)分[（(](\d+)(?:ｍ|m)[）)]'
-    
-    # パターン2: カテゴリ 施設名：徒歩X分（YYYｍ）※備考
-    pattern2 = r'([^\s]+)\s+([^：]+)：徒歩(\d+)分[（(](\d+)(?:ｍ|m)[）)]※?([^※]*?)(?=\s+[^\s]+\s+|$)'
-    
-    # パターン3: 施設名まで数値単位（カテゴリなし、徒歩時間なし）
-    pattern3 = r'^([^まで]+)まで(\d+)(?:ｍ|m)$'
-    
-    # パターン3の単独チェック（「施設名まで数値m」）
-    pattern3_match = re.match(pattern3, value)
+    # 「施設名まで数値m」の単独チェック（カテゴリなし、徒歩時間なし）
+    pattern3_match = RE_FACILITY_DISTANCE_ONLY.match(value)
     if pattern3_match:
         name = pattern3_match.group(1).strip()
         distance = int(pattern3_match.group(2))
@@ -1184,7 +1156,7 @@ def parse_surrounding_facilities_to_json(value: str, period: Optional[int] = Non
     else:
         # 全体を分割して処理（複数施設が連続している場合）
         # タブ文字で区切られた施設単位で分割
-        segments = re.split(r'\t+', value)
+        segments = RE_TABS.split(value)
         
         # ペアで処理（カテゴリ + 施設情報）
         i = 0
@@ -1206,7 +1178,7 @@ def parse_surrounding_facilities_to_json(value: str, period: Optional[int] = Non
                 facility_info = segments[i + 1].strip()
                 
                 # パターンマッチング（施設名：徒歩X分（YYYｍ））
-                facility_match = re.match(r'([^：]+)：徒歩(\d+)分[（(](\d+)(?:ｍ|m)[）)]', facility_info)
+                facility_match = RE_FACILITY_INFO.match(facility_info)
                 if facility_match:
                     name = facility_match.group(1).strip()
                     walking_time = int(facility_match.group(2))
@@ -1230,10 +1202,11 @@ def parse_surrounding_facilities_to_json(value: str, period: Optional[int] = Non
                 i += 2  # カテゴリと施設情報の両方を処理したので2つ進む
             else:
                 # 単独セグメントの従来パターンマッチング
-                matches = re.findall(pattern1, segment)
+                # パターン: カテゴリ 施設名：徒歩X分（YYYｍ）
+                matches = RE_FACILITY_WITH_CATEGORY.findall(segment)
                 if not matches:
                     # より詳細なパターンで再試行
-                    matches = re.findall(r'([^\s]+)\s+([^：]+)：徒歩(\d+)分[（(](\d+)(?:ｍ|m)[）)]', segment)
+                    matches = RE_FACILITY_WITH_CATEGORY.findall(segment)
                 
                 for match in matches:
                     category = match[0].strip()
@@ -1418,21 +1391,14 @@ def parse_parking_to_json(value: str, period: Optional[int] = None) -> Dict[str,
         if "料金無" in value or "無料" in value:
             result["value"] = 0
             result["unit"] = "円"
-        elif re.search(r'(?<!\d)0円(?!\d)', value):  # 前後に数字がない0円のみマッチ
+        elif RE_PARKING_ZERO_YEN.search(value):  # 前後に数字がない0円のみマッチ
             result["value"] = 0
             result["unit"] = "円"
         else:
             # 範囲パターンのチェック（例: 6000円～1万円）
-            range_patterns = [
-                (r'(\d+)万(\d+)円～(\d+)万(\d+)円', 'man_en_man_en'),           # 1万6761円～2万951円
-                (r'(\d+(?:,\d{3})*(?:\.\d+)?)円～(\d+)万(\d+)円', 'en_man_en'),   # 6000円～1万2000円
-                (r'(\d+(?:,\d{3})*(?:\.\d+)?)円～(\d+)万円', 'en_man'),            # 6000円～1万円
-                (r'(\d+(?:,\d{3})*(?:\.\d+)?)円～(\d+(?:,\d{3})*(?:\.\d+)?)円', 'en_en'), # 4500円～6000円
-            ]
-            
             range_found = False
-            for pattern, pattern_type in range_patterns:
-                range_match = re.search(pattern, value)
+            for pattern, pattern_type in PARKING_RANGE_PATTERNS:
+                range_match = pattern.search(value)
                 if range_match:
                     if pattern_type == 'man_en_man_en':
                         # 1万6761円～2万951円
@@ -1467,14 +1433,8 @@ def parse_parking_to_json(value: str, period: Optional[int] = None) -> Dict[str,
             
             if not range_found:
                 # 金額パターンの抽出（優先順位順）
-                fee_patterns = [
-                    (r'(\d+)万(\d+)円', 'man_en'),   # 1万2000円
-                    (r'(\d+)万円', 'man'),           # 1万円  
-                    (r'(\d+)円', 'en')               # 6000円
-                ]
-                
-                for pattern, pattern_type in fee_patterns:
-                    fee_match = re.search(pattern, value)
+                for pattern, pattern_type in PARKING_FEE_PATTERNS:
+                    fee_match = pattern.search(value)
                     if fee_match:
                         if pattern_type == 'man_en':
                             # 万円+円のパターン
@@ -1505,14 +1465,9 @@ def parse_parking_to_json(value: str, period: Optional[int] = None) -> Dict[str,
             result["unit"] = "円"
         else:
             # 料金の抽出
-            fee_patterns = [
-                (r'(\d+)万(\d+)円', 'man_en'),   # 1万2000円
-                (r'(\d+)万円', 'man'),           # 3万円  
-                (r'(\d+)円', 'en')               # 6000円
-            ]
             
-            for pattern, pattern_type in fee_patterns:
-                fee_match = re.search(pattern, value)
+            for pattern, pattern_type in PARKING_FEE_PATTERNS:
+                fee_match = pattern.search(value)
                 if fee_match:
                     if pattern_type == 'man_en':
                         man = int(fee_match.group(1))
@@ -1535,14 +1490,9 @@ def parse_parking_to_json(value: str, period: Optional[int] = None) -> Dict[str,
         result["location"] = "機械式"
         
         # 料金の抽出（複数料金の場合は最初の値を使用）
-        fee_patterns = [
-            (r'(\d+)万(\d+)円', 'man_en'),   # 1万2000円
-            (r'(\d+)万円', 'man'),           # 1万円  
-            (r'(\d+)円', 'en')               # 12700円
-        ]
         
-        for pattern, pattern_type in fee_patterns:
-            fee_match = re.search(pattern, value)
+        for pattern, pattern_type in PARKING_FEE_PATTERNS:
+            fee_match = pattern.search(value)
             if fee_match:
                 if pattern_type == 'man_en':
                     man = int(fee_match.group(1))
@@ -1707,7 +1657,7 @@ def _extract_price(price_text: str) -> Optional[Dict[str, Any]]:
         return None
     
     # 価格パターンのマッチング
-    price_match = re.search(r'(\d+(?:\.\d+)?)万円', price_text)
+    price_match = RE_PRICE_MAN_DECIMAL.search(price_text)
     if price_match:
         return {
             "value": float(price_match.group(1)),
@@ -1715,7 +1665,7 @@ def _extract_price(price_text: str) -> Optional[Dict[str, Any]]:
         }
     
     # その他の価格パターン
-    price_match = re.search(r'(\d+(?:\.\d+)?)(円|千円|億円)', price_text)
+    price_match = RE_PRICE_WITH_UNIT.search(price_text)
     if price_match:
         return {
             "value": float(price_match.group(1)),
@@ -1734,22 +1684,10 @@ def _extract_area(area_text: str) -> Optional[Dict[str, Any]]:
         return None
     
     # 面積パターンのマッチング (m2, ㎡, 平米, 坪)
-    area_patterns = [
-        r'(\d+(?:\.\d+)?)m2',
-        r'(\d+(?:\.\d+)?)㎡',
-        r'(\d+(?:\.\d+)?)平米',
-        r'(\d+(?:\.\d+)?)坪'
-    ]
-    
-    for pattern in area_patterns:
-        area_match = re.search(pattern, area_text)
+    for pattern, unit in AREA_PATTERNS:
+        area_match = pattern.search(area_text)
         if area_match:
             value = float(area_match.group(1))
-            if '坪' in pattern:
-                unit = "坪"
-            else:
-                unit = "m2"
-            
             return {
                 "value": value,
                 "unit": unit
@@ -1973,8 +1911,7 @@ def parse_building_coverage_to_json(value: str, period: Optional[int] = None) ->
     value = value.strip()
     
     # パターン1: 数字％・数字％ 形式（シンプルな2値のみ）
-    pattern1 = r'^(\d+(?:\.\d+)?)％・(\d+(?:\.\d+)?)％$'
-    match1 = re.search(pattern1, value)
+    match1 = RE_COVERAGE_1.search(value)
     
     if match1:
         building_coverage = float(match1.group(1))
@@ -1989,8 +1926,7 @@ def parse_building_coverage_to_json(value: str, period: Optional[int] = None) ->
         return result
     
     # パターン2: 建ペい率：XX％、容積率：YY％ 形式（建蔽率の表記とコロンなしも対応）
-    pattern2 = r'建(?:ペ|ぺ|蔽)い?率[：:]?(\d+(?:\.\d+)?)[％%](?:[\(（][^）\)]*[\)）]|[・･]\d+(?:\.\d+)?[％%])*[、,，\u3000].*?容積率[：:]?(\d+(?:\.\d+)?)[％%]'
-    match2 = re.search(pattern2, value)
+    match2 = RE_COVERAGE_2.search(value)
     
     if match2:
         building_coverage = float(match2.group(1))
@@ -2005,8 +1941,7 @@ def parse_building_coverage_to_json(value: str, period: Optional[int] = None) ->
         return result
     
     # パターン3: 建ぺい率：XX％/容積率：YY％ 形式（括弧付きも対応）
-    pattern3 = r'建(?:ペ|ぺ|蔽)い?率[：:](\d+(?:\.\d+)?)％(?:[\(（][^）\)]*[\)）])?[／/]容積率[：:](\d+(?:\.\d+)?)％'
-    match3 = re.search(pattern3, value)
+    match3 = RE_COVERAGE_3.search(value)
     
     if match3:
         building_coverage = float(match3.group(1))
@@ -2021,8 +1956,7 @@ def parse_building_coverage_to_json(value: str, period: Optional[int] = None) ->
         return result
     
     # パターン4: 建ぺい率：XX/容積率：YY 形式（％記号なし）
-    pattern4 = r'建(?:ペ|ぺ|蔽)い?率[：:](\d+(?:\.\d+)?)[／/]容積率[：:](\d+(?:\.\d+)?)'
-    match4 = re.search(pattern4, value)
+    match4 = RE_COVERAGE_4.search(value)
     
     if match4:
         building_coverage = float(match4.group(1))
@@ -2037,8 +1971,7 @@ def parse_building_coverage_to_json(value: str, period: Optional[int] = None) ->
         return result
     
     # パターン5: 建ぺい率XX％、容積率YY％ 形式（コロンなし、建蔽率の表記も対応）
-    pattern5 = r'建(?:ペ|ぺ|蔽)い?率(\d+(?:\.\d+)?)％[、,，].*?容積率(\d+(?:\.\d+)?)％'
-    match5 = re.search(pattern5, value)
+    match5 = RE_COVERAGE_5.search(value)
     
     if match5:
         building_coverage = float(match5.group(1))
@@ -2053,8 +1986,7 @@ def parse_building_coverage_to_json(value: str, period: Optional[int] = None) ->
         return result
     
     # パターン6: 建ぺい率・容積率：XX％・YY％ 形式
-    pattern6 = r'建(?:ペ|ぺ|蔽)い?率[・･]容積率[：:](\d+(?:\.\d+)?)％[・･](\d+(?:\.\d+)?)％'
-    match6 = re.search(pattern6, value)
+    match6 = RE_COVERAGE_6.search(value)
     
     if match6:
         building_coverage = float(match6.group(1))
@@ -2069,8 +2001,7 @@ def parse_building_coverage_to_json(value: str, period: Optional[int] = None) ->
         return result
     
     # パターン7: 数字％　数字％ 形式（全角スペース区切り）
-    pattern7 = r'^(\d+(?:\.\d+)?)％\u3000(\d+(?:\.\d+)?)％$'
-    match7 = re.search(pattern7, value)
+    match7 = RE_COVERAGE_7.search(value)
     
     if match7:
         building_coverage = float(match7.group(1))
@@ -2085,8 +2016,7 @@ def parse_building_coverage_to_json(value: str, period: Optional[int] = None) ->
         return result
     
     # パターン8: 数字％/数字％ 形式（シンプルなスラッシュ区切り）
-    pattern8 = r'^(\d+(?:\.\d+)?)％[／/](\d+(?:\.\d+)?)％$'
-    match8 = re.search(pattern8, value)
+    match8 = RE_COVERAGE_8.search(value)
     
     if match8:
         building_coverage = float(match8.group(1))
@@ -2101,8 +2031,7 @@ def parse_building_coverage_to_json(value: str, period: Optional[int] = None) ->
         return result
     
     # パターン8: 単純な数字・数字 形式（％記号なし）
-    pattern8 = r'^(\d+(?:\.\d+)?)[・･](\d+(?:\.\d+)?)$'
-    match8 = re.search(pattern8, value)
+    match8 = RE_COVERAGE_9.search(value)
     
     if match8:
         building_coverage = float(match8.group(1))
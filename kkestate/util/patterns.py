@@ -0,0 +1,335 @@
+"""
+正規表現パターンレジストリ
+json_cleaner / parser / key_mapper で使用する正規表現をモジュール読み込み時に一度だけコンパイルして保持する
+
+クレンジング処理は estate_detail の値ごとに何度も呼ばれるため、
+関数内でパターン文字列を都度 re.search / re.sub に渡すのではなく、ここで定義した
+コンパイル済みオブジェクトのメソッド（RE_XXX.search(value) など）を使用すること。
+新しいパターンを追加する場合も、関数内には書かずにこのモジュールへ追加する。
+"""
+
+import re
+
+
+# ============================================================================
+# 共通
+# ============================================================================
+RE_PERIOD_SUFFIX = re.compile(r'_第(\d+)期$')
+RE_NUMBER = re.compile(r'(\d+(?:\.\d+)?)')
+RE_NUMBER_WITH_COMMA = re.compile(r'(\d+(?:,\d{3})*(?:\.\d+)?)')
+RE_LEADING_NUMBER = re.compile(r'^(\d+)')
+RE_DIGIT = re.compile(r'\d')
+RE_DIGITS = re.compile(r'\d+')
+RE_NON_DIGITS = re.compile(r'(\D+)')
+RE_WHITESPACE = re.compile(r'\s+')
+RE_NON_WORD = re.compile(r'[^\w\d]')
+RE_NON_WORD_SPACE = re.compile(r'[^\w\s]')
+RE_PAREN_BLOCK = re.compile(r'[（(][^）)]*[）)]')
+RE_PAREN_CONTENT = re.compile(r'[（(]([^）)]*)[）)]')
+RE_PAREN_CONTENT_LAZY = re.compile(r'[（(](.+?)[）)]')
+RE_ZENKAKU_PAREN_CONTENT = re.compile(r'（(.+?)）')
+RE_PAREN_TAIL = re.compile(r'[（(].*')
+RE_CLOSE_PAREN = re.compile(r'[）)]')
+RE_BEFORE_PAREN = re.compile(r'^([^（(]+)')
+RE_NOTE = re.compile(r'※(.+)')
+RE_NOTE_TAIL = re.compile(r'※(.+)$')
+RE_NOTE_TAIL_BLOCK = re.compile(r'※.+$')
+RE_RANGE_SEP = re.compile(r'[～〜]')
+RE_NAKAGURO_SEP = re.compile(r'[・]')
+RE_COMMA_SEP = re.compile(r'[,、，]')
+RE_COMMA_SEP_SIMPLE = re.compile(r'[、,]')
+RE_LIST_SEP = re.compile(r'[,、，・]')
+RE_AREA_LIST_SEP = re.compile(r'[,、，　\s]+')
+RE_TAB_NEWLINE_SEP = re.compile(r'[\t\n]')
+RE_TABS = re.compile(r'\t+')
+RE_SLASH_SEP = re.compile(r'\s*/\s*')
+
+# ============================================================================
+# 日付
+# ============================================================================
+RE_DATE_YMD = re.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})日')
+RE_DATE_YM = re.compile(r'(\d{4})年(\d{1,2})月')
+RE_DATE_SLASH = re.compile(r'(\d{4})/(\d{1,2})/(\d{1,2})')
+RE_YEAR = re.compile(r'\d{4}年')
+RE_DELIVERY_AFTER_CONTRACT = re.compile(r'契約後(\d+(?:\.\d+)?)ヶ月')
+
+# ============================================================================
+# 価格・金額
+# ============================================================================
+RE_PRICE_OKU_MAN = re.compile(r'(\d+(?:\.\d+)?)億(?:(\d+(?:\.\d+)?)万)?')
+RE_PRICE_MAN_WITHOUT_OKU = re.compile(r'(?<![億\d])(\d+(?:,\d{3})*(?:\.\d+)?)万')
+RE_PRICE_MAN_YEN = re.compile(r'(\d+(?:,\d{3})*)万(\d+(?:,\d{3})*)円')
+RE_AMOUNT_MAN = re.compile(r'(\d+(?:,\d{3})*)万円')
+RE_AMOUNT_MAN_YEN = re.compile(r'(\d+)万(\d+)円')
+RE_AMOUNT_YEN = re.compile(r'(\d+(?:,\d{3})*)円')
+RE_PRICE_MAN_DECIMAL = re.compile(r'(\d+(?:\.\d+)?)万円')
+RE_PRICE_WITH_UNIT = re.compile(r'(\d+(?:\.\d+)?)(円|千円|億円)')
+
+# その他費用の抽出対象キーワード（カテゴリ -> パターン）
+OTHER_EXPENSE_PATTERNS = {
+    "駐車場": re.compile(r'(.*駐車場[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?', re.IGNORECASE),
+    "地代": re.compile(r'(.*地代)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?', re.IGNORECASE),
+    "敷金": re.compile(r'(敷金)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?', re.IGNORECASE),
+    "保証金": re.compile(r'(.*保証金[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?', re.IGNORECASE),
+    "解体": re.compile(r'(.*解体[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?', re.IGNORECASE),
+    "災害積立": re.compile(r'(災害積立[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?', re.IGNORECASE),
+    "メンテナンス": re.compile(r'(.*メンテナンス[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?', re.IGNORECASE),
+    "通信費": re.compile(r'(.*(?:インターネット|ネット|ＣＡＴＶ|CATV|TV|テレビ|フレッツ)[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?', re.IGNORECASE),
+    "管理費": re.compile(r'(管理一時金[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?', re.IGNORECASE),
+    "利用料": re.compile(r'(.*(?:利用料|使用料|専用利用料)[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?', re.IGNORECASE),
+    "自治会費": re.compile(r'(.*(?:町会費|町内会費|自治会費)[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?', re.IGNORECASE),
+    "セキュリティ": re.compile(r'(.*(?:セキュリティ|防犯|警備)[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?', re.IGNORECASE),
+    "コミュニティ": re.compile(r'(.*(?:コミュニティ|会費)[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?', re.IGNORECASE),
+    "サービス": re.compile(r'(.*(?:サービス)[^：]*)[:：]\s*([0-9万,～〜円未定]+)(?:[／/](.+))?', re.IGNORECASE),
+}
+
+# 目安光熱費
+RE_UTILITY_RANGE = re.compile(r'約?(\d+(?:\.\d+)?)万円～(\d+(?:\.\d+)?)万円')
+RE_UTILITY_SINGLE = re.compile(r'約?(\d+(?:\.\d+)?)万円')
+
+# ============================================================================
+# 最多価格帯
+# ============================================================================
+RE_BAND_SINGLE = re.compile(r'^(\d+(?:,\d{3})*(?:\.\d+)?)万円台(?:（予定）)?（(\d+)(?:戸|区画)）(?:※.*)?$')
+RE_BAND_OKU = re.compile(r'^(\d+(?:\.\d+)?)億円台（(\d+)(?:戸|区画)）$')
+RE_BAND_SINGLE_NO_PAREN = re.compile(r'^(\d+(?:,\d{3})*(?:\.\d+)?)万円台\s+(\d+)(?:戸|区画)(?:\s+※.*)?$')
+RE_BAND_MULTI_EACH = re.compile(r'^(.+?)（各(\d+)(?:戸|区画)）$')
+RE_BAND_OKU_MAN_RANGE = re.compile(r'^(\d+(?:,\d{3})*(?:\.\d+)?)万円台～(\d+(?:\.\d+)?)億(\d+(?:,\d{3})*)万円台$')
+RE_BAND_RANGE = re.compile(r'^(\d+(?:,\d{3})*(?:\.\d+)?)万円台～(\d+(?:,\d{3})*(?:\.\d+)?)万円台(?:[（(].*?[）)])?(?:※.*)?$')
+RE_BAND_ITEM = re.compile(r'(\d+(?:,\d{3})*(?:\.\d+)?)万円台$')
+RE_BAND_ITEM_STRICT = re.compile(r'^(\d+(?:,\d{3})*(?:\.\d+)?)万円台$')
+RE_BAND_OKU_MAN = re.compile(r'^(\d+(?:\.\d+)?)億(\d+(?:,\d{3})*)万円台(?:※.*)?$')
+RE_BAND_SINGLE_WITH_NOTE = re.compile(r'^(\d+(?:,\d{3})*(?:\.\d+)?)万円台(?:※.*)?$')
+
+# ============================================================================
+# 面積
+# ============================================================================
+RE_AREA_USAGE_FEE = re.compile(r'使用料[：:]?(\d+)円')
+RE_AREA_MONTHLY_FEE = re.compile(r'[（(](\d+)円[／/]月[）)]')
+RE_AREA_MONTHLY_FEE_ALT = re.compile(r'[（(][利使]用料[：:]?月額(\d+)円[）)]')
+
+# ============================================================================
+# 間取り
+# ============================================================================
+RE_LAYOUT_PLUS_NOTE = re.compile(r'([+＋][A-Z]+)[（(][^）)]*[）)]')
+RE_LAYOUT_TOKEN = re.compile(r'(\d+(?:[LDKSRF]+)(?:[+＋]\d*[LDKSRF]*)*)')
+RE_LAYOUT_VALID = re.compile(r'^\d+[LDKSRF]+(?:[+＋]\d*[LDKSRF]+)*$')
+RE_LAYOUT_TOKEN_NO_F = re.compile(r'(\d+(?:[LDKSR]+)(?:[+＋]\d*[LDKSRF]*)*)')
+RE_LAYOUT_VALID_NO_F = re.compile(r'^\d+[LDKSR]+(?:[+＋]\d*[LDKSRF]+)*$')
+RE_LAYOUT_SIMPLE = re.compile(r'^(\d+)([LDKSRF]+)$')
+RE_LAYOUT_ROOM_NOTE = re.compile(r'[（(][^）)]*(?:サービスルーム|ファミリークロゼット|シューズインクローク|納戸)[^）)]*[）)]')
+
+# ============================================================================
+# 管理費・修繕積立金
+# ============================================================================
+RE_FEE_AMOUNT = re.compile(r'(\d+(?:万\d+)?(?:,\d{3})*)円')
+RE_FEE_MAN_PART = re.compile(r'(\d+)万(\d+)')
+RE_FEE_STAGED = re.compile(r'^当初月額(\d+(?:万\d+)?(?:,\d{3})*)円／月、(.+)$')
+RE_FEE_PERIOD_SPECIAL = re.compile(r'^(\d+(?:万\d+)?(?:,\d{3})*)円／月（([^）]+のみ\d+(?:万\d+)?(?:,\d{3})*円／月)）$')
+RE_FEE_SPECIAL = re.compile(r'^(\d+(?:万\d+)?(?:,\d{3})*)円／月（([^）]+)）(.*)$')
+RE_FEE_FROM_PERIOD = re.compile(r'(\d+(?:万\d+)?(?:,\d{3})*)円／月[（(]([^）)]*(?:年目|年後|カ月目|カ月後)より[^）)]*)[）)]')
+RE_FEE_BREAKDOWN = re.compile(r'【内訳】(.+)$')
+
+# ============================================================================
+# 交通
+# ============================================================================
+RE_ACCESS_STATION = re.compile(r'(.+?)「(.+?)」(.+?)(\d+)分')
+RE_ACCESS_BUS = re.compile(r'バス(\d+)分.*?バス停「(.+?)」.*?歩(\d+)分')
+RE_ACCESS_CAR = re.compile(r'車(\d+)分')
+
+# ============================================================================
+# 会社情報
+# ============================================================================
+RE_COMPANY_ROLE = re.compile(r'＜([^＞]+)＞')
+RE_COMPANY_ROLE_BLOCK = re.compile(r'＜[^＞]+＞')
+RE_COMPANY_CONSTRUCTION_PERMIT = re.compile(r'建設業許可[/／]([^　\s]+)')
+RE_COMPANY_NAME_PAREN_NOISE = re.compile(r'[（）\(\)].*?[（）\(\)]')
+RE_COMPANY_NAME_NUMBER_NOISE = re.compile(r'第\d+.*')
+RE_COMPANY_ADDRESS = re.compile(r'〒(\d{3}-\d{4})\s*([^〒]+?)(?=株式会社|$)')
+
+# 免許番号（国土交通大臣免許 / 知事免許）
+RE_LICENSE_MINISTER = re.compile(r'国土交通大臣\s*\（(\d+)\）\s*第(\d+)\s*号')
+RE_LICENSE_GOVERNOR = re.compile(r'([^知事]*?)知事\s*\（(\d+)\）\s*第(\d+)\s*号')
+
+# 協会・団体会員情報
+MEMBERSHIP_PATTERNS = [
+    re.compile(r'\(公社\)([^　\s会員]+)会員'),
+    re.compile(r'\(一社\)([^　\s会員]+)会員'),
+    re.compile(r'([^　\s（）]+)協議会加盟'),
+]
+
+# 会社名（株式会社等を含む）。先頭から順に評価する
+COMPANY_NAME_PATTERNS = [
+    re.compile(r'(株式会社[^〒\n\t　]+)'),
+    re.compile(r'([^株式会社]*株式会社[^〒\n\t　]*)'),
+    re.compile(r'([^〒\n\t　]+株式会社)'),
+    re.compile(r'([^〒\n\t　]*会社[^〒\n\t　]*)'),
+]
+
+# 評価（X段階/Y段階中）
+RE_RATING = re.compile(r'(\d+)段階/(\d+)段階中')
+
+# ============================================================================
+# 住所
+# ============================================================================
+RE_ADDRESS_NUMBER_LIST = re.compile(r'・[\d・]+')
+RE_ADDRESS_PAREN = re.compile(r'（[^）]*）')
+RE_ADDRESS_SQUARE_BRACKET = re.compile(r'【[^】]*】')
+RE_ADDRESS_QUOTE = re.compile(r'「[^」]*」')
+RE_ADDRESS_WARD = re.compile(r'^(.+?区)')
+RE_ADDRESS_GUN = re.compile(r'^(.+?郡)')
+
+# 番地の後に続く日付表記や不要文字列
+RE_ADDRESS_TRAILING_NOISE = re.compile(
+    r'(-?\d+(?:-\d+)?(?:号室)?)'  # 番地部分
+    r'(\s*\d+月\d+日.*|\s*価格更新.*|\s*頭金.*|\s*物件.*|\s*諸費用.*|\s*おまとめ.*)'  # 日付表記以降や不要文字列
+)
+
+# 都道府県（先頭から順に評価する）
+PREFECTURE_PATTERNS = [
+    re.compile(r'^(東京都)'),
+    re.compile(r'^(北海道)'),
+    re.compile(r'^(京都府|大阪府)'),
+    re.compile(r'^(.{2,3}県)'),
+]
+
+# 北海道の支庁・振興局
+HOKKAIDO_OFFICE_PATTERNS = [
+    re.compile(r'^(.+?支庁)'),
+    re.compile(r'^(.+?振興局)'),
+]
+
+# 郡の下の町・村
+TOWN_VILLAGE_PATTERNS = [
+    re.compile(r'^(.+?町)'),
+    re.compile(r'^(.+?村)'),
+]
+
+# 市区町村（郡以外）
+CITY_PATTERNS = [
+    re.compile(r'^(.+?市)'),
+    re.compile(r'^(.+?区)'),  # 政令指定都市の区
+    re.compile(r'^(.+?町)'),  # 町（単独）
+    re.compile(r'^(.+?村)'),  # 村（単独）
+]
+
+# ============================================================================
+# 建物構造
+# ============================================================================
+RE_PARTIAL_STRUCTURE = re.compile(r'一部(.+?)(?:$|\s)')
+RE_EXTERIOR_MATERIAL = re.compile(r'(サイディング貼|アスファルトシングル葺|タイル貼|モルタル塗|リシン掻落)')
+
+# 所在階/構造/総階数（例: "3階/RC5階建"）
+RE_FLOOR_STRUCTURE = re.compile(r'^(\d+)階/(.+?)(\d+)階(?:地下(\d+)階)?建(.*)$')
+
+# 構造・階建て（parse_building_structure_to_json のパターン1〜7）
+RE_BUILDING_STRUCTURE_1 = re.compile(r'^(\d+)階/(.+?)(\d+)階(?:地下(\d+)階)?建.*?$')
+RE_BUILDING_STRUCTURE_2 = re.compile(r'^(.+?)(\d+)階(?:地下(\d+)階)?建.*?$')
+RE_BUILDING_STRUCTURE_3 = re.compile(r'^地上(\d+)階.*?(.+)$')
+RE_BUILDING_STRUCTURE_4 = re.compile(r'^構造：(.+?)\s+工法：.*?\s+地上階：(\d+)階.*?$')
+RE_BUILDING_STRUCTURE_5 = re.compile(r'^(.+?)/地上(\d+)階.*?$')
+RE_BUILDING_STRUCTURE_6 = re.compile(r'^(.+?)\u3000地上(\d+)階.*?$')
+RE_BUILDING_STRUCTURE_7 = re.compile(r'^(.+?)、\s*(\d+)階建.*?$')
+
+# ============================================================================
+# リフォーム
+# ============================================================================
+RE_REFORM_DATE = re.compile(r'(\d{4})年(\d{1,2})月(?:(?:完了)|(?:リフォーム完了))')
+RE_REFORM_WATER = re.compile(r'水回り設備交換[：:]([^　]+)')
+RE_REFORM_INTERIOR = re.compile(r'内装リフォーム[：:]([^　※]+)')
+RE_REFORM_OTHER = re.compile(r'その他[：:]([^※]+)')
+
+# ============================================================================
+# 地目
+# ============================================================================
+RE_LAND_USE_PREFIX = re.compile(r'^地目：')
+
+# ============================================================================
+# 周辺施設
+# ============================================================================
+RE_FACILITY_INFO = re.compile(r'([^：]+)：徒歩(\d+)分[（(](\d+)(?:ｍ|m)[）)]')
+RE_FACILITY_WITH_CATEGORY = re.compile(r'([^\s]+)\s+([^：]+)：徒歩(\d+)分[（(](\d+)(?:ｍ|m)[）)]')
+
+RE_FACILITY_DISTANCE_ONLY = re.compile(r'^([^まで]+)まで(\d+)(?:ｍ|m)$')
+
+# ============================================================================
+# 駐車場
+# ============================================================================
+RE_PARKING_ZERO_YEN = re.compile(r'(?<!\d)0円(?!\d)')
+
+# 料金範囲（パターン, 種別）
+PARKING_RANGE_PATTERNS = [
+    (re.compile(r'(\d+)万(\d+)円～(\d+)万(\d+)円'), 'man_en_man_en'),           # 1万6761円～2万951円
+    (re.compile(r'(\d+(?:,\d{3})*(?:\.\d+)?)円～(\d+)万(\d+)円'), 'en_man_en'),   # 6000円～1万2000円
+    (re.compile(r'(\d+(?:,\d{3})*(?:\.\d+)?)円～(\d+)万円'), 'en_man'),            # 6000円～1万円
+    (re.compile(r'(\d+(?:,\d{3})*(?:\.\d+)?)円～(\d+(?:,\d{3})*(?:\.\d+)?)円'), 'en_en'), # 4500円～6000円
+]
+
+# 単一料金（パターン, 種別）
+PARKING_FEE_PATTERNS = [
+    (re.compile(r'(\d+)万(\d+)円'), 'man_en'),   # 1万2000円
+    (re.compile(r'(\d+)万円'), 'man'),           # 1万円
+    (re.compile(r'(\d+)円'), 'en'),              # 6000円
+]
+
+# ============================================================================
+# 間取り図
+# ============================================================================
+# 面積（パターン, 単位）
+AREA_PATTERNS = [
+    (re.compile(r'(\d+(?:\.\d+)?)m2'), "m2"),
+    (re.compile(r'(\d+(?:\.\d+)?)㎡'), "m2"),
+    (re.compile(r'(\d+(?:\.\d+)?)平米'), "m2"),
+    (re.compile(r'(\d+(?:\.\d+)?)坪'), "坪"),
+]
+
+# ============================================================================
+# 建ぺい率・容積率
+# ============================================================================
+RE_COVERAGE_1 = re.compile(r'^(\d+(?:\.\d+)?)％・(\d+(?:\.\d+)?)％$')
+RE_COVERAGE_2 = re.compile(r'建(?:ペ|ぺ|蔽)い?率[：:]?(\d+(?:\.\d+)?)[％%](?:[\(（][^）\)]*[\)）]|[・･]\d+(?:\.\d+)?[％%])*[、,，\u3000].*?容積率[：:]?(\d+(?:\.\d+)?)[％%]')
+RE_COVERAGE_3 = re.compile(r'建(?:ペ|ぺ|蔽)い?率[：:](\d+(?:\.\d+)?)％(?:[\(（][^）\)]*[\)）])?[／/]容積率[：:](\d+(?:\.\d+)?)％')
+RE_COVERAGE_4 = re.compile(r'建(?:ペ|ぺ|蔽)い?率[：:](\d+(?:\.\d+)?)[／/]容積率[：:](\d+(?:\.\d+)?)')
+RE_COVERAGE_5 = re.compile(r'建(?:ペ|ぺ|蔽)い?率(\d+(?:\.\d+)?)％[、,，].*?容積率(\d+(?:\.\d+)?)％')
+RE_COVERAGE_6 = re.compile(r'建(?:ペ|ぺ|蔽)い?率[・･]容積率[：:](\d+(?:\.\d+)?)％[・･](\d+(?:\.\d+)?)％')
+RE_COVERAGE_7 = re.compile(r'^(\d+(?:\.\d+)?)％\u3000(\d+(?:\.\d+)?)％$')
+RE_COVERAGE_8 = re.compile(r'^(\d+(?:\.\d+)?)％[／/](\d+(?:\.\d+)?)％$')
+RE_COVERAGE_9 = re.compile(r'^(\d+(?:\.\d+)?)[・･](\d+(?:\.\d+)?)$')
+
+# ============================================================================
+# 住所の正規化キー（address_normalizer）
+# ============================================================================
+# NFKC 正規化後の住所に適用する（全角数字・全角ハイフンは半角になっている）
+RE_ADDRESS_KEY_KANJI_CHOME = re.compile(r'([一二三四五六七八九十]+)丁目')
+RE_ADDRESS_KEY_HYPHEN = re.compile(r'(?<=\d)[‐‑‒–—―−ーｰの](?=\d)')
+RE_ADDRESS_KEY_CHOME = re.compile(r'(\d+)丁目')
+RE_ADDRESS_KEY_BANCHI = re.compile(r'(\d+)番地?(?:の)?(?=\d|-|$)')
+RE_ADDRESS_KEY_GO = re.compile(r'(\d+)号(?!室)')
+# 最初の「番地-号」の後ろ（建物名・部屋番号など）は除く
+RE_ADDRESS_KEY_NUMBER_BLOCK = re.compile(r'^(.*?\d+(?:-\d+){1,2})')
+
+# ============================================================================
+# 住所の町丁目キー（gazetteer）
+# ============================================================================
+# NFKC 正規化後の住所（市区町村より後ろ）を町名と最初の番号（丁目、丁目がない地域は番地）に分ける
+# 「北1条西」「4条通」「1線」「第1地割」「2番町」のように条・線・地割・番町の付く数字は町名に含める
+# （町名が数字で始まり、その後に条・線・地割・番町がない場合は一致しない）
+RE_GAZETTEER_TOWN = re.compile(r'^(?:大字|字)?((?:[^\d\-]|\d+(?:条|線|地割|番町))+)-?(\d*)')
+
+# ============================================================================
+# 一括処理（batch_cleaner）の定型パターン
+# ============================================================================
+# 値全体が定型の場合のみ一致させ、一致しない値は1値ずつのクレンジング関数で処理する
+# 全角数字などは pandas の数値変換に対応しないため半角数字のみとする
+RE_BATCH_PRICE_MAN = re.compile(r'^(?P<man>[0-9]+(?:,[0-9]{3})*)万円$')
+RE_BATCH_AREA_SQM = re.compile(r'^(?P<area>[0-9]+(?:\.[0-9]+)?)(?:m2|㎡|m²)$')
+RE_BATCH_NUMBER_UNIT = re.compile(r'^(?P<number>[0-9]+)(?P<unit>戸|階|台|棟|区画|世帯)$')
+
+# ============================================================================
+# 不動産情報ライブラリの地価公示・地価調査 CSV（reinfolib_cleaner）
+# ============================================================================
+RE_LAND_SURVEY_DATE = re.compile(r'(令和|平成|昭和)(\d+)年(\d+)月(\d+)日')
+# 列単位の変換で pd.to_numeric に渡す定型（半角数字のみ、それ以外は1値ずつの関数で処理する）
+RE_LAND_SURVEY_DATE_FAST = re.compile(r'^(令和|平成|昭和)([0-9]+)年([0-9]+)月([0-9]+)日')
+RE_LAND_DIGITS = re.compile(r'[0-9]+')
+RE_LAND_DECIMAL = re.compile(r'[0-9]+(?:\.[0-9]+)?')
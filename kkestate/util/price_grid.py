@@ -0,0 +1,121 @@
+"""
+価格（円/m^2）の格子（グリッド）集計
+緯度・経度を GRID_SIZES の大きさの格子に分け、格子ごとに件数・平均・中央値・標準偏差を NumPy で一括計算する
+  - 格子の番号は (floor(緯度 / 大きさ), floor(経度 / 大きさ)) で全国共通（都道府県をまたいでも同じ格子になる）
+  - 大きさは2倍ずつのため、細かい格子の番号を 2^k で割ると粗い格子の番号になる
+  - 件数・合計は np.bincount、中央値は (格子, 値) で並べ替えた上で格子ごとの中央の位置から求める
+集計結果は列ごとの配列の JSON（ファイル）として保存し、地図（ana.py の make_heatmap）や web から読み込む
+
+例:
+    df_grid = aggregate_grid_levels(df["latitude"], df["longitude"], df["price_per_sqm"])
+    save_grid(df_grid, "./html/grid_13_{level}.json")
+"""
+
+import json
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, Optional, List, Union
+
+
+# 格子の大きさ [度]（0.01 ~= 1km）、番号（レベル）が大きいほど細かい
+GRID_SIZES = [0.08, 0.04, 0.02, 0.01, 0.005, 0.0025]
+
+# 集計結果の列
+GRID_COLUMNS = ["level", "iy", "ix", "n", "mean", "median", "std"]
+
+
+def aggregate_grid(latitude: Union[np.ndarray, pd.Series], longitude: Union[np.ndarray, pd.Series], values: Union[np.ndarray, pd.Series], level: int) -> pd.DataFrame:
+    """
+    1レベルの格子集計
+
+    Args:
+        latitude, longitude, values: 緯度・経度・値（同じ長さ、いずれかが NaN または値が0以下の点は除く）
+        level (int): GRID_SIZES の番号
+
+    Returns:
+        pd.DataFrame: GRID_COLUMNS の列（iy, ix の順に並ぶ）
+    """
+    cell = GRID_SIZES[level]
+    lat  = np.asarray(latitude,  dtype=float)
+    lng  = np.asarray(longitude, dtype=float)
+    val  = np.asarray(values,    dtype=float)
+    assert lat.shape == lng.shape == val.shape
+    mask = ~(np.isnan(lat) | np.isnan(lng) | np.isnan(val)) & (val > 0)
+    lat, lng, val = lat[mask], lng[mask], val[mask]
+    if val.shape[0] == 0:
+        return pd.DataFrame({x: pd.Series(dtype=int if x in ["level", "iy", "ix", "n"] else float) for x in GRID_COLUMNS})
+    iy = np.floor(lat / cell).astype(np.int64)
+    ix = np.floor(lng / cell).astype(np.int64)
+    # 格子の番号を1つの整数にまとめて、格子ごとの連番（inverse）に変換
+    key = (iy << 32) + (ix & 0xFFFFFFFF)
+    key_unique, inverse = np.unique(key, return_inverse=True)
+    n     = np.bincount(inverse)
+    total = np.bincount(inverse, weights=val)
+    mean  = total / n
+    std   = np.sqrt(np.maximum(np.bincount(inverse, weights=(val - mean[inverse]) ** 2) / n, 0.0))
+    # 中央値: (格子, 値) で並べ替え、各格子の開始位置から中央の2点を平均
+    sorted_val = val[np.lexsort((val, inverse))]
+    start  = np.concatenate([[0], np.cumsum(n)[:-1]])
+    median = (sorted_val[start + (n - 1) // 2] + sorted_val[start + n // 2]) / 2
+    return pd.DataFrame({
+        "level": level,
+        "iy": key_unique >> 32,
+        "ix": ((key_unique & 0xFFFFFFFF) ^ 0x80000000) - 0x80000000,
+        "n": n, "mean": mean, "median": median, "std": std,
+    })
+
+def aggregate_grid_levels(latitude: Union[np.ndarray, pd.Series], longitude: Union[np.ndarray, pd.Series], values: Union[np.ndarray, pd.Series], levels: Optional[List[int]] = None) -> pd.DataFrame:
+    """
+    複数レベルの格子集計（levels が None の場合は GRID_SIZES の全レベル）
+    """
+    if levels is None:
+        levels = list(range(len(GRID_SIZES)))
+    return pd.concat([aggregate_grid(latitude, longitude, values, level) for level in levels], ignore_index=True)
+
+def grid_bounds(df_grid: pd.DataFrame) -> pd.DataFrame:
+    """
+    格子の南西・北東の緯度経度（lat_min, lng_min, lat_max, lng_max）を追加
+    """
+    df_grid = df_grid.copy()
+    cell = np.array(GRID_SIZES)[df_grid["level"].to_numpy(dtype=int)]
+    df_grid["lat_min"] = df_grid["iy"].to_numpy() * cell
+    df_grid["lng_min"] = df_grid["ix"].to_numpy() * cell
+    df_grid["lat_max"] = df_grid["lat_min"] + cell
+    df_grid["lng_max"] = df_grid["lng_min"] + cell
+    return df_grid
+
+def save_grid(df_grid: pd.DataFrame, path_format: str, **kwargs) -> List[str]:
+    """
+    レベルごとに列ごとの配列の JSON として保存
+    {"level", "size", "iy": [...], "ix": [...], "n": [...], "mean": [...], "median": [...], "std": [...], その他 kwargs}
+
+    Args:
+        path_format (str): "{level}" を含む保存先（例: "./html/grid_13_{level}.json"）
+
+    Returns:
+        List[str]: 保存したファイル
+    """
+    assert "{level}" in path_format
+    list_path = []
+    for level, dfwk in df_grid.groupby("level"):
+        data: Dict[str, Any] = {"level": int(level), "size": GRID_SIZES[int(level)]}
+        data.update(kwargs)
+        for x in ["iy", "ix", "n"]:
+            data[x] = dfwk[x].astype(int).tolist()
+        for x in ["mean", "median", "std"]:
+            data[x] = np.round(dfwk[x].to_numpy(dtype=float), 1).tolist()
+        path = path_format.format(level=int(level))
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        list_path.append(path)
+    return list_path
+
+def load_grid(path: str) -> pd.DataFrame:
+    """
+    save_grid で保存したファイルを GRID_COLUMNS の DataFrame として読み込む
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    df = pd.DataFrame({x: data[x] for x in GRID_COLUMNS if x != "level"})
+    df.insert(0, "level", data["level"])
+    return df
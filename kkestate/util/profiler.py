@@ -0,0 +1,201 @@
+"""
+スクリプト全体のプロファイリング（各スクリプトの --profile オプション）
+  - cprofile: cProfile による決定的プロファイル、pstats 形式で保存（python -m pstats / snakeviz で参照）
+  - sampling: メインスレッドのスタックを一定間隔で取得、collapsed stack 形式で保存（flamegraph.pl / speedscope で参照）
+終了時（atexit）にファイルを保存し、自前のモジュール（json_cleaner, parser, suumo など）ごとに集計した上位の関数をログに出力する
+
+例:
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    if args.profile is not None:
+        start_profiling(args.profile, mode=args.profilemode, log_function=LOGGER.info)
+"""
+
+import atexit
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from typing import Dict, Any, Optional, List, Tuple, Callable
+
+
+# リポジトリのルート（この配下のファイルを自前のモジュールとして集計する）
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PROFILE_MODES = ["cprofile", "sampling"]
+
+
+def add_profile_arguments(parser):
+    """
+    argparse.ArgumentParser に --profile / --profilemode / --profileinterval を追加
+    """
+    parser.add_argument("--profile",         type=str, default=None, help="プロファイル結果の保存先（cprofile: pstats形式, sampling: collapsed stack形式）")
+    parser.add_argument("--profilemode",     type=str, default="cprofile", choices=PROFILE_MODES, help="プロファイルの方式（デフォルト: cprofile）")
+    parser.add_argument("--profileinterval", type=float, default=0.005, help="sampling のスタック取得間隔（秒、デフォルト: 0.005）")
+    return parser
+
+def get_module_group(filename: str) -> Tuple[str, bool]:
+    """
+    ファイル名から集計用のモジュール名を取得
+
+    Returns:
+        Tuple[str, bool]: (モジュール名, 自前のモジュールか)
+            例: ".../kkestate/util/json_cleaner.py" -> ("json_cleaner", True), ".../site-packages/pandas/core/frame.py" -> ("pandas", False)
+    """
+    if filename.startswith("~") or filename.startswith("<"):
+        return "<built-in>", False
+    path = os.path.abspath(filename)
+    if path.startswith(_REPO_ROOT + os.sep):
+        return os.path.splitext(os.path.basename(path))[0], True
+    parts = path.split(os.sep)
+    for name in ["site-packages", "dist-packages"]:
+        if name in parts and parts.index(name) + 1 < len(parts):
+            return os.path.splitext(parts[parts.index(name) + 1])[0], False
+    return "stdlib", False
+
+
+class ScriptProfiler:
+    """
+    スクリプト全体のプロファイラ（start から stop までを計測）
+    """
+    def __init__(self, output: str, mode: str = "cprofile", interval: float = 0.005, top: int = 20, log_function: Optional[Callable[[str], Any]] = print):
+        """
+        Args:
+            output (str): 保存先のファイル
+            mode (str): "cprofile" または "sampling"
+            interval (float): sampling のスタック取得間隔 [秒]
+            top (int): 終了時に出力する関数の件数
+            log_function (Optional[Callable]): サマリーの出力先（例: LOGGER.info）、Noneの場合は出力しない
+        """
+        assert mode in PROFILE_MODES
+        self.output       = output
+        self.mode         = mode
+        self.interval     = interval
+        self.top          = top
+        self.log_function = log_function
+        self.profiler: Optional[cProfile.Profile] = None
+        self.samples: Dict[Tuple[Tuple[str, str, int], ...], int] = {}
+        self.thread: Optional[threading.Thread] = None
+        self.event_stop   = threading.Event()
+        self.time_start   = None
+        self.is_stopped   = False
+
+    def start(self):
+        self.time_start = time.perf_counter()
+        if self.mode == "cprofile":
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        else:
+            self.thread = threading.Thread(target=self._sample, args=(threading.main_thread().ident, ), daemon=True)
+            self.thread.start()
+
+    def _sample(self, thread_id: int):
+        """
+        対象スレッドのスタック（ルートから末端への (ファイル名, 関数名, 行番号)）を interval 秒ごとに数える
+        """
+        while not self.event_stop.wait(self.interval):
+            frame = sys._current_frames().get(thread_id)
+            stack = []
+            while frame is not None:
+                stack.append((frame.f_code.co_filename, frame.f_code.co_name, frame.f_code.co_firstlineno))
+                frame = frame.f_back
+            if len(stack) > 0:
+                key = tuple(reversed(stack))
+                self.samples[key] = self.samples.get(key, 0) + 1
+
+    def stop(self):
+        """
+        計測を終了してファイルを保存し、サマリーを出力（2回目以降は何もしない）
+        """
+        if self.is_stopped or self.time_start is None:
+            return
+        self.is_stopped = True
+        if self.mode == "cprofile":
+            self.profiler.disable()
+            self.profiler.dump_stats(self.output)
+            lines = self.summarize_cprofile()
+        else:
+            self.event_stop.set()
+            self.thread.join()
+            self.write_collapsed()
+            lines = self.summarize_sampling()
+        if self.log_function is not None:
+            self.log_function(f"[PROFILE] {self.mode}: {time.perf_counter() - self.time_start:.1f} sec, saved to {self.output}")
+            for line in lines:
+                self.log_function(line)
+
+    def write_collapsed(self):
+        """
+        collapsed stack 形式（"モジュール:関数;モジュール:関数 サンプル数"）で保存
+        """
+        with open(self.output, "w", encoding="utf-8") as f:
+            for stack, count in sorted(self.samples.items(), key=lambda x: -x[1]):
+                names = [f"{get_module_group(filename)[0]}:{funcname}" for filename, funcname, _ in stack]
+                f.write(";".join(names) + f" {count}\n")
+
+    def summarize_cprofile(self) -> List[str]:
+        """
+        pstats からモジュールごとの自己時間と、自前のモジュールの累積時間の上位の関数を集計
+        """
+        stats = pstats.Stats(self.profiler).stats
+        dict_module: Dict[str, float] = {}
+        list_own = []
+        for (filename, lineno, funcname), (_, n_calls, tottime, cumtime, _) in stats.items():
+            module, is_own = get_module_group(filename)
+            dict_module[module] = dict_module.get(module, 0.0) + tottime
+            if is_own:
+                list_own.append((cumtime, tottime, n_calls, f"{module}:{funcname}:{lineno}"))
+        lines = ["[PROFILE] self time by module:"]
+        for module, tottime in sorted(dict_module.items(), key=lambda x: -x[1])[:self.top]:
+            lines.append(f"[PROFILE]   {module:<24} {tottime:10.3f}s")
+        lines.append("[PROFILE] top cumulative functions in own modules:")
+        for cumtime, tottime, n_calls, name in sorted(list_own, reverse=True)[:self.top]:
+            lines.append(f"[PROFILE]   {name:<60} cum={cumtime:10.3f}s self={tottime:10.3f}s calls={n_calls:,}")
+        return lines
+
+    def summarize_sampling(self) -> List[str]:
+        """
+        サンプルからモジュールごとの自己サンプル数と、自前のモジュールの関数を含むサンプル数の上位を集計
+        """
+        n_total = sum(self.samples.values())
+        dict_module: Dict[str, int] = {}
+        dict_own: Dict[str, int] = {}
+        for stack, count in self.samples.items():
+            module, _ = get_module_group(stack[-1][0])
+            dict_module[module] = dict_module.get(module, 0) + count
+            names = set()
+            for filename, funcname, lineno in stack:
+                module, is_own = get_module_group(filename)
+                if is_own:
+                    names.add(f"{module}:{funcname}:{lineno}")
+            for name in names:
+                dict_own[name] = dict_own.get(name, 0) + count
+        lines = [f"[PROFILE] self samples by module (total {n_total:,} samples, interval {self.interval * 1e3:.1f}ms):"]
+        for module, count in sorted(dict_module.items(), key=lambda x: -x[1])[:self.top]:
+            lines.append(f"[PROFILE]   {module:<24} {count:>10,} ({count / max(n_total, 1) * 100:5.1f}%)")
+        lines.append("[PROFILE] top cumulative functions in own modules:")
+        for name, count in sorted(dict_own.items(), key=lambda x: -x[1])[:self.top]:
+            lines.append(f"[PROFILE]   {name:<60} {count:>10,} ({count / max(n_total, 1) * 100:5.1f}%)")
+        return lines
+
+
+def start_profiling(output: str, mode: str = "cprofile", interval: float = 0.005, top: int = 20, log_function: Optional[Callable[[str], Any]] = print) -> ScriptProfiler:
+    """
+    プロファイルを開始し、終了時（sys.exit を含む）に保存・サマリー出力するよう atexit に登録
+
+    Args:
+        output (str): 保存先のファイル
+        mode (str): "cprofile"（pstats形式）または "sampling"（collapsed stack形式）
+        interval (float): sampling のスタック取得間隔 [秒]
+        top (int): 終了時に出力する関数の件数
+        log_function (Optional[Callable]): サマリーの出力先（例: LOGGER.info）
+
+    Returns:
+        ScriptProfiler: 開始したプロファイラ
+    """
+    profiler = ScriptProfiler(output, mode=mode, interval=interval, top=top, log_function=log_function)
+    profiler.start()
+    atexit.register(profiler.stop)
+    return profiler
@@ -0,0 +1,356 @@
+"""
+不動産情報ライブラリ（reinfolib）の地価公示・地価調査 CSV のクレンジング
+main/collect/reinfolib.py の upload_land_to_db で使用する
+
+1値ずつのクレンジング関数（clean_price など）と、列単位の関数（clean_price_series など）の2種類がある
+  - 列単位の関数は pandas の str 操作・数値変換でまとめて変換する
+  - 定型に一致しない値（全角数字、負の数など）だけを1値ずつの関数にフォールバックする（同じ値は1回だけ処理する）
+  - そのため、列単位の関数の結果は1値ずつの関数を apply した結果と同じになる
+
+例:
+    df_clean = clean_land_frame(pd.read_csv(path, encoding="utf-8-sig", skiprows=1), 2024, "13")
+"""
+
+import datetime
+import numpy as np
+import pandas as pd
+from typing import Callable, Optional
+from .patterns import (
+    RE_LAND_SURVEY_DATE, RE_LAND_SURVEY_DATE_FAST, RE_LAND_DIGITS, RE_LAND_DECIMAL
+)
+
+
+# 和暦の元年の前年（令和元年 = 2019）
+ERA_OFFSETS = {"令和": 2018, "平成": 1988, "昭和": 1925}
+
+
+# ============================================================================
+# 1値ずつのクレンジング
+# ============================================================================
+def clean_price(price_str) -> Optional[int]:
+    """価格データをクレンジング（241,000(円/㎡) -> 241000）"""
+    if pd.isna(price_str):
+        return None
+    price_str = str(price_str).replace(',', '').replace('(円/㎡)', '').replace('(円/10a)', '')
+    try:
+        return int(price_str)
+    except:
+        return None
+
+def clean_distance(distance_str) -> Optional[int]:
+    """距離データをクレンジング（1,300m -> 1300、近接 -> 0、接面 -> -1）"""
+    if pd.isna(distance_str):
+        return None
+    distance_str = str(distance_str)
+    if '近接' in distance_str:
+        return 0
+    elif '接面' in distance_str:
+        return -1
+    elif '駅前広場接面' in distance_str:
+        return -2
+    else:
+        # 数値部分を抽出
+        distance_str = distance_str.replace(',', '').replace('m', '').replace('ｍ', '')
+        try:
+            return int(distance_str)
+        except:
+            return None
+
+def clean_area(area_str) -> Optional[int]:
+    """地積データをクレンジング（101(㎡) -> 101）"""
+    if pd.isna(area_str):
+        return None
+    area_str = str(area_str).replace('(㎡)', '').replace(',', '')
+    try:
+        return int(area_str)
+    except:
+        return None
+
+def clean_width(width_str) -> Optional[float]:
+    """幅員データをクレンジング（4.0m -> 4.0）"""
+    if pd.isna(width_str):
+        return None
+    width_str = str(width_str).replace('m', '').replace('ｍ', '').replace(',', '')
+    try:
+        return float(width_str)
+    except:
+        return None
+
+def clean_ratio(ratio_str) -> Optional[int]:
+    """建蔽率・容積率をクレンジング（60(%) -> 60）"""
+    if pd.isna(ratio_str):
+        return None
+    ratio_str = str(ratio_str).replace('(%)', '').replace(',', '')
+    try:
+        return int(ratio_str)
+    except:
+        return None
+
+def clean_reference_number(ref_str) -> Optional[str]:
+    """標準地番号の重複文字列をクリーニング（春日-1春日-1 -> 春日-1）"""
+    if pd.isna(ref_str):
+        return None
+    ref_str = str(ref_str).strip()
+
+    # 文字列長が偶数で、前半と後半が同じ場合は前半のみを返す
+    if len(ref_str) % 2 == 0:
+        mid = len(ref_str) // 2
+        first_half = ref_str[:mid]
+        second_half = ref_str[mid:]
+        if first_half == second_half:
+            return first_half
+
+    return ref_str
+
+def parse_survey_date(date_str) -> Optional[datetime.date]:
+    """調査基準日をパース（令和6年7月1日 -> 2024-07-01）"""
+    if pd.isna(date_str):
+        return None
+    date_str = str(date_str)
+    # 文字列に最初に含まれる元号（令和 -> 平成 -> 昭和 の順に確認）で始まる場合のみ変換
+    for era, offset in ERA_OFFSETS.items():
+        if era in date_str:
+            match = RE_LAND_SURVEY_DATE.match(date_str)
+            if match and match.group(1) == era:
+                return datetime.date(offset + int(match.group(2)), int(match.group(3)), int(match.group(4)))
+            return None
+    return None
+
+
+# ============================================================================
+# 列単位のクレンジング
+# ============================================================================
+def _to_str(series: pd.Series) -> pd.Series:
+    """
+    欠損以外の値を str() と同じ文字列にした pyarrow の文字列の Series（str 操作を pyarrow.compute でまとめて処理する）
+    """
+    return pd.Series(series).astype("string[pyarrow]")
+
+def _to_mask(series: pd.Series) -> pd.Series:
+    """
+    str 操作の結果（欠損あり）を bool の Series に変換（欠損は False）
+    """
+    return series.fillna(False).astype(bool)
+
+def _fallback(series: pd.Series, result: pd.Series, is_fast: pd.Series, clean_function: Callable) -> pd.Series:
+    """
+    定型に一致しなかった欠損以外の値だけを1値ずつの関数で変換（同じ値は1回だけ処理する）
+    """
+    is_rest = series.notna() & ~is_fast
+    if not is_rest.any():
+        return result
+    rest   = series[is_rest]
+    mapped = rest.map({x: clean_function(x) for x in rest.unique()})
+    if result.dtype != object and mapped.map(lambda x: x is None or isinstance(x, (int, float))).all():
+        return result.where(~is_rest, mapped.astype(float))
+    result = result.astype(object)
+    result[is_rest] = mapped
+    return result
+
+def _to_number(series: pd.Series, stripped: pd.Series, pattern, clean_function: Callable, is_integer: bool) -> pd.Series:
+    """
+    区切り文字・単位を除いた文字列 stripped のうち pattern に一致する値を数値に変換し、残りを clean_function で変換
+    整数の列は欠損がなければ int64、あれば float64（1値ずつの関数を apply した場合と同じ）
+    """
+    is_fast = _to_mask(stripped.str.fullmatch(pattern.pattern))
+    result  = stripped.where(is_fast).astype("float64[pyarrow]").astype(float)
+    result  = _fallback(series, result, is_fast, clean_function)
+    if is_integer and result.dtype != object and result.notna().all():
+        result = result.astype(np.int64)
+    return result
+
+def clean_price_series(series: pd.Series) -> pd.Series:
+    """clean_price の列単位版"""
+    text = _to_str(series).str.replace(',', '', regex=False).str.replace('(円/㎡)', '', regex=False).str.replace('(円/10a)', '', regex=False)
+    return _to_number(series, text, RE_LAND_DIGITS, clean_price, True)
+
+def clean_distance_series(series: pd.Series) -> pd.Series:
+    """clean_distance の列単位版（"近接" を含む -> 0、"接面" を含む -> -1）"""
+    text    = _to_str(series)
+    is_near = _to_mask(text.str.contains('近接', regex=False))
+    is_face = _to_mask(text.str.contains('接面', regex=False)) & ~is_near
+    text    = text.mask(is_near | is_face, '0').str.replace(',', '', regex=False).str.replace('m', '', regex=False).str.replace('ｍ', '', regex=False)
+    result  = _to_number(series, text, RE_LAND_DIGITS, clean_distance, True)
+    return result.mask(is_face, -1)
+
+def clean_area_series(series: pd.Series) -> pd.Series:
+    """clean_area の列単位版"""
+    text = _to_str(series).str.replace('(㎡)', '', regex=False).str.replace(',', '', regex=False)
+    return _to_number(series, text, RE_LAND_DIGITS, clean_area, True)
+
+def clean_width_series(series: pd.Series) -> pd.Series:
+    """clean_width の列単位版"""
+    text = _to_str(series).str.replace('m', '', regex=False).str.replace('ｍ', '', regex=False).str.replace(',', '', regex=False)
+    return _to_number(series, text, RE_LAND_DECIMAL, clean_width, False)
+
+def clean_ratio_series(series: pd.Series) -> pd.Series:
+    """clean_ratio の列単位版"""
+    text = _to_str(series).str.replace('(%)', '', regex=False).str.replace(',', '', regex=False)
+    return _to_number(series, text, RE_LAND_DIGITS, clean_ratio, True)
+
+def clean_reference_number_series(series: pd.Series) -> pd.Series:
+    """
+    clean_reference_number の列単位版（前半と後半が同じ文字列は前半のみ）
+    文字列の長さごとに前半と後半を切り出して比較する
+    """
+    text   = _to_str(series).str.strip()
+    length = text.str.len().to_numpy(dtype=float, na_value=np.nan)
+    result = text.to_numpy(dtype=object, na_value=None)
+    for n in np.unique(length[length % 2 == 0]).astype(int):
+        index  = np.flatnonzero(length == n)
+        values = text.iloc[index]
+        half   = values.str.slice(0, n // 2)
+        is_dup = _to_mask(half == values.str.slice(n // 2)).to_numpy()
+        result[index[is_dup]] = half.to_numpy(dtype=object)[is_dup]
+    return pd.Series(result, index=series.index, dtype=object)
+
+def parse_survey_date_series(series: pd.Series) -> pd.Series:
+    """
+    parse_survey_date の列単位版（datetime.date の object の列、変換できない値は None）
+    調査基準日は1ファイル内で数種類のため、重複を除いた値だけを変換して元の並びに戻す
+    元号が1種類だけ含まれ、半角数字で書かれた値を str.extract で変換し、それ以外は parse_survey_date にフォールバックする
+    """
+    codes, uniques = pd.factorize(pd.Series(series), use_na_sentinel=True)
+    uniques = pd.Series(uniques, dtype=object)
+    text    = _to_str(uniques)
+    parts   = text.str.extract(RE_LAND_SURVEY_DATE_FAST.pattern)
+    n_era   = sum(_to_mask(text.str.contains(x, regex=False)).astype(int) for x in ERA_OFFSETS.keys())
+    is_fast = _to_mask(parts[0].notna() & (n_era == 1))
+    dates   = pd.to_datetime(pd.DataFrame({
+        "year":  parts[0].map(ERA_OFFSETS).astype(float) + parts[1].astype(float),
+        "month": parts[2].astype(float),
+        "day":   parts[3].astype(float),
+    })[is_fast], errors="coerce")
+    # 存在しない日付（例: 2月30日）は1値ずつの関数で ValueError にする
+    is_fast = is_fast & dates.reindex(uniques.index).notna()
+    result  = pd.Series(None, index=uniques.index, dtype=object)
+    result[is_fast] = dates[is_fast].dt.date
+    # 欠損（codes = -1）は末尾に追加した None になる
+    result  = np.append(_fallback(uniques, result, is_fast, parse_survey_date).to_numpy(dtype=object), None)
+    return pd.Series(result[codes], index=pd.Series(series).index, dtype=object)
+
+
+# ============================================================================
+# カラム名・DataFrame 全体
+# ============================================================================
+def clean_column_name(col_name: str) -> str:
+    """カラム名から余計な文字列を除去して正規化"""
+    # 先頭の文字列で厳密にマッチング
+    if col_name.startswith('標準地番号'):
+        return 'reference_number'
+    elif col_name.startswith('調査基準日'):
+        return 'survey_date'
+    elif col_name.startswith('所在及び地番'):
+        return 'location'
+    elif col_name.startswith('住居表示'):
+        return 'residential_address'
+    elif col_name.startswith('価格(円/㎡)'):
+        return 'price_per_sqm'
+    elif col_name.startswith('名称'):
+        return 'station_name'
+    elif col_name.startswith('距離'):
+        return 'station_distance'
+    elif col_name.startswith('地積(㎡)'):
+        return 'land_area'
+    elif col_name.startswith('形状'):
+        return 'land_shape'
+    elif col_name.startswith('利用区分'):
+        return 'land_use_category'
+    elif col_name.startswith('構造'):
+        return 'building_structure'
+    elif col_name.startswith('階層'):
+        return 'building_floors'
+    elif col_name.startswith('利用現況'):
+        return 'current_use'
+    elif col_name.startswith('給排水'):
+        return 'utilities'
+    elif col_name.startswith('周辺の土地'):
+        return 'surrounding_use'
+    elif col_name.startswith('方位') and col_name.endswith('.1'):
+        return 'other_road_direction'
+    elif col_name.startswith('方位'):
+        return 'front_road_direction'
+    elif col_name.startswith('幅員'):
+        return 'front_road_width'
+    elif col_name.startswith('種類'):
+        return 'front_road_type'
+    elif col_name.startswith('舗装'):
+        return 'front_road_pavement'
+    elif col_name.startswith('区分') and col_name != '区分':
+        return 'other_road_category'
+    elif col_name.startswith('用途地域'):
+        return 'use_district'
+    elif col_name.startswith('高度地区'):
+        return 'height_district'
+    elif col_name.startswith('防火'):
+        return 'fire_prevention_area'
+    elif col_name.startswith('建蔽率'):
+        return 'coverage_ratio'
+    elif col_name.startswith('容積率'):
+        return 'floor_area_ratio'
+    elif col_name.startswith('都市計画区域'):
+        return 'city_planning_area'
+    elif col_name.startswith('森林法') or col_name.startswith('公園法'):
+        return 'forest_park_law'
+    elif col_name.startswith('鑑定評価書') and 'URL' not in col_name:
+        return 'appraisal_report'
+    elif col_name == '区分':
+        return 'category'
+    else:
+        return col_name.lower().replace(' ', '_')
+
+def clean_land_frame(df: pd.DataFrame, year: int, prefecture_code: str, is_vectorized: bool = True) -> pd.DataFrame:
+    """
+    地価公示・地価調査 CSV（reinfolib.py の download_land_prices の出力）を reinfolib_land のカラムに変換
+
+    Args:
+        df (pd.DataFrame): CSV を読み込んだ DataFrame（カラム名は日本語のまま）
+        is_vectorized (bool): False の場合は1値ずつの関数を apply する（比較用）
+    """
+    df = df.rename(columns={col: clean_column_name(col) for col in df.columns})
+    if is_vectorized:
+        price, distance, area, width, ratio, reference, survey = (
+            clean_price_series, clean_distance_series, clean_area_series, clean_width_series,
+            clean_ratio_series, clean_reference_number_series, parse_survey_date_series
+        )
+    else:
+        price, distance, area, width, ratio, reference, survey = [
+            (lambda f: (lambda x: x.apply(f)))(f) for f in [
+                clean_price, clean_distance, clean_area, clean_width, clean_ratio, clean_reference_number, parse_survey_date
+            ]
+        ]
+    return pd.DataFrame({
+        'year': year,
+        'prefecture_code': prefecture_code,
+        'category': df['category'],
+        'reference_number': reference(df['reference_number']),
+        'survey_date': survey(df['survey_date']),
+        'location': df['location'],
+        'residential_address': df['residential_address'],
+        'price_per_sqm': price(df['price_per_sqm']),
+        'station_name': df['station_name'],
+        'station_distance': distance(df['station_distance']),
+        'land_area': area(df['land_area']),
+        'land_shape': df['land_shape'],
+        'land_use_category': df['land_use_category'],
+        'building_structure': df['building_structure'],
+        'building_floors': df['building_floors'],
+        'current_use': df['current_use'],
+        'utilities': df['utilities'],
+        'surrounding_use': df['surrounding_use'],
+        'front_road_direction': df['front_road_direction'],
+        'front_road_width': width(df['front_road_width']),
+        'front_road_type': df['front_road_type'],
+        'front_road_pavement': df['front_road_pavement'],
+        'other_road_direction': df.get('other_road_direction'),
+        'other_road_category': df.get('other_road_category'),
+        'use_district': df.get('use_district'),
+        'height_district': df.get('height_district'),
+        'fire_prevention_area': df.get('fire_prevention_area'),
+        'coverage_ratio': ratio(df['coverage_ratio']) if 'coverage_ratio' in df.columns else None,
+        'floor_area_ratio': ratio(df['floor_area_ratio']) if 'floor_area_ratio' in df.columns else None,
+        'city_planning_area': df.get('city_planning_area'),
+        'forest_park_law': df.get('forest_park_law'),
+        'appraisal_report': df.get('appraisal_report'),
+        'appraisal_report_url': df.get('鑑定評価書URL')
+    })
@@ -0,0 +1,167 @@
+"""
+クレンジング済みJSON（estate_cleaned.value_cleaned）のスキーマ検証
+kkestate.master.json_schemas.SCHEMAS の各項目を初回使用時に一度だけ検証関数へ変換して保持する
+  - 必須フィールドはタプル、許可フィールドは frozenset、型は isinstance に渡すタプルに事前変換
+  - 1値の検証は dict を1回走査するだけで完了する
+"""
+
+import json
+import pandas as pd
+from typing import Dict, Any, Optional, List, Tuple, Callable
+from kkestate.master.json_schemas import SCHEMAS
+
+
+# 項目名 -> 検証関数（グローバル変数）
+_SCHEMA_VALIDATORS: Dict[str, Callable[[Dict[str, Any]], Tuple[bool, str]]] = {}
+_SCHEMA_ALLOWED_FIELDS: Dict[str, frozenset] = {}
+
+
+def compile_schema(schema: Dict[str, Any]) -> Tuple[Callable[[Dict[str, Any]], Tuple[bool, str]], frozenset]:
+    """
+    SCHEMAS の1項目を検証関数に変換
+
+    Args:
+        schema (Dict[str, Any]): スキーマ定義（required_fields, optional_fields, field_types）
+
+    Returns:
+        Tuple[Callable, frozenset]: (検証関数 output_json -> (検証結果, エラーメッセージ), 許可フィールド)
+    """
+    required_fields = tuple(schema.get("required_fields", []))
+    allowed_fields  = frozenset(schema.get("required_fields", []) + schema.get("optional_fields", []))
+    field_types: Dict[str, Tuple[Tuple[type, ...], List[type]]] = {}
+    for field, expected_types in schema.get("field_types", {}).items():
+        if not isinstance(expected_types, list):
+            expected_types = [expected_types]
+        field_types[field] = (tuple(expected_types), expected_types)
+
+    def validate(output_json: Dict[str, Any]) -> Tuple[bool, str]:
+        for field in required_fields:
+            if field not in output_json:
+                return False, f"必須フィールド '{field}' が見つかりません"
+        for field, value in output_json.items():
+            types = field_types.get(field)
+            if types is not None and not isinstance(value, types[0]):
+                return False, f"フィールド '{field}' の型が不正です。期待: {types[1]}, 実際: {type(value)}"
+        return True, ""
+
+    return validate, allowed_fields
+
+def get_schema_validator(cleaned_name: str) -> Optional[Callable[[Dict[str, Any]], Tuple[bool, str]]]:
+    """
+    クレンジング済み項目名の検証関数を取得（初回のみ作成）
+
+    Args:
+        cleaned_name (str): クレンジング済み項目名（例: "価格"）
+
+    Returns:
+        Optional[Callable]: 検証関数、SCHEMAS に定義がない場合はNone
+    """
+    validator = _SCHEMA_VALIDATORS.get(cleaned_name)
+    if validator is None:
+        if cleaned_name is None or cleaned_name not in SCHEMAS:
+            return None
+        validator, allowed_fields = compile_schema(SCHEMAS[cleaned_name])
+        _SCHEMA_VALIDATORS[cleaned_name] = validator
+        _SCHEMA_ALLOWED_FIELDS[cleaned_name] = allowed_fields
+    return validator
+
+def validate_cleaned_value(output_json: Dict[str, Any], cleaned_name: str) -> Tuple[bool, str]:
+    """
+    JSON出力が期待されるスキーマに合致するかを検証
+    スキーマが定義されていない項目は検証せずに合格とする
+
+    Args:
+        output_json (Dict[str, Any]): クレンジング関数の出力JSON
+        cleaned_name (str): クレンジング済み項目名
+
+    Returns:
+        Tuple[bool, str]: (検証結果, エラーメッセージ)
+    """
+    validator = get_schema_validator(cleaned_name)
+    if validator is None:
+        return True, ""
+    if not isinstance(output_json, dict):
+        return False, f"JSONオブジェクトではありません: {type(output_json)}"
+    return validator(output_json)
+
+def find_undefined_fields(output_json: Dict[str, Any], cleaned_name: str) -> List[str]:
+    """
+    JSON出力のうちスキーマに定義されていないフィールドを取得（検証結果には影響しない）
+
+    Args:
+        output_json (Dict[str, Any]): クレンジング関数の出力JSON
+        cleaned_name (str): クレンジング済み項目名
+
+    Returns:
+        List[str]: 未定義フィールドの昇順リスト
+    """
+    if get_schema_validator(cleaned_name) is None or not isinstance(output_json, dict):
+        return []
+    allowed_fields = _SCHEMA_ALLOWED_FIELDS[cleaned_name]
+    return sorted(x for x in output_json.keys() if x not in allowed_fields)
+
+def summarize_schema_violations(df: pd.DataFrame, value_column: str = "value_cleaned", name_column: str = "name", id_column: str = "id_cleaned") -> pd.DataFrame:
+    """
+    estate_cleaned の行をまとめて検証し、id_cleaned ごとの違反件数を集計
+    value_cleaned は辞書またはJSON文字列のどちらでもよい
+
+    Args:
+        df (pd.DataFrame): id_cleaned, 項目名, value_cleaned の列を持つデータ
+        value_column (str): value_cleaned の列名
+        name_column (str): クレンジング済み項目名の列名
+        id_column (str): id_cleaned の列名
+
+    Returns:
+        pd.DataFrame: id_cleaned, name, n_rows, n_invalid, n_undefined, error, example の列を持つ集計結果
+            （error, example は最初に見つかった違反）
+    """
+    columns = [id_column, "name", "n_rows", "n_invalid", "n_undefined", "error", "example"]
+    if df.shape[0] == 0:
+        return pd.DataFrame(columns=columns)
+    records = []
+    for (id_cleaned, cleaned_name), df_group in df.groupby([id_column, name_column], sort=True):
+        validator = get_schema_validator(cleaned_name)
+        n_invalid, n_undefined, error, example = 0, 0, None, None
+        if validator is not None:
+            allowed_fields = _SCHEMA_ALLOWED_FIELDS[cleaned_name]
+            for value in df_group[value_column].tolist():
+                if isinstance(value, str):
+                    try:
+                        value = json.loads(value)
+                    except json.JSONDecodeError as e:
+                        value = e
+                if isinstance(value, dict):
+                    is_valid, error_msg = validator(value)
+                    if not allowed_fields.issuperset(value.keys()):
+                        n_undefined += 1
+                elif value is None:
+                    is_valid, error_msg = True, ""
+                else:
+                    is_valid, error_msg = False, f"JSONオブジェクトではありません: {value}"
+                if not is_valid:
+                    n_invalid += 1
+                    if error is None:
+                        error, example = error_msg, value
+        records.append([id_cleaned, cleaned_name, df_group.shape[0], n_invalid, n_undefined, error, example])
+    return pd.DataFrame(records, columns=columns)
+
+def merge_schema_violations(list_df: List[pd.DataFrame], id_column: str = "id_cleaned") -> pd.DataFrame:
+    """
+    summarize_schema_violations の結果（チャンクごと）を id_cleaned ごとに合算
+
+    Args:
+        list_df (List[pd.DataFrame]): summarize_schema_violations の結果のリスト
+        id_column (str): id_cleaned の列名
+
+    Returns:
+        pd.DataFrame: summarize_schema_violations と同じ列の集計結果
+    """
+    list_df = [x for x in list_df if x.shape[0] > 0]
+    if len(list_df) == 0:
+        return pd.DataFrame(columns=[id_column, "name", "n_rows", "n_invalid", "n_undefined", "error", "example"])
+    df = pd.concat(list_df, ignore_index=True)
+    return df.groupby([id_column, "name"], sort=True).agg({
+        "n_rows": "sum", "n_invalid": "sum", "n_undefined": "sum",
+        "error": lambda x: x.dropna().iloc[0] if x.notna().any() else None,
+        "example": lambda x: x.dropna().iloc[0] if x.notna().any() else None,
+    }).reset_index()
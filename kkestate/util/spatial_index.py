@@ -0,0 +1,234 @@
+"""
+緯度経度の点の空間インデックス（NumPy のみ、格子バケット方式）
+点を cell_size [m] の格子に分けて格子の番号順に並べ、格子ごとの開始位置を保持する
+k近傍・半径の検索は全ての検索点をまとめて処理する
+  - 検索点ごとに周囲 (2R+1)^2 個の格子の点を候補として一括で展開し、距離（haversine）を計算する
+  - k近傍は k 番目の距離が R 格子分以内に収まった検索点から確定し、残りの検索点は R を2倍にして再検索する
+  - 展開する格子の数が点の数を超える場合（遠く離れた検索点など）は全ての点を候補にする
+
+例:
+    index = GridIndex(df_land["latitude"], df_land["longitude"], cell_size=500)
+    ids, dist = index.query_knn(df_suumo["latitude"], df_suumo["longitude"], k=5)
+    qid, ids, dist = index.query_radius(df_suumo["latitude"], df_suumo["longitude"], radius=1000)
+"""
+
+import warnings
+import numpy as np
+import pandas as pd
+from typing import Optional, Tuple, Union
+
+
+EARTH_RADIUS = 6371008.8  # [m]
+ArrayLike = Union[np.ndarray, pd.Series, list]
+
+
+def haversine(lat1: np.ndarray, lng1: np.ndarray, lat2: np.ndarray, lng2: np.ndarray) -> np.ndarray:
+    """
+    2点間の距離 [m]（配列どうしで要素ごとに計算）
+    """
+    lat1, lng1, lat2, lng2 = [np.radians(np.asarray(x, dtype=float)) for x in (lat1, lng1, lat2, lng2)]
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+def group_median(group: np.ndarray, values: np.ndarray, n_groups: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    グループ（0 - n_groups-1）ごとの件数と中央値（件数0のグループは NaN）
+    """
+    n      = np.bincount(group, minlength=n_groups)
+    median = np.full(n_groups, np.nan)
+    if values.shape[0] == 0:
+        return n, median
+    order  = np.lexsort((values, group))
+    sorted_val = values[order]
+    start  = np.concatenate([[0], np.cumsum(n)[:-1]])
+    is_any = n > 0
+    median[is_any] = (sorted_val[start[is_any] + (n[is_any] - 1) // 2] + sorted_val[start[is_any] + n[is_any] // 2]) / 2
+    return n, median
+
+
+class GridIndex:
+    """
+    格子バケットによる緯度経度の点の空間インデックス
+    """
+    def __init__(self, latitude: ArrayLike, longitude: ArrayLike, cell_size: float = 500.0, chunk_cells: int = 2000000):
+        """
+        Args:
+            latitude, longitude: 点の緯度・経度（NaN の点は検索結果に含まれない）
+            cell_size (float): 格子の大きさ [m]
+            chunk_cells (int): 1回に展開する格子の数の目安（検索点をこれに収まるように分割する）
+        """
+        self.latitude  = np.asarray(latitude,  dtype=float)
+        self.longitude = np.asarray(longitude, dtype=float)
+        assert self.latitude.shape == self.longitude.shape
+        self.cell_size   = float(cell_size)
+        self.chunk_cells = chunk_cells
+        # 格子の大きさ（度）: 経度方向は点の最大緯度で換算（全ての点の緯度で東西の幅が cell_size 以上になる）
+        is_valid = ~(np.isnan(self.latitude) | np.isnan(self.longitude))
+        self.lat_max  = min(np.abs(self.latitude[is_valid]).max() if is_valid.any() else 0.0, 89.0)
+        self.cell_lat = np.degrees(self.cell_size / EARTH_RADIUS)
+        self.cell_lng = self.cell_lat / np.cos(np.radians(self.lat_max))
+        # 格子の番号順に並べた点の番号と、格子ごとの開始位置・件数
+        self.index = np.where(is_valid)[0]
+        iy, ix = self._to_cell(self.latitude[self.index], self.longitude[self.index])
+        key    = self._to_key(iy, ix)
+        order  = np.argsort(key, kind="stable")
+        self.index = self.index[order]
+        self.keys, self.starts, self.counts = np.unique(key[order], return_index=True, return_counts=True)
+
+    def __len__(self) -> int:
+        return self.index.shape[0]
+
+    def _to_cell(self, latitude: np.ndarray, longitude: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return np.floor(latitude / self.cell_lat).astype(np.int64), np.floor(longitude / self.cell_lng).astype(np.int64)
+
+    @staticmethod
+    def _to_key(iy: np.ndarray, ix: np.ndarray) -> np.ndarray:
+        return (iy << 32) + (ix & 0xFFFFFFFF)
+
+    def _candidates(self, latitude: np.ndarray, longitude: np.ndarray, n_ring: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        検索点ごとに周囲 n_ring 格子分（経度方向は検索点の緯度で広げる）の格子の点を展開し、(検索点の番号, 点の番号, 距離) を返す
+        """
+        if len(self) == 0 or latitude.shape[0] == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+        # 検索点が格子を作った点より高緯度の場合、経度方向の格子は cell_size より短くなるため範囲を広げる
+        lat_query = min(np.abs(latitude).max(), 89.0)
+        n_ring_x  = int(np.ceil(n_ring * max(np.cos(np.radians(self.lat_max)) / np.cos(np.radians(lat_query)), 1.0)))
+        # 展開する格子の数が点の数より多い場合は、全ての点を候補にする方が少ない
+        if (2 * n_ring + 1) * (2 * n_ring_x + 1) >= len(self):
+            qid = np.repeat(np.arange(latitude.shape[0]), len(self))
+            ids = np.tile(self.index, latitude.shape[0])
+            return qid, ids, haversine(latitude[qid], longitude[qid], self.latitude[ids], self.longitude[ids])
+        iy, ix = self._to_cell(latitude, longitude)
+        dy, dx = [x.ravel() for x in np.meshgrid(np.arange(-n_ring, n_ring + 1), np.arange(-n_ring_x, n_ring_x + 1), indexing="ij")]
+        key    = self._to_key(iy[:, None] + dy[None, :], ix[:, None] + dx[None, :]).ravel()
+        pos    = np.minimum(np.searchsorted(self.keys, key), self.keys.shape[0] - 1)
+        is_hit = self.keys[pos] == key
+        counts = np.where(is_hit, self.counts[pos], 0)
+        starts = np.where(is_hit, self.starts[pos], 0)
+        # 格子ごとの [start, start + count) を1つの配列に展開
+        qid    = np.repeat(np.repeat(np.arange(latitude.shape[0]), dy.shape[0]), counts)
+        within = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+        ids    = self.index[np.repeat(starts, counts) + within]
+        dist   = haversine(latitude[qid], longitude[qid], self.latitude[ids], self.longitude[ids])
+        return qid, ids, dist
+
+    def _chunks(self, n_query: int, n_ring: int):
+        """
+        展開する格子の数が chunk_cells 程度になるように検索点を分割
+        """
+        size = max(1, self.chunk_cells // min((2 * n_ring + 1) ** 2, max(len(self), 1)))
+        for i in range(0, n_query, size):
+            yield slice(i, min(i + size, n_query))
+
+    def query_radius(self, latitude: ArrayLike, longitude: ArrayLike, radius: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        検索点ごとの半径 radius [m] 以内の点
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (検索点の番号, 点の番号, 距離 [m])、検索点・距離の順に並ぶ
+        """
+        latitude  = np.asarray(latitude,  dtype=float)
+        longitude = np.asarray(longitude, dtype=float)
+        is_valid  = np.where(~(np.isnan(latitude) | np.isnan(longitude)))[0]
+        n_ring    = int(np.ceil(radius / self.cell_size))
+        list_qid, list_ids, list_dist = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)], [np.zeros(0)]
+        for chunk in self._chunks(is_valid.shape[0], n_ring):
+            qid, ids, dist = self._candidates(latitude[is_valid[chunk]], longitude[is_valid[chunk]], n_ring)
+            mask = dist <= radius
+            list_qid.append(is_valid[chunk][qid[mask]])
+            list_ids.append(ids[mask])
+            list_dist.append(dist[mask])
+        qid, ids, dist = np.concatenate(list_qid), np.concatenate(list_ids), np.concatenate(list_dist)
+        order = np.lexsort((dist, qid))
+        return qid[order], ids[order], dist[order]
+
+    def query_knn(self, latitude: ArrayLike, longitude: ArrayLike, k: int = 1, max_radius: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        検索点ごとの近い順に k 個の点
+
+        Args:
+            max_radius (Optional[float]): これより遠い点は含めない [m]、Noneの場合は制限なし
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (点の番号, 距離 [m]) いずれも (検索点の数, k)、見つからない場合は -1, inf
+        """
+        latitude  = np.asarray(latitude,  dtype=float)
+        longitude = np.asarray(longitude, dtype=float)
+        n_query   = latitude.shape[0]
+        out_ids   = np.full((n_query, k), -1, dtype=np.int64)
+        out_dist  = np.full((n_query, k), np.inf)
+        remain    = np.where(~(np.isnan(latitude) | np.isnan(longitude)))[0]
+        if len(self) == 0:
+            return out_ids, out_dist
+        # 検索点から全ての点を含む格子の範囲（これを超えて広げても結果は変わらない）
+        iy, ix = self._to_cell(latitude[remain], longitude[remain])
+        iy_pt, ix_pt = self.keys >> 32, ((self.keys & 0xFFFFFFFF) ^ 0x80000000) - 0x80000000
+        n_ring_max = int(max(
+            np.abs(iy[:, None] - np.array([iy_pt.min(), iy_pt.max()])[None, :]).max(initial=0),
+            np.abs(ix[:, None] - np.array([ix_pt.min(), ix_pt.max()])[None, :]).max(initial=0),
+        )) + 1
+        if max_radius is not None:
+            n_ring_max = min(n_ring_max, int(np.ceil(max_radius / self.cell_size)))
+        n_ring = 1
+        while remain.shape[0] > 0:
+            n_ring = min(n_ring, n_ring_max)
+            for chunk in self._chunks(remain.shape[0], n_ring):
+                target = remain[chunk]
+                qid, ids, dist = self._candidates(latitude[target], longitude[target], n_ring)
+                if max_radius is not None:
+                    mask = dist <= max_radius
+                    qid, ids, dist = qid[mask], ids[mask], dist[mask]
+                # 検索点ごとに距離の小さい順に k 個
+                order = np.lexsort((dist, qid))
+                qid, ids, dist = qid[order], ids[order], dist[order]
+                n     = np.bincount(qid, minlength=target.shape[0])
+                rank  = np.arange(qid.shape[0]) - np.repeat(np.cumsum(n) - n, n)
+                mask  = rank < k
+                out_ids [target[qid[mask]], rank[mask]] = ids [mask]
+                out_dist[target[qid[mask]], rank[mask]] = dist[mask]
+            if n_ring >= n_ring_max:
+                break
+            # k 番目の点が n_ring 格子分の距離以内にあれば、それより近い点は全て候補に含まれているので確定
+            is_done = out_dist[remain, k - 1] <= n_ring * self.cell_size
+            remain  = remain[~is_done]
+            n_ring *= 2
+        return out_ids, out_dist
+
+def summarize_neighbors(index: GridIndex, values: ArrayLike, latitude: ArrayLike, longitude: ArrayLike, k: int = 5, radius: float = 1000.0, max_radius: Optional[float] = None) -> pd.DataFrame:
+    """
+    検索点ごとに近傍の点の値（例: 公示地価の 円/m^2）を集計
+
+    Args:
+        index (GridIndex): 近傍の点の空間インデックス
+        values: index の点の値（index を作った点と同じ並び）
+        k (int): k近傍の件数
+        radius (float): 半径の集計の範囲 [m]
+        max_radius (Optional[float]): k近傍で含める最大の距離 [m]
+
+    Returns:
+        pd.DataFrame: 検索点と同じ並びで nearest_dist, nearest_id, knn_n, knn_median, knn_mean_dist, radius_n, radius_median
+    """
+    values    = np.asarray(values, dtype=float)
+    n_query   = len(latitude)
+    ids, dist = index.query_knn(latitude, longitude, k=k, max_radius=max_radius)
+    is_found  = ids >= 0
+    val_knn   = np.where(is_found, values[np.where(is_found, ids, 0)], np.nan)
+    qid, ids_r, _ = index.query_radius(latitude, longitude, radius)
+    val_r     = values[ids_r]
+    mask      = ~np.isnan(val_r)
+    radius_n, radius_median = group_median(qid[mask], val_r[mask], n_query)
+    # 近傍が見つからない検索点は NaN（全て NaN の行の警告は出さない）
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        knn_median    = np.nanmedian(val_knn, axis=1) if n_query > 0 else np.zeros(0)
+        knn_mean_dist = np.nanmean(np.where(is_found, dist, np.nan), axis=1) if n_query > 0 else np.zeros(0)
+    return pd.DataFrame({
+        "nearest_dist":  np.where(is_found[:, 0], dist[:, 0], np.nan),
+        "nearest_id":    ids[:, 0],
+        "knn_n":         (is_found & ~np.isnan(val_knn)).sum(axis=1),
+        "knn_median":    knn_median,
+        "knn_mean_dist": knn_mean_dist,
+        "radius_n":      radius_n,
+        "radius_median": radius_median,
+    })
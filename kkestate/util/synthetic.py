@@ -0,0 +1,396 @@
+"""
+負荷試験用の合成データ生成
+estate_main / estate_run / estate_detail / estate_mst_key と同じ列の DataFrame を物件数のチャンク単位で生成する
+  - キー名は物件種別ごとの語彙（key_mapper.KEY_FUNCTION_MAPPING に定義されたキー）から出現確率に従って選ぶ
+  - 値は kkestate/test/testcases.py の入力値、所在地は citycode.csv の市区町村、価格は都道府県別の対数正規分布から作成
+  - 物件数は都道府県の人口比、run の回数はポアソン分布、run の間隔は指数分布（1日以上）
+  - 2回目以降の run は前回から変化した値のみ estate_detail に含める（suumo.py と同じ差分保存）
+乱数は numpy でチャンク単位にまとめて発生させるため、1億行規模でも Python のループは出力行数に比例する部分のみ
+"""
+
+import datetime
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, List, Tuple, Iterator
+from .citycode import load_citycode_map
+from .key_mapper import KEY_FUNCTION_MAPPING
+from ..test import testcases
+
+
+# 都道府県コード（1-47）の人口 [万人]（物件数の比率に使用）
+PREF_POPULATION = [
+    522, 124, 121, 230,  96, 107, 183, 287, 193, 194,  734,  628, 1405,  924, 220, 103,
+    113,  77,  81, 205, 198, 363, 754, 177, 141, 258,  884,  547,  132,   92,  55,  67,
+    189, 280, 134,  72,  95, 133,  69, 514,  81, 131,  174,  112,  107,  159, 147,
+]
+
+# 都道府県コード -> 価格の中央値 [万円]（記載のない都道府県は DEFAULT_PRICE_MEDIAN）
+PREF_PRICE_MEDIAN = {
+    13: 6000, 14: 4500, 27: 3800, 11: 3500, 12: 3300, 26: 3300, 23: 3200, 28: 3000, 40: 2600, 1: 2400, 4: 2400, 34: 2500,
+}
+DEFAULT_PRICE_MEDIAN = 2000
+
+# 値が毎回変わるキー（run の日付から作成）
+SYNTHETIC_DATE_KEYS = {"情報提供日": 0, "次回更新日": 7}
+
+# testcases.py にない値の候補
+SYNTHETIC_TEXT_POOLS = {
+    "物件名": [
+        "パークハウス", "ライオンズマンション", "グランドメゾン", "プラウド", "ブリリア", "クレストフォルム",
+        "サンクタス", "ザ・パークハウス", "シティハウス", "ルネ", "コスモ", "ダイアパレス",
+    ],
+    "取引態様": ["仲介", "売主", "代理", "専任媒介", "一般媒介"],
+    "施工": ["大成建設", "鹿島建設", "清水建設", "長谷工コーポレーション", "前田建設工業", "戸田建設"],
+    "管理": ["委託(通勤)/管理会社", "委託(巡回)/管理会社", "自主管理", "委託(常駐)/管理会社"],
+    "私道負担・道路": ["無", "北側 幅員4.0m 公道", "南側 幅員6.0m 公道", "私道負担 25.3m2", "東側 幅員5.5m 私道"],
+    "販売スケジュール": ["販売開始予定：2025年4月中旬", "先着順申込受付中", "第1期販売中"],
+    "イベント情報": ["現地見学会開催中", "モデルルーム公開中（要予約）", "オンライン相談会実施中"],
+}
+
+# 物件種別（suumo.py の LIST_TYPE） -> (出現比率, [(キー名, 出現確率, 変化率の倍率, 値の候補)])
+#   変化率の倍率: 2回目以降の run で値が変わる確率 = change_rate * 倍率（0 は変化しない）
+#   値の候補: testcases.py の TEST_CASES_* の名前、"price" / "address" / "date" は専用の生成、それ以外は SYNTHETIC_TEXT_POOLS のキー
+SYNTHETIC_LISTING_TYPES: Dict[str, Tuple[float, List[Tuple[str, float, float, str]]]] = {
+    "ms/chuko": (0.45, [
+        ("物件名",           1.00, 0.0, "物件名"),
+        ("価格",             1.00, 3.0, "price"),
+        ("所在地",           1.00, 0.0, "address"),
+        ("交通",             1.00, 0.1, "TEST_CASES_ACCESS"),
+        ("間取り",           1.00, 0.0, "TEST_CASES_LAYOUT"),
+        ("専有面積",         1.00, 0.0, "TEST_CASES_AREA"),
+        ("その他面積",       0.90, 0.0, "TEST_CASES_AREAS"),
+        ("所在階",           0.90, 0.0, "TEST_CASES_FLOOR"),
+        ("向き",             0.90, 0.0, "TEST_CASES_DIRECTION"),
+        ("築年月",           1.00, 0.0, "TEST_CASES_DATE1"),
+        ("総戸数",           0.95, 0.0, "TEST_CASES_UNITS1"),
+        ("管理費",           0.95, 0.2, "TEST_CASES_MANAGEMENT_FEE"),
+        ("修繕積立金",       0.95, 0.3, "TEST_CASES_REPAIR_FUND"),
+        ("構造・階建て",     0.95, 0.0, "TEST_CASES_BUILDING_STRUCTURE"),
+        ("引渡可能時期",     0.90, 1.0, "TEST_CASES_DELIVERY_DATE"),
+        ("リフォーム",       0.40, 0.2, "TEST_CASES_REFORM"),
+        ("駐車場",           0.70, 0.2, "TEST_CASES_PARKING"),
+        ("用途地域",         0.60, 0.0, "TEST_CASES_ZONING"),
+        ("特徴ピックアップ", 0.80, 0.5, "TEST_CASES_FEATURE_PICKUP"),
+        ("周辺環境",         0.50, 0.1, "TEST_CASES_SURROUNDING_FACILITIES"),
+        ("取引態様",         0.90, 0.0, "取引態様"),
+        ("情報提供日",       1.00, 0.0, "date"),
+        ("次回更新日",       1.00, 0.0, "date"),
+    ]),
+    "chukoikkodate": (0.30, [
+        ("物件名",           0.60, 0.0, "物件名"),
+        ("価格",             1.00, 3.0, "price"),
+        ("所在地",           1.00, 0.0, "address"),
+        ("交通",             1.00, 0.1, "TEST_CASES_ACCESS"),
+        ("間取り",           1.00, 0.0, "TEST_CASES_LAYOUT2"),
+        ("土地面積",         1.00, 0.0, "TEST_CASES_AREA"),
+        ("建物面積",         1.00, 0.0, "TEST_CASES_AREA"),
+        ("築年月",           1.00, 0.0, "TEST_CASES_DATE1"),
+        ("引渡可能時期",     0.90, 1.0, "TEST_CASES_DELIVERY_DATE"),
+        ("建ぺい率・容積率", 0.95, 0.0, "TEST_CASES_BUILDING_COVERAGE"),
+        ("用途地域",         0.90, 0.0, "TEST_CASES_ZONING"),
+        ("地目",             0.80, 0.0, "TEST_CASES_LAND_USE"),
+        ("構造・工法",       0.80, 0.0, "TEST_CASES_BUILDING_STRUCTURE2"),
+        ("私道負担・道路",   0.90, 0.0, "私道負担・道路"),
+        ("駐車場",           0.80, 0.1, "TEST_CASES_PARKING"),
+        ("リフォーム",       0.50, 0.2, "TEST_CASES_REFORM"),
+        ("特徴ピックアップ", 0.80, 0.5, "TEST_CASES_FEATURE_PICKUP"),
+        ("取引態様",         0.90, 0.0, "取引態様"),
+        ("情報提供日",       1.00, 0.0, "date"),
+        ("次回更新日",       1.00, 0.0, "date"),
+    ]),
+    "ikkodate": (0.15, [
+        ("物件名",           1.00, 0.0, "物件名"),
+        ("価格",             1.00, 2.0, "price"),
+        ("最多価格帯",       0.50, 1.0, "TEST_CASES_PRICE_BAND"),
+        ("所在地",           1.00, 0.0, "address"),
+        ("交通",             1.00, 0.1, "TEST_CASES_ACCESS"),
+        ("間取り",           1.00, 0.2, "TEST_CASES_LAYOUT2"),
+        ("土地面積",         1.00, 0.2, "TEST_CASES_AREA"),
+        ("建物面積",         1.00, 0.2, "TEST_CASES_AREA"),
+        ("販売戸数",         0.90, 1.0, "TEST_CASES_UNITS2"),
+        ("総戸数",           0.90, 0.0, "TEST_CASES_UNITS1"),
+        ("完成時期（築年月）", 0.90, 0.0, "TEST_CASES_DATE1"),
+        ("引渡可能時期",     0.90, 0.5, "TEST_CASES_DELIVERY_DATE"),
+        ("建ぺい率・容積率", 0.95, 0.0, "TEST_CASES_BUILDING_COVERAGE"),
+        ("用途地域",         0.90, 0.0, "TEST_CASES_ZONING"),
+        ("地目",             0.80, 0.0, "TEST_CASES_LAND_USE"),
+        ("構造・工法",       0.80, 0.0, "TEST_CASES_BUILDING_STRUCTURE2"),
+        ("私道負担・道路",   0.90, 0.0, "私道負担・道路"),
+        ("制限事項",         0.50, 0.0, "TEST_CASES_RESTRICTIONS"),
+        ("特徴ピックアップ", 0.80, 0.5, "TEST_CASES_FEATURE_PICKUP"),
+        ("周辺環境",         0.60, 0.1, "TEST_CASES_SURROUNDING_FACILITIES"),
+        ("取引態様",         0.90, 0.0, "取引態様"),
+        ("情報提供日",       1.00, 0.0, "date"),
+        ("次回更新日",       1.00, 0.0, "date"),
+    ]),
+    "ms/shinchiku": (0.10, [
+        ("物件名",           1.00, 0.0, "物件名"),
+        ("価格",             0.80, 2.0, "TEST_CASES_PRICE"),
+        ("最多価格帯",       0.80, 1.0, "TEST_CASES_PRICE_BAND2"),
+        ("所在地",           1.00, 0.0, "address"),
+        ("交通",             1.00, 0.1, "TEST_CASES_ACCESS"),
+        ("間取り",           1.00, 0.5, "TEST_CASES_LAYOUT"),
+        ("専有面積",         1.00, 0.5, "TEST_CASES_AREA"),
+        ("その他面積",       0.90, 0.5, "TEST_CASES_AREAS"),
+        ("総戸数",           1.00, 0.0, "TEST_CASES_UNITS1"),
+        ("今回販売戸数",     0.90, 1.0, "TEST_CASES_UNITS2"),
+        ("完成時期",         1.00, 0.0, "TEST_CASES_DATE1"),
+        ("引渡時期",         1.00, 0.2, "TEST_CASES_DATE2"),
+        ("管理費",           0.95, 0.2, "TEST_CASES_MANAGEMENT_FEE"),
+        ("管理準備金",       0.70, 0.1, "TEST_CASES_MANAGEMENT_PREP_FEE"),
+        ("修繕積立金",       0.95, 0.2, "TEST_CASES_REPAIR_FUND"),
+        ("修繕積立基金",     0.80, 0.1, "TEST_CASES_REPAIR_FUND_BASIC"),
+        ("その他諸経費",     0.70, 0.1, "TEST_CASES_OTHER_EXPENSES"),
+        ("構造・階建て",     1.00, 0.0, "TEST_CASES_BUILDING_STRUCTURE"),
+        ("用途地域",         0.90, 0.0, "TEST_CASES_ZONING"),
+        ("施工",             0.90, 0.0, "施工"),
+        ("管理",             0.90, 0.0, "管理"),
+        ("取引条件有効期限", 0.90, 1.0, "TEST_CASES_DATE_EXACT"),
+        ("特徴ピックアップ", 0.80, 0.3, "TEST_CASES_FEATURE_PICKUP"),
+        ("販売スケジュール", 0.60, 1.0, "販売スケジュール"),
+        ("イベント情報",     0.50, 1.0, "イベント情報"),
+        ("情報提供日",       1.00, 0.0, "date"),
+        ("次回更新日",       1.00, 0.0, "date"),
+    ]),
+}
+
+# 都道府県コード -> [都道府県名+市区町村名]（グローバル変数）
+_PREF_CITIES = None
+
+
+# ============================================================================
+# マスタ・値の候補
+# ============================================================================
+def _load_pref_cities() -> Dict[int, List[str]]:
+    """
+    citycode.csv から都道府県コードごとの「都道府県名+市区町村名」のリストを作成（初回のみ）
+    """
+    global _PREF_CITIES
+    if _PREF_CITIES is None:
+        _PREF_CITIES = {}
+        for full_name, code in sorted(load_citycode_map().items(), key=lambda x: x[1]):
+            _PREF_CITIES.setdefault(int(code[:2]), []).append(full_name)
+    return _PREF_CITIES
+
+def get_synthetic_key_names() -> List[str]:
+    """
+    合成データで使用する全てのキー名（estate_mst_key.name）を取得
+    """
+    key_names = []
+    for _, keys in SYNTHETIC_LISTING_TYPES.values():
+        for key_name, _, _, _ in keys:
+            assert key_name in KEY_FUNCTION_MAPPING, f"unknown key: {key_name}"
+            if key_name not in key_names:
+                key_names.append(key_name)
+    return key_names
+
+def make_synthetic_mst_key(df_key: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    合成データのキー名のうち estate_mst_key に未登録のものに id を割り当てる
+
+    Args:
+        df_key (Optional[pd.DataFrame]): 登録済みの estate_mst_key（id, name の列）
+
+    Returns:
+        pd.DataFrame: 追加する estate_mst_key の行（id, id_cleaned, name の列）
+    """
+    registered = set() if df_key is None else set(df_key["name"].tolist())
+    id_from    = 1 if df_key is None or df_key.shape[0] == 0 else int(df_key["id"].max()) + 1
+    key_names  = [x for x in get_synthetic_key_names() if x not in registered]
+    return pd.DataFrame({"id": np.arange(id_from, id_from + len(key_names), dtype=int), "id_cleaned": None, "name": key_names})
+
+def _get_value_pool(source: str) -> np.ndarray:
+    """
+    値の候補（重複なし、文字列のみ）を取得
+    """
+    if source in SYNTHETIC_TEXT_POOLS:
+        values = SYNTHETIC_TEXT_POOLS[source]
+    else:
+        values = [x["input"] for x in getattr(testcases, source)]
+    values = [x for x in dict.fromkeys(values) if isinstance(x, str) and x.strip() != ""]
+    assert len(values) > 0, f"empty value pool: {source}"
+    return np.array(values, dtype=object)
+
+def _format_price(values: np.ndarray) -> List[str]:
+    """
+    価格 [万円] を suumo の表記（例: "3980万円"、"1億2000万円"）に変換
+    """
+    list_str = []
+    for x in values.tolist():
+        oku, man = divmod(int(x), 10000)
+        if oku == 0:
+            list_str.append(f"{man}万円")
+        elif man == 0:
+            list_str.append(f"{oku}億円")
+        else:
+            list_str.append(f"{oku}億{man}万円")
+    return list_str
+
+
+# ============================================================================
+# 合成データの生成
+# ============================================================================
+def _group_cumsum(x: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    連続する counts 行ごとの累積和（行方向、2次元配列にも対応）
+    """
+    cumsum = np.cumsum(x, axis=0)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    base   = cumsum[starts] - x[starts]
+    return cumsum - np.repeat(base, counts, axis=0)
+
+def _generate_detail(
+    rng: np.random.Generator, listing_type: str, df_run: pd.DataFrame, pref_codes: np.ndarray,
+    key_ids: Dict[str, int], change_rate: float
+) -> pd.DataFrame:
+    """
+    1つの物件種別の成功した run について estate_detail の行を生成
+
+    Args:
+        df_run (pd.DataFrame): 物件ごとに連続して並んだ成功した run（id, id_main, timestamp, is_first の列）
+        pref_codes (np.ndarray): 物件ごとの都道府県コード（df_run の物件の並び順）
+
+    Returns:
+        pd.DataFrame: id_run, id_key, value の列
+    """
+    _, keys = SYNTHETIC_LISTING_TYPES[listing_type]
+    n_estate = pref_codes.shape[0]
+    counts   = df_run.groupby("id_main", sort=False).size().values
+    is_first = df_run["is_first"].values
+    estate_index = np.repeat(np.arange(n_estate), counts)
+    list_df = []
+    for key_name, presence, change_mult, source in keys:
+        is_present = (rng.random(n_estate) < presence)[estate_index]
+        if source == "date":
+            # run の日付から作成（毎回変わる）
+            is_emit = is_present
+            dates   = pd.DatetimeIndex(df_run["timestamp"].values[is_emit] + np.timedelta64(SYNTHETIC_DATE_KEYS[key_name], "D"))
+            values  = [f"{x}年{y}月{z}日" for x, y, z in zip(dates.year.tolist(), dates.month.tolist(), dates.day.tolist())]
+        else:
+            is_change = np.zeros(df_run.shape[0], dtype=bool) if change_mult == 0 else (rng.random(df_run.shape[0]) < min(change_rate * change_mult, 1.0))
+            is_change = is_change & (~is_first)
+            is_emit   = is_present & (is_first | is_change)
+            if source == "price":
+                # 都道府県別の中央値の対数正規分布、変化は 1-7% の値下げ
+                median  = np.array([PREF_PRICE_MEDIAN.get(x, DEFAULT_PRICE_MEDIAN) for x in pref_codes.tolist()], dtype=float)
+                log_p0  = np.log(median) + rng.normal(0.0, 0.5, n_estate)
+                log_dp  = np.where(is_change, np.log(rng.uniform(0.93, 0.99, df_run.shape[0])), 0.0)
+                prices  = np.exp(log_p0[estate_index] + _group_cumsum(log_dp, counts))
+                prices  = np.maximum(np.round(prices / 10) * 10, 100)
+                # 10万円単位に丸めて直前と同じ価格になった場合は変化なし
+                is_emit = is_emit & (is_first | (prices != np.concatenate([[np.nan], prices[:-1]])))
+                values  = _format_price(prices[is_emit])
+            elif source == "address":
+                # 市区町村 + 丁目（変化しない）
+                cities  = _load_pref_cities()
+                address = [
+                    f"{cities[x][i % len(cities[x])]}{j}丁目"
+                    for x, i, j in zip(pref_codes.tolist(), rng.integers(0, 1 << 30, n_estate).tolist(), rng.integers(1, 10, n_estate).tolist())
+                ]
+                values  = np.array(address, dtype=object)[estate_index[is_emit]].tolist()
+            else:
+                # 候補から選択、変化する場合は直前と異なる候補へ移る
+                pool    = _get_value_pool(source)
+                n_pool  = pool.shape[0]
+                index0  = rng.integers(0, n_pool, n_estate)[estate_index]
+                shift   = np.where(is_change, rng.integers(1, max(n_pool, 2), df_run.shape[0]), 0) if n_pool > 1 else np.zeros(df_run.shape[0], dtype=int)
+                is_emit = is_emit & (is_first | (shift > 0))
+                values  = pool[((index0 + _group_cumsum(shift, counts)) % n_pool)[is_emit]].tolist()
+        list_df.append(pd.DataFrame({"id_run": df_run["id"].values[is_emit], "id_key": key_ids[key_name], "value": values}))
+    return pd.concat(list_df, ignore_index=True)
+
+def generate_synthetic_chunks(
+    n_estates: int, mean_runs: float = 8.0, change_rate: float = 0.05, failure_rate: float = 0.02,
+    date_from: str = "2024-01-01", date_to: str = "2025-01-01", mean_interval_days: float = 7.0,
+    prefcodes: Optional[List[int]] = None, key_ids: Optional[Dict[str, int]] = None,
+    id_main_from: int = 1, id_run_from: int = 1, chunk_size: int = 100000, seed: int = 0
+) -> Iterator[Dict[str, pd.DataFrame]]:
+    """
+    estate_main / estate_run / estate_detail の合成データを物件 chunk_size 件ごとに生成
+
+    Args:
+        n_estates (int): 物件数（estate_main の行数）
+        mean_runs (float): 物件あたりの run の平均回数（1 + ポアソン分布）
+        change_rate (float): 2回目以降の run で値が変わる基本の確率（キーごとの倍率を掛ける）
+        failure_rate (float): run が失敗する確率（失敗した run は estate_detail を持たない）
+        date_from (str): 最初の run の日時の下限
+        date_to (str): run の日時の上限（これを超える run は作成しない）
+        mean_interval_days (float): run の間隔の平均日数（指数分布、1日以上）
+        prefcodes (Optional[List[int]]): 対象の都道府県コード、Noneの場合は全国
+        key_ids (Optional[Dict[str, int]]): キー名 -> estate_mst_key.id、Noneの場合は get_synthetic_key_names の順に1から
+        id_main_from (int): estate_main.id の開始値
+        id_run_from (int): estate_run.id の開始値
+        chunk_size (int): 1チャンクあたりの物件数
+        seed (int): 乱数シード
+
+    Yields:
+        Dict[str, pd.DataFrame]: {"estate_main": id, name, url, sys_updated / "estate_run": id, id_main, is_success, is_ref, timestamp
+            / "estate_detail": id_run, id_key, value}
+    """
+    assert n_estates >= 0 and mean_runs >= 1.0 and mean_interval_days >= 1.0
+    assert 0.0 <= change_rate <= 1.0 and 0.0 <= failure_rate < 1.0
+    if key_ids is None:
+        key_ids = {x: i + 1 for i, x in enumerate(get_synthetic_key_names())}
+    rng = np.random.default_rng(seed)
+    ts_from = np.datetime64(datetime.datetime.fromisoformat(date_from), "s")
+    ts_to   = np.datetime64(datetime.datetime.fromisoformat(date_to),   "s")
+    assert ts_from < ts_to
+    prefcodes  = list(range(1, 48)) if prefcodes is None else [int(x) for x in prefcodes]
+    pref_prob  = np.array([PREF_POPULATION[x - 1] for x in prefcodes], dtype=float)
+    pref_prob /= pref_prob.sum()
+    listing_types = list(SYNTHETIC_LISTING_TYPES.keys())
+    type_prob  = np.array([SYNTHETIC_LISTING_TYPES[x][0] for x in listing_types], dtype=float)
+    type_prob /= type_prob.sum()
+    span_sec   = int((ts_to - ts_from) / np.timedelta64(1, "s"))
+
+    id_main, id_run = id_main_from, id_run_from
+    for i_chunk in range(0, n_estates, chunk_size):
+        n_chunk = min(chunk_size, n_estates - i_chunk)
+        ids_main   = np.arange(id_main, id_main + n_chunk, dtype=np.int64)
+        pref_codes = np.array(prefcodes)[rng.choice(len(prefcodes), n_chunk, p=pref_prob)]
+        type_index = rng.choice(len(listing_types), n_chunk, p=type_prob)
+
+        # estate_run: 最初の run の日時は一様分布、以降は指数分布の間隔（日付が重ならないよう1日以上）
+        n_runs    = 1 + rng.poisson(mean_runs - 1.0, n_chunk)
+        run_main  = np.repeat(ids_main, n_runs)
+        run_no    = np.arange(run_main.shape[0]) - np.repeat(np.cumsum(n_runs) - n_runs, n_runs)
+        first_ts  = ts_from + rng.integers(0, span_sec, n_chunk).astype("timedelta64[s]")
+        interval  = np.where(run_no == 0, 0, np.floor(1 + rng.exponential(max(mean_interval_days - 1.0, 1e-9), run_main.shape[0])))
+        offset    = _group_cumsum((interval * 86400).astype(np.int64), n_runs)
+        timestamp = np.repeat(first_ts, n_runs) + offset.astype("timedelta64[s]")
+        df_run = pd.DataFrame({"id_main": run_main, "run_no": run_no, "timestamp": timestamp})
+        df_run = df_run.loc[(df_run["run_no"] == 0) | (df_run["timestamp"] <= ts_to)].reset_index(drop=True)
+        df_run["id"]         = np.arange(id_run, id_run + df_run.shape[0], dtype=np.int64)
+        df_run["is_success"] = rng.random(df_run.shape[0]) >= failure_rate
+        df_run["is_ref"]     = False
+
+        # estate_main
+        df_main = pd.DataFrame({
+            "id": ids_main,
+            "name": [f"合成物件{x}" for x in ids_main.tolist()],
+            "url": [f"/{listing_types[x]}/{y:02d}/nc_{z:09d}/" for x, y, z in zip(type_index.tolist(), pref_codes.tolist(), ids_main.tolist())],
+            "sys_updated": df_run.groupby("id_main")["timestamp"].max().reindex(ids_main).values,
+        })
+
+        # estate_detail: 物件種別ごとに成功した run の値を生成
+        df_success = df_run.loc[df_run["is_success"], ["id", "id_main", "timestamp"]].reset_index(drop=True)
+        df_success["is_first"] = ~df_success["id_main"].duplicated()
+        list_df = []
+        for i_type, listing_type in enumerate(listing_types):
+            mask_main = (type_index == i_type)
+            df_type   = df_success.loc[df_success["id_main"].isin(ids_main[mask_main])]
+            if df_type.shape[0] == 0:
+                continue
+            # 成功した run を持つ物件のみ（df_type の物件の並び順）
+            pref_type = pd.Series(pref_codes, index=ids_main).loc[df_type["id_main"].unique()].values
+            list_df.append(_generate_detail(rng, listing_type, df_type, pref_type, key_ids, change_rate))
+        df_detail = pd.concat(list_df, ignore_index=True) if len(list_df) > 0 else pd.DataFrame(columns=["id_run", "id_key", "value"])
+        df_detail = df_detail.sort_values(["id_run", "id_key"]).reset_index(drop=True)
+
+        id_main += n_chunk
+        id_run  += df_run.shape[0]
+        yield {
+            "estate_main":   df_main,
+            "estate_run":    df_run[["id", "id_main", "is_success", "is_ref", "timestamp"]],
+            "estate_detail": df_detail,
+        }
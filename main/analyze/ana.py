@@ -1,13 +1,22 @@
-import argparse, datetime
+import argparse, datetime, json, sys, time
+import multiprocessing
 import numpy as np
 import pandas as pd
 from kkpsgre.connector import DBConnector
 from kklogger import set_logger
 from kkestate.config.psgre import HOST, PORT, USER, PASS, DBNAME, DBTYPE
+from kkestate.util.profiler import add_profile_arguments, start_profiling
+from kkestate.util.price_grid import GRID_SIZES, aggregate_grid_levels, grid_bounds, save_grid
+from kkestate.util.spatial_index import GridIndex, summarize_neighbors
+from kkestate.util.columnar_store import read_store
+from kkestate.util.numeric_extract import NUMERIC_NAMES, make_numeric_frame
 import folium
 
 
 LOGGER = set_logger(__name__)
+# 都道府県をまたいで共有するデータ（fork した子プロセスにはコピーせずに引き継がれる）と、プロセスごとのDB接続
+SHARED = {}
+DB     = None
 DICT_TYPE = {
     (False,   'house'): "中古戸",
     (False, 'mansion'): "中古MS",
@@ -17,53 +26,123 @@ DICT_TYPE = {
 }
 
 
-def make_heatmap(df: pd.DataFrame, base_d: float, save_path: str="./heatmap.html"):
-    # don't use now
-    assert isinstance(df, pd.DataFrame)
-    assert isinstance(base_d,    float)
-    assert isinstance(save_path, str)    
-    # dataframe processing
-    df      = df.copy()
-    lat_min = int(df["latitude" ].min() / base_d) * base_d
-    lat_max = int(df["latitude" ].max() / base_d) * base_d + base_d
-    lng_min = int(df["longitude"].min() / base_d) * base_d
-    lng_max = int(df["longitude"].max() / base_d) * base_d + base_d
-    df      = df.loc[~df["latitude"].isna()]
-    df["latitude" ] = ((df["latitude" ] - lat_min) / base_d).astype(int)
-    df["longitude"] = ((df["longitude"] - lng_min) / base_d).astype(int)
-    df["grid"     ] = df[["latitude", "longitude"]].apply(lambda x: tuple(x), axis=1)
-    df_heat = df.groupby("grid")["price_per_sqm"].mean()
-    df_heat.index = pd.MultiIndex.from_tuples(df_heat.index.tolist())
-    ndf  = np.zeros((max(df["latitude"].max() + 1, df["longitude"].max() + 1), max(df["latitude"].max() + 1, df["longitude"].max() + 1)), dtype=int)
-    for y, x, v in df_heat.loc[~df_heat.isna()].reset_index().to_numpy().astype(int):
-        ndf[y, x] = v
-    # make heatmap
+# 地図・近傍の集計で使う reinfolib_land の列（--store のローカルキャッシュから読み込む列）
+LAND_COLUMNS = ["category", "reference_number", "location", "price_per_sqm", "land_area"]
+
+
+def make_heatmap(df_grid: pd.DataFrame, save_path: str="./heatmap.html", level_show: int = 3):
+    """
+    格子集計（kkestate.util.price_grid）の中央値を、レベルごとに1つの GeoJSON レイヤーとして描画
+    level_show のレベルのみ最初に表示し、その他のレベルはレイヤーの切り替えで表示する
+    """
+    from folium.utilities import JsCode
     from branca.colormap import linear
-    m    = folium.Map(location=[36.0, 138.0], zoom_start=5)
-    lats = np.arange(lat_min, lat_max, base_d)
-    lons = np.arange(lng_min, lng_max, base_d)
-    colormap = linear.YlOrRd_09.scale(ndf.min(), ndf.max())
-    colormap.caption = 'average price'
+    assert isinstance(df_grid, pd.DataFrame)
+    assert isinstance(save_path, str)
+    df_grid = grid_bounds(df_grid)
+    m = folium.Map(
+        location=[(df_grid["lat_min"].min() + df_grid["lat_max"].max()) / 2, (df_grid["lng_min"].min() + df_grid["lng_max"].max()) / 2],
+        zoom_start=10, tiles='CartoDB positron', control_scale=False, prefer_canvas=True,
+    )
+    m.fit_bounds([[df_grid["lat_min"].min(), df_grid["lng_min"].min()], [df_grid["lat_max"].max(), df_grid["lng_max"].max()]])
+    colormap = linear.YlOrRd_09.scale(df_grid["median"].quantile(0.10), df_grid["median"].quantile(0.90))
+    colormap.caption = 'median price (10% - 90%)'
     colormap.add_to(m)
-    for i, lat in enumerate(lats):
-        for j, lon in enumerate(lons):
-            val   = ndf[i, j]
-            if val == 0:
-                continue
-            color = colormap(val)
-            folium.Rectangle(
-                bounds=[[lat,        lon],
-                        [lat+base_d, lon+base_d] ],
-                stroke=False,          # 枠線なし
-                fill=True,
-                fill_color=color,
-                fill_opacity=0.5       # 0〜1で調整
-            ).add_to(m)
+    palette  = [colormap(x) for x in np.linspace(colormap.vmin, colormap.vmax, 256)]
+    m.get_root().header.add_child(folium.Element(MAP_HEADER % {"palette": json.dumps(palette)}))
+    df_grid["color"] = to_color_index(df_grid["median"].to_numpy(), colormap.vmin, colormap.vmax, n_levels=len(palette))
+    for level, dfwk in df_grid.groupby("level"):
+        features = [
+            {"type": "Feature", "geometry": {"type": "Polygon", "coordinates": [[[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]]}, "properties": {"c": c, "m": int(v), "n": n}}
+            for x0, y0, x1, y1, c, v, n in zip(
+                dfwk["lng_min"].round(6).tolist(), dfwk["lat_min"].round(6).tolist(), dfwk["lng_max"].round(6).tolist(), dfwk["lat_max"].round(6).tolist(),
+                dfwk["color"].tolist(), dfwk["median"].tolist(), dfwk["n"].tolist(),
+            )
+        ]
+        folium.GeoJson(
+            {"type": "FeatureCollection", "features": features},
+            name=f"grid {GRID_SIZES[level]}",
+            show=(level == level_show),
+            on_each_feature=JsCode(HEATMAP_ON_EACH_FEATURE),
+        ).add_to(m)
+    folium.LayerControl(collapsed=False).add_to(m)
     m.save(save_path)
 
 
+# 地点のポップアップ・ラベル（GeoJSON の properties から地図上で作成）
+# properties: r: 円の半径, c: 色（map_palette の番号）, p: 円/m^2, a: 面積, o: 価格（万円、reinfolib は -1）, i: estate_main.id, u: suumo の url
+MAP_ON_EACH_FEATURE = """
+function (feature, layer) {
+    const x = feature.properties, color = map_palette[x.c];
+    layer.setRadius(x.r);
+    layer.setStyle({color: color, fillColor: color});
+    layer.bindPopup(
+        %(category)s + ": " + x.p + " 円/m^2" + "<br>area: " + x.a + " m^2" + "<br>price: " + x.o + " 円" +
+        (x.u ? "<br><a href='/property/" + x.i + "' target='_blank' rel='noopener noreferrer'>detail</a>" : "") +
+        (x.u ? "<br><a href='https://suumo.jp/" + x.u + "' target='_blank' rel='noopener noreferrer'>suumo</a>" : "")
+    );
+    layer.bindTooltip("<span style='color:" + color + "'>" + Math.trunc(x.p / 1000) + "k</span>", {permanent: true, direction: "top", className: "map-price-label"});
+}
+"""
+# 格子のスタイル・ツールチップ（properties: c: 色（map_palette の番号）, m: 中央値 円/m^2, n: 件数）
+HEATMAP_ON_EACH_FEATURE = """
+function (feature, layer) {
+    const x = feature.properties;
+    layer.setStyle({stroke: false, fill: true, fillColor: map_palette[x.c], fillOpacity: 0.5});
+    layer.bindTooltip(x.m + " 円/m^2 (n=" + x.n + ")");
+}
+"""
+MAP_HEADER = """
+<script>var map_palette = %(palette)s;</script>
+<style>
+.map-price-label { background: transparent; border: none; box-shadow: none; font-size: 12px; font-weight: bold; text-shadow: 1px 1px 1px white; }
+.map-price-label::before { display: none; }
+</style>
+"""
+
+
+def to_color_index(values: np.ndarray, vmin: float, vmax: float, n_levels: int = 256) -> np.ndarray:
+    """
+    値を vmin - vmax で n_levels 段階の色の番号（0 - n_levels-1）に一括で変換
+    """
+    index = (np.asarray(values, dtype=float) - vmin) / (vmax - vmin if vmax > vmin else 1.0) * (n_levels - 1)
+    return np.clip(np.round(index), 0, n_levels - 1).astype(int)
+
+
+def make_points(df_land: pd.DataFrame, df_suumo: pd.DataFrame) -> pd.DataFrame:
+    """
+    reinfolib と suumo の地点を1つの DataFrame にまとめ、カテゴリ・円の半径・ポップアップの値を列として一括で作成
+    """
+    df_land_pt = pd.DataFrame({
+        "latitude": df_land["latitude"], "longitude": df_land["longitude"], "price": df_land["price_per_sqm"], "area": df_land["land_area"],
+        "category": df_land["category"], "price_org": -1.0, "id": None, "url": None,
+    })
+    df_suumo_pt = pd.DataFrame({
+        "latitude": df_suumo["latitude"], "longitude": df_suumo["longitude"], "price": df_suumo["price_per_sqm"], "area": df_suumo["area"],
+        "category": [DICT_TYPE.get((None if pd.isna(x) else bool(x), y)) for x, y in zip(df_suumo["is_new"], df_suumo["building_type"])],
+        "price_org": df_suumo["price"], "id": df_suumo["id"], "url": df_suumo["url"],
+    })
+    df = pd.concat([df_land_pt, df_suumo_pt], ignore_index=True)
+    for x in ["latitude", "longitude", "price", "area", "price_org"]:
+        df[x] = pd.to_numeric(df[x], errors="coerce").astype(float)
+    df["area"] = df["area"].fillna(df_land["land_area"].median())
+    df = df.loc[~(df["latitude"].isna() | df["longitude"].isna() | df["price"].isna() | df["category"].isna())].reset_index(drop=True)
+    area_min, area_max = df_suumo["area"].quantile(0.01), df_suumo["area"].quantile(0.99)
+    df["radius"   ] = np.round(25.0 * np.clip((df["area"].to_numpy() - area_min) / (area_max - area_min), 0.0, 1.0) + 5.0, 1)
+    df["latitude" ] = df["latitude" ].round(6)
+    df["longitude"] = df["longitude"].round(6)
+    for x in ["price", "area", "price_org"]:
+        df[x] = df[x].fillna(-1).astype(int)
+    df["id"] = df["id"].where(df["url"].notna(), None)
+    return df
+
+
 def make_map(df_land: pd.DataFrame, df_suumo: pd.DataFrame, save_path: str="./map.html"):
-    from folium.features import DivIcon
+    """
+    カテゴリごとに1つの GeoJSON レイヤー（FeatureCollection）として地点を描画
+    各 Feature には数値のみを持たせ、色・半径・ポップアップ・ラベルは地図上（JavaScript）で作成する
+    """
+    from folium.utilities import JsCode
     assert isinstance(df_land, pd.DataFrame)
     assert isinstance(df_suumo, pd.DataFrame)
     assert isinstance(save_path, str)
@@ -76,146 +155,220 @@ def make_map(df_land: pd.DataFrame, df_suumo: pd.DataFrame, save_path: str="./ma
         zoom_start=10,        # お好みのズームレベルに
         tiles='CartoDB positron',
         control_scale=False,  # スケール（距離目盛）も非表示
-        max_bounds=True       # マップの端（bounds）外へのパンを制限
+        max_bounds=True,      # マップの端（bounds）外へのパンを制限
+        prefer_canvas=True,   # 多数の円を canvas で描画
     )
     m.fit_bounds([
         [lat_min, lng_min],   # 南西コーナー
         [lat_max, lng_max],   # 北東コーナー
     ])
-    from folium.plugins import MarkerCluster
     from branca.colormap import linear
     colormap = linear.YlOrRd_09.scale( df_suumo["price_per_sqm"].quantile(0.10), df_suumo["price_per_sqm"].quantile(0.90))
     colormap.caption = 'average price (10% - 90%)'
     colormap.add_to(m)
-    groups = {}
+    palette  = [colormap(x) for x in np.linspace(colormap.vmin, colormap.vmax, 256)]
+    m.get_root().header.add_child(folium.Element(MAP_HEADER % {"palette": json.dumps(palette)}))
+    df       = make_points(df_land, df_suumo)
+    df["color"] = to_color_index(df["price"].to_numpy(), colormap.vmin, colormap.vmax, n_levels=len(palette))
     for cat in (df_land['category'].unique().tolist() + list(DICT_TYPE.values())):
-        fg = folium.FeatureGroup(name=cat, show=True)
-        mc = MarkerCluster(
-            name=f"{cat} Cluster",
-            disableClusteringAtZoom=15
-        ).add_to(fg)
-        m.add_child(fg)
-        groups[cat] = mc
-    area_min, area_max = df_suumo["area"].quantile(0.01), df_suumo["area"].quantile(0.99)
-    list_points = [(x, y, "land") for x, y in df_land.iterrows()] + [(x, y, "suumo") for x, y in df_suumo.iterrows()]
-    for _, row, _type in list_points:
-        if _type == "land":
-            lat, lon, price, area, cat = row['latitude'], row['longitude'], row['price_per_sqm'], row['land_area'], row['category']
-            price_org = -1
-            url = None
-        else:
-            lat, lon, price, area = row['latitude'], row['longitude'], row["price_per_sqm"], row["area"]
-            price_org = row["price"]
-            cat1, cat2, url = row["building_type"], row["is_new"], row["url"]
-            cat = DICT_TYPE.get((cat2, cat1))
-        if area is None or np.isnan(area):
-            area = df_land["land_area"].median()
-        if np.isnan(lat) or np.isnan(lon) or np.isnan(price):
+        dfwk = df.loc[df["category"] == cat]
+        if dfwk.shape[0] == 0:
             continue
-        LOGGER.info(f"{lat}, {lon}, {price}, {area}, {cat}")
-        folium.CircleMarker(
-            location=[lat, lon],
-            radius=25.0 * np.clip((area - area_min) / (area_max - area_min), 0.0, 1.0) + 5.0,
-            color=colormap(price),
-            fill=True,
-            fill_color=colormap(price),
-            fill_opacity=0.6,
-            stroke=False,
-            popup=(
-                f"{cat}: {int(price)} 円/m^2" + 
-                f"<br>area: {int(area)} m^2" + 
-                f"<br>price: {int(price_org)} 円" + 
-                (f"<br><a href='/property/{row['id']}' target='_blank' rel='noopener noreferrer'>detail</a>" if url else "") +
-                (f"<br><a href='https://suumo.jp/{url}' target='_blank' rel='noopener noreferrer'>suumo</a>" if url else "")
-            ),
-        ).add_to(groups[cat])
-        folium.map.Marker(
-            location=[lat, lon],
-            icon=DivIcon(
-                icon_size=(0,0),    # アイコンサイズをゼロにして「丸のみ」を表示
-                icon_anchor=(0,0),
-                html=f'''<div style="
-                            font-size:12px;
-                            font-weight:bold;
-                            color:{colormap(price)};
-                            text-shadow: 1px 1px 1px white;
-                            transform: translate(-50%, -150%);
-                        ">
-                            {int(price/1000)}k
-                        </div>'''
+        features = [
+            {"type": "Feature", "geometry": {"type": "Point", "coordinates": [lon, lat]}, "properties": {"r": r, "c": c, "p": p, "a": a, "o": o, "i": i, "u": u}}
+            for lon, lat, r, c, p, a, o, i, u in zip(
+                dfwk["longitude"].tolist(), dfwk["latitude"].tolist(), dfwk["radius"].tolist(), dfwk["color"].tolist(),
+                dfwk["price"].tolist(), dfwk["area"].tolist(), dfwk["price_org"].tolist(), dfwk["id"].tolist(), dfwk["url"].tolist(),
             )
-        ).add_to(groups[cat])
+        ]
+        LOGGER.info(f"{cat}: {len(features)} points")
+        folium.GeoJson(
+            {"type": "FeatureCollection", "features": features},
+            name=cat,
+            show=True,
+            marker=folium.CircleMarker(fill=True, fill_opacity=0.6, stroke=False),
+            on_each_feature=JsCode(MAP_ON_EACH_FEATURE % {"category": json.dumps(cat, ensure_ascii=False)}),
+        ).add_to(m)
     folium.LayerControl(collapsed=False).add_to(m)
     m.save(save_path)
 
 
+def get_db() -> DBConnector:
+    """
+    プロセスごとのDB接続（初回使用時に接続）
+    """
+    global DB
+    if DB is None:
+        DB = DBConnector(HOST, port=PORT, dbname=DBNAME, user=USER, password=PASS, dbtype=DBTYPE, max_disp_len=200)
+    return DB
+
+
+def load_shared(since: datetime.datetime) -> dict:
+    """
+    全都道府県で共通のマスタ（位置情報・期間内の物件）を1回だけ読み込む
+    位置情報は reinfolib_land の元の住所ごと（estate_mst_location_key で正規化キーの緯度経度を引いたもの）
+    キーの行がない住所は元の住所で estate_mst_location を引く（view.sql の estate_main_extended.location_key と同じ COALESCE）
+    """
+    db = get_db()
+    return {
+        "df_loc": db.select_sql(
+            f"select a.location, b.latitude, b.longitude from (select distinct location from reinfolib_land where location is not null) as a " + 
+            f"left join estate_mst_location_key as k on a.location = k.location " + 
+            f"inner join estate_mst_location as b on coalesce(k.location_key, a.location) = b.location;"
+        ),
+        "id_main": db.select_sql(
+            f"select distinct id_main from estate_run where is_success = true and is_ref = true and timestamp >= '{since.strftime("%Y-%m-%d 00:00:00")}';"
+        )["id_main"].astype(int).tolist(),
+    }
+
+
+def _make_prefecture_map_star(x: tuple) -> dict:
+    return make_prefecture_map(*x)
+
+
+def init_worker():
+    """
+    子プロセスの初期化: 親プロセスのDB接続は fork 後に共有できないため、子プロセスで接続し直す
+    """
+    global DB
+    DB = None
+
+
+def make_comparables(df_suumo: pd.DataFrame, df_land: pd.DataFrame, k: int = 5, radius: float = 1000.0) -> pd.DataFrame:
+    """
+    suumo の物件ごとに近傍の公示地価（reinfolib_land）を集計（全物件をまとめて空間インデックスで検索）
+
+    Returns:
+        pd.DataFrame: df_suumo と同じ並びで land_nearest_dist, land_knn_n, land_knn_median, land_knn_mean_dist, land_radius_n, land_radius_median, ratio_knn
+    """
+    index = GridIndex(df_land["latitude"], df_land["longitude"], cell_size=max(radius / 2, 100.0))
+    df    = summarize_neighbors(index, df_land["price_per_sqm"], df_suumo["latitude"], df_suumo["longitude"], k=k, radius=radius)
+    df    = df.drop(columns=["nearest_id"]).add_prefix("land_").set_index(df_suumo.index)
+    price = df_suumo["price_per_sqm"].where(df_suumo["price_per_sqm"] > 0)
+    df["ratio_knn"] = price / df["land_knn_median"]
+    return df
+
+
+def make_prefecture_map(code: str, year: int, since: datetime.datetime, dir: str, grid: bool = False, comparables: bool = False, store: str = None, market: bool = False) -> dict:
+    """
+    1都道府県の地図を作成（SHARED のマスタを使用）
+    grid が True の場合は suumo の価格の格子集計をレベルごとのファイル（grid_{code}_{level}.json）とヒートマップとして保存
+    comparables が True の場合は物件ごとの近傍の公示地価の集計を comparables_{code}.csv として保存
+    store を指定した場合は reinfolib_land を DB ではなく列指向のローカルキャッシュ（reinfolib.py --store）から LAND_COLUMNS だけ読み込む
+    market が True の場合は市区町村・種類・四半期ごとの取引価格と掲載価格の集計（market_index）を market_{code}.csv として保存
+
+    Returns:
+        dict: {"code", "is_success", "n_land", "n_suumo", "elapsed", "error"}
+    """
+    time_start = time.perf_counter()
+    result     = {"code": code, "is_success": False, "n_land": 0, "n_suumo": 0, "elapsed": 0.0, "error": None}
+    try:
+        db = get_db()
+        # reinfolib
+        if store is None:
+            df_land = db.select_sql(f"select * from reinfolib_land   where year = {year} and prefecture_code = '{code}';")
+        else:
+            df_land = read_store(store, "reinfolib_land", columns=LAND_COLUMNS, filters={"year": year, "prefecture_code": code})
+            df_land["category"] = df_land["category"].astype(object)  # 辞書型（category）は DB から読んだ場合と同じ文字列の列に戻す
+        df_land   = pd.merge(df_land, SHARED["df_loc"], on="location", how="left")
+        # suumo
+        df_run_latest = db.select_sql(
+            f"select id as id_run, id_main, timestamp from estate_run where is_ref = true and " + 
+            f"id_main in (select id from estate_main_extended where citycode like '{code}%') and " + 
+            f"timestamp >= '{since.strftime("%Y-%m-%d 00:00:00")}'"
+        ).sort_values("timestamp", ascending=False).groupby("id_main").first()
+        if df_land.shape[0] == 0 or df_run_latest.shape[0] == 0:
+            raise ValueError(f"no data. reinfolib_land: {df_land.shape[0]}, estate_run: {df_run_latest.shape[0]}")
+        df_suumo  = db.select_sql(
+            f"select a.*, b.longitude, b.latitude from estate_main_extended as a " + 
+            f"left join estate_mst_location as b on a.location_key = b.location " + 
+            f"where a.citycode like '{code}%' and a.id in ({','.join(map(str, SHARED["id_main"]))});"
+        )
+        df_numeric = db.select_sql(
+            f"select a.id_run, a.id_run_ref, a.id_key, c.name, b.price_man, b.area_sqm, b.is_undefined from estate_detail_ref as a " + 
+            f"inner join estate_cleaned_numeric as b on a.id_run_ref = b.id_run and a.id_key = b.id_key " + 
+            f"inner join estate_mst_cleaned as c on b.id_cleaned = c.id " + 
+            f"where c.name in ('{"','".join(NUMERIC_NAMES)}') and " + 
+            f"a.id_run in ({','.join(df_run_latest['id_run'].astype(str).tolist())});"
+        )
+        df_join  = make_numeric_frame(df_numeric, df_run_latest.reset_index()[["id_main", "id_run"]])
+        df_suumo = pd.merge(df_suumo, df_join, how="left", left_on="id", right_on="id_main")
+        df_suumo["area"] = df_suumo["area_ms"].copy()
+        df_suumo.loc[df_suumo["building_type"] == "house", "area"] = df_suumo["area_building"]
+        df_suumo.loc[df_suumo["building_type"] == "land",  "area"] = df_suumo["area_land"]
+        df_suumo["price_per_sqm"] = (df_suumo["price"] * 10000) / df_suumo["area"]
+        df_suumo.loc[df_suumo["price_per_sqm"] < 0, "price_per_sqm"] = -1
+        make_map(df_land.copy(), df_suumo.copy(), save_path=f"{dir}/map_{code}.html")
+        if grid:
+            df_grid = aggregate_grid_levels(df_suumo["latitude"], df_suumo["longitude"], df_suumo["price_per_sqm"])
+            if df_grid.shape[0] > 0:
+                save_grid(df_grid, f"{dir}/grid_{code}_{{level}}.json", code=code, since=since.strftime("%Y%m%d"))
+                make_heatmap(df_grid, save_path=f"{dir}/heatmap_{code}.html")
+        if comparables:
+            df_comp = pd.concat([df_suumo[["id", "url", "building_type", "is_new", "latitude", "longitude", "price", "area", "price_per_sqm"]], make_comparables(df_suumo, df_land)], axis=1)
+            df_comp.to_csv(f"{dir}/comparables_{code}.csv", index=False)
+        if market:
+            # make_market_index.py で集計済みの行を (prefecture_code, year, quarter) のインデックスで読み込む
+            df_market = db.select_sql(f"select * from market_index where prefecture_code = '{code}' and year = {year} order by citycode, property_type, quarter;")
+            if df_market.shape[0] > 0:
+                df_market["ratio_p50"] = df_market["listing_p50"] / df_market["transaction_p50"]
+            df_market.to_csv(f"{dir}/market_{code}.csv", index=False)
+        result.update({"is_success": True, "n_land": df_land.shape[0], "n_suumo": df_suumo.shape[0]})
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["elapsed"] = time.perf_counter() - time_start
+    return result
+
+
 if __name__ == "__main__":
     # 引数処理
-    parser = argparse.ArgumentParser(description="")
-    parser.add_argument("--code",  type=str, required=True)
-    parser.add_argument("--year",  type=int, default=2024)
-    parser.add_argument("--dir",   type=str, default="./html")
+    parser = argparse.ArgumentParser(
+        description="",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+実行例:
+  python ana.py --code 13                            # 1都道府県
+  python ana.py --code 13,14,27 --workers 3          # 複数の都道府県を3プロセスで並列に作成
+  python ana.py --code all --workers 8               # 全都道府県（01-47）
+  python ana.py --code 13 --grid                     # 価格の格子集計・ヒートマップも保存
+  python ana.py --code 13 --comparables              # 物件ごとの近傍の公示地価（k=5、半径1km）も保存
+  python ana.py --code all --store ./store           # reinfolib_land をローカルキャッシュ（Parquet）から読み込み
+  python ana.py --code 13 --market                   # 市区町村・種類・四半期ごとの取引価格と掲載価格の集計（market_index）も保存
+"""
+    )
+    parser.add_argument("--code",    type=lambda x: [f"{i:02d}" for i in range(1, 48)] if x == "all" else x.split(","), required=True, help="都道府県コード（カンマ区切り、all: 全都道府県）")
+    parser.add_argument("--year",    type=int, default=2024)
+    parser.add_argument("--dir",     type=str, default="./html")
     parser.add_argument(
         "--since", type=lambda x: datetime.datetime.strptime(x, "%Y%m%d"),
         default=(datetime.datetime.now() - datetime.timedelta(days=30*6)).strftime("%Y%m%d")
     )
+    parser.add_argument("--workers", type=int, default=1, help="並列に作成するプロセス数（デフォルト: 1）")
+    parser.add_argument("--grid",    action="store_true", default=False, help="価格の格子集計（grid_{code}_{level}.json）とヒートマップ（heatmap_{code}.html）も保存")
+    parser.add_argument("--comparables", action="store_true", default=False, help="物件ごとの近傍の公示地価の集計（comparables_{code}.csv）も保存")
+    parser.add_argument("--store",   type=str, default=None, help="reinfolib_land を列指向のローカルキャッシュ（reinfolib.py uploadland --store の保存先）から読み込む")
+    parser.add_argument("--market",  action="store_true", default=False, help="市区町村・種類・四半期ごとの取引価格と掲載価格の集計（market_{code}.csv、make_market_index.py で作成）も保存")
+    add_profile_arguments(parser)
     args = parser.parse_args()
     LOGGER.info(f"{args}")
+    if args.profile is not None:
+        start_profiling(args.profile, mode=args.profilemode, interval=args.profileinterval, log_function=LOGGER.info)
 
-    # connection
-    DB        = DBConnector(HOST, port=PORT, dbname=DBNAME, user=USER, password=PASS, dbtype=DBTYPE, max_disp_len=200)
-    # reinfolib
-    df_land   = DB.select_sql(f"select * from reinfolib_land   where year = {args.year} and prefecture_code = '{args.code}';")
-    df_estate = DB.select_sql(f"select * from reinfolib_estate where year = {args.year} and prefecture_code = '{args.code}' and period = 1;")
-    df_loc    = DB.select_sql(f"select * from estate_mst_location;")
-    df_land   = pd.merge(df_land, df_loc[["location", "latitude", "longitude"]], on="location", how="left")
-    # suumo
-    df_target = DB.select_sql(f"select * from estate_run where is_success = true and is_ref = true and timestamp >= '{args.since.strftime("%Y-%m-%d 00:00:00")}';")
-    df_suumo  = DB.select_sql(
-        f"select a.*, b.longitude, b.latitude from estate_main_extended as a " + 
-        f"left join estate_mst_location as b on a.location = b.location " + 
-        f"where a.citycode like '{args.code}%' and a.id in ({','.join(df_target["id_main"].unique().astype(str).tolist())});"
-    )
-    df_run_latest = DB.select_sql(
-        f"select id as id_run, id_main, timestamp from estate_run where is_ref = true and " + 
-        f"id_main in (select id from estate_main_extended where citycode like '{args.code}%') and " + 
-        f"timestamp >= '{args.since.strftime("%Y-%m-%d 00:00:00")}'"
-    ).sort_values("timestamp", ascending=False).groupby("id_main").first()
-    df_detail = DB.select_sql(
-        f"select a.*, b.* from estate_detail_ref as a " + 
-        f"left join estate_cleaned as b on a.id_run_ref = b.id_run and a.id_key = b.id_key and " + 
-        f"b.id_cleaned in (select id from estate_mst_cleaned where name like '価格%' or name like '%面積%') "
-        f"where true and " +
-        f"a.id_run in ({','.join(df_run_latest['id_run'].astype(str).tolist())}) and " + 
-        f"id_cleaned is not null;"
-    )
-    df_mst   = DB.select_sql("select * from estate_mst_cleaned;")
-    dict_mst = {int(a): {x: y for x, y in df_mst[["id", "name"]].to_numpy()}[a] for a in df_detail["id_cleaned"].unique()}
-    ## join
-    df_detail = df_detail.sort_values(["id_run", "id_run_ref"]).reset_index(drop=True).groupby(["id_run", "id_cleaned"])[["value_cleaned"]].last().reset_index()
-    df_join   = df_run_latest.reset_index()[["id_main", "id_run"]].copy()
-    for x, y in dict_mst.items():
-        dfwk = df_detail.loc[df_detail["id_cleaned"] == x, ["id_run", "value_cleaned"]].copy()
-        dfwk.columns = ["id_run", f"value_{y}"]
-        df_join = pd.merge(df_join, dfwk, how="left", on="id_run")
-    df_suumo = pd.merge(df_suumo, df_join, how="left", left_on="id", right_on="id_main")
-    ## value_価格
-    df_suumo["price"] = df_suumo["value_価格"].str["value"].copy()
-    df_suumo.loc[df_suumo["value_価格"].str["is_undefined"] == True, "price"] = -1
-    assert df_suumo.loc[(df_suumo["value_価格"].str["unit"] != "万円") & (df_suumo["price"] >= 0)].shape[0] == 0
-    ## value_面積
-    df_suumo["area_ms"] = df_suumo["value_専有面積"].str["value"].copy()
-    assert df_suumo.loc[(df_suumo["value_専有面積"].str["unit"] != "m^2") & (~df_suumo["area_ms"].isna())].shape[0] == 0
-    df_suumo["area_land"] = df_suumo["value_土地面積"].str["value"].copy()
-    assert df_suumo.loc[(df_suumo["value_土地面積"].str["unit"] != "m^2") & (~df_suumo["area_land"].isna())].shape[0] == 0
-    df_suumo["area_building"] = df_suumo["value_建物面積"].str["value"].copy()
-    assert df_suumo.loc[(df_suumo["value_建物面積"].str["unit"] != "m^2") & (~df_suumo["area_building"].isna())].shape[0] == 0
-    df_suumo["area"] = df_suumo["area_ms"].copy()
-    df_suumo.loc[df_suumo["building_type"] == "house", "area"] = df_suumo["area_building"]
-    df_suumo.loc[df_suumo["building_type"] == "land",  "area"] = df_suumo["area_land"]
-    df_suumo["price_per_sqm"] = (df_suumo["price"] * 10000) / df_suumo["area"]
-    df_suumo.loc[df_suumo["price_per_sqm"] < 0, "price_per_sqm"] = -1
-    ## 0.00001 ~= 1m, 1km ~= 0.01
-    # BASE_D  = 0.01
-    # make_heatmap(df, BASE_D)
-    make_map(df_land.copy(), df_suumo.copy(), save_path=f"{args.dir}/map_{args.code}.html")
+    # 共通のマスタ（子プロセスには fork で引き継ぐ）
+    SHARED.update(load_shared(args.since))
+    LOGGER.info(f"shared: estate_mst_location {SHARED['df_loc'].shape[0]}, estate_main {len(SHARED['id_main'])}")
+    list_args = [(code, args.year, args.since, args.dir, args.grid, args.comparables, args.store, args.market) for code in args.code]
+    if args.workers > 1 and len(list_args) > 1:
+        with multiprocessing.get_context("fork").Pool(processes=min(args.workers, len(list_args)), initializer=init_worker) as pool:
+            list_result = [x for x in pool.imap_unordered(_make_prefecture_map_star, list_args)]
+    else:
+        list_result = [make_prefecture_map(*x) for x in list_args]
+    # 結果のサマリ
+    for x in sorted(list_result, key=lambda x: x["code"]):
+        if x["is_success"]:
+            LOGGER.info(f"code: {x['code']}, land: {x['n_land']}, suumo: {x['n_suumo']}, elapsed: {x['elapsed']:.1f} sec", color=["GREEN"])
+        else:
+            LOGGER.error(f"code: {x['code']}, elapsed: {x['elapsed']:.1f} sec, error: {x['error']}")
+    list_failed = [x["code"] for x in list_result if not x["is_success"]]
+    LOGGER.info(f"success: {len(list_result) - len(list_failed)}/{len(list_result)}" + (f", failed: {','.join(sorted(list_failed))}" if len(list_failed) > 0 else ""))
+    sys.exit(1 if len(list_failed) > 0 else 0)
@@ -31,6 +31,11 @@ DRY_RUN=false
 PREFECTURES=""
 SINCE_DATE=""
 OUTPUT_DIR=""
+WORKERS=4
+GRID=false
+COMPARABLES=false
+MARKET=false
+STORE=""
 
 # 引数処理
 while [[ $# -gt 0 ]]; do
@@ -47,6 +52,26 @@ while [[ $# -gt 0 ]]; do
             OUTPUT_DIR="$2"
             shift 2
             ;;
+        --workers)
+            WORKERS="$2"
+            shift 2
+            ;;
+        --grid)
+            GRID=true
+            shift
+            ;;
+        --comparables)
+            COMPARABLES=true
+            shift
+            ;;
+        --market)
+            MARKET=true
+            shift
+            ;;
+        --store)
+            STORE="$2"
+            shift 2
+            ;;
         --dry-run)
             DRY_RUN=true
             shift
@@ -61,6 +86,11 @@ while [[ $# -gt 0 ]]; do
             echo "  --year YEAR          処理対象年 (default: 2024)"
             echo "  --since YYYYMMDD     開始日付 (default: 現在日時-10日を1/11/21に丸めた値)"
             echo "  --dir PATH           出力ディレクトリ (default: ./html)"
+            echo "  --workers N          並列に作成するプロセス数 (default: 4)"
+            echo "  --grid               価格の格子集計とヒートマップも保存"
+            echo "  --comparables        物件ごとの近傍の公示地価の集計も保存"
+            echo "  --market             市区町村・種類・四半期ごとの取引価格と掲載価格の集計も保存"
+            echo "  --store PATH         reinfolib_land をローカルキャッシュ（Parquet）から読み込む"
             echo "  --dry-run            実際には実行せず、コマンドのみ表示"
             echo "  --prefectures CODES  実行する都道府県コード（カンマ区切り）. 例: 13,14,27"
             echo "  --help               このヘルプを表示"
@@ -78,7 +108,7 @@ if [ -z "$SINCE_DATE" ]; then
     SINCE_DATE=$(get_rounded_date)
 fi
 
-echo "実行設定: year=$YEAR, since=$SINCE_DATE, dir=$OUTPUT_DIR, dry_run=$DRY_RUN"
+echo "実行設定: year=$YEAR, since=$SINCE_DATE, dir=$OUTPUT_DIR, workers=$WORKERS, grid=$GRID, comparables=$COMPARABLES, market=$MARKET, store=$STORE, dry_run=$DRY_RUN"
 
 # 実行する都道府県コードのリストを決定
 if [ -n "$PREFECTURES" ]; then
@@ -91,44 +121,40 @@ fi
 
 echo "処理対象都道府県数: ${#PREFECTURE_ARRAY[@]}"
 
-# 結果カウント
-SUCCESS_COUNT=0
-FAILED_CODES=()
-
-# 各都道府県に対して実行
-for CODE in "${PREFECTURE_ARRAY[@]}"; do
-    CMD="python ana.py --code $CODE --year $YEAR --since $SINCE_DATE"
-    if [ -n "$OUTPUT_DIR" ]; then
-        CMD="$CMD --dir $OUTPUT_DIR"
-    fi
-    
-    echo "=========================================="
-    echo "都道府県コード $CODE の処理を開始"
-    echo "コマンド: $CMD"
-    
-    if [ "$DRY_RUN" = true ]; then
-        echo "[DRY RUN] 実行をスキップ"
-        continue
-    fi
-    
-    # コマンド実行
-    if eval $CMD; then
-        echo "都道府県コード $CODE の処理が完了"
-        ((SUCCESS_COUNT++))
-    else
-        echo "エラー: 都道府県コード $CODE の処理に失敗"
-        FAILED_CODES+=($CODE)
-    fi
-done
+# 全都道府県を1回の実行で作成（共通のマスタは1回だけ読み込み、--workers のプロセス数で並列に作成）
+CODES=$(IFS=','; echo "${PREFECTURE_ARRAY[*]}")
+CMD="python ana.py --code $CODES --year $YEAR --since $SINCE_DATE --workers $WORKERS"
+if [ -n "$OUTPUT_DIR" ]; then
+    CMD="$CMD --dir $OUTPUT_DIR"
+fi
+if [ "$GRID" = true ]; then
+    CMD="$CMD --grid"
+fi
+if [ "$COMPARABLES" = true ]; then
+    CMD="$CMD --comparables"
+fi
+if [ "$MARKET" = true ]; then
+    CMD="$CMD --market"
+fi
+if [ -n "$STORE" ]; then
+    CMD="$CMD --store $STORE"
+fi
 
-# 結果のサマリを表示
 echo "=========================================="
-echo "処理完了: 成功 $SUCCESS_COUNT/${#PREFECTURE_ARRAY[@]} 件"
+echo "コマンド: $CMD"
 
-if [ ${#FAILED_CODES[@]} -gt 0 ]; then
-    echo "失敗した都道府県コード: ${FAILED_CODES[*]}"
-    exit 1
-else
+if [ "$DRY_RUN" = true ]; then
+    echo "[DRY RUN] 実行をスキップ"
+    exit 0
+fi
+
+# コマンド実行（失敗した都道府県コードは ana.py のログに出力される）
+if eval $CMD; then
+    echo "=========================================="
     echo "全ての都道府県の処理が正常に完了しました"
     exit 0
-fi
\ No newline at end of file
+else
+    echo "=========================================="
+    echo "エラー: 一部の都道府県の処理に失敗しました（ログの failed を確認）"
+    exit 1
+fi
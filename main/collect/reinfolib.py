@@ -1,21 +1,29 @@
 import argparse
+import io
+import json
 import os
+import queue
+import threading
 import time
 import re
 import zipfile
-import tempfile
 import shutil
 from datetime import datetime
-from playwright.sync_api import Playwright, sync_playwright, expect
+from typing import List, Optional, Dict, Any, Tuple
+from playwright.sync_api import Playwright, Browser, sync_playwright, expect
 from kklogger import set_logger
 import pandas as pd
 from kkpsgre.connector import DBConnector
 from kkestate.config.psgre import HOST, PORT, USER, PASS, DBNAME, DBTYPE
+from kkestate.util.profiler import add_profile_arguments, start_profiling
+from kkestate.util.reinfolib_cleaner import clean_land_frame
+from kkestate.util.columnar_store import PartitionWriter
+from kkestate.util.file_manifest import file_checksum, row_hashes
 
 LOGGER = set_logger(__name__)
 
 
-def download_land_prices(playwright: Playwright, year: int, prefecture_code: str, headless: bool = False) -> pd.DataFrame:
+def download_land_prices(playwright: Playwright, year: int, prefecture_code: str, headless: bool = False, browser: Optional[Browser] = None) -> pd.DataFrame:
     """
     国土交通省の地価公示・地価調査データをスクレイピングしてDataFrameに変換
     
@@ -24,6 +32,7 @@ def download_land_prices(playwright: Playwright, year: int, prefecture_code: str
         year: 対象年（例: 2024）
         prefecture_code: 都道府県コード（01-47の2桁）
         headless: ヘッドレスモードで実行するか
+        browser: 起動済みのブラウザ（指定した場合は新しいコンテキストだけを作成し、ブラウザは閉じない）
         
     Returns:
         pd.DataFrame: スクレイピングしたデータ
@@ -52,7 +61,9 @@ def download_land_prices(playwright: Playwright, year: int, prefecture_code: str
     
     # ※ダウンロードディレクトリ作成は呼び出し側で実行
     
-    browser = playwright.chromium.launch(headless=headless)
+    is_own_browser = browser is None
+    if is_own_browser:
+        browser = playwright.chromium.launch(headless=headless)
     context = browser.new_context()
     page = context.new_page()
     
@@ -69,28 +80,23 @@ def download_land_prices(playwright: Playwright, year: int, prefecture_code: str
         ]
         
         for checkbox_id in checkboxes:
-            checkbox = page.locator(checkbox_id)
-            if not checkbox.is_checked():
-                checkbox.check()
-                time.sleep(0.2)
+            page.locator(checkbox_id).check()
         LOGGER.info("区分: 地価公示・地価調査の両方をチェック")
         
         # 2. 地域: 都道府県選択
         # 地域選択ボタンをクリック
         page.get_by_role("button", name="地域選択").click()
-        time.sleep(0.5)
         
         # ポップアップが表示されるまで待機
         page.wait_for_selector("#cboPrefectures", state="visible")
         
         # 都道府県選択
         page.locator("#cboPrefectures").select_option(prefecture_code)
-        time.sleep(0.5)
         LOGGER.info(f"都道府県コード {prefecture_code} を選択")
         
-        # 「変更」ボタンをクリック（ポップアップ内の）
+        # 「変更」ボタンをクリック（ポップアップ内の）し、ポップアップが閉じるまで待機
         page.locator("#btnDecisionArea").click()
-        time.sleep(0.5)
+        page.wait_for_selector("#cboPrefectures", state="hidden")
         
         # 3. 用途区分: 全てチェック
         use_category_checkboxes = [
@@ -105,28 +111,24 @@ def download_land_prices(playwright: Playwright, year: int, prefecture_code: str
         ]
         
         for checkbox_id in use_category_checkboxes:
-            checkbox = page.locator(checkbox_id)
-            if not checkbox.is_checked():
-                checkbox.check()
-                time.sleep(0.1)
+            page.locator(checkbox_id).check()
         LOGGER.info("用途区分: 全ての項目をチェック")
         
         # 4. 調査年: 上限・下限に同一年を設定
         year_value = str(year)
         page.locator("#cmbSeasonFrom").select_option(year_value)
-        time.sleep(0.2)
         page.locator("#cmbSeasonTo").select_option(year_value)
-        time.sleep(0.2)
         LOGGER.info(f"調査年: {year}年 を上限・下限に設定")
         
-        # 一覧表示ボタンをクリック
+        # 一覧表示ボタンをクリックし、検索結果の件数が表示されるまで待機
         page.locator("#btnDislpayList").click()
-        time.sleep(1)
         page.wait_for_load_state("networkidle")
+        result_count = page.locator("text=現在の条件での検索結果：")
+        result_count.wait_for(state="visible")
         LOGGER.info("一覧表示をクリック")
         
         # 検索結果件数チェック
-        result_count_text = page.locator("text=現在の条件での検索結果：").text_content()
+        result_count_text = result_count.text_content()
         count_match = re.search(r"(\d+)件", result_count_text)
         if count_match:
             result_count = int(count_match.group(1))
@@ -234,26 +236,15 @@ def download_land_prices(playwright: Playwright, year: int, prefecture_code: str
                 if next_button.is_visible():
                     LOGGER.info(f"ページ {next_page} のボタンをクリック中...")
                     next_button.click()
-                    # ページ変更を待機（最大10秒）
-                    page_changed = False
-                    for i in range(20):  # 0.5秒 × 20 = 10秒
-                        time.sleep(0.25)
-                        try:
-                            new_page_indicator = page.locator("text=/\\d+/\\d+/").text_content()
-                            new_current_page = int(new_page_indicator.split('/')[0])
-                            if new_current_page == next_page:
-                                page_changed = True
-                                break
-                        except:
-                            pass  # ページ遷移中はエラーが発生する可能性
-                    
-                    if not page_changed:
+                    # ページ番号が次のページになるまで待機（最大10秒）
+                    try:
+                        expect(page.locator("text=/\\d+/\\d+/")).to_have_text(re.compile(f"^{next_page}/"), timeout=10000)
+                    except AssertionError:
                         LOGGER.warning("ページ変更が確認できませんでした. 終了します")
                         break
                     
                     # ネットワークの安定を待機
                     page.wait_for_load_state("networkidle", timeout=30000)
-                    time.sleep(1)  # 追加の安全待機
                     page_number = next_page
                     LOGGER.info(f"ページ {page_number} に移動完了")
                 else:
@@ -284,10 +275,11 @@ def download_land_prices(playwright: Playwright, year: int, prefecture_code: str
         raise
     finally:
         context.close()
-        browser.close()
+        if is_own_browser:
+            browser.close()
 
 
-def download_estate_prices(playwright: Playwright, year: int, period: int, download_dir: str = "./downloads", headless: bool = False) -> str:
+def download_estate_prices(playwright: Playwright, year: int, period: int, download_dir: str = "./downloads", headless: bool = False, browser: Optional[Browser] = None) -> str:
     """
     国土交通省の不動産取引価格情報をダウンロード
     
@@ -297,6 +289,7 @@ def download_estate_prices(playwright: Playwright, year: int, period: int, downl
         period: 四半期（1-4）
         download_dir: ダウンロード保存先ディレクトリ
         headless: ヘッドレスモードで実行するか
+        browser: 起動済みのブラウザ（指定した場合は新しいコンテキストだけを作成し、ブラウザは閉じない）
         
     Returns:
         str: ダウンロードしたファイルパス
@@ -309,7 +302,9 @@ def download_estate_prices(playwright: Playwright, year: int, period: int, downl
     # ダウンロードディレクトリ作成
     os.makedirs(download_dir, exist_ok=True)
     
-    browser = playwright.chromium.launch(headless=headless)
+    is_own_browser = browser is None
+    if is_own_browser:
+        browser = playwright.chromium.launch(headless=headless)
     context = browser.new_context(accept_downloads=True)
     page = context.new_page()
     
@@ -321,30 +316,20 @@ def download_estate_prices(playwright: Playwright, year: int, period: int, downl
         # 地域: 全都道府県
         page.locator("#cmbPrefectures").select_option("99")
         LOGGER.info("地域: 全都道府県を選択")
-        time.sleep(0.5)
-        
-        # 価格情報区分: 両方チェック（デフォルトで両方チェックされているはず）
-        # 必要に応じてチェック状態を確認・設定
-        checkbox1 = page.locator("#chkTransactionPrice")
-        checkbox2 = page.locator("#chkClosedPrice")
-        if not checkbox1.is_checked():
-            checkbox1.check()
-            time.sleep(0.5)
-        if not checkbox2.is_checked():
-            checkbox2.check()
-            time.sleep(0.5)
+        
+        # 価格情報区分: 両方チェック（デフォルトで両方チェックされているはず、check() はチェック済みなら何もしない）
+        page.locator("#chkTransactionPrice").check()
+        page.locator("#chkClosedPrice").check()
         LOGGER.info("価格情報区分: 両方チェック")
         
         # 種類: すべて
         page.locator("#cmbKind").select_option("all")
         LOGGER.info("種類: すべてを選択")
-        time.sleep(0.5)
         
-        # 時期: 下限と上限に同じ値を設定
+        # 時期: 下限と上限に同じ値を設定（上限の選択肢は下限の選択後に更新されるため、選択できるまで待機）
         page.locator("#cmbSeasonFrom").select_option(season_value)
-        time.sleep(0.5)
+        page.locator(f"#cmbSeasonTo option[value='{season_value}']").wait_for(state="attached")
         page.locator("#cmbSeasonTo").select_option(season_value)
-        time.sleep(0.5)
         LOGGER.info(f"時期: {season_value}（{year}年第{period}四半期）を設定")
         
         # ダウンロード実行
@@ -357,14 +342,14 @@ def download_estate_prices(playwright: Playwright, year: int, period: int, downl
             try:
                 # ポップアップの「閉じる」ボタンを探す
                 close_button = page.locator("#btnClose")
-                if close_button.is_visible():
-                    LOGGER.warning("ダウンロード用ファイルの作成中です. 後で再試行してください.")
+                is_preparing = close_button.is_visible()
+                if is_preparing:
                     close_button.click()
-                    time.sleep(0.5)
-                    import sys
-                    sys.exit(1)  # 失敗を示す終了コード
-            except:
-                pass
+            except Exception:
+                is_preparing = False
+            if is_preparing:
+                LOGGER.warning("ダウンロード用ファイルの作成中です. 後で再試行してください.")
+                raise RuntimeError(f"ダウンロード用ファイルの作成中: {year}年第{period}四半期")
             raise
         
         # ファイル保存
@@ -380,17 +365,180 @@ def download_estate_prices(playwright: Playwright, year: int, period: int, downl
         raise
     finally:
         context.close()
-        browser.close()
+        if is_own_browser:
+            browser.close()
+
 
+# 一括ダウンロードの対象（estate: (year, period), land: (year, prefecture_code)）
+BACKFILL_KINDS = ["estate", "land"]
+
+
+def backfill_target_path(kind: str, target: Tuple[int, Any], download_dir: str) -> str:
+    """
+    対象の保存先ファイル
+    """
+    if kind == "estate":
+        return os.path.join(download_dir, f"reinfolib_estate_{target[0]}_{target[1]}.zip")
+    return os.path.join(download_dir, f"reinfolib_land_{target[0]}_{target[1]}.csv")
 
-def upload_land_to_db(download_dir: str = "./downloads", update: bool = False, skip: bool = False):
+def save_land_csv(df: pd.DataFrame, year: int, prefecture_code: str, download_dir: str) -> str:
+    """
+    地価公示・地価調査データを CSV（UTF-8 with BOM）として保存
+    """
+    os.makedirs(download_dir, exist_ok=True)
+    filepath = backfill_target_path("land", (year, prefecture_code), download_dir)
+    df.to_csv(filepath, index=False, encoding='utf-8-sig')
+    return filepath
+
+def load_manifest(manifest_path: str) -> set:
+    """
+    マニフェスト（1行1件の JSON）から完了済みの対象 {(kind, year, period or prefecture_code)} を読み込む
+    """
+    completed = set()
+    if not os.path.exists(manifest_path):
+        return completed
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line == "":
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get("status") == "success":
+                completed.add((record["kind"], int(record["target"][0]), str(record["target"][1])))
+    return completed
+
+def _append_backfill_result(result: Dict[str, Any], manifest_path: str, lock: threading.Lock, results: List[Dict[str, Any]]):
+    """
+    1対象の結果を results とマニフェストに追加
+    """
+    result["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    with lock:
+        results.append(result)
+        with open(manifest_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(result, ensure_ascii=False) + "\n")
+    LOGGER.info(
+        f"{'Success' if result['status'] == 'success' else 'ERROR'}: {result['kind']} {tuple(result['target'])} {result['elapsed']:.1f}秒 (attempt {result['n_attempt']})",
+        color=["BOLD", "GREEN"] if result["status"] == "success" else ["BOLD", "RED"]
+    )
+
+def _backfill_worker(kind: str, queue_target: queue.Queue, download_dir: str, headless: bool, retries: int, retry_wait: float, manifest_path: str, lock: threading.Lock, results: List[Dict[str, Any]], errors: List[str]):
+    """
+    1スレッド分の一括ダウンロード: ブラウザを1つ起動し、対象ごとに新しいコンテキストで処理する
+    （Playwright の sync API のオブジェクトは作成したスレッドでしか使えないため、ブラウザはスレッドごとに持つ）
+    ブラウザの起動などで例外が発生した場合はスレッドを終了して errors に追加し、残りの対象は他のスレッド（または run_backfill）に任せる
+    """
+    try:
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(headless=headless)
+            try:
+                while True:
+                    try:
+                        target = queue_target.get_nowait()
+                    except queue.Empty:
+                        break
+                    time_start = time.perf_counter()
+                    result = {"kind": kind, "target": [target[0], target[1]], "status": "failed", "path": None, "n_rows": None, "n_attempt": 0, "elapsed": 0.0, "error": None}
+                    for n_attempt in range(1, retries + 1):
+                        result["n_attempt"] = n_attempt
+                        try:
+                            if kind == "estate":
+                                result["path"] = download_estate_prices(playwright, target[0], target[1], download_dir, headless, browser=browser)
+                            else:
+                                df = download_land_prices(playwright, target[0], target[1], headless, browser=browser)
+                                result["path"]   = save_land_csv(df, target[0], target[1], download_dir)
+                                result["n_rows"] = len(df)
+                            result["status"], result["error"] = "success", None
+                            break
+                        except Exception as e:
+                            result["error"] = f"{type(e).__name__}: {e}"
+                            LOGGER.warning(f"Failed: {kind} {target} (attempt {n_attempt}/{retries}) {result['error']}")
+                            if n_attempt < retries:
+                                time.sleep(retry_wait * n_attempt)
+                    result["elapsed"] = round(time.perf_counter() - time_start, 1)
+                    _append_backfill_result(result, manifest_path, lock, results)
+            finally:
+                browser.close()
+    except Exception as e:
+        LOGGER.error(f"Backfill worker stopped: {type(e).__name__}: {e}", color=["BOLD", "RED"])
+        with lock:
+            errors.append(f"{type(e).__name__}: {e}")
+
+def run_backfill(kind: str, targets: List[Tuple[int, Any]], download_dir: str = "./downloads", workers: int = 2, headless: bool = True, retries: int = 3, retry_wait: float = 10.0, manifest_path: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    複数の (year, period) / (year, prefecture_code) を workers 個のブラウザで並列にダウンロード
+    完了した対象はマニフェスト（download_dir/reinfolib_{kind}_manifest.jsonl）に1行ずつ追記し、
+    再実行時はマニフェストで完了済みの対象と保存先ファイルが既にある対象をスキップする
+    ブラウザを起動できなかったなどで処理されなかった対象も failed として結果に含める（結果は必ず対象ごとに1件）
+
+    Returns:
+        List[Dict[str, Any]]: 対象ごとの結果 {"kind", "target", "status", "path", "n_rows", "n_attempt", "elapsed", "error", "timestamp"}
+    """
+    assert kind in BACKFILL_KINDS
+    os.makedirs(download_dir, exist_ok=True)
+    if manifest_path is None:
+        manifest_path = os.path.join(download_dir, f"reinfolib_{kind}_manifest.jsonl")
+    completed = load_manifest(manifest_path)
+    list_todo = []
+    for target in targets:
+        if (kind, int(target[0]), str(target[1])) in completed:
+            LOGGER.info(f"Skip: {kind} {target} (manifest)")
+        elif os.path.exists(backfill_target_path(kind, target, download_dir)):
+            LOGGER.info(f"Skip: {kind} {target} (already exists)")
+        else:
+            list_todo.append(target)
+    LOGGER.info(f"=== REINFOLIB Backfill Start: {kind}, 対象 {len(list_todo)}件 / {len(targets)}件, workers={workers} ===")
+    if len(list_todo) == 0:
+        return []
+    time_start   = time.perf_counter()
+    queue_target = queue.Queue()
+    for target in list_todo:
+        queue_target.put(target)
+    lock, results, errors = threading.Lock(), [], []
+    threads = [
+        threading.Thread(target=_backfill_worker, args=(kind, queue_target, download_dir, headless, retries, retry_wait, manifest_path, lock, results, errors))
+        for _ in range(max(min(workers, len(list_todo)), 1))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 処理されなかった対象（すべてのスレッドが途中で終了した場合）
+    set_done = set((int(x["target"][0]), str(x["target"][1])) for x in results)
+    for target in list_todo:
+        if (int(target[0]), str(target[1])) not in set_done:
+            result = {
+                "kind": kind, "target": [target[0], target[1]], "status": "failed", "path": None, "n_rows": None, "n_attempt": 0, "elapsed": 0.0,
+                "error": f"not processed ({errors[-1] if len(errors) > 0 else 'worker stopped'})"
+            }
+            _append_backfill_result(result, manifest_path, lock, results)
+    n_success = sum(x["status"] == "success" for x in results)
+    LOGGER.info(f"=== REINFOLIB Backfill Complete: {time.perf_counter() - time_start:.1f}秒 ===")
+    LOGGER.info(f"Success: {n_success} / Failed: {len(results) - n_success}")
+    for x in sorted(results, key=lambda x: -x["elapsed"]):
+        LOGGER.info(f"  {x['status']:7s} {x['kind']} {tuple(x['target'])} {x['elapsed']:7.1f}秒 attempt={x['n_attempt']}" + (f" {x['error']}" if x["error"] else ""))
+    return results
+
+
+# reinfolib_land の整数のカラム（COPY の CSV で小数点を付けないように Int64 にする）
+LAND_INTEGER_COLUMNS = ['price_per_sqm', 'station_distance', 'land_area', 'coverage_ratio', 'floor_area_ratio']
+
+
+def upload_land_to_db(download_dir: str = "./downloads", update: bool = False, skip: bool = False, store: Optional[str] = None, force: bool = False):
     """
     land CSVファイルをデータベースにアップロード
+    内容が前回の投入（reinfolib_file_manifest のチェックサム）と同じファイルは読み込まずにスキップし、
+    変更されたファイルは行ハッシュで比較して、なくなった行の削除と新しい行の追加だけを行う
+    store を指定した場合、チェックサムが同じファイルも読み込んでパーティションを保存する（データベースの更新のみスキップ）
     
     Args:
         download_dir: CSVファイルが格納されたディレクトリ
         update: データベース更新を実行するか
         skip: 既存データがある場合はスキップするか
+        store: 列指向のローカルキャッシュ（columnar_store.py）の保存先、指定した場合は (year, prefecture_code) のパーティションを入れ替える（update に関係なく保存）
+        force: チェックサムが同じファイルも行ハッシュで比較する
     """
     LOGGER.info(f"Landデータのデータベースアップロード開始: {download_dir}")
     
@@ -405,9 +553,11 @@ def upload_land_to_db(download_dir: str = "./downloads", update: bool = False, s
         return
     
     LOGGER.info(f"{len(csv_files)}個のCSVファイルを処理します")
+    manifest = load_file_manifest(DB, "reinfolib_land")
     
     success_count = 0
     failed_count = 0
+    unchanged_count = 0
     
     for csv_file in sorted(csv_files):
         # ファイル名からyearとprefecture_codeを抽出 (reinfolib_land_YYYY_PP.csv)
@@ -428,9 +578,15 @@ def upload_land_to_db(download_dir: str = "./downloads", update: bool = False, s
                 LOGGER.info(f"スキップ: {csv_file} (Year: {year}, Prefecture: {prefecture_code}) - 既存データあり")
                 continue
         
-        LOGGER.info(f"処理中: {csv_file} (Year: {year}, Prefecture: {prefecture_code})")
-        
         csv_path = os.path.join(download_dir, csv_file)
+        checksum = file_checksum(csv_path)
+        is_unchanged = not force and manifest.get(csv_file) == checksum
+        if is_unchanged and store is None:
+            LOGGER.info(f"スキップ: {csv_file} (Year: {year}, Prefecture: {prefecture_code}) - 前回の投入から変更なし")
+            unchanged_count += 1
+            continue
+        
+        LOGGER.info(f"処理中: {csv_file} (Year: {year}, Prefecture: {prefecture_code})" + (" - 前回の投入から変更なし、ローカルキャッシュのみ保存" if is_unchanged else ""))
         
         # CSVを読み込み（UTF-8 with BOM）
         try:
@@ -446,291 +602,192 @@ def upload_land_to_db(download_dir: str = "./downloads", update: bool = False, s
             failed_count += 1
             continue
         
-        # データクレンジング関数
-        def clean_price(price_str):
-            """価格データをクレンジング（241,000(円/㎡) -> 241000）"""
-            if pd.isna(price_str):
-                return None
-            price_str = str(price_str).replace(',', '').replace('(円/㎡)', '').replace('(円/10a)', '')
-            try:
-                return int(price_str)
-            except:
-                return None
-        
-        def clean_distance(distance_str):
-            """距離データをクレンジング（1,300m -> 1300、近接 -> 0、接面 -> -1）"""
-            if pd.isna(distance_str):
-                return None
-            distance_str = str(distance_str)
-            if '近接' in distance_str:
-                return 0
-            elif '接面' in distance_str:
-                return -1
-            elif '駅前広場接面' in distance_str:
-                return -2
-            else:
-                # 数値部分を抽出
-                distance_str = distance_str.replace(',', '').replace('m', '').replace('ｍ', '')
-                try:
-                    return int(distance_str)
-                except:
-                    return None
-        
-        def clean_area(area_str):
-            """地積データをクレンジング（101(㎡) -> 101）"""
-            if pd.isna(area_str):
-                return None
-            area_str = str(area_str).replace('(㎡)', '').replace(',', '')
-            try:
-                return int(area_str)
-            except:
-                return None
-        
-        def clean_width(width_str):
-            """幅員データをクレンジング（4.0m -> 4.0）"""
-            if pd.isna(width_str):
-                return None
-            width_str = str(width_str).replace('m', '').replace('ｍ', '').replace(',', '')
-            try:
-                return float(width_str)
-            except:
-                return None
-        
-        def clean_ratio(ratio_str):
-            """建蔽率・容積率をクレンジング（60(%) -> 60）"""
-            if pd.isna(ratio_str):
-                return None
-            ratio_str = str(ratio_str).replace('(%)', '').replace(',', '')
-            try:
-                return int(ratio_str)
-            except:
-                return None
-        
-        def clean_reference_number(ref_str):
-            """標準地番号の重複文字列をクリーニング（春日-1春日-1 -> 春日-1）"""
-            if pd.isna(ref_str):
-                return None
-            ref_str = str(ref_str).strip()
-            
-            # 文字列長が偶数で、前半と後半が同じ場合は前半のみを返す
-            if len(ref_str) % 2 == 0:
-                mid = len(ref_str) // 2
-                first_half = ref_str[:mid]
-                second_half = ref_str[mid:]
-                if first_half == second_half:
-                    return first_half
-            
-            return ref_str
-        
-        def parse_survey_date(date_str):
-            """調査基準日をパース（令和6年7月1日 -> 2024-07-01）"""
-            if pd.isna(date_str):
-                return None
-            # 令和、平成、昭和の変換
-            import datetime
-            date_str = str(date_str)
-            
-            # 令和の場合
-            if '令和' in date_str:
-                match = re.match(r'令和(\d+)年(\d+)月(\d+)日', date_str)
-                if match:
-                    year = 2018 + int(match.group(1))  # 令和元年 = 2019
-                    month = int(match.group(2))
-                    day = int(match.group(3))
-                    return datetime.date(year, month, day)
-            # 平成の場合
-            elif '平成' in date_str:
-                match = re.match(r'平成(\d+)年(\d+)月(\d+)日', date_str)
-                if match:
-                    year = 1988 + int(match.group(1))  # 平成元年 = 1989
-                    month = int(match.group(2))
-                    day = int(match.group(3))
-                    return datetime.date(year, month, day)
-            # 昭和の場合
-            elif '昭和' in date_str:
-                match = re.match(r'昭和(\d+)年(\d+)月(\d+)日', date_str)
-                if match:
-                    year = 1925 + int(match.group(1))  # 昭和元年 = 1926
-                    month = int(match.group(2))
-                    day = int(match.group(3))
-                    return datetime.date(year, month, day)
-            
-            return None
-        
-        # カラム名マッピング（日本語から英語への変換）
-        def clean_column_name(col_name):
-            """カラム名から余計な文字列を除去して正規化"""
-            import re
-            # 先頭の文字列で厳密にマッチング
-            if col_name.startswith('標準地番号'):
-                return 'reference_number'
-            elif col_name.startswith('調査基準日'):
-                return 'survey_date'
-            elif col_name.startswith('所在及び地番'):
-                return 'location'
-            elif col_name.startswith('住居表示'):
-                return 'residential_address'
-            elif col_name.startswith('価格(円/㎡)'):
-                return 'price_per_sqm'
-            elif col_name.startswith('名称'):
-                return 'station_name'
-            elif col_name.startswith('距離'):
-                return 'station_distance'
-            elif col_name.startswith('地積(㎡)'):
-                return 'land_area'
-            elif col_name.startswith('形状'):
-                return 'land_shape'
-            elif col_name.startswith('利用区分'):
-                return 'land_use_category'
-            elif col_name.startswith('構造'):
-                return 'building_structure'
-            elif col_name.startswith('階層'):
-                return 'building_floors'
-            elif col_name.startswith('利用現況'):
-                return 'current_use'
-            elif col_name.startswith('給排水'):
-                return 'utilities'
-            elif col_name.startswith('周辺の土地'):
-                return 'surrounding_use'
-            elif col_name.startswith('方位') and col_name.endswith('.1'):
-                return 'other_road_direction'
-            elif col_name.startswith('方位'):
-                return 'front_road_direction'
-            elif col_name.startswith('幅員'):
-                return 'front_road_width'
-            elif col_name.startswith('種類'):
-                return 'front_road_type'
-            elif col_name.startswith('舗装'):
-                return 'front_road_pavement'
-            elif col_name.startswith('区分') and col_name != '区分':
-                return 'other_road_category'
-            elif col_name.startswith('用途地域'):
-                return 'use_district'
-            elif col_name.startswith('高度地区'):
-                return 'height_district'
-            elif col_name.startswith('防火'):
-                return 'fire_prevention_area'
-            elif col_name.startswith('建蔽率'):
-                return 'coverage_ratio'
-            elif col_name.startswith('容積率'):
-                return 'floor_area_ratio'
-            elif col_name.startswith('都市計画区域'):
-                return 'city_planning_area'
-            elif col_name.startswith('森林法') or col_name.startswith('公園法'):
-                return 'forest_park_law'
-            elif col_name.startswith('鑑定評価書') and 'URL' not in col_name:
-                return 'appraisal_report'
-            elif col_name == '区分':
-                return 'category'
-            else:
-                return col_name.lower().replace(' ', '_')
-        
-        # カラム名を変換
-        column_mapping = {col: clean_column_name(col) for col in df.columns}
-        df = df.rename(columns=column_mapping)
-        
-        cleaned_df = pd.DataFrame({
-            'year': year,
-            'prefecture_code': prefecture_code,
-            'category': df['category'],
-            'reference_number': df['reference_number'].apply(clean_reference_number),
-            'survey_date': df['survey_date'].apply(parse_survey_date),
-            'location': df['location'],
-            'residential_address': df['residential_address'],
-            'price_per_sqm': df['price_per_sqm'].apply(clean_price),
-            'station_name': df['station_name'],
-            'station_distance': df['station_distance'].apply(clean_distance),
-            'land_area': df['land_area'].apply(clean_area),
-            'land_shape': df['land_shape'],
-            'land_use_category': df['land_use_category'],
-            'building_structure': df['building_structure'],
-            'building_floors': df['building_floors'],
-            'current_use': df['current_use'],
-            'utilities': df['utilities'],
-            'surrounding_use': df['surrounding_use'],
-            'front_road_direction': df['front_road_direction'],
-            'front_road_width': df['front_road_width'].apply(clean_width),
-            'front_road_type': df['front_road_type'],
-            'front_road_pavement': df['front_road_pavement'],
-            'other_road_direction': df.get('other_road_direction'),
-            'other_road_category': df.get('other_road_category'),
-            'use_district': df.get('use_district'),
-            'height_district': df.get('height_district'),
-            'fire_prevention_area': df.get('fire_prevention_area'),
-            'coverage_ratio': df['coverage_ratio'].apply(clean_ratio) if 'coverage_ratio' in df.columns else None,
-            'floor_area_ratio': df['floor_area_ratio'].apply(clean_ratio) if 'floor_area_ratio' in df.columns else None,
-            'city_planning_area': df.get('city_planning_area'),
-            'forest_park_law': df.get('forest_park_law'),
-            'appraisal_report': df.get('appraisal_report'),
-            'appraisal_report_url': df.get('鑑定評価書URL')
-        })
+        # データクレンジング（列単位）
+        cleaned_df = clean_land_frame(df, year, prefecture_code)
+        for col in LAND_INTEGER_COLUMNS:
+            cleaned_df[col] = pd.to_numeric(cleaned_df[col], errors='coerce').astype("Int64")
+        land_columns = cleaned_df.columns.tolist()
+        cleaned_df['row_hash'] = row_hashes(cleaned_df, land_columns)
         
         LOGGER.info(f"  {csv_file}: {len(cleaned_df)}行をクレンジング完了")
         
+        if store is not None:
+            writer = PartitionWriter(store, "reinfolib_land", {"year": year, "prefecture_code": prefecture_code})
+            writer.write(cleaned_df)
+            LOGGER.info(f"  ローカルキャッシュ保存完了: {writer.path} ({writer.commit()}行)")
+        
+        if is_unchanged:
+            LOGGER.info(f"  前回の投入から変更なし: データベース更新をスキップ")
+            unchanged_count += 1
+            continue
         if update:
-            # 既存データを削除
-            delete_sql = f"DELETE FROM reinfolib_land WHERE year = {year} AND prefecture_code = '{prefecture_code}'"
-            DB.set_sql(delete_sql)
-            LOGGER.info(f"  既存データ削除: year={year}, prefecture_code={prefecture_code}")
-            
-            # 新データを挿入
-            DB.insert_from_df(cleaned_df, 'reinfolib_land', is_select=False, set_sql=True)
-            DB.execute_sql()
-            LOGGER.info(f"  データベース挿入完了: {len(cleaned_df)}行", color=["BOLD", "GREEN"])
+            # ステージングテーブルに COPY し、行ハッシュの差分だけを1トランザクションで反映
+            stage = f"reinfolib_land_stage_{year}_{prefecture_code}"
+            DB.execute_sql(f"DROP TABLE IF EXISTS {stage}")
+            DB.execute_sql(f"CREATE UNLOGGED TABLE {stage} AS SELECT {', '.join(land_columns)}, row_hash FROM reinfolib_land WITH NO DATA")
+            copy_from_df(DB, cleaned_df, stage, land_columns + ['row_hash'])
+            n_delete, n_insert = apply_delta(
+                DB, "reinfolib_land", stage, {"year": year, "prefecture_code": prefecture_code}, land_columns,
+                "reinfolib_land", csv_file, checksum, len(cleaned_df)
+            )
+            LOGGER.info(f"  データベース差分反映完了: 削除 {n_delete}行, 追加 {n_insert}行, 変更なし {len(cleaned_df) - n_insert}行", color=["BOLD", "GREEN"])
         else:
             LOGGER.info(f"  [ドライラン] データベース挿入をスキップ")
         success_count += 1
     
     LOGGER.info(f"\n=== アップロード完了 ===")
     LOGGER.info(f"成功: {success_count} ファイル")
+    LOGGER.info(f"変更なし: {unchanged_count} ファイル")
     LOGGER.info(f"失敗: {failed_count} ファイル")
 
 
-def upload_estate_to_db(download_dir: str = "./downloads", update: bool = False, skip: bool = False):
+# 不動産取引価格情報の CSV カラム（CSVカラム名 -> DBカラム名）
+ESTATE_COLUMN_MAPPING = {
+    '種類': 'property_type',
+    '価格情報区分': 'price_info_category',
+    '地域': 'region',
+    '市区町村コード': 'municipality_code',
+    '都道府県名': 'prefecture_name',
+    '市区町村名': 'municipality_name',
+    '地区名': 'district_name',
+    '最寄駅：名称': 'nearest_station_name',
+    '最寄駅：距離（分）': 'nearest_station_distance',
+    '取引価格（総額）': 'transaction_price',
+    '坪単価': 'price_per_tsubo',
+    '間取り': 'floor_plan',
+    '面積（u）': 'area_sqm',
+    '取引価格（u単価）': 'price_per_sqm',
+    '土地の形状': 'land_shape',
+    '間口': 'frontage',
+    '延床面積（u）': 'floor_area_sqm',
+    '建築年': 'building_year',
+    '建物の構造': 'building_structure',
+    '用途': 'use',
+    '今後の利用目的': 'future_use',
+    '前面道路：方位': 'front_road_direction',
+    '前面道路：種類': 'front_road_type',
+    '前面道路：幅員（ｍ）': 'front_road_width',
+    '都市計画': 'city_planning',
+    '建ぺい率（％）': 'coverage_ratio',
+    '容積率（％）': 'floor_area_ratio',
+    '取引時期': 'transaction_period',
+    '改装': 'renovation',
+    '取引の事情等': 'transaction_notes'
+}
+
+# reinfolib_estate の整数・小数のカラム（それ以外は文字列のまま投入）
+ESTATE_INTEGER_COLUMNS = ['nearest_station_distance', 'transaction_price', 'price_per_tsubo', 'price_per_sqm', 'building_year', 'coverage_ratio', 'floor_area_ratio']
+ESTATE_DECIMAL_COLUMNS = ['area_sqm', 'frontage', 'floor_area_sqm', 'front_road_width']
+
+# COPY するカラムの並び
+ESTATE_DB_COLUMNS = ['year', 'period', 'prefecture_code'] + list(ESTATE_COLUMN_MAPPING.values())
+
+
+def clean_building_year(series: pd.Series) -> pd.Series:
     """
-    estate ZIPファイルを展開してデータベースにアップロード
+    建築年をクレンジング（1989年 -> 1989, 1980年代前半 -> 1980, 戦前 -> 1944（昭和19年、終戦前年））
+    """
+    series = series.astype("string")
+    year   = pd.to_numeric(series.str.extract(r'(\d{4})', expand=False), errors='coerce')
+    return year.mask(series.str.contains('戦前', na=False), 1944).astype("Int64")
+
+def read_estate_zip(zip_path: str, year: int, period: int, chunksize: int = 100000):
+    """
+    ZIPファイルを展開せずに、都道府県ごとの CSV を chunksize 行ずつ読み込んで reinfolib_estate のカラムに変換
+    （全カラムを文字列として読み込み、数値のカラムだけを変換する）
+
+    Yields:
+        Tuple[str, pd.DataFrame]: (CSVファイル名, ESTATE_DB_COLUMNS の DataFrame)
+    """
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        for member in sorted(x for x in zf.namelist() if x.endswith('.csv')):
+            csv_file   = os.path.basename(member)
+            match_csv  = re.match(r'(\d{2})_', csv_file)
+            if not match_csv:
+                LOGGER.warning(f"    CSVファイル名が不正です: {csv_file}")
+                continue
+            prefecture_code = match_csv.group(1)
+            with zf.open(member) as f:
+                try:
+                    reader = pd.read_csv(f, encoding='shift_jis', encoding_errors='ignore', dtype=str, chunksize=chunksize)
+                    for df in reader:
+                        df = df.rename(columns=ESTATE_COLUMN_MAPPING)
+                        list_unknown = [x for x in df.columns if x not in ESTATE_DB_COLUMNS]
+                        if len(list_unknown) > 0:
+                            LOGGER.warning(f"    {csv_file}: 未定義のカラムを除外 {list_unknown}")
+                        df = df.reindex(columns=ESTATE_DB_COLUMNS)
+                        df['year']            = year
+                        df['period']          = period
+                        df['prefecture_code'] = prefecture_code
+                        df['building_year']   = clean_building_year(df['building_year'])
+                        for col in ESTATE_INTEGER_COLUMNS:
+                            if col != 'building_year':
+                                df[col] = pd.to_numeric(df[col], errors='coerce').round().astype("Int64")
+                        for col in ESTATE_DECIMAL_COLUMNS:
+                            df[col] = pd.to_numeric(df[col], errors='coerce')
+                        yield csv_file, df
+                except pd.errors.EmptyDataError:
+                    LOGGER.warning(f"    {csv_file}: 空のCSVファイル")
+
+def copy_from_df(db: DBConnector, df: pd.DataFrame, table: str, columns: List[str]):
+    """
+    DataFrame を COPY FROM STDIN（CSV形式、空欄は NULL）でテーブルに投入
+    """
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False, header=False, columns=columns)
+    buffer.seek(0)
+    with db.con.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+    db.con.commit()
+
+def load_file_manifest(db: DBConnector, dataset: str) -> Dict[str, str]:
+    """
+    前回までに投入したファイルのチェックサム（ファイル名 -> SHA-256）
+    """
+    df = db.select_sql(f"SELECT file_name, checksum FROM reinfolib_file_manifest WHERE dataset = '{dataset}'")
+    return dict(zip(df["file_name"].tolist(), df["checksum"].tolist())) if df.shape[0] > 0 else {}
+
+def apply_delta(db: DBConnector, table: str, stage: str, keys: Dict[str, Any], columns: List[str], dataset: str, file_name: str, checksum: str, n_rows: int) -> Tuple[int, int]:
+    """
+    ステージングテーブルとの行ハッシュの差分を反映（keys の範囲の行のうち、ステージングにない行を削除し、テーブルにない行を追加）
+    削除・追加・ファイルのチェックサムの記録・ステージングテーブルの削除は1トランザクションで実行する
+
+    Returns:
+        Tuple[int, int]: (削除した行数, 追加した行数)
+    """
+    where    = " AND ".join(f"a.{x} = '{y}'" if isinstance(y, str) else f"a.{x} = {y}" for x, y in keys.items())
+    is_keep  = f"EXISTS (SELECT 1 FROM {stage} AS b WHERE b.row_hash = a.row_hash)"
+    is_exist = f"EXISTS (SELECT 1 FROM {table} AS a WHERE {where} AND a.row_hash = b.row_hash)"
+    n_delete = int(db.select_sql(f"SELECT COUNT(*) AS n FROM {table} AS a WHERE {where} AND NOT {is_keep}")["n"].iloc[0])
+    n_insert = int(db.select_sql(f"SELECT COUNT(*) AS n FROM {stage} AS b WHERE NOT {is_exist}")["n"].iloc[0])
+    db.set_sql(f"DELETE FROM {table} AS a WHERE {where} AND NOT {is_keep}")
+    db.set_sql(f"INSERT INTO {table} ({', '.join(columns)}, row_hash) SELECT {', '.join(columns)}, row_hash FROM {stage} AS b WHERE NOT {is_exist}")
+    db.set_sql(
+        f"INSERT INTO reinfolib_file_manifest (file_name, dataset, checksum, n_rows) VALUES ('{file_name}', '{dataset}', '{checksum}', {n_rows}) " +
+        f"ON CONFLICT (file_name) DO UPDATE SET dataset = EXCLUDED.dataset, checksum = EXCLUDED.checksum, n_rows = EXCLUDED.n_rows, sys_updated = CURRENT_TIMESTAMP"
+    )
+    db.set_sql(f"DROP TABLE {stage}")
+    db.execute_sql()
+    return n_delete, n_insert
+
+def upload_estate_to_db(download_dir: str = "./downloads", update: bool = False, skip: bool = False, chunksize: int = 100000, store: Optional[str] = None, force: bool = False):
+    """
+    estate ZIPファイルをデータベースにアップロード
+    ZIPファイルは展開せずに CSV を chunksize 行ずつ読み込み、(year, period) ごとのステージングテーブルに COPY した後、
+    1トランザクションで reinfolib_estate の (year, period) の行に差分（行ハッシュ）を反映する（メモリ使用量は chunksize 行分）
+    内容が前回の投入（reinfolib_file_manifest のチェックサム）と同じZIPファイルは読み込まずにスキップする
+    （store を指定した場合は読み込んでパーティションを保存し、データベースの更新のみスキップする）
     
     Args:
         download_dir: ZIPファイルが格納されたディレクトリ
         update: データベース更新を実行するか
         skip: 既存データがある場合はスキップするか
+        chunksize: 1回に読み込む・COPY する行数
+        store: 列指向のローカルキャッシュ（columnar_store.py）の保存先、指定した場合は (year, period) のパーティションを入れ替える（update に関係なく保存）
+        force: チェックサムが同じファイルも行ハッシュで比較する
     """
     LOGGER.info(f"Estateデータのデータベースアップロード開始: {download_dir}")
     
-    # カラムマッピング（CSVカラム名 -> DBカラム名）
-    column_mapping = {
-        '種類': 'property_type',
-        '価格情報区分': 'price_info_category',
-        '地域': 'region',
-        '市区町村コード': 'municipality_code',
-        '都道府県名': 'prefecture_name',
-        '市区町村名': 'municipality_name',
-        '地区名': 'district_name',
-        '最寄駅：名称': 'nearest_station_name',
-        '最寄駅：距離（分）': 'nearest_station_distance',
-        '取引価格（総額）': 'transaction_price',
-        '坪単価': 'price_per_tsubo',
-        '間取り': 'floor_plan',
-        '面積（u）': 'area_sqm',
-        '取引価格（u単価）': 'price_per_sqm',
-        '土地の形状': 'land_shape',
-        '間口': 'frontage',
-        '延床面積（u）': 'floor_area_sqm',
-        '建築年': 'building_year',
-        '建物の構造': 'building_structure',
-        '用途': 'use',
-        '今後の利用目的': 'future_use',
-        '前面道路：方位': 'front_road_direction',
-        '前面道路：種類': 'front_road_type',
-        '前面道路：幅員（ｍ）': 'front_road_width',
-        '都市計画': 'city_planning',
-        '建ぺい率（％）': 'coverage_ratio',
-        '容積率（％）': 'floor_area_ratio',
-        '取引時期': 'transaction_period',
-        '改装': 'renovation',
-        '取引の事情等': 'transaction_notes'
-    }
-    
     # データベース接続
     DB = DBConnector(HOST, port=PORT, dbname=DBNAME, user=USER, password=PASS, dbtype=DBTYPE, max_disp_len=200)
     
@@ -742,9 +799,11 @@ def upload_estate_to_db(download_dir: str = "./downloads", update: bool = False,
         return
     
     LOGGER.info(f"{len(zip_files)}個のZIPファイルを処理します")
+    manifest = load_file_manifest(DB, "reinfolib_estate")
     
     success_count = 0
     failed_count = 0
+    unchanged_count = 0
     
     for zip_file in sorted(zip_files):
         # ファイル名からyearとperiodを抽出 (reinfolib_estate_YYYY_P.zip)
@@ -764,112 +823,79 @@ def upload_estate_to_db(download_dir: str = "./downloads", update: bool = False,
                 LOGGER.info(f"スキップ: {zip_file} (Year: {year}, Period: {period}) - 既存データあり")
                 continue
         
-        LOGGER.info(f"処理中: {zip_file} (Year: {year}, Period: {period})")
+        checksum = file_checksum(os.path.join(download_dir, zip_file))
+        is_unchanged = not force and manifest.get(zip_file) == checksum
+        if is_unchanged and store is None:
+            LOGGER.info(f"スキップ: {zip_file} (Year: {year}, Period: {period}) - 前回の投入から変更なし")
+            unchanged_count += 1
+            continue
         
-        # 一時ディレクトリを作成
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # ZIPファイルを展開
-            zip_path = os.path.join(download_dir, zip_file)
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                zf.extractall(temp_dir)
-                LOGGER.info(f"  ZIP展開完了: {temp_dir}")
-            
-            # CSVファイルを処理
-            csv_files = [f for f in os.listdir(temp_dir) if f.endswith('.csv')]
-            LOGGER.info(f"  {len(csv_files)}個のCSVファイルを処理")
-            
-            all_data = []
-            
-            for csv_file in csv_files:
-                # ファイル名から都道府県コードを抽出
-                match_csv = re.match(r'(\d{2})_', csv_file)
-                if not match_csv:
-                    LOGGER.warning(f"    CSVファイル名が不正です: {csv_file}")
-                    continue
-                
-                prefecture_code = match_csv.group(1)
-                csv_path = os.path.join(temp_dir, csv_file)
-                
-                # CSVを読み込み（Shift-JIS）
-                try:
-                    df = pd.read_csv(csv_path, encoding='shift_jis', encoding_errors='ignore')
-                except pd.errors.EmptyDataError:
-                    LOGGER.warning(f"    {csv_file}: 空のCSVファイル")
-                    continue
-                
-                # 空のDataFrameの場合はスキップ
-                if df.empty:
-                    LOGGER.info(f"    {csv_file}: データなし")
-                    continue
-                
-                # カラム名を変換
-                df = df.rename(columns=column_mapping)
-                
-                # year, period, prefecture_codeを追加
-                df['year'] = year
-                df['period'] = period
-                df['prefecture_code'] = prefecture_code
-                
-                # building_year のクレンジング（「1989年」-> 1989）
-                def clean_building_year(year_str):
-                    """建築年をクレンジング（1989年 -> 1989, 戦前 -> 1944）"""
-                    if pd.isna(year_str):
-                        return None
-                    year_str = str(year_str).replace('年', '').replace('頃', '').strip()
-                    # 戦前の場合は1944年とする（昭和19年、終戦前年）
-                    if '戦前' in year_str:
-                        return 1944
-                    # 年代範囲の場合（例: 1980年代前半）
-                    if '年代' in year_str:
-                        match = re.search(r'(\d{4})', year_str)
-                        if match:
-                            return int(match.group(1))
-                    # 通常の年の場合
-                    match = re.search(r'(\d{4})', year_str)
-                    if match:
-                        return int(match.group(1))
-                    return None
-                
-                if 'building_year' in df.columns:
-                    df['building_year'] = df['building_year'].apply(clean_building_year)
-                
-                # 数値型の変換とクリーニング
-                numeric_columns = ['nearest_station_distance', 'transaction_price', 'price_per_tsubo', 
-                                 'area_sqm', 'price_per_sqm', 'frontage', 'floor_area_sqm', 
-                                 'front_road_width', 'coverage_ratio', 'floor_area_ratio']
-                
-                for col in numeric_columns:
-                    if col in df.columns:
-                        df[col] = pd.to_numeric(df[col], errors='coerce')
-                
-                all_data.append(df)
-                LOGGER.info(f"    {csv_file}: {len(df)}行読み込み")
-            
-            # 全データを結合
-            if all_data:
-                combined_df = pd.concat(all_data, ignore_index=True)
-                LOGGER.info(f"  合計: {len(combined_df)}行")
-                
-                if update:
-                    # 既存データを削除
-                    delete_sql = f"DELETE FROM reinfolib_estate WHERE year = {year} AND period = {period}"
-                    DB.set_sql(delete_sql)
-                    LOGGER.info(f"  既存データ削除: year={year}, period={period}")
-                    
-                    # 新データを挿入
-                    DB.insert_from_df(combined_df, 'reinfolib_estate', is_select=False, set_sql=True)
-                    DB.execute_sql()
-                    LOGGER.info(f"  データベース挿入完了: {len(combined_df)}行", color=["BOLD", "GREEN"])
-                else:
-                    LOGGER.info(f"  [ドライラン] データベース挿入をスキップ")
-                
-                success_count += 1
-            else:
-                LOGGER.warning(f"  有効なデータがありません")
-                failed_count += 1
+        LOGGER.info(f"処理中: {zip_file} (Year: {year}, Period: {period})" + (" - 前回の投入から変更なし、ローカルキャッシュのみ保存" if is_unchanged else ""))
+        time_start = time.perf_counter()
+        is_db = update and not is_unchanged
+        
+        # ステージングテーブル（id・システムカラムなし、WAL なし）
+        stage = f"reinfolib_estate_stage_{year}_{period}"
+        if is_db:
+            DB.execute_sql(f"DROP TABLE IF EXISTS {stage}")
+            DB.execute_sql(f"CREATE UNLOGGED TABLE {stage} AS SELECT {', '.join(ESTATE_DB_COLUMNS)}, row_hash FROM reinfolib_estate WITH NO DATA")
+        
+        n_rows  = 0
+        n_files = {}
+        counts  = {}
+        writer  = PartitionWriter(store, "reinfolib_estate", {"year": year, "period": period}) if store is not None else None
+        try:
+            for csv_file, df in read_estate_zip(os.path.join(download_dir, zip_file), year, period, chunksize=chunksize):
+                df['row_hash'] = row_hashes(df, ESTATE_DB_COLUMNS, counts=counts)
+                if is_db:
+                    copy_from_df(DB, df, stage, ESTATE_DB_COLUMNS + ['row_hash'])
+                if writer is not None:
+                    writer.write(df)
+                n_rows += len(df)
+                n_files[csv_file] = n_files.get(csv_file, 0) + len(df)
+            for csv_file, n in n_files.items():
+                LOGGER.info(f"    {csv_file}: {n}行読み込み")
+        except Exception as e:
+            LOGGER.warning(f"  読み込み・COPYに失敗しました: {type(e).__name__}: {e}")
+            if is_db:
+                DB.con.rollback()
+                DB.execute_sql(f"DROP TABLE IF EXISTS {stage}")
+            if writer is not None:
+                writer.abort()
+            failed_count += 1
+            continue
+        
+        if n_rows == 0:
+            LOGGER.warning(f"  有効なデータがありません")
+            if is_db:
+                DB.execute_sql(f"DROP TABLE IF EXISTS {stage}")
+            if writer is not None:
+                writer.abort()
+            failed_count += 1
+            continue
+        LOGGER.info(f"  合計: {n_rows}行 ({time.perf_counter() - time_start:.1f}秒)")
+        if writer is not None:
+            LOGGER.info(f"  ローカルキャッシュ保存完了: {writer.path} ({writer.commit()}行)")
+        
+        if is_unchanged:
+            LOGGER.info(f"  前回の投入から変更なし: データベース更新をスキップ")
+            unchanged_count += 1
+            continue
+        if update:
+            # なくなった行の削除・新しい行の追加・チェックサムの記録・ステージングテーブルの削除を1トランザクションで実行
+            n_delete, n_insert = apply_delta(
+                DB, "reinfolib_estate", stage, {"year": year, "period": period}, ESTATE_DB_COLUMNS,
+                "reinfolib_estate", zip_file, checksum, n_rows
+            )
+            LOGGER.info(f"  データベース差分反映完了: year={year}, period={period}, 削除 {n_delete}行, 追加 {n_insert}行, 変更なし {n_rows - n_insert}行 ({time.perf_counter() - time_start:.1f}秒)", color=["BOLD", "GREEN"])
+        else:
+            LOGGER.info(f"  [ドライラン] データベース挿入をスキップ")
+        
+        success_count += 1
     
     LOGGER.info(f"\n=== アップロード完了 ===")
     LOGGER.info(f"成功: {success_count} ファイル")
+    LOGGER.info(f"変更なし: {unchanged_count} ファイル")
     LOGGER.info(f"失敗: {failed_count} ファイル")
 
 
@@ -891,8 +917,9 @@ if __name__ == "__main__":
   # ヘッドレスモード（ブラウザ非表示）で実行
   python reinfolib.py estate --year 2024 --period 2 --headless
   
-  # 一括ダウンロード（別スクリプト）
-  bash download_reinfolib_estate_all.sh
+  # 一括ダウンロード（2006-2024年の全四半期を3ブラウザで並列、完了済みはマニフェストからスキップ）
+  python reinfolib.py backfillestate --year-from 2006 --year-to 2024 --workers 3 --headless
+  bash download_reinfolib_estate_all.sh 2006 2024
 
 ■ 地価公示・地価調査データ（land）のスクレイピング
   # 基本的な使用方法（2024年・東京都）
@@ -910,18 +937,25 @@ if __name__ == "__main__":
   # ヘッドレスモードで実行（大阪府）
   python reinfolib.py land --year 2023 --prefecture-code 27 --headless
   
-  # 一括スクレイピング（別スクリプト・1970-2024年全都道府県）
-  bash download_reinfolib_land_all.sh
+  # 一括スクレイピング（1970-2024年全都道府県を4ブラウザで並列）
+  python reinfolib.py backfillland --year-from 1970 --year-to 2024 --workers 4 --headless
+  python reinfolib.py backfillland --year-from 2024 --year-to 2024 --prefecture-code 13   # 1都道府県のみ
+  bash download_reinfolib_land_all.sh 1970 2024
 
 ■ ダウンロード済みデータのデータベース投入
   # Estate データ（不動産取引価格）のDB投入
   python reinfolib.py uploadestate                      # ドライラン
   python reinfolib.py uploadestate --update              # DB更新
   python reinfolib.py uploadestate --download-dir /home/share/reinfolib --update
+  python reinfolib.py uploadestate --update --skip --chunksize 200000   # 1回に読み込む・COPY する行数
   
   # Land データ（地価公示・地価調査）のDB投入
   python reinfolib.py uploadland                        # ドライラン
   python reinfolib.py uploadland --update                # DB更新
+  
+  # DB投入と同時に列指向のローカルキャッシュ（Parquet）も保存（ana.py --store で読み込み）
+  python reinfolib.py uploadland --update --store ./store
+  python reinfolib.py uploadestate --update --store ./store
 
 =================================================================
 注意事項:
@@ -929,14 +963,20 @@ if __name__ == "__main__":
   - land: CSVファイルを生成（年度ごと、都道府県別）
   - uploadestate: estateデータ（ZIPファイル）のDB投入
   - uploadland: landデータ（CSVファイル）のDB投入
+  - backfillestate / backfillland: 複数の年・四半期・都道府県を並列にダウンロード
+    （結果は download-dir/reinfolib_{estate,land}_manifest.jsonl に対象ごとの所要時間とともに追記）
   - データベース更新時は --update フラグが必須（安全のため）
+  - uploadestate / uploadland はファイルのチェックサムを reinfolib_file_manifest に記録し、変更のないファイルはスキップ
+    （変更されたファイルは行ハッシュ（row_hash）で比較し、なくなった行の削除と新しい行の追加だけを行う、--force で常に比較）
+  - --store のキャッシュは store/reinfolib_{land,estate}/year=.../ にパーティションごとに入れ替えて保存（--update なしでも保存）
+    （チェックサムが前回の投入と同じファイルも読み込んでパーティションを保存し、DB の更新のみスキップ）
   - 大量データ取得時はヘッドレスモード推奨（--headless）
   - ダウンロード済みファイルは再取得しません（既存ファイルチェック）
 =================================================================
 '''
     )
     
-    parser.add_argument("type", choices=["estate", "land", "uploadestate", "uploadland"], help="コマンドタイプ（estate: 不動産取引価格ダウンロード, land: 地価公示・地価調査スクレイピング, uploadestate: estateデータDB投入, uploadland: landデータDB投入）")
+    parser.add_argument("type", choices=["estate", "land", "uploadestate", "uploadland", "backfillestate", "backfillland"], help="コマンドタイプ（estate: 不動産取引価格ダウンロード, land: 地価公示・地価調査スクレイピング, uploadestate: estateデータDB投入, uploadland: landデータDB投入, backfillestate/backfillland: 一括ダウンロード）")
     parser.add_argument("--year", type=int, help="対象年（例: 2024）（estate/landタイプで必須）")
     parser.add_argument("--period", type=int, choices=[1, 2, 3, 4], help="四半期（1-4）（estateタイプのみ必須）")
     parser.add_argument("--prefecture-code", type=str, help="都道府県コード（01-47の2桁）（landタイプのみ必須）")
@@ -944,9 +984,19 @@ if __name__ == "__main__":
     parser.add_argument("--headless", action="store_true", default=False, help="ヘッドレスモードで実行")
     parser.add_argument("--update", action="store_true", default=False, help="データベース更新を実行（uploadestate/uploadlandで使用）")
     parser.add_argument("--skip", action="store_true", default=False, help="既存データがある場合はスキップ（uploadestate/uploadlandで使用）")
+    parser.add_argument("--force", action="store_true", default=False, help="前回の投入とチェックサムが同じファイルも行ハッシュで比較（uploadestate/uploadlandで使用）")
+    parser.add_argument("--year-from", type=int, help="一括ダウンロードの開始年（backfillestate: 2006以降, backfillland: 1970以降）")
+    parser.add_argument("--year-to", type=int, help="一括ダウンロードの終了年")
+    parser.add_argument("--workers", type=int, default=2, help="一括ダウンロードで並列に使うブラウザの数")
+    parser.add_argument("--retries", type=int, default=3, help="一括ダウンロードの1対象あたりの試行回数")
+    parser.add_argument("--chunksize", type=int, default=100000, help="CSVを1回に読み込む・COPYする行数（uploadestateで使用）")
+    parser.add_argument("--store", type=str, help="列指向のローカルキャッシュ（Parquet）の保存先ディレクトリ（uploadestate/uploadlandで使用、--update なしでも保存）")
+    add_profile_arguments(parser)
     
     args = parser.parse_args()
     LOGGER.info(f"実行引数: {args}")
+    if args.profile is not None:
+        start_profiling(args.profile, mode=args.profilemode, interval=args.profileinterval, log_function=LOGGER.info)
     
     # データタイプによる引数検証
     if args.type in ["estate", "land"] and args.year is None:
@@ -957,16 +1007,31 @@ if __name__ == "__main__":
         parser.error("landタイプの場合、--prefecture-codeは必須です")
     
     # 都道府県コードの検証（landタイプの場合）
-    if args.type == "land":
+    if args.type == "land" or (args.type == "backfillland" and args.prefecture_code is not None):
         if not args.prefecture_code.isdigit() or len(args.prefecture_code) != 2 or not (1 <= int(args.prefecture_code) <= 47):
             parser.error("--prefecture-codeは01-47の2桁で指定してください")
     
-    if args.type == "uploadestate":
+    if args.type in ["backfillestate", "backfillland"]:
+        if args.year_from is None or args.year_to is None or args.year_from > args.year_to:
+            parser.error(f"{args.type}タイプの場合、--year-from <= --year-to で指定してください")
+    
+    if args.type in ["backfillestate", "backfillland"]:
+        # 一括ダウンロード
+        if args.type == "backfillestate":
+            periods = [args.period] if args.period is not None else [1, 2, 3, 4]
+            targets = [(year, period) for year in range(max(args.year_from, 2006), args.year_to + 1) for period in periods]
+        else:
+            codes   = [args.prefecture_code] if args.prefecture_code is not None else [f"{i:02d}" for i in range(1, 48)]
+            targets = [(year, code) for year in range(max(args.year_from, 1970), args.year_to + 1) for code in codes]
+        results = run_backfill(args.type.replace("backfill", ""), targets, args.download_dir, workers=args.workers, headless=args.headless, retries=args.retries)
+        if any(x["status"] != "success" for x in results):
+            exit(1)
+    elif args.type == "uploadestate":
         # Estate データのアップロード処理
-        upload_estate_to_db(args.download_dir, args.update, args.skip)
+        upload_estate_to_db(args.download_dir, args.update, args.skip, chunksize=args.chunksize, store=args.store, force=args.force)
     elif args.type == "uploadland":
         # Land データのアップロード処理
-        upload_land_to_db(args.download_dir, args.update, args.skip)
+        upload_land_to_db(args.download_dir, args.update, args.skip, store=args.store, force=args.force)
     else:
         # ダウンロード処理
         if args.headless:
@@ -982,10 +1047,7 @@ if __name__ == "__main__":
                 df = download_land_prices(playwright, args.year, args.prefecture_code, args.headless)
                 
                 # CSV保存処理
-                os.makedirs(args.download_dir, exist_ok=True)
-                filename = f"reinfolib_land_{args.year}_{args.prefecture_code}.csv"
-                filepath = os.path.join(args.download_dir, filename)
-                df.to_csv(filepath, index=False, encoding='utf-8-sig')
+                filepath = save_land_csv(df, args.year, args.prefecture_code, args.download_dir)
                 
                 LOGGER.info(f"CSV保存完了: {filepath}", color=["BOLD", "GREEN"])
                 LOGGER.info(f"データ行数: {len(df)}行, カラム数: {len(df.columns)}列")
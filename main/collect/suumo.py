@@ -3,9 +3,12 @@ import pandas as pd
 from kkpsgre.connector import DBConnector
 from kklogger import set_logger
 from kkestate.config.psgre import HOST, PORT, USER, PASS, DBNAME, DBTYPE
+from kkestate.util.metrics import StageMetrics
+from kkestate.util.profiler import add_profile_arguments, start_profiling
 
 
 LOGGER    = set_logger(__name__)
+METRICS   = StageMetrics("suumo", log_function=LOGGER.info)
 BASE_URL  = "https://suumo.jp"
 LIST_TYPE = ["ms/shinchiku", "ms/chuko", "ikkodate", "chukoikkodate"]
 DICT_MST_URLS = {
@@ -88,8 +91,10 @@ def get_estate_list(url: str):
     assert isinstance(url, str)
     LOGGER.info(url)
     cnt = 0
+    watch = METRICS.stopwatch()
     while True:
         html = requests.get(url)
+        watch.lap("http")
         soup = bs4.BeautifulSoup(html.content, 'html.parser')
         if len(soup.find_all("div", class_="error_pop")) > 0:
             # There is not list of estates.
@@ -123,6 +128,7 @@ def get_estate_list(url: str):
         """)
     df = pd.DataFrame(list_title, columns=["name"])
     df["url"] = list_urls
+    watch.lap("parse", n=df.shape[0])
     return df.to_dict()
 
 
@@ -130,7 +136,9 @@ def get_estate_detail(url):
     assert isinstance(url, str)
     url  = f"{url}property/" if url[-1] == "/" else f"{url}/property/"
     LOGGER.info(url)
+    watch = METRICS.stopwatch()
     html = requests.get(url, timeout=10, allow_redirects=False)
+    watch.lap("http")
     if html.status_code in [301, 503]:
         LOGGER.warning(f"STATUS CODE: {html.status_code}") # redirect URL: html.headers['Location']
         return -1
@@ -169,7 +177,9 @@ def get_estate_detail(url):
             ## kaishainfo
             url = url.replace("property/", "kaishainfo/")
             LOGGER.info(url)
+            watch.lap("parse", n=0)
             html = requests.get(url)
+            watch.lap("http")
             soup = bs4.BeautifulSoup(html.content, 'html.parser')
             tbl  = soup.find("div", class_="section_h2-header").find_next("div", class_="section_h2-body").find("table", class_="detailtable")
             _key     = [x.text.strip() for x in tbl.find_all("th", class_="detailtable-title")]
@@ -198,6 +208,7 @@ def get_estate_detail(url):
             else:
                 dict_ret[title] = re.sub(r"[\t\n\r\f]+", r"\t", soupwk.find_next("div", class_="mt10").text.strip()) 
     dict_ret = {x: re.sub(r"[\t\n\r\f]+", r"\t", y).replace("\xa0", "").replace("'", "") for x, y in dict_ret.items()} # again
+    watch.lap("parse", n=len(dict_ret))
     return dict_ret
 
 
@@ -217,7 +228,13 @@ if __name__ == "__main__":
     parser.add_argument("--datefrom",    type=str, help="--datefrom 20230101", required=False)
     parser.add_argument("--prefcode",    type=lambda x: x.split(","), help="--pref 13,02")
     parser.add_argument("--initpref",    action='store_true', default=False)
+    parser.add_argument("--metrics",     type=str, help="--metrics metrics.jsonl (JSON Lines of stage metrics)")
+    parser.add_argument("--metricsinterval", type=float, default=60, help="--metricsinterval 60 (sec)")
+    add_profile_arguments(parser)
     args = parser.parse_args()
+    if args.profile is not None:
+        start_profiling(args.profile, mode=args.profilemode, interval=args.profileinterval, log_function=LOGGER.info)
+    METRICS.configure(interval=args.metricsinterval, output=args.metrics)
 
     if args.prefcode is not None:
         for x in args.prefcode:
@@ -273,8 +290,10 @@ if __name__ == "__main__":
             ## prefcode process
             DB.execute_sql("UPDATE estate_tmp_pref SET target_checked = null;")
         for i_url, url in enumerate(list_urls):
+            METRICS.report_if_due()
             dictwk = get_estate_list(url)
             df     = pd.DataFrame(dictwk)
+            watch  = METRICS.stopwatch()
             if args.runmain and args.update:
                 ## runmain process
                 DB.execute_sql(f"update estate_tmp set is_checked = true where url = '{url}';")
@@ -300,6 +319,8 @@ if __name__ == "__main__":
                 if args.update and args.runmain:
                     ## runmain process (updating sys_updated is only for "runmain" process)
                     DB.execute_sql("update estate_main set sys_updated = CURRENT_TIMESTAMP where id in (" + ",".join(df["id_new"].astype(str).tolist()) +");")
+            watch.lap("db_main", n=df.shape[0])
+            METRICS.count("list_pages")
         if args.update and args.prefcode is not None:
             ## prefcode process
             DB.execute_sql("delete from estate_tmp_pref where target_checked = null;")
@@ -329,17 +350,23 @@ if __name__ == "__main__":
             )
         list_df = []
         for url, id_main in df[["url", "id"]].values:
+            METRICS.report_if_due()
+            watch = METRICS.stopwatch()
             if args.update:
                 id_run = DB.execute_sql(f"INSERT into estate_run (id_main, timestamp) VALUES ({id_main}, CURRENT_TIMESTAMP);SELECT lastval();")[0][0]
+                watch.lap("db_write", n=0)
             else:
                 id_run = None
             try:
                 dict_ret = get_estate_detail(BASE_URL + url)
             except (ConnectionResetError, requests.exceptions.ChunkedEncodingError, requests.exceptions.ConnectionError) as e:
                 LOGGER.warning(f"{str(e)} happend.")
+                METRICS.count("error")
                 time.sleep(10)
                 continue
+            watch.reset()
             if isinstance(dict_ret, int):
+                METRICS.count("closed")
                 if args.update:
                     DB.execute_sql(f"update estate_run set is_success = true where id = {id_run};")
                 continue
@@ -355,6 +382,7 @@ if __name__ == "__main__":
                     DB.execute_sql()
                 df_key    = DB.select_sql("select id as id_key, name as key from estate_mst_key where name in ('" + "','".join(df_detail["key"].unique().tolist())+ "');")
                 df_detail = pd.merge(df_detail, df_key, how="left", on="key")
+                watch.lap("db_key", n=df_detail.shape[0])
             # insert
             df_detail["id_run"]  = id_run
             if df_detail.shape[0] > 0 and args.update:
@@ -365,7 +393,12 @@ if __name__ == "__main__":
                     df_prev     = df_prev.loc[:, ["id_key", "value_prev"]]
                     df_detail   = pd.merge(df_detail, df_prev, how="left", on=["id_key"])
                     df_detail   = df_detail.loc[df_detail["value_prev"].isna() | (df_detail["value_prev"] != df_detail["value"])]
+                watch.lap("db_read", n=df_detail.shape[0])
                 if df_detail.shape[0] > 0:
                     DB.insert_from_df(df_detail[["id_run", "id_key", "value"]], "estate_detail", is_select=False)
                 DB.set_sql(f"update estate_run set is_success = true where id = {id_run};")
                 DB.execute_sql()
+                watch.lap("db_write", n=df_detail.shape[0])
+            METRICS.count("success")
+
+    METRICS.close()
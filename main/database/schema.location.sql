@@ -9,6 +9,7 @@ CREATE TABLE estate_mst_location (
     -- 位置情報
     longitude               double precision,               -- 経度
     latitude                double precision,               -- 緯度
+    source                  text NOT NULL DEFAULT 'gsi',    -- 緯度経度の取得元（gsi: AddressSearch API, gazetteer: 町丁目インデックスの代表点・中央値）
     
     -- システムカラム
     sys_created             timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
@@ -17,11 +18,34 @@ CREATE TABLE estate_mst_location (
 
 -- インデックス作成
 CREATE INDEX idx_estate_mst_location_coords ON estate_mst_location (longitude, latitude);
+-- 既存のテーブルへの source の追加（既存の行は gsi）
+-- ALTER TABLE estate_mst_location ADD COLUMN IF NOT EXISTS source text NOT NULL DEFAULT 'gsi';
 
 -- コメント追加
 COMMENT ON TABLE estate_mst_location IS '住所緯度経度マスターテーブル';
 COMMENT ON COLUMN estate_mst_location.location IS '住所（所在地）';
 COMMENT ON COLUMN estate_mst_location.longitude IS '経度';
 COMMENT ON COLUMN estate_mst_location.latitude IS '緯度';
+COMMENT ON COLUMN estate_mst_location.source IS '緯度経度の取得元（gsi: AddressSearch API, gazetteer: 町丁目インデックスの近似値）';
 COMMENT ON COLUMN estate_mst_location.sys_created IS '作成日時';
-COMMENT ON COLUMN estate_mst_location.sys_updated IS '更新日時';
\ No newline at end of file
+COMMENT ON COLUMN estate_mst_location.sys_updated IS '更新日時';
+
+-- 住所 -> 正規化キーの対応テーブル
+-- estate_mst_location は正規化キー（kkestate.util.address_normalizer.normalize_address）で登録し、
+-- 元の住所（estate_cleaned / reinfolib_land の location）はこのテーブルを経由して結合する
+CREATE TABLE estate_mst_location_key (
+    location                text PRIMARY KEY,               -- 元の住所
+    location_key            text NOT NULL,                  -- 正規化キー（estate_mst_location.location）
+
+    -- システムカラム
+    sys_created             timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    sys_updated             timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_estate_mst_location_key_key ON estate_mst_location_key (location_key);
+
+COMMENT ON TABLE estate_mst_location_key IS '住所正規化キー対応テーブル';
+COMMENT ON COLUMN estate_mst_location_key.location IS '元の住所';
+COMMENT ON COLUMN estate_mst_location_key.location_key IS '正規化キー';
+COMMENT ON COLUMN estate_mst_location_key.sys_created IS '作成日時';
+COMMENT ON COLUMN estate_mst_location_key.sys_updated IS '更新日時';
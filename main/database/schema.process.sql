@@ -64,3 +64,49 @@ CREATE INDEX IF NOT EXISTS idx_estate_detail_ref_run_ref ON estate_detail_ref(id
 CREATE INDEX IF NOT EXISTS idx_estate_detail_ref_run_key ON estate_detail_ref(id_run, id_key);
 CREATE INDEX IF NOT EXISTS idx_estate_detail_ref_spec1_run     ON estate_detail_ref(id_run)     WHERE id_key = 1;
 CREATE INDEX IF NOT EXISTS idx_estate_detail_ref_spec1_run_ref ON estate_detail_ref(id_run_ref) WHERE id_key = 1;
+
+
+-- estate_cleaned_numericテーブル: クレンジング済みデータの数値（価格・面積）
+-- estate_cleanedの価格・面積の項目を単位を揃えた数値の列で保持する（分析用）
+CREATE TABLE IF NOT EXISTS estate_cleaned_numeric (
+    id_run BIGINT NOT NULL,
+    id_key SMALLINT NOT NULL,
+    id_cleaned SMALLINT NOT NULL,
+    price_man DOUBLE PRECISION,  -- 価格（万円）
+    area_sqm DOUBLE PRECISION,   -- 面積（m^2）
+    unit TEXT,                   -- 元の単位
+    is_undefined BOOLEAN NOT NULL DEFAULT FALSE,
+    PRIMARY KEY (id_run, id_key),
+    FOREIGN KEY (id_run, id_key) REFERENCES estate_cleaned(id_run, id_key) ON DELETE CASCADE,
+    FOREIGN KEY (id_cleaned) REFERENCES estate_mst_cleaned(id)
+);
+
+-- 検索用インデックス
+CREATE INDEX IF NOT EXISTS idx_estate_cleaned_numeric_run ON estate_cleaned_numeric(id_run);
+CREATE INDEX IF NOT EXISTS idx_estate_cleaned_numeric_cleaned ON estate_cleaned_numeric(id_cleaned);
+
+
+-- market_indexテーブル: 市区町村・種類・四半期ごとの取引価格（reinfolib_estate）と掲載価格（suumo）の集計
+-- make_market_index.py が変更のあった四半期だけを再集計して入れ替える（kkestate.util.market_index）
+-- 単価は円/m^2、片方のソースにしかない場合はもう片方の件数が0・分位点がNULL
+CREATE TABLE IF NOT EXISTS market_index (
+    citycode CHAR(5) NOT NULL,          -- 市区町村コード（reinfolib: municipality_code, suumo: estate_cleaned の citycode）
+    property_type TEXT NOT NULL,        -- 種類（mansion, house, land）
+    year SMALLINT NOT NULL,             -- 年
+    quarter SMALLINT NOT NULL,          -- 四半期（1-4、reinfolib: period, suumo: run の timestamp）
+    prefecture_code CHAR(2) GENERATED ALWAYS AS (LEFT(citycode, 2)) STORED,
+    n_transaction INTEGER NOT NULL DEFAULT 0,
+    transaction_p25 DOUBLE PRECISION,
+    transaction_p50 DOUBLE PRECISION,
+    transaction_p75 DOUBLE PRECISION,
+    n_listing INTEGER NOT NULL DEFAULT 0,
+    listing_p25 DOUBLE PRECISION,
+    listing_p50 DOUBLE PRECISION,
+    listing_p75 DOUBLE PRECISION,
+    sys_updated TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (citycode, property_type, year, quarter)
+);
+
+-- 検索用インデックス（都道府県単位の読み込み、四半期単位の入れ替え）
+CREATE INDEX IF NOT EXISTS idx_market_index_pref ON market_index(prefecture_code, year, quarter);
+CREATE INDEX IF NOT EXISTS idx_market_index_quarter ON market_index(year, quarter);
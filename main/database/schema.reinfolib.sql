@@ -43,6 +43,9 @@ CREATE TABLE reinfolib_estate (
     renovation              text,                           -- 改装
     transaction_notes       text,                           -- 取引の事情等
     
+    -- 差分アップロード用
+    row_hash                bigint,                         -- 行の内容のハッシュ（kkestate.util.file_manifest.row_hashes）
+    
     -- システムカラム
     sys_created             timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
     sys_updated             timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP
@@ -56,6 +59,7 @@ CREATE INDEX idx_reinfolib_estate_transaction_price ON reinfolib_estate (transac
 CREATE INDEX idx_reinfolib_estate_property_type ON reinfolib_estate (property_type);
 CREATE INDEX idx_reinfolib_estate_area ON reinfolib_estate (area_sqm);
 CREATE INDEX idx_reinfolib_estate_transaction_period ON reinfolib_estate (transaction_period);
+CREATE INDEX idx_reinfolib_estate_row_hash ON reinfolib_estate (year, period, row_hash);
 
 -- コメント追加
 COMMENT ON TABLE reinfolib_estate IS '国土交通省 不動産取引価格情報';
@@ -145,6 +149,9 @@ CREATE TABLE reinfolib_land (
     appraisal_report        text,                           -- 鑑定評価書有無
     appraisal_report_url    text,                           -- 鑑定評価書URL
     
+    -- 差分アップロード用
+    row_hash                bigint,                         -- 行の内容のハッシュ（kkestate.util.file_manifest.row_hashes）
+    
     -- システムカラム
     sys_created             timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
     sys_updated             timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP
@@ -160,6 +167,7 @@ CREATE INDEX idx_reinfolib_land_use_district ON reinfolib_land (use_district);
 CREATE INDEX idx_reinfolib_land_station ON reinfolib_land (station_name, station_distance);
 CREATE INDEX idx_reinfolib_land_location ON reinfolib_land (location);
 CREATE INDEX idx_reinfolib_land_reference_number ON reinfolib_land (reference_number);
+CREATE INDEX idx_reinfolib_land_row_hash ON reinfolib_land (year, prefecture_code, row_hash);
 
 -- コメント追加
 COMMENT ON TABLE reinfolib_land IS '国土交通省 地価公示・地価調査データ';
@@ -184,4 +192,34 @@ COMMENT ON COLUMN reinfolib_land.front_road_pavement IS '前面道路舗装（
 COMMENT ON COLUMN reinfolib_land.coverage_ratio IS '建蔽率（パーセント）';
 COMMENT ON COLUMN reinfolib_land.floor_area_ratio IS '容積率（パーセント）';
 COMMENT ON COLUMN reinfolib_land.appraisal_report IS '鑑定評価書有無';
-COMMENT ON COLUMN reinfolib_land.appraisal_report_url IS '鑑定評価書URL';
\ No newline at end of file
+COMMENT ON COLUMN reinfolib_land.appraisal_report_url IS '鑑定評価書URL';
+
+
+-- ========================================
+-- REINFOLIBのダウンロードファイルの投入記録
+-- reinfolib.py uploadestate / uploadland は内容（SHA-256）が前回と同じファイルをスキップし、
+-- 変更されたファイルは row_hash で比較して差分の行だけを削除・追加する
+-- ========================================
+
+CREATE TABLE reinfolib_file_manifest (
+    file_name               text PRIMARY KEY,               -- ファイル名（例: reinfolib_land_2024_13.csv）
+    dataset                 text NOT NULL,                  -- 投入先のテーブル（reinfolib_estate, reinfolib_land）
+    checksum                char(64) NOT NULL,              -- ファイルの内容の SHA-256
+    n_rows                  integer NOT NULL,               -- 投入時の行数
+    
+    -- システムカラム
+    sys_created             timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    sys_updated             timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE reinfolib_file_manifest IS 'REINFOLIB ファイル投入記録';
+COMMENT ON COLUMN reinfolib_file_manifest.file_name IS 'ファイル名';
+COMMENT ON COLUMN reinfolib_file_manifest.dataset IS '投入先のテーブル';
+COMMENT ON COLUMN reinfolib_file_manifest.checksum IS 'ファイルの内容の SHA-256';
+COMMENT ON COLUMN reinfolib_file_manifest.n_rows IS '投入時の行数';
+
+-- 既存のデータベースへの追加（row_hash が NULL の行は次回の投入時に削除・追加される）
+-- ALTER TABLE reinfolib_estate ADD COLUMN row_hash bigint;
+-- ALTER TABLE reinfolib_land   ADD COLUMN row_hash bigint;
+-- CREATE INDEX idx_reinfolib_estate_row_hash ON reinfolib_estate (year, period, row_hash);
+-- CREATE INDEX idx_reinfolib_land_row_hash ON reinfolib_land (year, prefecture_code, row_hash);
@@ -47,6 +47,7 @@ SELECT
     em.id,
     em.name,
     ld.location,
+    COALESCE(mk.location_key, ld.location) AS location_key,
     ld.citycode,
     em.url,
     
@@ -145,7 +146,8 @@ SELECT
     em.sys_updated
     
 FROM estate_main em
-INNER JOIN location_data ld ON em.id = ld.id_main;
+INNER JOIN location_data ld ON em.id = ld.id_main
+LEFT JOIN estate_mst_location_key mk ON ld.location = mk.location;
 
 -- インデックス作成
 -- 1. 主キー（既存のestate_mainのidに対応）
@@ -160,6 +162,7 @@ CREATE INDEX idx_estate_main_extended_city ON estate_main_extended (city);
 CREATE INDEX idx_estate_main_extended_property_id ON estate_main_extended (property_id);
 CREATE INDEX idx_estate_main_extended_sys_updated ON estate_main_extended (sys_updated);
 CREATE INDEX idx_estate_main_extended_location ON estate_main_extended (location);
+CREATE INDEX idx_estate_main_extended_location_key ON estate_main_extended (location_key);
 CREATE INDEX idx_estate_main_extended_citycode ON estate_main_extended (citycode);
 
 -- 3. 複合インデックス（検索パフォーマンス向上）
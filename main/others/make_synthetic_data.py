@@ -0,0 +1,193 @@
+"""
+make_synthetic_data.py - 負荷試験用の合成データ作成
+estate_main / estate_run / estate_detail / estate_mst_key に kkestate.util.synthetic で生成した合成データを投入する
+process_estate.py / generate_detail_ref.py / ana.py を本番規模（estate_detail 100万-1億行）で試験するためのもの
+
+出力先:
+  psgre : --host / --dbname で指定した試験用の PostgreSQL（既存の id の続きから追加し、最後にシーケンスを更新）
+          kkestate.config.psgre の本番の DB（DBNAME）は指定できない
+  sqlite: SQLiteファイル（同じ列・主キーのテーブルを作成）
+  csv   : テーブルごとのCSVファイル（\\copy estate_detail FROM 'estate_detail.csv' CSV HEADER で投入できる）
+          既存のCSVがある場合はその id の続きから追記する
+
+実行例:
+  python make_synthetic_data.py --target csv --output ./synthetic --estates 100000
+  python make_synthetic_data.py --target sqlite --output ./synthetic.db --estates 3000000 --runs 10 --changerate 0.05
+  python make_synthetic_data.py --target psgre --host 127.0.0.1 --dbname estate_loadtest --estates 1000000 --prefcode 13,14 --update
+"""
+
+import argparse
+import os
+import sqlite3
+import time
+import pandas as pd
+from kklogger import set_logger
+from kkpsgre.connector import DBConnector
+from kkestate.config.psgre import PORT, USER, PASS, DBNAME, DBTYPE
+from kkestate.util.synthetic import generate_synthetic_chunks, make_synthetic_mst_key
+
+
+LOGGER = set_logger(__name__)
+
+# SQLite のテーブル定義（main/database/schema.collect.sql と同じ列・主キー）
+SQLITE_SCHEMAS = [
+    "CREATE TABLE IF NOT EXISTS estate_main (id INTEGER PRIMARY KEY, name TEXT, url TEXT NOT NULL UNIQUE, sys_updated TIMESTAMP NOT NULL);",
+    "CREATE TABLE IF NOT EXISTS estate_run (id INTEGER PRIMARY KEY, id_main INTEGER NOT NULL, is_success BOOLEAN NOT NULL DEFAULT 0, is_ref BOOLEAN NOT NULL DEFAULT 0, timestamp TIMESTAMP);",
+    "CREATE TABLE IF NOT EXISTS estate_detail (id_run INTEGER NOT NULL, id_key INTEGER NOT NULL, value TEXT, PRIMARY KEY (id_run, id_key));",
+    "CREATE TABLE IF NOT EXISTS estate_mst_key (id INTEGER PRIMARY KEY, id_cleaned INTEGER, name TEXT NOT NULL UNIQUE, sys_updated TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP);",
+    "CREATE INDEX IF NOT EXISTS idx_estate_run_0 ON estate_run (id_main);",
+]
+
+
+class SyntheticWriter:
+    """
+    出力先ごとの書き込み処理（select / insert / finish）
+    """
+    def __init__(
+        self, target: str, output: str = None, update: bool = False,
+        host: str = None, port: int = PORT, dbname: str = None, user: str = USER, password: str = PASS
+    ):
+        assert target in ["psgre", "sqlite", "csv"]
+        self.target = target
+        self.update = update
+        self.db     = None
+        self.con    = None
+        if target == "psgre":
+            assert host is not None and dbname is not None, "--host and --dbname are required for psgre"
+            assert dbname != DBNAME, f"the production database '{DBNAME}' (kkestate.config.psgre) cannot be used"
+            self.db = DBConnector(host, port=port, dbname=dbname, user=user, password=password, dbtype=DBTYPE, max_disp_len=200)
+        elif target == "sqlite":
+            assert output is not None, "--output is required for sqlite"
+            self.con = sqlite3.connect(output)
+            for sql in SQLITE_SCHEMAS:
+                self.con.execute(sql)
+        else:
+            assert output is not None, "--output is required for csv"
+            os.makedirs(output, exist_ok=True)
+        self.output = output
+
+    def select_max_id(self, table: str) -> int:
+        """
+        既存データの id の最大値（データがない場合は0）
+        """
+        if self.target == "psgre":
+            df = self.db.select_sql(f"select max(id) as id from {table};")
+            return 0 if df.shape[0] == 0 or pd.isna(df["id"].iloc[0]) else int(df["id"].iloc[0])
+        elif self.target == "sqlite":
+            value = self.con.execute(f"select max(id) from {table};").fetchone()[0]
+            return 0 if value is None else int(value)
+        filepath = os.path.join(self.output, f"{table}.csv")
+        if not os.path.exists(filepath):
+            return 0
+        df = pd.read_csv(filepath, usecols=["id"])
+        return 0 if df.shape[0] == 0 else int(df["id"].max())
+
+    def select_mst_key(self) -> pd.DataFrame:
+        """
+        登録済みの estate_mst_key（id, name）
+        """
+        if self.target == "psgre":
+            return self.db.select_sql("select id, name from estate_mst_key;")
+        elif self.target == "sqlite":
+            return pd.read_sql("select id, name from estate_mst_key;", self.con)
+        filepath = os.path.join(self.output, "estate_mst_key.csv")
+        if os.path.exists(filepath):
+            return pd.read_csv(filepath, usecols=["id", "name"])
+        return pd.DataFrame(columns=["id", "name"])
+
+    def insert(self, df: pd.DataFrame, table: str):
+        """
+        DataFrame をテーブルに追加
+        """
+        if df.shape[0] == 0:
+            return
+        if self.target == "psgre":
+            if self.update:
+                self.db.insert_from_df(df, table, is_select=False, set_sql=True)
+        elif self.target == "sqlite":
+            df.to_sql(table, self.con, if_exists="append", index=False, chunksize=100000)
+        else:
+            filepath = os.path.join(self.output, f"{table}.csv")
+            df.to_csv(filepath, mode="a", header=(not os.path.exists(filepath)), index=False)
+
+    def commit(self):
+        if self.target == "psgre":
+            if self.update:
+                self.db.execute_sql()
+        elif self.target == "sqlite":
+            self.con.commit()
+
+    def finish(self):
+        """
+        シーケンスの更新（psgre のみ、id を指定して投入したため）
+        """
+        if self.target == "psgre" and self.update:
+            for table in ["estate_main", "estate_run", "estate_mst_key"]:
+                self.db.set_sql(f"SELECT setval('{table}_id_seq', (SELECT MAX(id) FROM {table}));")
+            self.db.execute_sql()
+        elif self.target == "sqlite":
+            self.con.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--target",     type=str,   default="csv", choices=["psgre", "sqlite", "csv"], help="出力先")
+    parser.add_argument("--output",     type=str,   help="sqlite: SQLiteファイル, csv: 出力ディレクトリ")
+    parser.add_argument("--estates",    type=int,   default=10000, help="物件数（estate_main の行数）")
+    parser.add_argument("--runs",       type=float, default=8.0,   help="物件あたりの run の平均回数")
+    parser.add_argument("--changerate", type=float, default=0.05,  help="2回目以降の run で値が変わる基本の確率")
+    parser.add_argument("--failrate",   type=float, default=0.02,  help="run が失敗する確率")
+    parser.add_argument("--interval",   type=float, default=7.0,   help="run の間隔の平均日数")
+    parser.add_argument("--fr",         type=str,   default="2024-01-01", help="最初の run の日時の下限（--fr 2024-01-01）")
+    parser.add_argument("--to",         type=str,   default="2025-01-01", help="run の日時の上限（--to 2025-01-01）")
+    parser.add_argument("--prefcode",   type=lambda x: [int(y) for y in x.split(",")], help="対象の都道府県コード（--prefcode 13,14）")
+    parser.add_argument("--chunksize",  type=int,   default=100000, help="1チャンクあたりの物件数")
+    parser.add_argument("--seed",       type=int,   default=0, help="乱数シード")
+    parser.add_argument("--update",     action='store_true', default=False, help="psgre: データベース更新処理を実行")
+    parser.add_argument("--host",       type=str,   help="psgre: 試験用のDBのホスト（必須）")
+    parser.add_argument("--port",       type=int,   default=PORT, help="psgre: 試験用のDBのポート")
+    parser.add_argument("--dbname",     type=str,   help="psgre: 試験用のDB名（必須、本番の DBNAME は不可）")
+    parser.add_argument("--user",       type=str,   default=USER, help="psgre: 試験用のDBのユーザー")
+    parser.add_argument("--password",   type=str,   default=PASS, help="psgre: 試験用のDBのパスワード")
+    args = parser.parse_args()
+    if args.target == "psgre":
+        if args.host is None or args.dbname is None:
+            parser.error("--host and --dbname are required for --target psgre")
+        if args.dbname == DBNAME:
+            parser.error(f"--dbname {args.dbname} is the production database (kkestate.config.psgre). use a database for load testing")
+    LOGGER.info(f"{ {x: y for x, y in vars(args).items() if x != 'password'} }")
+
+    writer = SyntheticWriter(
+        args.target, output=args.output, update=args.update,
+        host=args.host, port=args.port, dbname=args.dbname, user=args.user, password=args.password
+    )
+
+    # estate_mst_key: 未登録のキーを追加
+    df_key = writer.select_mst_key()
+    df_new = make_synthetic_mst_key(df_key)
+    writer.insert(df_new, "estate_mst_key")
+    writer.commit()
+    df_key  = pd.concat([df_key, df_new[["id", "name"]]], ignore_index=True)
+    key_ids = {y: int(x) for x, y in df_key[["id", "name"]].values}
+    LOGGER.info(f"estate_mst_key: {df_new.shape[0]} keys added")
+
+    # estate_main / estate_run / estate_detail: 既存の id の続きから追加
+    n_rows = {"estate_main": 0, "estate_run": 0, "estate_detail": 0}
+    time_start = time.perf_counter()
+    for dict_df in generate_synthetic_chunks(
+        args.estates, mean_runs=args.runs, change_rate=args.changerate, failure_rate=args.failrate,
+        date_from=args.fr, date_to=args.to, mean_interval_days=args.interval, prefcodes=args.prefcode, key_ids=key_ids,
+        id_main_from=writer.select_max_id("estate_main") + 1, id_run_from=writer.select_max_id("estate_run") + 1,
+        chunk_size=args.chunksize, seed=args.seed
+    ):
+        for table, df in dict_df.items():
+            writer.insert(df, table)
+            n_rows[table] += df.shape[0]
+        writer.commit()
+        LOGGER.info(
+            f"main: {n_rows['estate_main']}, run: {n_rows['estate_run']}, detail: {n_rows['estate_detail']} "
+            f"({n_rows['estate_detail'] / max(time.perf_counter() - time_start, 1e-9):,.0f} detail rows/sec)"
+        )
+    writer.finish()
+    if args.target == "psgre" and not args.update:
+        LOGGER.warning("--update is not specified. nothing is inserted.")
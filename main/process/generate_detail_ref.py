@@ -21,8 +21,11 @@ from kklogger import set_logger
 from kkpsgre.connector import DBConnector
 from kkpsgre.util.com import check_type_list
 from kkestate.config.psgre import HOST, PORT, USER, PASS, DBNAME, DBTYPE
+from kkestate.util.metrics import StageMetrics
+from kkestate.util.profiler import add_profile_arguments, start_profiling
 
 LOGGER = set_logger(__name__)
+METRICS = StageMetrics("generate_detail_ref", log_function=LOGGER.info)
 
 def parse_runid_range(x: str):
     """
@@ -169,13 +172,19 @@ if __name__ == "__main__":
   python generate_detail_ref.py process --recent 3 --update           # 過去3ヶ月分
   python generate_detail_ref.py process --recent 1 --limit 200 --update  # 過去1ヶ月、200件まで
   python generate_detail_ref.py process --runid 123456 --months 12 --update  # 過去12ヶ月分を参照
+  python generate_detail_ref.py process --update --metrics metrics.jsonl      # 段階ごとの処理時間をファイルにも出力
   
   # 分析のみ（更新なし）
   python generate_detail_ref.py process --runid 123456                # 分析のみ
   python generate_detail_ref.py process --recent 1                    # 過去1ヶ月分を分析のみ
+  
+  # プロファイル（サブコマンドの前に指定）
+  python generate_detail_ref.py --profile ref.prof process --update
 '''
     )
     
+    add_profile_arguments(parser)
+    
     # サブコマンドを追加
     subparsers = parser.add_subparsers(dest='command', help='実行する処理')
     
@@ -186,6 +195,8 @@ if __name__ == "__main__":
     process_parser.add_argument("--limit", type=int, default=100, help="一度に処理するrun数の上限（デフォルト: 100）")
     process_parser.add_argument("--months", type=int, default=6, help="過去何ヶ月分のデータを取得するか（デフォルト: 6）")
     process_parser.add_argument("--update", action='store_true', default=False, help="データベースに実際に保存する")
+    process_parser.add_argument("--metrics", type=str, help="段階ごとの処理時間を出力するメトリクスファイル（JSON Lines）")
+    process_parser.add_argument("--metricsinterval", type=float, default=60, help="処理時間のサマリーを出力する間隔（秒、デフォルト: 60）")
     
     # statsサブコマンド
     stats_parser = subparsers.add_parser('stats', help='統計情報を表示')
@@ -199,6 +210,8 @@ if __name__ == "__main__":
         exit(1)
     
     LOGGER.info(f"実行引数: {args}")
+    if args.profile is not None:
+        start_profiling(args.profile, mode=args.profilemode, interval=args.profileinterval, log_function=LOGGER.info)
     
     # データベース接続
     DB = DBConnector(HOST, port=PORT, dbname=DBNAME, user=USER, password=PASS, dbtype=DBTYPE, max_disp_len=200)
@@ -231,12 +244,15 @@ if __name__ == "__main__":
         
     elif args.command == 'process':
         # データ参照関係生成処理（最適化版）
+        METRICS.configure(interval=args.metricsinterval, output=args.metrics)
+        watch = METRICS.stopwatch()
         if args.runid or args.recent:
             run_ids = parse_runid_range(args.runid) if args.runid else None
         else:
             # 未処理分を自動処理（is_ref=falseのrun_idを対象）
             run_ids = get_unprocessed_runs(DB, args.limit)["id_run"].tolist()
         df, run_id_min, run_id_max = get_extended_runs_data(DB, run_ids=run_ids, recent_months=args.recent, months_back=args.months)
+        watch.lap("db_runs", n=df.shape[0])
         
         # 空のデータフレームの場合は正常終了
         if df.empty:
@@ -244,24 +260,35 @@ if __name__ == "__main__":
             sys.exit(0)
         
         for id_run, id_main, timestamp in df.loc[(df["id_run"] >= run_id_min) & (df["id_run"] <= run_id_max), ["id_run", "id_main", "timestamp"]].to_numpy():
+            METRICS.report_if_due()
+            watch.reset()
             target_id_runs = df.loc[(df["id_main"] == id_main) & (df["timestamp"] >= (timestamp - timedelta(days=args.months * 31))) & (df["id_run"] <= id_run), "id_run"].tolist()
+            watch.lap("select_runs", n=len(target_id_runs))
             dfwk = get_keys_by_target_id_runs(DB, target_id_runs)
+            watch.lap("db_read", n=dfwk.shape[0])
             if dfwk.empty:
                 LOGGER.warning(f"run_id={id_run}: 正常に run が終了しているにも関わらず、データが無く、参照関係も存在しません")
+                METRICS.count("empty")
                 if args.update:
                     DB.set_sql(f"DELETE FROM estate_detail_ref WHERE id_run = {id_run};")
                     DB.set_sql(f"UPDATE estate_run SET is_ref = true WHERE id = {id_run};")
                     DB.execute_sql()
+                    watch.lap("db_write", n=0)
                 continue
             dfwk = pd.merge(dfwk, df[["id_run", "timestamp"]], how="left", on="id_run")
             dfwk = dfwk.sort_values(["id_key", "timestamp"], ascending=False).reset_index(drop=True).groupby("id_key")["id_run"].first().reset_index()
             dfwk.columns = dfwk.columns.str.replace("id_run", "id_run_ref")
             dfwk["id_run"] = id_run
+            watch.lap("resolve", n=dfwk.shape[0])
+            METRICS.count("runs")
             if args.update:
                 DB.set_sql(f"DELETE FROM estate_detail_ref WHERE id_run = {id_run};")
                 DB.insert_from_df(dfwk, "estate_detail_ref", is_select=True, set_sql=True)
                 DB.set_sql(f"UPDATE estate_run SET is_ref = true WHERE id = {id_run};")
                 DB.execute_sql()
+                watch.lap("db_write", n=dfwk.shape[0])
                 LOGGER.info(f"run_id={id_run}: {len(dfwk)}件の参照関係を保存", color=["BOLD", "GREEN"])
             else:
                 LOGGER.info(f"run_id={id_run}: {len(dfwk)}件の参照関係を生成（--update未指定のため保存なし）")
+        
+        METRICS.close()
@@ -1,5 +1,9 @@
 """
 住所から緯度経度を取得してDBに格納するスクリプト
+住所は正規化キー（kkestate.util.address_normalizer）にまとめてから取得し、estate_mst_location は正規化キーで登録する
+元の住所 -> 正規化キーの対応は estate_mst_location_key に登録する（--update の場合、対象の住所はすべて登録）
+町丁目インデックス（--gazetteer）で取得した近似の緯度経度は source = 'gazetteer' で登録し、
+町丁目インデックスの作成には使わない。--gazetteer なしの --skip では再取得の対象にする（API の緯度経度で置き換える）
 
 対応テーブル:
 - land: reinfolib_land 地価公示データの住所（2020-2024年）
@@ -10,31 +14,167 @@
 python make_location_mst.py --table land --update --skip
 python make_location_mst.py --table ext --update
 python make_location_mst.py --table clean --limit 5000 --update --skip
+python make_location_mst.py --table clean --update --skip --retrynull 30
+python make_location_mst.py --table clean --update --skip --gazetteer chome --towncsv ./13000-17.0b/13_2023.csv
+python make_location_mst.py --table clean --update --skip    # 町丁目インデックスで登録した住所を API で取得し直す
+python make_location_mst.py --table clean --update --skip --workers 8 --rate 10 --batchsize 500
+python make_location_mst.py --migrate --update    # 元の住所で登録済みの estate_mst_location を正規化キーに移行
 """
 
 import argparse
-import requests
+import itertools
 import pandas as pd
+from typing import List, Dict, Any, Optional, Set
 from kkpsgre.connector import DBConnector
 from kklogger import set_logger
 from kkestate.config.psgre import HOST, PORT, USER, PASS, DBNAME, DBTYPE
+from kkestate.util.profiler import add_profile_arguments, start_profiling
+from kkestate.util.geocoder import GsiGeocoder
+from kkestate.util.gazetteer import Gazetteer, GAZETTEER_LEVELS
+from kkestate.util.address_normalizer import normalize_addresses
 LOGGER    = set_logger(__name__)
 
 
+def to_sql_str(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+def upsert_location_keys(db: DBConnector, dict_key: Dict[str, Optional[str]], chunksize: int = 1000):
+    """
+    元の住所 -> 正規化キーの対応を estate_mst_location_key にまとめて UPSERT（キーが変わらない行は更新しない）
+    """
+    list_key = [(x, y) for x, y in dict_key.items() if y is not None]
+    for i in range(0, len(list_key), chunksize):
+        values = ",\n".join(f"({to_sql_str(x)}, {to_sql_str(y)})" for x, y in list_key[i:i + chunksize])
+        db.execute_sql(f"""
+            INSERT INTO estate_mst_location_key (location, location_key)
+            VALUES {values}
+            ON CONFLICT (location) DO UPDATE SET
+                location_key = EXCLUDED.location_key,
+                sys_updated = CURRENT_TIMESTAMP
+            WHERE estate_mst_location_key.location_key <> EXCLUDED.location_key
+        """)
+
+def migrate_location_keys(db: DBConnector, is_update: bool = False, chunksize: int = 1000):
+    """
+    元の住所で登録済みの estate_mst_location を正規化キーに移行
+      - すべての行の 住所 -> 正規化キー を estate_mst_location_key に登録
+      - 正規化キーの行がない場合は、同じキーの住所の緯度経度（NULL でないもの、gsi を優先）で作成し、キーが NULL の行は緯度経度を補う
+      - 正規化キーと異なる住所の行は削除
+    """
+    df = db.select_sql("SELECT location, longitude, latitude, source FROM estate_mst_location")
+    if df.shape[0] == 0:
+        LOGGER.info("estate_mst_location にデータがありません")
+        return
+    dict_key = normalize_addresses(df["location"].tolist())
+    df["location_key"] = df["location"].map(dict_key)
+    df_move  = df.loc[df["location_key"].notna() & (df["location_key"] != df["location"])]
+    df_order = df_move["longitude"].isna().astype(int) * 2 + (df_move["source"] == "gazetteer").astype(int)
+    df_new   = df_move.loc[df_order.sort_values(kind="stable").index].drop_duplicates("location_key")
+    LOGGER.info(f"estate_mst_location: {df.shape[0]}件, 正規化キー: {df['location_key'].nunique()}件, 移行する行: {df_move.shape[0]}件")
+    if not is_update:
+        LOGGER.info("  [ドライラン] 移行をスキップ")
+        return
+    upsert_location_keys(db, dict_key, chunksize=chunksize)
+    for i in range(0, df_new.shape[0], chunksize):
+        dfwk   = df_new.iloc[i:i + chunksize]
+        values = ",\n".join(
+            f"({to_sql_str(x)}, {'NULL' if pd.isna(y) else f'{y:.15f}'}, {'NULL' if pd.isna(z) else f'{z:.15f}'}, {to_sql_str(w)})"
+            for x, y, z, w in zip(dfwk["location_key"], dfwk["longitude"], dfwk["latitude"], dfwk["source"])
+        )
+        db.execute_sql(f"""
+            INSERT INTO estate_mst_location (location, longitude, latitude, source)
+            VALUES {values}
+            ON CONFLICT (location) DO UPDATE SET
+                longitude = EXCLUDED.longitude,
+                latitude = EXCLUDED.latitude,
+                source = EXCLUDED.source,
+                sys_updated = CURRENT_TIMESTAMP
+            WHERE estate_mst_location.longitude IS NULL AND EXCLUDED.longitude IS NOT NULL
+        """)
+    list_delete = df_move["location"].tolist()
+    for i in range(0, len(list_delete), chunksize):
+        db.execute_sql(f"DELETE FROM estate_mst_location WHERE location IN ({','.join(to_sql_str(x) for x in list_delete[i:i + chunksize])})")
+    LOGGER.info(f"移行完了: 作成・更新 {df_new.shape[0]}件, 削除 {len(list_delete)}件")
+
+def get_known_locations(db: DBConnector, retry_null_days: Optional[float] = None, is_gsi_only: bool = False) -> Set[str]:
+    """
+    estate_mst_location に登録済みの住所（--skip で除外する住所）
+    retry_null_days を指定した場合、緯度経度が NULL の行のうち更新から retry_null_days 日以上経過したものは含めない（再取得する）
+    is_gsi_only の場合、町丁目インデックスで登録した行（source = 'gazetteer'）は含めない（API で再取得する）
+    """
+    list_where = []
+    if retry_null_days is not None:
+        list_where.append(f"NOT ((longitude IS NULL OR latitude IS NULL) AND sys_updated <= CURRENT_TIMESTAMP - INTERVAL '{float(retry_null_days)} days')")
+    if is_gsi_only:
+        list_where.append("source = 'gsi'")
+    sql = "SELECT location FROM estate_mst_location" + ("" if len(list_where) == 0 else " WHERE " + " AND ".join(list_where))
+    df = db.select_sql(sql)
+    return set(df["location"].tolist()) if df.shape[0] > 0 else set()
+
+def upsert_locations(db: DBConnector, list_result: List[Dict[str, Any]]):
+    """
+    ジオコーディング結果を estate_mst_location にまとめて UPSERT
+      - ok: 緯度経度と取得元（source）を更新（町丁目インデックスの近似値では API の緯度経度を上書きしない）
+      - notfound: 緯度経度は NULL で登録（既存の行は更新日時のみ更新）
+      - error: 登録しない（次回の実行で再取得する）
+    """
+    list_ok       = [x for x in list_result if x["status"] == "ok"]
+    list_notfound = [x for x in list_result if x["status"] == "notfound"]
+    if len(list_ok) > 0:
+        values = ",\n".join(f"({to_sql_str(x['location'])}, {x['longitude']:.15f}, {x['latitude']:.15f}, {to_sql_str(x['source'])})" for x in list_ok)
+        db.set_sql(f"""
+            INSERT INTO estate_mst_location (location, longitude, latitude, source)
+            VALUES {values}
+            ON CONFLICT (location) DO UPDATE SET
+                longitude = EXCLUDED.longitude,
+                latitude = EXCLUDED.latitude,
+                source = EXCLUDED.source,
+                sys_updated = CURRENT_TIMESTAMP
+            WHERE EXCLUDED.source = 'gsi' OR estate_mst_location.source = 'gazetteer' OR estate_mst_location.longitude IS NULL
+        """)
+    if len(list_notfound) > 0:
+        values = ",\n".join(f"({to_sql_str(x['location'])}, NULL, NULL)" for x in list_notfound)
+        db.set_sql(f"""
+            INSERT INTO estate_mst_location (location, longitude, latitude)
+            VALUES {values}
+            ON CONFLICT (location) DO UPDATE SET
+                sys_updated = CURRENT_TIMESTAMP
+        """)
+    if len(list_ok) + len(list_notfound) > 0:
+        db.execute_sql()
+
+
 if __name__ == "__main__":
     # 引数処理
     parser = argparse.ArgumentParser(description="住所から緯度経度を取得してDBに格納")
     parser.add_argument("--update", action="store_true", default=False, help="データベース更新を実行")
     parser.add_argument("--skip", action="store_true", default=False, help="既存データがある場合はスキップ")
+    parser.add_argument("--retrynull", type=float, default=None, help="--skip の場合でも、緯度経度が NULL で更新から指定日数以上経過した住所は再取得する")
+    parser.add_argument("--migrate", action="store_true", default=False, help="登録済みの estate_mst_location を正規化キーに移行して終了")
     parser.add_argument("--table", type=str, choices=["land", "ext", "clean"], 
                         default="land", help="対象テーブル選択 (land: reinfolib_land, ext: estate_main_extended, clean: estate_cleaned)")
     parser.add_argument("--limit", type=int, default=None, help="処理件数の上限")
+    parser.add_argument("--gazetteer", type=str, choices=GAZETTEER_LEVELS, default=None,
+                        help="APIの前にローカルの町丁目インデックスで緯度経度を引く (chome: 丁目まで一致した場合のみ, town: 町名までの一致も使う)")
+    parser.add_argument("--towncsv", type=str, nargs="*", default=[], help="町丁目インデックスに追加する位置参照情報（大字・町丁目レベル）のCSV")
+    parser.add_argument("--workers", type=int, default=4, help="同時にジオコーディングする住所の数（デフォルト: 4）")
+    parser.add_argument("--rate", type=float, default=5.0, help="APIへのリクエスト数の上限 [件/秒]（デフォルト: 5）")
+    parser.add_argument("--retries", type=int, default=4, help="1住所あたりのリトライ回数（デフォルト: 4）")
+    parser.add_argument("--batchsize", type=int, default=100, help="まとめてDBに登録する住所の数（デフォルト: 100）")
+    add_profile_arguments(parser)
     args = parser.parse_args()
     LOGGER.info(f"実行引数: {args}")
+    if args.profile is not None:
+        start_profiling(args.profile, mode=args.profilemode, interval=args.profileinterval, log_function=LOGGER.info)
     
     # connection
     DB  = DBConnector(HOST, port=PORT, dbname=DBNAME, user=USER, password=PASS, dbtype=DBTYPE, max_disp_len=200)
     
+    # 正規化キーへの移行
+    if args.migrate:
+        migrate_location_keys(DB, is_update=args.update)
+        exit(0)
+    
     # テーブル別のSQL構築
     if args.table == "land":
         sql = "SELECT location FROM reinfolib_land WHERE year BETWEEN 2020 AND 2024"
@@ -69,42 +209,64 @@ if __name__ == "__main__":
     total = len(locations)
     LOGGER.info(f"重複除去後の住所数: {total}件")
     
-    url = "https://msearch.gsi.go.jp/address-search/AddressSearch?q="
-    for i, x in enumerate(locations, 1):
-        # skipフラグがある場合、既存データをチェック
-        if args.skip:
-            check_result = DB.select_sql(f"SELECT 1 FROM estate_mst_location WHERE location = '{x.replace('\'', '\'\'')}'")
-            if len(check_result) > 0:
-                LOGGER.info(f"[{i:5d}/{total:5d}] {x} - スキップ（既存データあり）")
-                continue
-        
-        LOGGER.info(f"[{i:5d}/{total:5d}] {x}")
-        tmp = f"{url}{x}"
-        res = requests.get(tmp)
-        assert res.status_code == 200, f"status code is not 200: {x}"
-        res = res.json()
-        if len(res) != 1:
-            LOGGER.warning(f"no result: {x}")
-            if args.update:
-                DB.execute_sql(f"""
-                    INSERT INTO estate_mst_location (location, longitude, latitude)
-                    VALUES ('{x.replace("'", "''")}', NULL, NULL)
-                    ON CONFLICT (location) DO UPDATE SET
-                        sys_updated = CURRENT_TIMESTAMP
-                """)
+    # 正規化キーにまとめる（対応は estate_mst_location_key に登録）
+    dict_key  = normalize_addresses(locations)
+    locations = sorted(set(x for x in dict_key.values() if x is not None))
+    LOGGER.info(f"正規化キーの数: {len(locations)}件")
+    if args.update:
+        upsert_location_keys(DB, dict_key)
+    
+    # skipフラグがある場合、登録済みの住所を1回のSELECTで取得して除外
+    if args.skip:
+        set_known = get_known_locations(DB, retry_null_days=args.retrynull, is_gsi_only=(args.gazetteer is None))
+        locations = [x for x in locations if x not in set_known]
+        LOGGER.info(f"登録済み: {len(set_known)}件, スキップ後の住所数: {len(locations)}件")
+    
+    # 町丁目インデックスで見つかった住所は API に送らない
+    total = len(locations)
+    list_local = []
+    if args.gazetteer is not None:
+        gazetteer = Gazetteer()
+        # 町丁目インデックスで登録した近似値は含めない（近似値の中央値を次の近似値に使わない）
+        df_known  = DB.select_sql("SELECT location, longitude, latitude FROM estate_mst_location WHERE longitude IS NOT NULL AND latitude IS NOT NULL AND source = 'gsi'")
+        if df_known.shape[0] > 0:
+            gazetteer.add_locations(df_known)
+        for path in args.towncsv:
+            gazetteer.add_town_csv(path)
+        LOGGER.info(f"町丁目インデックス: {len(gazetteer)}件")
+        list_miss = []
+        for x in locations:
+            result = gazetteer.lookup(x, level=args.gazetteer)
+            if result is None:
+                list_miss.append(x)
             else:
-                LOGGER.info("  [ドライラン] INSERT をスキップ")
-            continue
-        longitude, latitude = res[0]["geometry"]["coordinates"]
+                list_local.append(result)
+        locations = list_miss
+        LOGGER.info(f"町丁目インデックスで取得: {len(list_local)}件, APIで取得: {len(locations)}件")
+    
+    # 並列にジオコーディングし、batchsize 件ごとにまとめて登録
+    geocoder = GsiGeocoder(workers=args.workers, rate=args.rate, retries=args.retries)
+    counts   = {"ok": 0, "notfound": 0, "error": 0}
+    list_result = []
+    try:
+        for i, result in enumerate(itertools.chain(list_local, geocoder.geocode_many(locations)), 1):
+            x = result["location"]
+            counts[result["status"]] += 1
+            if result["status"] == "ok":
+                LOGGER.info(f"[{i:5d}/{total:5d}] {x} 緯度: {result['latitude']:.15f}, 経度: {result['longitude']:.15f} ({result['source']})" + (f" (retry: {result['n_retry']})" if result["n_retry"] > 0 else ""))
+            elif result["status"] == "notfound":
+                LOGGER.warning(f"[{i:5d}/{total:5d}] no result: {x}")
+            else:
+                LOGGER.error(f"[{i:5d}/{total:5d}] failed: {x} ({result['error']})")
+            list_result.append(result)
+            if len(list_result) >= args.batchsize:
+                if args.update:
+                    upsert_locations(DB, list_result)
+                list_result = []
+    finally:
+        # 途中で例外が発生した場合も、取得済みで未登録の結果は登録する
         if args.update:
-            DB.execute_sql(f"""
-                INSERT INTO estate_mst_location (location, longitude, latitude)
-                VALUES ('{x.replace("'", "''")}', {longitude:.15f}, {latitude:.15f})
-                ON CONFLICT (location) DO UPDATE SET
-                    longitude = EXCLUDED.longitude,
-                    latitude = EXCLUDED.latitude,
-                    sys_updated = CURRENT_TIMESTAMP
-            """)
-        else:
-            LOGGER.info(f"  [ドライラン] 緯度: {latitude:.15f}, 経度: {longitude:.15f}")
-
+            upsert_locations(DB, list_result)
+    if not args.update:
+        LOGGER.info("  [ドライラン] INSERT をスキップ")
+    LOGGER.info(f"完了: 取得 {counts['ok']}件（うち町丁目インデックス {len(list_local)}件）, 該当なし {counts['notfound']}件, 失敗 {counts['error']}件（失敗した住所は次回の実行で再取得）")
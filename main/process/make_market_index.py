@@ -0,0 +1,179 @@
+"""
+reinfolib の取引価格（reinfolib_estate）と suumo の掲載価格（estate_cleaned_numeric）を市区町村・種類・四半期ごとに集計して market_index に格納するスクリプト
+集計は kkestate.util.market_index で行い、四半期ごとに DELETE / INSERT で入れ替える
+
+対象の四半期:
+- --quarter: 指定した四半期
+- --all: reinfolib_estate と estate_run のすべての四半期
+- 指定なし: 前回の集計（market_index の sys_updated の最大値）の --margin 日前以降に
+  投入された reinfolib_estate のファイル（reinfolib_file_manifest）と、estate_run の run がある四半期
+  （クレンジング（process_estate.py process）は run の数日後に行われるため、--margin 日分は重ねて再集計する）
+
+使用例:
+python make_market_index.py                            # 対象の四半期と件数の確認のみ
+python make_market_index.py --update                   # 前回の集計以降に変更のあった四半期を再集計
+python make_market_index.py --all --update             # すべての四半期を再集計
+python make_market_index.py --quarter 2024-4,2025-1 --update
+python make_market_index.py --fr 20250101 --update     # 2025年1月1日以降に変更のあった四半期を再集計
+"""
+
+import argparse
+import datetime
+import re
+import time
+import pandas as pd
+from typing import List, Optional, Tuple
+from kkpsgre.connector import DBConnector
+from kklogger import set_logger
+from kkestate.config.psgre import HOST, PORT, USER, PASS, DBNAME, DBTYPE
+from kkestate.util.profiler import add_profile_arguments, start_profiling
+from kkestate.util.numeric_extract import NUMERIC_NAMES, make_numeric_frame
+from kkestate.util.market_index import REINFOLIB_PROPERTY_TYPES, to_transaction_frame, to_listing_frame, make_market_index, quarter_range
+LOGGER = set_logger(__name__)
+
+
+def parse_quarters(x: str) -> List[Tuple[int, int]]:
+    """
+    四半期の指定を解析する（例: "2024-4,2025-1" -> [(2024, 4), (2025, 1)]）
+    """
+    list_quarter = []
+    for y in x.split(","):
+        match = re.match(r'^(\d{4})-([1-4])$', y.strip())
+        if match is None:
+            raise ValueError(f"四半期は YYYY-Q（例: 2024-4）の形式で指定してください。入力: {y}")
+        list_quarter.append((int(match.group(1)), int(match.group(2))))
+    return list_quarter
+
+def get_last_updated(db: DBConnector) -> Optional[datetime.datetime]:
+    """
+    前回の集計の日時（market_index の sys_updated の最大値、空の場合は None）
+    """
+    df = db.select_sql("SELECT MAX(sys_updated) AS sys_updated FROM market_index")
+    return None if df.shape[0] == 0 or pd.isna(df.iloc[0]["sys_updated"]) else pd.Timestamp(df.iloc[0]["sys_updated"]).to_pydatetime()
+
+def find_quarters(db: DBConnector, since: Optional[datetime.datetime] = None) -> List[Tuple[int, int]]:
+    """
+    再集計する四半期（since 以降に reinfolib_estate のファイルが投入された、または suumo の run がある四半期、since が None の場合はすべて）
+    """
+    set_quarter = set()
+    if since is None:
+        df = db.select_sql("SELECT DISTINCT year, period FROM reinfolib_estate")
+        if df.shape[0] > 0:
+            set_quarter.update(zip(df["year"].astype(int).tolist(), df["period"].astype(int).tolist()))
+    else:
+        df = db.select_sql(f"SELECT file_name FROM reinfolib_file_manifest WHERE dataset = 'reinfolib_estate' AND sys_updated >= '{since.strftime('%Y-%m-%d %H:%M:%S')}'")
+        for x in df["file_name"].tolist() if df.shape[0] > 0 else []:
+            match = re.match(r'reinfolib_estate_(\d{4})_(\d)\.zip', x)
+            if match is not None:
+                set_quarter.add((int(match.group(1)), int(match.group(2))))
+    df = db.select_sql(
+        "SELECT DISTINCT CAST(EXTRACT(YEAR FROM timestamp) AS integer) AS year, CAST(EXTRACT(QUARTER FROM timestamp) AS integer) AS quarter " +
+        "FROM estate_run WHERE is_ref = true AND timestamp IS NOT NULL" + ("" if since is None else f" AND timestamp >= '{since.strftime('%Y-%m-%d %H:%M:%S')}'")
+    )
+    if df.shape[0] > 0:
+        set_quarter.update(zip(df["year"].astype(int).tolist(), df["quarter"].astype(int).tolist()))
+    return sorted(set_quarter)
+
+def load_transactions(db: DBConnector, year: int, quarter: int) -> pd.DataFrame:
+    """
+    四半期の reinfolib_estate の取引（集計の対象の種類のみ）
+    """
+    return db.select_sql(
+        f"SELECT municipality_code, property_type, year, period, transaction_price, area_sqm, floor_area_sqm, price_per_sqm FROM reinfolib_estate " +
+        f"WHERE year = {year} AND period = {quarter} AND property_type IN ('{"','".join(REINFOLIB_PROPERTY_TYPES)}')"
+    )
+
+def load_listings(db: DBConnector, year: int, quarter: int, chunksize: int = 10000) -> pd.DataFrame:
+    """
+    四半期の suumo の物件（物件ごとに四半期内で最後の run）の citycode, building_type, timestamp と価格・面積（make_numeric_frame の列）
+    """
+    date_from, date_to = quarter_range(year, quarter)
+    df_run = db.select_sql(f"""
+        SELECT DISTINCT ON (r.id_main)
+            r.id_main, r.id AS id_run, r.timestamp, (c.value_cleaned->>'citycode') AS citycode,
+            CASE
+                WHEN m.url LIKE '/ms/%' THEN 'mansion'
+                WHEN m.url LIKE '%ikkodate/%' THEN 'house'
+                WHEN m.url LIKE '/tochi/%' THEN 'land'
+                ELSE 'unknown'
+            END AS building_type
+        FROM estate_run r
+        INNER JOIN estate_main m ON m.id = r.id_main
+        INNER JOIN estate_detail_ref d ON d.id_run = r.id AND d.id_key = 1
+        INNER JOIN estate_cleaned c ON c.id_run = d.id_run_ref AND c.id_key = 1
+        WHERE r.is_ref = true AND r.timestamp >= '{date_from}' AND r.timestamp < '{date_to}'
+        ORDER BY r.id_main, r.timestamp DESC, r.id DESC
+    """)
+    if df_run.shape[0] == 0:
+        return df_run
+    list_id  = df_run["id_run"].astype(int).tolist()
+    list_df  = []
+    for i in range(0, len(list_id), chunksize):
+        list_df.append(db.select_sql(
+            f"SELECT a.id_run, a.id_run_ref, a.id_key, c.name, b.price_man, b.area_sqm, b.is_undefined FROM estate_detail_ref AS a " +
+            f"INNER JOIN estate_cleaned_numeric AS b ON a.id_run_ref = b.id_run AND a.id_key = b.id_key " +
+            f"INNER JOIN estate_mst_cleaned AS c ON b.id_cleaned = c.id " +
+            f"WHERE c.name IN ('{"','".join(NUMERIC_NAMES)}') AND a.id_run IN ({','.join(map(str, list_id[i:i + chunksize]))})"
+        ))
+    df_numeric = pd.concat(list_df, ignore_index=True)
+    return make_numeric_frame(df_numeric, df_run)
+
+def update_quarter(db: DBConnector, year: int, quarter: int, is_update: bool = False) -> pd.DataFrame:
+    """
+    1四半期を再集計し、is_update の場合は market_index の同じ四半期の行と1トランザクションで入れ替える
+    """
+    df_transaction = to_transaction_frame(load_transactions(db, year, quarter))
+    df_listing     = to_listing_frame(load_listings(db, year, quarter))
+    df_market      = make_market_index(df_transaction, df_listing)
+    if is_update:
+        db.set_sql(f"DELETE FROM market_index WHERE year = {year} AND quarter = {quarter};")
+        if df_market.shape[0] > 0:
+            db.insert_from_df(df_market, "market_index", is_select=False, set_sql=True)
+        db.execute_sql()
+    return df_market
+
+
+if __name__ == "__main__":
+    # 引数処理
+    parser = argparse.ArgumentParser(description="取引価格（reinfolib）と掲載価格（suumo）の市区町村・種類・四半期ごとの集計を market_index に格納")
+    parser.add_argument("--update",  action="store_true", default=False, help="データベース更新を実行")
+    parser.add_argument("--all",     action="store_true", default=False, help="すべての四半期を再集計")
+    parser.add_argument("--quarter", type=parse_quarters, default=None, help="再集計する四半期（カンマ区切り、例: 2024-4,2025-1）")
+    parser.add_argument("--fr",      type=lambda x: datetime.datetime.strptime(x, "%Y%m%d"), default=None, help="この日以降に変更のあった四半期を再集計（YYYYMMDD形式）")
+    parser.add_argument("--margin",  type=int, default=3, help="--fr の指定がない場合に、前回の集計から重ねて再集計する日数（デフォルト: 3）")
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+    LOGGER.info(f"実行引数: {args}")
+    if args.profile is not None:
+        start_profiling(args.profile, mode=args.profilemode, interval=args.profileinterval, log_function=LOGGER.info)
+
+    # connection
+    DB = DBConnector(HOST, port=PORT, dbname=DBNAME, user=USER, password=PASS, dbtype=DBTYPE, max_disp_len=200)
+
+    # 対象の四半期
+    if args.quarter is not None:
+        list_quarter = sorted(set(args.quarter))
+    elif args.all:
+        list_quarter = find_quarters(DB, since=None)
+    else:
+        since = args.fr
+        if since is None:
+            last_updated = get_last_updated(DB)
+            since = None if last_updated is None else last_updated - datetime.timedelta(days=args.margin)
+        LOGGER.info(f"変更の確認: {'すべて（market_index が空）' if since is None else since.strftime('%Y-%m-%d %H:%M:%S') + ' 以降'}")
+        list_quarter = find_quarters(DB, since=since)
+    LOGGER.info(f"対象の四半期: {len(list_quarter)}件 {', '.join(f'{x}-{y}' for x, y in list_quarter)}")
+    if not args.update:
+        LOGGER.info("  [ドライラン] 集計のみ行い、DB は更新しません")
+
+    # 四半期ごとに再集計
+    n_rows = 0
+    for year, quarter in list_quarter:
+        time_start = time.perf_counter()
+        df_market  = update_quarter(DB, year, quarter, is_update=args.update)
+        n_rows    += df_market.shape[0]
+        LOGGER.info(
+            f"{year}-{quarter}: {df_market.shape[0]}行, 取引: {int(df_market['n_transaction'].sum())}件, 掲載: {int(df_market['n_listing'].sum())}件, " +
+            f"{time.perf_counter() - time_start:.1f} sec"
+        )
+    LOGGER.info(f"完了: {len(list_quarter)}四半期, {n_rows}行" + ("" if args.update else "（ドライラン）"))
@@ -13,6 +13,11 @@ from kkpsgre.connector import DBConnector
 from kkestate.config.psgre import HOST, PORT, USER, PASS, DBNAME, DBTYPE
 from kkestate.util.key_mapper import get_processing_info_for_key
 from kkestate.util.json_cleaner import extract_period_from_key
+from kkestate.util.batch_cleaner import clean_series
+from kkestate.util.schema_validator import validate_cleaned_value, summarize_schema_violations, merge_schema_violations
+from kkestate.util.numeric_extract import NUMERIC_CLEANED_NAMES, extract_numeric_value, extract_numeric_frame, to_numeric_insert_sql
+from kkestate.util.metrics import StageMetrics
+from kkestate.util.profiler import add_profile_arguments, start_profiling
 
 def parse_runid_range(x: str):
     """
@@ -41,6 +46,7 @@ def parse_runid_range(x: str):
         raise ValueError(f"runid指定は単一（123）または範囲（1,1000）のみ対応しています。入力: {x}")
 
 LOGGER = set_logger(__name__)
+METRICS = StageMetrics("process_estate", log_function=LOGGER.info)
 
 def get_sample_data(db, key_id: int, limit: Optional[int] = 100) -> list:
     """
@@ -225,17 +231,18 @@ def update_key_mapping(db: DBConnector, update_db: bool = False, sample_size: in
             
             LOGGER.info(f"  重複を除いた変換例（{len(value_counts)}パターン、総{value_counts.sum()}件）:", color=["CYAN"])
             
-            for i, (raw_value, count) in enumerate(value_counts.items(), 1):  # 全パターン表示
-                try:
-                    json_result = clean_single_value_to_json(raw_name, cleaned_name, raw_value, processing_function, type_schema)
-                    transformation_examples.append({
-                        'raw': raw_value,
-                        'json': json_result,
-                        'count': count
-                    })
-                    LOGGER.info(f"  {i}. '{raw_value}' → {json_result} [{count}件]")
-                except Exception as e:
-                    LOGGER.info(f"  {i}. '{raw_value}' → エラー: {e} [{count}件]", color=["RED"])
+            # 全パターンをまとめてクレンジング
+            json_results = clean_values_to_json(
+                [raw_name] * len(value_counts), value_counts.index.tolist(), processing_function, [type_schema] * len(value_counts)
+            )
+            
+            for i, ((raw_value, count), json_result) in enumerate(zip(value_counts.items(), json_results), 1):  # 全パターン表示
+                transformation_examples.append({
+                    'raw': raw_value,
+                    'json': json_result,
+                    'count': count
+                })
+                LOGGER.info(f"  {i}. '{raw_value}' → {json_result} [{count}件]")
         else:
             # 通常表示（最初の5件のみ）
             for i, raw_value in enumerate(sample_values[:5], 1):
@@ -379,6 +386,46 @@ def clean_single_value_to_json(raw_name: str, cleaned_name: str, raw_value: Any,
         LOGGER.warning(f"クレンジングエラー ({raw_name}): {e}")
         return {"value": str(raw_value), "error": str(e)}
 
+def clean_values_to_json(raw_names: List[str], raw_values: List[Any], processing_function, type_schemas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    同じ処理関数の値をまとめてJSONクレンジングする（clean_single_value_to_json の一括版）
+    同じ値は1回だけ処理し、定型の値は batch_cleaner で一括変換する
+    
+    Args:
+        raw_names: 元のキー名のリスト
+        raw_values: 生の値のリスト
+        processing_function: 処理関数
+        type_schemas: 型スキーマのリスト（period_aware判定用）
+        
+    Returns:
+        クリーニング済みのJSON辞書のリスト（raw_valuesと同じ順序）
+    """
+    results = [None] * len(raw_values)
+    indexes, values, periods, keys = [], [], [], []
+    for i, (raw_name, raw_value, type_schema) in enumerate(zip(raw_names, raw_values, type_schemas)):
+        if raw_value is None or str(raw_value).strip() == '':
+            results[i] = {"value": None}
+            continue
+        
+        # 期別情報を抽出（period_awareがFalseの場合はperiodをNoneにする）
+        period = extract_period_from_key(raw_name)[1]
+        if type_schema and not type_schema.get('period_aware', True):
+            period = None
+        
+        indexes.append(i)
+        values.append(str(raw_value))
+        periods.append(period)
+        keys.append(raw_name)
+    
+    if indexes:
+        cleaned_values = clean_series(values, processing_function, periods=periods, raw_keys=keys, errors="coerce")
+        for i, raw_name, cleaned_value in zip(indexes, keys, cleaned_values.tolist()):
+            if "error" in cleaned_value:
+                LOGGER.warning(f"クレンジングエラー ({raw_name}): {cleaned_value['error']}")
+            results[i] = cleaned_value
+    
+    return results
+
 def get_unprocessed_runs(db: DBConnector, limit: int = 1000, date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[int]:
     """
     未処理のrun_idリストを取得する
@@ -480,7 +527,7 @@ def get_run_details(db: DBConnector, run_id: int, target_key_ids: Optional[List[
     result_df = db.select_sql(sql)
     return result_df.to_dict('records') if not result_df.empty else []
 
-def save_cleaned_data(db: DBConnector, run_id: int, details: List[Dict[str, Any]], update_db: bool = True) -> bool:
+def save_cleaned_data(db: DBConnector, run_id: int, details: List[Dict[str, Any]], update_db: bool = True, schema_check: str = "flag") -> bool:
     """
     クレンジング済みデータをestate_cleanedに保存する
     
@@ -489,15 +536,20 @@ def save_cleaned_data(db: DBConnector, run_id: int, details: List[Dict[str, Any]
         run_id: run_id
         details: 詳細データリスト
         update_db: Trueの場合はDBを更新、Falseの場合は分析のみ
+        schema_check: スキーマ検証の扱い（none: 検証しない, flag: 警告のみ, reject: 違反した値は保存しない）
         
     Returns:
         保存成功フラグ
     """
     try:
+        watch = METRICS.stopwatch()
+        
         # 全てのキーに対してクレンジング情報を事前取得
         processed_details = []
         cleaned_names = set()
         
+        # 処理関数ごとにまとめて一括でクレンジングする
+        function_groups = {}
         for detail in details:
             key_id = detail['id_key']
             key_name = detail['key_name']
@@ -510,17 +562,27 @@ def save_cleaned_data(db: DBConnector, run_id: int, details: List[Dict[str, Any]
             if cleaned_name is None:
                 continue
             
-            # クリーニング処理実行
-            cleaned_value = clean_single_value_to_json(key_name, cleaned_name, raw_value, processing_function, type_schema)
-            
             processed_details.append({
                 'key_id': key_id,
                 'key_name': key_name,
                 'raw_value': raw_value,
                 'cleaned_name': cleaned_name,
-                'cleaned_value': cleaned_value
+                'cleaned_value': None
             })
             cleaned_names.add(cleaned_name)
+            function_groups.setdefault(processing_function, []).append((len(processed_details) - 1, type_schema))
+        watch.lap("mapping", n=len(details))
+        
+        # クリーニング処理実行
+        for processing_function, group in function_groups.items():
+            indexes = [i for i, _ in group]
+            cleaned_values = clean_values_to_json(
+                [processed_details[i]['key_name'] for i in indexes], [processed_details[i]['raw_value'] for i in indexes],
+                processing_function, [type_schema for _, type_schema in group]
+            )
+            for i, cleaned_value in zip(indexes, cleaned_values):
+                processed_details[i]['cleaned_value'] = cleaned_value
+        watch.lap("cleanse", n=len(processed_details))
         
         # estate_mst_cleanedのidを一括取得
         cleaned_name_map = {}
@@ -531,6 +593,7 @@ def save_cleaned_data(db: DBConnector, run_id: int, details: List[Dict[str, Any]
             
             if not cleaned_result.empty:
                 cleaned_name_map = dict(zip(cleaned_result['name'], cleaned_result['id']))
+        watch.lap("db_mst", n=len(cleaned_names))
         
         # 処理済みデータをログ出力とSQL準備
         insert_sqls = []
@@ -550,6 +613,14 @@ def save_cleaned_data(db: DBConnector, run_id: int, details: List[Dict[str, Any]
             # ログ出力
             LOGGER.info(f"[CLEAN] run_id={run_id}, key_id={key_id}, key_name={key_name}, raw_value: {raw_value}, cleaned_value: {cleaned_value}")
             
+            # スキーマ検証
+            if schema_check != "none":
+                is_valid, error_msg = validate_cleaned_value(cleaned_value, cleaned_name)
+                if not is_valid:
+                    LOGGER.warning(f"[SCHEMA] run_id={run_id}, key_id={key_id}, cleaned_name={cleaned_name}: {error_msg}")
+                    if schema_check == "reject":
+                        continue
+            
             # SQLを準備（update_dbがTrueの場合のみ）
             if update_db:
                 # SQLインジェクション対策のため、文字列をエスケープ
@@ -562,6 +633,16 @@ def save_cleaned_data(db: DBConnector, run_id: int, details: List[Dict[str, Any]
                     value_cleaned = EXCLUDED.value_cleaned"""
                 
                 insert_sqls.append(insert_sql)
+                
+                # 価格・面積の数値をestate_cleaned_numericに保存（数値がなくなった場合は削除）
+                if cleaned_name in NUMERIC_CLEANED_NAMES:
+                    numeric = extract_numeric_value(cleaned_name, cleaned_value)
+                    if numeric is not None:
+                        insert_sqls.append(to_numeric_insert_sql(run_id, key_id, cleaned_id, numeric))
+                    else:
+                        insert_sqls.append(f"DELETE FROM estate_cleaned_numeric WHERE id_run = {run_id} AND id_key = {key_id}")
+        
+        watch.lap("prepare", n=len(processed_details))
         
         # 全てのINSERT文を1回のトランザクションで実行
         LOGGER.info(f"[DEBUG] update_db={update_db}, insert_sqls数={len(insert_sqls)}")
@@ -570,6 +651,7 @@ def save_cleaned_data(db: DBConnector, run_id: int, details: List[Dict[str, Any]
             LOGGER.info(f"[DEBUG] SQL実行開始: {len(insert_sqls)}件のINSERT")
             db.execute_sql(combined_sql)
             LOGGER.info(f"[DEBUG] SQL実行完了")
+            watch.lap("db_write", n=len(insert_sqls))
         elif update_db and not insert_sqls:
             LOGGER.warning(f"[DEBUG] update_db=Trueだが、insert_sqlsが空です")
         
@@ -579,7 +661,7 @@ def save_cleaned_data(db: DBConnector, run_id: int, details: List[Dict[str, Any]
         LOGGER.error(f"データ保存エラー (run_id={run_id}): {e}")
         return False
 
-def process_single_run(db: DBConnector, run_id: int, update_db: bool = True, target_key_ids: Optional[List[int]] = None) -> bool:
+def process_single_run(db: DBConnector, run_id: int, update_db: bool = True, target_key_ids: Optional[List[int]] = None, schema_check: str = "flag") -> bool:
     """
     単一のrun_idを処理する
     
@@ -588,31 +670,39 @@ def process_single_run(db: DBConnector, run_id: int, update_db: bool = True, tar
         run_id: 処理するrun_id
         update_db: Trueの場合はDBを更新、Falseの場合は分析のみ
         target_key_ids: 特定のkey_idのみ処理する場合に指定
+        schema_check: スキーマ検証の扱い（none, flag, reject）
         
     Returns:
         処理成功フラグ
     """
     try:
+        watch = METRICS.stopwatch()
+        
         # target_key_idsが指定されていない場合のみ、既存のestate_cleanedデータを削除
         if update_db and target_key_ids is None:
             delete_sql = f"DELETE FROM estate_cleaned WHERE id_run = {run_id}"
             db.execute_sql(delete_sql)
             LOGGER.info(f"run_id {run_id} の既存クレンジングデータを削除しました")
+            watch.lap("db_delete")
         
         # run詳細データを取得
         details = get_run_details(db, run_id, target_key_ids)
+        watch.lap("db_read", n=len(details))
         
         if not details:
             LOGGER.warning(f"run_id {run_id} のデータが見つかりません（前回と同一データのため省略済み）")
+            METRICS.count("empty")
             return True
         
         # クレンジング・保存実行
-        success = save_cleaned_data(db, run_id, details, update_db)
+        success = save_cleaned_data(db, run_id, details, update_db, schema_check=schema_check)
         
         if success:
             LOGGER.info(f"run_id {run_id} の処理が完了しました ({len(details)}件)")
+            METRICS.count("success")
         else:
             LOGGER.error(f"run_id {run_id} の処理が失敗しました")
+            METRICS.count("failed")
         
         return success
         
@@ -620,7 +710,7 @@ def process_single_run(db: DBConnector, run_id: int, update_db: bool = True, tar
         LOGGER.error(f"run_id {run_id} の処理中にエラーが発生しました: {e}")
         return False
 
-def process_batch(db: DBConnector, batch_size: int = 100, update_db: bool = True, date_from: Optional[str] = None, date_to: Optional[str] = None) -> Dict[str, int]:
+def process_batch(db: DBConnector, batch_size: int = 100, update_db: bool = True, date_from: Optional[str] = None, date_to: Optional[str] = None, schema_check: str = "flag") -> Dict[str, int]:
     """
     バッチ処理でデータクレンジングを実行する
     
@@ -630,6 +720,7 @@ def process_batch(db: DBConnector, batch_size: int = 100, update_db: bool = True
         update_db: Trueの場合はDBを更新、Falseの場合は分析のみ
         date_from: 開始日 (YYYYMMDD形式)
         date_to: 終了日 (YYYYMMDD形式)
+        schema_check: スキーマ検証の扱い（none, flag, reject）
         
     Returns:
         処理結果統計
@@ -647,9 +738,10 @@ def process_batch(db: DBConnector, batch_size: int = 100, update_db: bool = True
         LOGGER.info(f"バッチ処理開始: {len(unprocessed_runs)}件のrun_idを処理します")
         
         for i, run_id in enumerate(unprocessed_runs, 1):
+            METRICS.report_if_due()
             LOGGER.info(f"処理中 ({i}/{len(unprocessed_runs)}): run_id {run_id}")
             
-            if process_single_run(db, run_id, update_db):
+            if process_single_run(db, run_id, update_db, schema_check=schema_check):
                 success_count += 1
             else:
                 failed_count += 1
@@ -667,6 +759,80 @@ def process_batch(db: DBConnector, batch_size: int = 100, update_db: bool = True
         LOGGER.error(f"バッチ処理中にエラーが発生しました: {e}")
         return {'total': 0, 'success': 0, 'failed': 0}
 
+def validate_cleaned_data(db: DBConnector, run_id_range: Optional[tuple] = None, chunk_size: int = 10000):
+    """
+    estate_cleanedの既存データをrun_idの範囲ごとに読み込み、スキーマ違反をid_cleanedごとに集計する
+    
+    Args:
+        db: データベースコネクター
+        run_id_range: 検証するrun_idの範囲 (開始, 終了)、Noneの場合は全件
+        chunk_size: 1回に読み込むrun_idの件数
+        
+    Returns:
+        id_cleanedごとの集計結果（summarize_schema_violations の列）
+    """
+    if run_id_range is None:
+        range_df = db.select_sql("SELECT MIN(id_run) as min_id, MAX(id_run) as max_id FROM estate_cleaned")
+        if range_df.empty or range_df.iloc[0]['min_id'] is None:
+            return merge_schema_violations([])
+        run_id_range = (int(range_df.iloc[0]['min_id']), int(range_df.iloc[0]['max_id']))
+    
+    list_df = []
+    for id_from in range(run_id_range[0], run_id_range[1] + 1, chunk_size):
+        id_to = min(id_from + chunk_size - 1, run_id_range[1])
+        sql = f"""
+        SELECT c.id_cleaned, m.name, c.value_cleaned
+        FROM estate_cleaned c
+        JOIN estate_mst_cleaned m ON m.id = c.id_cleaned
+        WHERE c.id_run BETWEEN {id_from} AND {id_to}
+        """
+        df = db.select_sql(sql)
+        list_df.append(summarize_schema_violations(df))
+        LOGGER.info(f"run_id {id_from} - {id_to}: {len(df):,}件を検証しました")
+    
+    return merge_schema_violations(list_df)
+
+def backfill_numeric_data(db: DBConnector, run_id_range: Optional[tuple] = None, chunk_size: int = 10000, update_db: bool = False) -> int:
+    """
+    estate_cleanedの既存データからestate_cleaned_numeric（価格・面積の数値）をrun_idの範囲ごとに作成する
+    
+    Args:
+        db: データベースコネクター
+        run_id_range: 対象のrun_idの範囲 (開始, 終了)、Noneの場合は全件
+        chunk_size: 1回に読み込むrun_idの件数
+        update_db: Trueの場合はDBを更新、Falseの場合は件数の確認のみ
+        
+    Returns:
+        作成した行数
+    """
+    if run_id_range is None:
+        range_df = db.select_sql("SELECT MIN(id_run) as min_id, MAX(id_run) as max_id FROM estate_cleaned")
+        if range_df.empty or range_df.iloc[0]['min_id'] is None:
+            return 0
+        run_id_range = (int(range_df.iloc[0]['min_id']), int(range_df.iloc[0]['max_id']))
+    
+    names_str = "', '".join(NUMERIC_CLEANED_NAMES.keys())
+    n_total = 0
+    for id_from in range(run_id_range[0], run_id_range[1] + 1, chunk_size):
+        id_to = min(id_from + chunk_size - 1, run_id_range[1])
+        sql = f"""
+        SELECT c.id_run, c.id_key, c.id_cleaned, m.name, c.value_cleaned
+        FROM estate_cleaned c
+        JOIN estate_mst_cleaned m ON m.id = c.id_cleaned
+        WHERE c.id_run BETWEEN {id_from} AND {id_to} AND m.name IN ('{names_str}')
+        """
+        df = db.select_sql(sql)
+        df_numeric = extract_numeric_frame(df)
+        if update_db:
+            db.set_sql(f"DELETE FROM estate_cleaned_numeric WHERE id_run BETWEEN {id_from} AND {id_to};")
+            if df_numeric.shape[0] > 0:
+                db.insert_from_df(df_numeric, "estate_cleaned_numeric", is_select=False, set_sql=True)
+            db.execute_sql()
+        n_total += df_numeric.shape[0]
+        LOGGER.info(f"run_id {id_from} - {id_to}: {len(df):,}件から{len(df_numeric):,}件の数値を作成しました")
+    
+    return n_total
+
 def get_processing_stats(db: DBConnector) -> Dict[str, int]:
     """
     処理統計を取得する
@@ -735,11 +901,29 @@ if __name__ == "__main__":
   python process_estate.py process --to 20250630     # 2025年6月30日までのデータを処理
   python process_estate.py process --fr 20250601 --to 20250630  # 期間指定
   
+  python process_estate.py process --update --schema reject  # スキーマ違反の値は保存しない
+  python process_estate.py process --update --metrics metrics.jsonl --metricsinterval 30  # 段階ごとの処理時間を30秒ごとに出力
+  
+  # スキーマ一括検証
+  python process_estate.py validate                  # estate_cleaned全件を検証
+  python process_estate.py validate --runid 1,100000 # run_id範囲を検証
+  
+  # 価格・面積の数値（estate_cleaned_numeric）を既存のestate_cleanedから作成
+  python process_estate.py numeric                   # 件数の確認のみ
+  python process_estate.py numeric --update          # DB更新あり
+  python process_estate.py numeric --runid 1,100000 --update  # run_id範囲
+  
   # 統計情報表示
   python process_estate.py stats                     # 処理統計を表示
+  
+  # プロファイル（サブコマンドの前に指定）
+  python process_estate.py --profile process.prof process --update                        # cProfile（pstats形式）
+  python process_estate.py --profile process.txt --profilemode sampling process --update  # サンプリング（collapsed stack形式）
 '''
     )
     
+    add_profile_arguments(parser)
+    
     # サブコマンドを追加
     subparsers = parser.add_subparsers(dest='command', help='実行する処理')
     
@@ -758,6 +942,20 @@ if __name__ == "__main__":
     process_parser.add_argument('--keyid', type=parse_runid_range, help='特定のkey_idのみ処理（例: 123 または 120,125）')
     process_parser.add_argument('--fr', type=str, help='処理対象の開始日（YYYYMMDD形式）')
     process_parser.add_argument('--to', type=str, help='処理対象の終了日（YYYYMMDD形式）')
+    process_parser.add_argument('--schema', type=str, default='flag', choices=['none', 'flag', 'reject'], help='スキーマ検証（none: 検証しない, flag: 警告のみ, reject: 違反した値は保存しない）')
+    process_parser.add_argument('--metrics', type=str, help='段階ごとの処理時間を出力するメトリクスファイル（JSON Lines）')
+    process_parser.add_argument('--metricsinterval', type=float, default=60, help='処理時間のサマリーを出力する間隔（秒、デフォルト: 60）')
+    
+    # validateサブコマンド
+    validate_parser = subparsers.add_parser('validate', help='estate_cleanedのスキーマ一括検証')
+    validate_parser.add_argument("--runid", type=lambda x: parse_runid_range(x), help='検証するrun_idの範囲（範囲指定: 1,1000、単一指定: 123）')
+    validate_parser.add_argument("--chunksize", type=int, default=10000, help='1回に読み込むrun_idの件数（デフォルト: 10000）')
+    
+    # numericサブコマンド
+    numeric_parser = subparsers.add_parser('numeric', help='estate_cleanedから価格・面積の数値（estate_cleaned_numeric）を作成')
+    numeric_parser.add_argument("--update", action='store_true', default=False, help='データベース更新処理を実行')
+    numeric_parser.add_argument("--runid", type=lambda x: parse_runid_range(x), help='対象のrun_idの範囲（範囲指定: 1,1000、単一指定: 123）')
+    numeric_parser.add_argument("--chunksize", type=int, default=10000, help='1回に読み込むrun_idの件数（デフォルト: 10000）')
     
     # statsサブコマンド
     stats_parser = subparsers.add_parser('stats', help='処理統計を表示')
@@ -767,7 +965,7 @@ if __name__ == "__main__":
     # コマンドが指定されていない場合はエラー
     if args.command is None:
         parser.print_help()
-        LOGGER.error("実行する処理を指定してください（mapping, process, stats）")
+        LOGGER.error("実行する処理を指定してください（mapping, process, validate, numeric, stats）")
         sys.exit(1)
     
     # サンプル件数の検証
@@ -797,6 +995,9 @@ if __name__ == "__main__":
     
     LOGGER.info(f"{args}")
     
+    if args.profile is not None:
+        start_profiling(args.profile, mode=args.profilemode, interval=args.profileinterval, log_function=LOGGER.info)
+    
     try:
         # データベース接続
         db = DBConnector(HOST, port=PORT, dbname=DBNAME, user=USER, password=PASS, dbtype=DBTYPE)
@@ -813,6 +1014,26 @@ if __name__ == "__main__":
                 update_key_mapping(db, update_db=False, sample_size=args.sample, unique_display=args.unique, specific_key_id=args.keyid)
                 LOGGER.info("キーマッピング分析が完了しました", color=["BOLD", "GREEN"])
         
+        elif args.command == 'validate':
+            # スキーマ一括検証
+            run_id_range = (min(args.runid), max(args.runid)) if args.runid else None
+            df_violation = validate_cleaned_data(db, run_id_range=run_id_range, chunk_size=args.chunksize)
+            LOGGER.info("=== スキーマ検証結果 ===")
+            for _, row in df_violation.iterrows():
+                color = ["BOLD", "RED"] if row['n_invalid'] > 0 else ["GREEN"]
+                LOGGER.info(f"[{row['id_cleaned']}] {row['name']}: {row['n_invalid']:,}/{row['n_rows']:,}件 違反, 未定義フィールド {row['n_undefined']:,}件", color=color)
+                if row['n_invalid'] > 0:
+                    LOGGER.info(f"    Error: {row['error']}")
+                    LOGGER.info(f"    Example: {row['example']}")
+            n_invalid = int(df_violation['n_invalid'].sum()) if not df_violation.empty else 0
+            LOGGER.info(f"スキーマ違反: {n_invalid:,}件", color=["BOLD", "GREEN"] if n_invalid == 0 else ["BOLD", "RED"])
+        
+        elif args.command == 'numeric':
+            # 価格・面積の数値の作成
+            run_id_range = (min(args.runid), max(args.runid)) if args.runid else None
+            n_numeric = backfill_numeric_data(db, run_id_range=run_id_range, chunk_size=args.chunksize, update_db=args.update)
+            LOGGER.info(f"価格・面積の数値: {n_numeric:,}件" + ("を保存しました" if args.update else "（--update未指定のため保存なし）"), color=["BOLD", "GREEN"])
+        
         elif args.command == 'stats':
             # 統計表示
             stats = get_processing_stats(db)
@@ -824,6 +1045,7 @@ if __name__ == "__main__":
         
         elif args.command == 'process':
             # データクレンジング処理
+            METRICS.configure(interval=args.metricsinterval, output=args.metrics)
             target_key_ids = args.keyid if hasattr(args, 'keyid') and args.keyid else None
             
             if args.runid:
@@ -856,8 +1078,9 @@ if __name__ == "__main__":
                 failed_count = 0
                 
                 for i, run_id in enumerate(run_ids, 1):
+                    METRICS.report_if_due()
                     LOGGER.info(f"処理中 ({i}/{len(run_ids)}): run_id {run_id}")
-                    success = process_single_run(db, run_id, update_db=args.update, target_key_ids=target_key_ids)
+                    success = process_single_run(db, run_id, update_db=args.update, target_key_ids=target_key_ids, schema_check=args.schema)
                     if success:
                         success_count += 1
                     else:
@@ -881,7 +1104,7 @@ if __name__ == "__main__":
                         date_msg.append(f"終了日: {date_to}")
                     LOGGER.info(f"日付条件: {', '.join(date_msg)}")
                 
-                result = process_batch(db, args.batchsize, update_db=args.update, date_from=date_from, date_to=date_to)
+                result = process_batch(db, args.batchsize, update_db=args.update, date_from=date_from, date_to=date_to, schema_check=args.schema)
                 
                 if result['total'] == 0:
                     LOGGER.warning("処理対象のデータがありません")
@@ -891,6 +1114,8 @@ if __name__ == "__main__":
                     
                     if result['failed'] > 0:
                         LOGGER.warning(f"失敗した{action}: {result['failed']}件")
+            
+            METRICS.close()
         
         # 処理が何も指定されていない場合のメッセージは表示しない
         # （デフォルトで分析が実行されるため）
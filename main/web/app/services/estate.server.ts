@@ -240,4 +240,71 @@ export async function getPropertyDetails(propertyId: number): Promise<PropertyDe
     console.error("[getPropertyDetails] Database error:", error);
     throw new Error(`Failed to fetch property details: ${error instanceof Error ? error.message : String(error)}`);
   }
-}
\ No newline at end of file
+}
+// 市区町村・種類の四半期ごとの相場（market_index、make_market_index.py で集計済み）
+export interface MarketIndexItem {
+  citycode: string;
+  property_type: string;
+  year: number;
+  quarter: number;
+  n_transaction: number;
+  transaction_p25: number | null;
+  transaction_p50: number | null;
+  transaction_p75: number | null;
+  n_listing: number;
+  listing_p25: number | null;
+  listing_p50: number | null;
+  listing_p75: number | null;
+}
+
+// 相場データ取得（主キー (citycode, property_type, year, quarter) の範囲検索）
+export async function getMarketIndex(citycode: string, propertyType: string): Promise<MarketIndexItem[]> {
+  try {
+    console.log(`[getMarketIndex] Fetching market index for citycode: ${citycode}, property_type: ${propertyType}`);
+
+    const sql = `
+      SELECT
+        citycode, property_type, year, quarter,
+        n_transaction, transaction_p25, transaction_p50, transaction_p75,
+        n_listing, listing_p25, listing_p50, listing_p75
+      FROM market_index
+      WHERE citycode = $1 AND property_type = $2
+      ORDER BY year, quarter;
+    `;
+
+    const rows = await executeQuery<{
+      citycode: string;
+      property_type: string;
+      year: string;
+      quarter: string;
+      n_transaction: string;
+      transaction_p25: string | null;
+      transaction_p50: string | null;
+      transaction_p75: string | null;
+      n_listing: string;
+      listing_p25: string | null;
+      listing_p50: string | null;
+      listing_p75: string | null;
+    }>(sql, [citycode, propertyType]);
+
+    const toNumber = (x: string | null) => (x === null ? null : parseFloat(x));
+    return rows.map(row => ({
+      citycode: row.citycode,
+      property_type: row.property_type,
+      year: parseInt(row.year),
+      quarter: parseInt(row.quarter),
+      n_transaction: parseInt(row.n_transaction),
+      transaction_p25: toNumber(row.transaction_p25),
+      transaction_p50: toNumber(row.transaction_p50),
+      transaction_p75: toNumber(row.transaction_p75),
+      n_listing: parseInt(row.n_listing),
+      listing_p25: toNumber(row.listing_p25),
+      listing_p50: toNumber(row.listing_p50),
+      listing_p75: toNumber(row.listing_p75),
+    }));
+
+  } catch (error) {
+    console.error("[getMarketIndex] Database error:", error);
+    throw new Error(`Failed to fetch market index: ${error instanceof Error ? error.message : String(error)}`);
+  }
+}
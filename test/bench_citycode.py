@@ -0,0 +1,84 @@
+"""
+bench_citycode.py - citycode 最長前方一致検索のベンチマーク
+citycode.csv の全市区町村から作成した住所コーパスで、線形走査とトライ木インデックスを比較する
+"""
+
+import argparse
+import random
+import time
+from kklogger import set_logger
+from kkestate.util.citycode import load_citycode_map, load_citycode_index, get_citycode_from_address
+
+LOGGER = set_logger(__name__)
+
+# 市区町村名の後に続く町名・番地の例
+ADDRESS_SUFFIXES = [
+    "1-2-3", "本町2丁目4-5", "中央三丁目10番地", "大字上野1234番地1", "駅前通り5-6-7 ○○マンション101号室",
+    "", "字東山", "南1条西2丁目",
+]
+
+def _get_citycode_linear(address: str, citycode_map: dict):
+    """
+    比較用: 全エントリを線形走査する従来の最長一致検索
+    """
+    best_match = ""
+    best_citycode = None
+    for full_name, citycode in citycode_map.items():
+        if address.startswith(full_name) and len(full_name) > len(best_match):
+            best_match = full_name
+            best_citycode = citycode
+    return best_citycode
+
+def make_address_corpus(size: int, seed: int = 0) -> list[str]:
+    """
+    citycode.csv の都道府県名+市区町村名に町名・番地を付けた住所コーパスを作成
+    一部は一致しない住所（都道府県名の誤記、空文字列相当の短い文字列）を含める
+    """
+    rnd = random.Random(seed)
+    names = list(load_citycode_map().keys())
+    corpus = []
+    for i in range(size):
+        if i % 20 == 0:
+            corpus.append("海外" + rnd.choice(ADDRESS_SUFFIXES))
+        elif i % 20 == 1:
+            name = rnd.choice(names)
+            corpus.append(name[:2] + rnd.choice(ADDRESS_SUFFIXES))
+        else:
+            corpus.append(rnd.choice(names) + rnd.choice(ADDRESS_SUFFIXES))
+    return corpus
+
+def run_citycode_benchmark(size: int = 10000):
+    """
+    線形走査とトライ木インデックスの処理時間を比較し、結果が一致することを確認する
+    """
+    citycode_map = load_citycode_map()
+    time_start = time.perf_counter()
+    index = load_citycode_index()
+    LOGGER.info(f"index build: {len(index)} entries, {(time.perf_counter() - time_start) * 1e3:.1f} ms")
+
+    corpus = make_address_corpus(size)
+
+    time_start = time.perf_counter()
+    results_linear = [_get_citycode_linear(address, citycode_map) for address in corpus]
+    time_linear = time.perf_counter() - time_start
+
+    time_start = time.perf_counter()
+    results_index = [get_citycode_from_address(address) for address in corpus]
+    time_index = time.perf_counter() - time_start
+
+    n_mismatch = sum(a != b for a, b in zip(results_linear, results_index))
+    LOGGER.info(f"linear: {time_linear / size * 1e6:8.2f} us/address")
+    LOGGER.info(f"trie  : {time_index  / size * 1e6:8.2f} us/address")
+    LOGGER.info(
+        f"Benchmark Summary: {size} addresses, speedup x{time_linear / max(time_index, 1e-9):.1f}, mismatch: {n_mismatch}",
+        color=["BOLD", "GREEN"] if n_mismatch == 0 else ["BOLD", "RED"]
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=10000, help="住所コーパスの件数")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # citycode検索のベンチマークを実行
+    run_citycode_benchmark(size=args.size)
@@ -0,0 +1,208 @@
+"""
+bench_json_cleansing.py - JSON クレンジング機能のマイクロベンチマーク
+kkestate/test/testcases.py の入力値を使用して、クレンジング関数ごとの1値あたりの処理時間・スループット・メモリ確保量を計測する
+結果をJSONファイルに保存し、保存済みのベースラインと比較して閾値を超えて遅くなった場合は終了コード1で終了する
+
+実行例:
+  python bench_json_cleansing.py --output baseline.json                         # ベースラインを保存
+  python bench_json_cleansing.py --baseline baseline.json --threshold 0.2        # 20%以上遅くなった関数があれば失敗
+  python bench_json_cleansing.py --target PRICE --replicate 10 --number 100      # 対象を絞って入力を10倍に複製
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from kklogger import set_logger
+from kkestate.test.testcases import TEST_MAPPING
+
+LOGGER = set_logger(__name__)
+
+def _call_clean_function(clean_function, input_value, raw_key=None):
+    """
+    test_json_cleansing.py と同じ引数規則でクレンジング関数を呼び出す
+    """
+    if clean_function.__name__ in ['clean_units_to_json']:
+        return clean_function(input_value, raw_key=raw_key or "総戸数")
+    elif clean_function.__name__ in ['clean_utility_cost_to_json']:
+        return clean_function(input_value, raw_key="目安光熱費")
+    elif clean_function.__name__ in ['clean_price_band_to_json']:
+        return clean_function(input_value, raw_key="最多価格帯")
+    else:
+        return clean_function(input_value)
+
+def _measure_time(clean_function, inputs, raw_key, number: int, repeat: int) -> float:
+    """
+    inputs を number 回処理する時間を repeat 回計測し、最小値を返す
+    """
+    times = []
+    for _ in range(repeat):
+        time_start = time.perf_counter()
+        for _ in range(number):
+            for input_value in inputs:
+                _call_clean_function(clean_function, input_value, raw_key)
+        times.append(time.perf_counter() - time_start)
+    return min(times)
+
+def _measure_allocation(clean_function, inputs, raw_key) -> tuple[float, int]:
+    """
+    tracemalloc で1値あたりのメモリ確保量を計測
+
+    Returns:
+        tuple[float, int]: (1値の処理中に確保したメモリのピーク [bytes] の平均, メモリブロック確保数の合計)
+    """
+    tracemalloc.start()
+    try:
+        peaks = []
+        snapshot_start = tracemalloc.take_snapshot()
+        for input_value in inputs:
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            _call_clean_function(clean_function, input_value, raw_key)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - current)
+        snapshot_end = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    n_blocks = sum(max(x.count_diff, 0) for x in snapshot_end.compare_to(snapshot_start, "lineno"))
+    return sum(peaks) / max(len(peaks), 1), n_blocks
+
+def run_json_cleansing_benchmark(number: int = 1000, target: str = None, replicate: int = 1, repeat: int = 3, is_alloc: bool = True) -> dict:
+    """
+    全てのJSONクレンジング関数のベンチマークを実行
+
+    Args:
+        number: 各入力値の繰り返し実行回数
+        target: 対象のテスト名（部分一致）。Noneの場合は全て
+        replicate: 入力値リストの複製数（入力件数を増やして計測する）
+        repeat: 計測の繰り返し回数（最小値を採用）
+        is_alloc: Trueの場合はメモリ確保量も計測する
+
+    Returns:
+        dict: {"meta": 実行条件, "results": テスト名 -> 計測結果}
+    """
+    results = {}
+    total_values = 0
+    total_time = 0.0
+
+    for test_mapping_item in TEST_MAPPING:
+        if len(test_mapping_item) == 4:
+            test_name, test_cases, clean_function, raw_key = test_mapping_item
+        else:
+            test_name, test_cases, clean_function = test_mapping_item
+            raw_key = None
+        if target is not None and target not in test_name:
+            continue
+        inputs = [test_case["input"] for test_case in test_cases] * replicate
+        if len(inputs) == 0:
+            continue
+
+        # ウォームアップ（遅延ロードされるマスタ等の読み込みを計測から除外）
+        for input_value in inputs:
+            _call_clean_function(clean_function, input_value, raw_key)
+
+        elapsed  = _measure_time(clean_function, inputs, raw_key, number, repeat)
+        n_values = len(inputs) * number
+        total_values += n_values
+        total_time   += elapsed
+        result = {
+            "function": clean_function.__name__,
+            "n_inputs": len(inputs),
+            "us_per_value": elapsed / n_values * 1e6,
+            "values_per_sec": n_values / max(elapsed, 1e-12),
+        }
+        if is_alloc:
+            result["peak_bytes_per_value"], result["alloc_blocks"] = _measure_allocation(clean_function, inputs, raw_key)
+        results[test_name] = result
+
+        LOGGER.info(
+            f"{test_name:<30} {clean_function.__name__:<35} {len(inputs):>5} inputs, {result['us_per_value']:8.2f} us/value, "
+            f"{result['values_per_sec']:>10,.0f} values/sec" + (f", {result['peak_bytes_per_value']:8.0f} peak bytes/value" if is_alloc else "")
+        )
+
+    if total_values > 0:
+        LOGGER.info(
+            f"Benchmark Summary: {total_values} values, {total_time:.3f} sec, {total_time / total_values * 1e6:.2f} us/value",
+            color=["BOLD", "GREEN"]
+        )
+
+    return {
+        "meta": {
+            "datetime": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "number": number,
+            "replicate": replicate,
+            "repeat": repeat,
+            "target": target,
+        },
+        "results": results,
+    }
+
+def compare_with_baseline(benchmark: dict, baseline: dict, threshold: float = 0.2) -> list[str]:
+    """
+    ベースラインと1値あたりの処理時間を比較
+
+    Args:
+        benchmark: run_json_cleansing_benchmark の結果
+        baseline: 保存済みのベースライン（同じ形式）
+        threshold: 許容する処理時間の増加率（0.2 の場合は 20% 増まで許容）
+
+    Returns:
+        list[str]: 閾値を超えて遅くなったテスト名のリスト
+    """
+    regressions = []
+    for test_name, result in benchmark["results"].items():
+        result_base = baseline["results"].get(test_name)
+        if result_base is None:
+            LOGGER.info(f"{test_name:<30} ベースラインに無いためスキップ")
+            continue
+        ratio = result["us_per_value"] / max(result_base["us_per_value"], 1e-12)
+        is_regression = ratio > 1.0 + threshold
+        if is_regression:
+            regressions.append(test_name)
+        msg = f"{test_name:<30} {result_base['us_per_value']:8.2f} -> {result['us_per_value']:8.2f} us/value (x{ratio:.2f})"
+        if is_regression:
+            LOGGER.info(msg, color=["BOLD", "RED"])
+        elif ratio < 1.0 - threshold:
+            LOGGER.info(msg, color=["GREEN"])
+        else:
+            LOGGER.info(msg)
+    LOGGER.info(
+        f"Baseline Comparison: {len(regressions)} regressions (threshold: +{threshold * 100:.0f}%)",
+        color=["BOLD", "GREEN"] if len(regressions) == 0 else ["BOLD", "RED"]
+    )
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number",    type=int,   default=1000, help="各入力値の繰り返し実行回数")
+    parser.add_argument("--target",    type=str,   default=None, help="対象のテスト名（部分一致）")
+    parser.add_argument("--replicate", type=int,   default=1,    help="入力値リストの複製数")
+    parser.add_argument("--repeat",    type=int,   default=3,    help="計測の繰り返し回数（最小値を採用）")
+    parser.add_argument("--noalloc",   action='store_true', default=False, help="メモリ確保量を計測しない")
+    parser.add_argument("--output",    type=str,   default=None, help="結果を保存するJSONファイル")
+    parser.add_argument("--baseline",  type=str,   default=None, help="比較するベースラインのJSONファイル")
+    parser.add_argument("--threshold", type=float, default=0.2,  help="許容する処理時間の増加率（0.2 = 20%%）")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # JSONクレンジングのベンチマークを実行
+    benchmark = run_json_cleansing_benchmark(
+        number=args.number, target=args.target, replicate=args.replicate, repeat=args.repeat, is_alloc=(not args.noalloc)
+    )
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(benchmark, f, ensure_ascii=False, indent=2)
+        LOGGER.info(f"save benchmark: {args.output}")
+
+    # ベースラインとの比較
+    if args.baseline is not None:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(benchmark, baseline, threshold=args.threshold)
+        if len(regressions) > 0:
+            sys.exit(1)
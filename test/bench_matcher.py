@@ -0,0 +1,72 @@
+"""
+bench_matcher.py - 複数キーワード検索（Aho–Corasick法）のベンチマーク
+キーワード数を増やしながら、キーワード毎の部分一致（in）ループとマッチャーの処理時間を比較する
+"""
+
+import argparse
+import random
+import time
+from kklogger import set_logger
+from kkestate.util.matcher import AhoCorasick
+from kkestate.util.json_cleaner import UNIMPORTANT_PATTERNS, FEATURE_PICKUP_RULES
+from kkestate.test.testcases import TEST_MAPPING
+
+LOGGER = set_logger(__name__)
+
+def _contains_any_loop(text: str, patterns: list[str]) -> bool:
+    """
+    比較用: キーワード毎に部分一致を確認する従来の方法
+    """
+    for pattern in patterns:
+        if pattern in text:
+            return True
+    return False
+
+def make_patterns(n_patterns: int, seed: int = 0) -> list[str]:
+    """
+    既存のキーワード（不要パターン・特徴ピックアップ）を元に、指定数まで合成キーワードを追加する
+    """
+    rnd = random.Random(seed)
+    base = list(UNIMPORTANT_PATTERNS) + [keyword for keywords, _, _ in FEATURE_PICKUP_RULES for keyword in keywords]
+    patterns = list(dict.fromkeys(base))[:n_patterns]
+    while len(patterns) < n_patterns:
+        pattern = rnd.choice(base) + "※" + str(len(patterns))
+        patterns.append(pattern)
+    return patterns
+
+def run_matcher_benchmark(number: int = 20, sizes: list[int] = (26, 100, 400)):
+    """
+    キーワード数毎に1値あたりの処理時間を計測し、結果が一致することを確認する
+    """
+    texts = [test_case["input"] for item in TEST_MAPPING for test_case in item[1] if isinstance(test_case["input"], str)]
+    for n_patterns in sizes:
+        patterns = make_patterns(n_patterns)
+        matcher  = AhoCorasick(patterns)
+
+        time_start = time.perf_counter()
+        for _ in range(number):
+            results_loop = [_contains_any_loop(text, patterns) for text in texts]
+        time_loop = time.perf_counter() - time_start
+
+        time_start = time.perf_counter()
+        for _ in range(number):
+            results_matcher = [matcher.contains_any(text) for text in texts]
+        time_matcher = time.perf_counter() - time_start
+
+        n_values   = len(texts) * number
+        n_mismatch = sum(a != b for a, b in zip(results_loop, results_matcher))
+        LOGGER.info(
+            f"{n_patterns:>5} patterns: loop {time_loop / n_values * 1e6:8.2f} us/value, "
+            f"aho-corasick {time_matcher / n_values * 1e6:8.2f} us/value, mismatch: {n_mismatch}",
+            color=["BOLD", "GREEN"] if n_mismatch == 0 else ["BOLD", "RED"]
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=20, help="各入力値の繰り返し実行回数")
+    parser.add_argument("--sizes", type=lambda x: [int(y) for y in x.split(",")], default=[26, 100, 400], help="キーワード数（カンマ区切り）")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # 複数キーワード検索のベンチマークを実行
+    run_matcher_benchmark(number=args.number, sizes=args.sizes)
@@ -0,0 +1,69 @@
+"""
+test_address_normalizer.py - 住所の正規化キー（address_normalizer）のテスト
+表記の揺れ（全角・半角、丁目・番地・号、建物名）が同じキーにまとまること、キーを再度正規化しても変わらないことを確認する
+"""
+
+import argparse
+from kklogger import set_logger
+from kkestate.test.helpers import check
+from kkestate.util.address_normalizer import normalize_address, normalize_addresses, kanji_to_int
+from kkestate.test.testcases import TEST_CASES_ADDRESS_SIMPLE
+
+LOGGER = set_logger(__name__)
+
+def run_address_normalizer_tests():
+    """
+    住所の正規化キーのテストを実行
+    """
+    total_tests = 0
+    failed_tests = 0
+
+    # 表記の揺れ
+    for address, expected in [
+        ("東京都港区六本木1-2-3",                                  "東京都港区六本木1-2-3"),
+        ("東京都港区六本木１－２－３",                              "東京都港区六本木1-2-3"),
+        ("東京都港区六本木１ー２ー３",                              "東京都港区六本木1-2-3"),
+        ("東京都港区六本木1丁目2-3",                               "東京都港区六本木1-2-3"),
+        ("東京都港区六本木一丁目２番３号　六本木ビル205号室",        "東京都港区六本木1-2-3"),
+        ("東京都港区六本木1-2-3六本木ヒルズ",                      "東京都港区六本木1-2-3"),
+        ("北海道札幌市中央区南十二条西１５丁目4-25-205号室",        "北海道札幌市中央区南十二条西15-4-25"),
+        ("北海道札幌市中央区南6条西16-1-11",                       "北海道札幌市中央区南6条西16-1-11"),
+        ("東京都千代田区霞ヶ関3丁目",                              "東京都千代田区霞ケ関3"),
+        ("東京都千代田区一番町",                                   "東京都千代田区一番町"),
+        ("茨城県つくば市大字上郷1234番地の5",                      "茨城県つくば市大字上郷1234-5"),
+        ("北海道札幌市豊平区平岸三条１４-68・72・73（地番）",       "北海道札幌市豊平区平岸三条14-68"),
+        ("",                                                       None),
+        (None,                                                     None),
+    ]:
+        total_tests += 1
+        actual = normalize_address(address)
+        failed_tests += check(f"normalize: {address}", actual == expected, f"expected: {expected}, actual: {actual}")
+    total_tests += 1
+    failed_tests += check("kanji", [kanji_to_int(x) for x in ["一", "九", "十", "十五", "二十", "九十九"]] == [1, 9, 10, 15, 20, 99])
+
+    # クレンジング済みの住所のキーは再度正規化しても変わらない
+    for test_case in TEST_CASES_ADDRESS_SIMPLE:
+        location = test_case["expected"].get("location")
+        if location is None:
+            continue
+        key = normalize_address(location)
+        total_tests += 1
+        failed_tests += check(f"idempotent: {location}", key is not None and normalize_address(key) == key, f"key: {key}")
+
+    # 重複する住所・揺れのある住所は同じキーになる
+    dict_key = normalize_addresses(["千葉県柏市柏の葉５-7-2", "千葉県柏市柏の葉5-7-2", "千葉県柏市柏の葉５丁目7番2号", "千葉県柏市柏の葉５-7-2"])
+    total_tests += 1
+    failed_tests += check("collapse", len(dict_key) == 3 and set(dict_key.values()) == {"千葉県柏市柏の葉5-7-2"}, f"{dict_key}")
+
+    # 結果サマリー
+    passed_tests = total_tests - failed_tests
+    LOGGER.info(f"Test Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed",
+                color=["BOLD", "GREEN"] if failed_tests == 0 else ["BOLD", "RED"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # 住所の正規化キーのテストを実行
+    run_address_normalizer_tests()
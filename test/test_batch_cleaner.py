@@ -0,0 +1,105 @@
+"""
+test_batch_cleaner.py - クレンジング関数の一括処理（batch_cleaner）のテスト
+kkestate/test/testcases.py の入力値について、一括処理の結果が1値ずつのクレンジング関数と一致することを確認する
+"""
+
+import argparse
+import json
+import random
+import pandas as pd
+from kklogger import set_logger
+from kkestate.util.batch_cleaner import clean_series, RAW_KEY_FUNCTIONS
+from kkestate.util.json_cleaner import clean_price_to_json, clean_number_to_json
+from kkestate.test.testcases import TEST_MAPPING
+
+LOGGER = set_logger(__name__)
+
+# 定型パターンの境界となる入力値
+EXTRA_INPUTS = [
+    "3980万円", " 3,980万円 ", "1,23万円", "3万円", "3980万円～4200万円", "1億円",
+    "65.5m2", "65.50㎡", "0.5m²", "65m2（壁芯）",
+    "128戸", "010戸", "１２８戸", "12階", "3台",
+    # int64 / uint64 の範囲を超える値（1値ずつのクレンジング関数と同じく Python の int / float で変換する）
+    "99999999999999999999万円", "1" + "0" * 400 + "万円", "1" + "0" * 400 + "m2",
+    "9223372036854775807戸", "9223372036854775808戸", "18446744073709551616戸",
+    "", "  ", None, "未定", "-",
+]
+
+def _call_clean_function(clean_function, input_value, period, raw_key):
+    """
+    比較用: 1値ずつのクレンジング関数を呼び出す（例外は clean_series の errors="coerce" と同じ形式に変換）
+    """
+    try:
+        if clean_function.__name__ in RAW_KEY_FUNCTIONS:
+            return clean_function(input_value, raw_key=raw_key, period=period)
+        else:
+            return clean_function(input_value, period=period)
+    except Exception as e:
+        return {"value": input_value, "error": str(e)}
+
+def run_batch_cleaner_tests(size: int = 2000, seed: int = 0):
+    """
+    全てのクレンジング関数について一括処理のテストを実行
+    """
+    rnd = random.Random(seed)
+    total_tests = 0
+    failed_tests = 0
+
+    for test_mapping_item in TEST_MAPPING:
+        if len(test_mapping_item) == 4:
+            test_name, test_cases, clean_function, raw_key = test_mapping_item
+        else:
+            test_name, test_cases, clean_function = test_mapping_item
+            raw_key = None
+        raw_key = raw_key or {"clean_units_to_json": "総戸数", "clean_price_band_to_json": "最多価格帯"}.get(clean_function.__name__, "")
+        inputs = [test_case["input"] for test_case in test_cases] + EXTRA_INPUTS
+
+        # 重複を含む入力列（期別あり・なし混在、indexは0始まりではない）
+        values  = [rnd.choice(inputs) for _ in range(size)]
+        periods = [rnd.choice([None, 1, 4]) for _ in range(size)]
+        actual_results = clean_series(pd.Series(values, index=range(100, 100 + size)), clean_function, periods=periods, raw_keys=raw_key, errors="coerce")
+        if actual_results.index.tolist() != list(range(100, 100 + size)):
+            failed_tests += 1
+            LOGGER.info(f"  FAIL: {test_name} index is not aligned", color=["BOLD", "RED"])
+
+        for input_value, period, actual_result in zip(values, periods, actual_results.tolist()):
+            total_tests += 1
+            expected_result = _call_clean_function(clean_function, input_value, period, raw_key)
+            # キーの順序・int/floatの違いも保存されるJSON文字列で比較する
+            if json.dumps(actual_result, ensure_ascii=False) != json.dumps(expected_result, ensure_ascii=False):
+                failed_tests += 1
+                LOGGER.info(f"  FAIL: {test_name} '{input_value}' (period={period})", color=["BOLD", "RED"])
+                LOGGER.info(f"    Expected: {expected_result}")
+                LOGGER.info(f"    Actual:   {actual_result}")
+
+    # 範囲を超える値が1つあっても、バッチ全体は例外にならず他の値と同じく変換される
+    for clean_function, values in [
+        (clean_price_to_json,  ["1,000万円", "99999999999999999999万円"]),
+        (clean_number_to_json, ["128戸", "9223372036854775808戸"]),
+    ]:
+        for errors in ["raise", "coerce"]:
+            total_tests += 1
+            try:
+                actual_results = clean_series(values, clean_function, errors=errors).tolist()
+            except Exception as e:
+                actual_results = [{"value": None, "error": str(e)}]
+            expected_results = [clean_function(x) for x in values]
+            if json.dumps(actual_results, ensure_ascii=False) != json.dumps(expected_results, ensure_ascii=False):
+                failed_tests += 1
+                LOGGER.info(f"  FAIL: overflow {clean_function.__name__} (errors={errors})", color=["BOLD", "RED"])
+                LOGGER.info(f"    Expected: {expected_results}")
+                LOGGER.info(f"    Actual:   {actual_results}")
+
+    # 結果サマリー
+    passed_tests = total_tests - failed_tests
+    LOGGER.info(f"Test Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed",
+                color=["BOLD", "GREEN"] if failed_tests == 0 else ["BOLD", "RED"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=2000, help="テスト名ごとの入力列の長さ")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # 一括処理のテストを実行
+    run_batch_cleaner_tests(size=args.size)
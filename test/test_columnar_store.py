@@ -0,0 +1,128 @@
+"""
+test_columnar_store.py - reinfolib の列指向のローカルキャッシュ（columnar_store）のテスト
+パーティションの書き込み・入れ替え・中断、列の型、列の選択・条件での読み込みと、条件による読み込むファイルの絞り込みを確認する
+"""
+
+import argparse
+import datetime
+import os
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+from kklogger import set_logger
+from kkestate.test.helpers import check
+from kkestate.util.columnar_store import PartitionWriter, open_store, read_store, to_expression
+from kkestate.util.reinfolib_cleaner import clean_land_frame
+
+LOGGER = set_logger(__name__)
+
+def make_land_frame(size: int, year: int, prefecture_code: str, seed: int = 0) -> pd.DataFrame:
+    """
+    clean_land_frame で変換した reinfolib_land のランダムな DataFrame
+    """
+    rnd = np.random.default_rng(seed)
+    df  = pd.DataFrame({
+        "標準地番号":   [f"港-{i}港-{i}" for i in range(size)],
+        "調査基準日":   rnd.choice(["令和6年1月1日", "令和6年7月1日"], size),
+        "所在及び地番": [f"東京都港区六本木{i % 7 + 1}-{i}" for i in range(size)],
+        "住居表示":     [None] * size,
+        "価格(円/㎡)":  [f"{x:,}(円/㎡)" for x in rnd.integers(10000, 5000000, size)],
+        "名称":         rnd.choice(["六本木", "麻布十番", "乃木坂"], size),
+        "距離":         rnd.choice(["1,300m", "850m", "近接", None], size),
+        "地積(㎡)":     [f"{x:,}(㎡)" for x in rnd.integers(50, 3000, size)],
+        "形状":         rnd.choice(["台形", "長方形"], size),
+        "幅員":         rnd.choice(["4.0m", "12.5m"], size),
+        "建蔽率":       rnd.choice(["60(%)", "80(%)"], size),
+        "区分":         rnd.choice(["地価公示", "地価調査"], size),
+    })
+    for x in ["利用区分", "構造", "階層", "利用現況", "給排水", "周辺の土地の利用現況", "方位", "種類", "舗装"]:
+        df[x] = None
+    return clean_land_frame(df, year, prefecture_code)
+
+def run_columnar_store_tests(size: int = 200000):
+    """
+    列指向のローカルキャッシュのテストを実行
+    """
+    total_tests = 0
+    failed_tests = 0
+
+    with tempfile.TemporaryDirectory() as root:
+        # 2年 x 3都道府県のパーティションを書き込み
+        frames = {}
+        for year in [2023, 2024]:
+            for code in ["01", "13", "47"]:
+                frames[(year, code)] = make_land_frame(size if (year, code) == (2024, "13") else 100, year, code, seed=year + int(code))
+                writer = PartitionWriter(root, "reinfolib_land", {"year": year, "prefecture_code": code})
+                writer.write(frames[(year, code)])
+                writer.commit()
+
+        # 型と値（辞書型の列は category、partition のキーはパスから復元）
+        df = read_store(root, "reinfolib_land", filters={"year": 2023, "prefecture_code": "47"})
+        expected = frames[(2023, "47")]
+        total_tests += 5
+        failed_tests += check("rows", len(df) == len(expected), f"{len(df)} != {len(expected)}")
+        failed_tests += check("category dtype", isinstance(df["category"].dtype, pd.CategoricalDtype) and isinstance(df["station_name"].dtype, pd.CategoricalDtype))
+        failed_tests += check("values", df["price_per_sqm"].tolist() == expected["price_per_sqm"].tolist() and df["category"].astype(object).tolist() == expected["category"].tolist())
+        failed_tests += check("date", df["survey_date"].tolist() == expected["survey_date"].tolist() and isinstance(df["survey_date"].iloc[0], datetime.date))
+        failed_tests += check("partition keys", set(df["year"].tolist()) == {2023} and set(df["prefecture_code"].tolist()) == {"47"})
+
+        # 条件で読み込むファイルを絞り込む
+        dataset = open_store(root, "reinfolib_land")
+        total_tests += 3
+        failed_tests += check("pruning", len(list(dataset.get_fragments(filter=to_expression({"year": 2024, "prefecture_code": ["13", "47"]})))) == 2)
+        df = read_store(root, "reinfolib_land", columns=["location", "price_per_sqm"], filters=(ds.field("year") == 2024) & (ds.field("price_per_sqm") >= 4000000))
+        failed_tests += check("columns", df.columns.tolist() == ["location", "price_per_sqm"])
+        n_expected = sum(int((frames[(2024, x)]["price_per_sqm"] >= 4000000).sum()) for x in ["01", "13", "47"])
+        failed_tests += check("predicate", len(df) == n_expected and (df["price_per_sqm"] >= 4000000).all(), f"{len(df)} != {n_expected}")
+
+        # 入れ替え: 同じパーティションを書き直すと古い行は残らない、中断した場合は既存のパーティションが残る
+        writer = PartitionWriter(root, "reinfolib_land", {"year": 2023, "prefecture_code": "01"})
+        writer.write(frames[(2023, "01")].iloc[:10])
+        writer.commit()
+        writer = PartitionWriter(root, "reinfolib_land", {"year": 2023, "prefecture_code": "47"})
+        writer.write(frames[(2023, "47")].iloc[:10])
+        writer.abort()
+        total_tests += 3
+        failed_tests += check("replace", len(read_store(root, "reinfolib_land", filters={"year": 2023, "prefecture_code": "01"})) == 10)
+        failed_tests += check("abort", len(read_store(root, "reinfolib_land", filters={"year": 2023, "prefecture_code": "47"})) == 100)
+        failed_tests += check("no temporary files", not any(x.startswith(".") for x in os.listdir(os.path.join(root, "reinfolib_land", "year=2023"))))
+
+        # estate: (year, period) のパーティションに都道府県ごとのファイルを追加（チャンクごとに part が増える）
+        writer = PartitionWriter(root, "reinfolib_estate", {"year": 2024, "period": 4})
+        for i in range(3):
+            writer.write(pd.DataFrame({
+                "prefecture_code": ["01", "13", "13"], "property_type": ["宅地(土地)", "中古マンション等", None],
+                "transaction_price": pd.array([1000000 * i, None, 30000000], dtype="Int64"), "area_sqm": [100.5, 65.0, np.nan],
+            }))
+        writer.commit()
+        df = read_store(root, "reinfolib_estate", filters={"year": 2024, "period": 4, "prefecture_code": "13"})
+        total_tests += 2
+        failed_tests += check("estate parts", len(os.listdir(os.path.join(root, "reinfolib_estate", "year=2024", "period=4", "prefecture_code=13"))) == 3)
+        failed_tests += check("estate values", len(df) == 6 and df["transaction_price"].isna().sum() == 3 and df["transaction_price"].sum() == 90000000 and df["building_year"].isna().all())
+
+        # 読み込み時間（DB の select * の代わりに LAND_COLUMNS だけを読む場合）
+        time_start = time.perf_counter()
+        df_all = read_store(root, "reinfolib_land", filters={"year": 2024, "prefecture_code": "13"})
+        time_all = time.perf_counter() - time_start
+        time_start = time.perf_counter()
+        df_col = read_store(root, "reinfolib_land", columns=["category", "reference_number", "location", "price_per_sqm", "land_area"], filters={"year": 2024, "prefecture_code": "13"})
+        time_col = time.perf_counter() - time_start
+        LOGGER.info(f"read_store: {len(df_all)} rows, all columns: {time_all:.3f}s, 5 columns: {time_col:.3f}s")
+        total_tests += 1
+        failed_tests += check("read rows", len(df_all) == len(df_col) == size)
+
+    # 結果サマリー
+    passed_tests = total_tests - failed_tests
+    LOGGER.info(f"Test Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed",
+                color=["BOLD", "GREEN"] if failed_tests == 0 else ["BOLD", "RED"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=200000, help="読み込み時間を計測するパーティションの行数")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # 列指向のローカルキャッシュのテストを実行
+    run_columnar_store_tests(size=args.size)
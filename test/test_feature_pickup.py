@@ -0,0 +1,107 @@
+"""
+test_feature_pickup.py - 特徴ピックアップの分類（FEATURE_PICKUP_RULES）のテスト
+完全一致辞書 + マッチャーによる分類が、ルール表を先頭から順に部分一致で判定する方法と一致することを確認する
+"""
+
+import argparse
+import random
+from kklogger import set_logger
+from kkestate.util.json_cleaner import (
+    FEATURE_PICKUP_RULES, FEATURE_PICKUP_IGNORE_CASE_KEYWORDS, RE_SLASH_SEP,
+    classify_feature_pickup, _match_feature_pickup_rule
+)
+from kkestate.test.testcases import TEST_MAPPING
+
+LOGGER = set_logger(__name__)
+
+# 分類結果の期待値（ルール表への置き換え前の出力）
+EXPECTED_CLASSIFICATIONS = [
+    (["角地", "都市ガス"], ({"equipment": {"utilities": ["city_gas"]}, "land_features": {"corner_lot": True}}, ["corner_lot", "city_gas"])),
+    (["全室南向き"], ({"building_specs": {"orientation": "south"}, "equipment": {}}, ["south_facing"])),
+    (["BELS評価取得"], ({"certifications": {"bels": True}, "equipment": {}}, ["bels"])),
+    (
+        ["システムキッチン", "食器洗乾燥機", "床暖房"],
+        ({"equipment": {"kitchen": ["system", "dishwasher"], "heating_cooling": ["floor_heating"]}}, ["system_kitchen", "dishwasher", "floor_heating"])
+    ),
+    (
+        ["駐車2台可", "南側道路面す"],
+        ({"equipment": {}, "land_features": {"south_facing_road": True}, "parking_transport": {"parking_capacity": 2}}, ["parking_2cars", "south_road"])
+    ),
+    (
+        ["LDK20畳以上", "ペット相談", "眺望良好"],
+        ({"building_specs": {"ldk_size_tatami": {"min": 20}}, "equipment": {}, "room_features": {"pet_negotiable": True}}, ["ldk_20tatami_plus", "pet_ok", "眺望良好"])
+    ),
+]
+
+def _match_feature_pickup_rule_sequential(feature: str):
+    """
+    比較用: ルール表を先頭から順に部分一致で判定する（従来の if/elif の連鎖と同じ判定順）
+    """
+    for rule_index, (keywords, _, _) in enumerate(FEATURE_PICKUP_RULES):
+        for keyword in keywords:
+            if keyword in FEATURE_PICKUP_IGNORE_CASE_KEYWORDS:
+                if keyword in feature.lower():
+                    return rule_index
+            elif keyword in feature:
+                return rule_index
+    return None
+
+def make_feature_corpus(size: int, seed: int = 0) -> list[str]:
+    """
+    ルール表のキーワード、テストケースの項目、キーワードを組み合わせた項目から分類対象のコーパスを作成
+    """
+    rnd = random.Random(seed)
+    keywords = [keyword for keywords, _, _ in FEATURE_PICKUP_RULES for keyword in keywords] + ["Bels", "BELS", "その他"]
+    corpus = list(keywords)
+    for item in TEST_MAPPING:
+        for test_case in item[1]:
+            if isinstance(test_case["input"], str):
+                corpus.extend([x.strip() for x in RE_SLASH_SEP.split(test_case["input"]) if x.strip()])
+    for _ in range(size):
+        if rnd.random() < 0.5:
+            corpus.append(rnd.choice(["", "全室", "駅"]) + rnd.choice(keywords) + rnd.choice(["", "あり", "（一部）"]))
+        else:
+            corpus.append(rnd.choice(keywords) + rnd.choice(keywords))
+    return corpus
+
+def run_feature_pickup_tests(size: int = 10000):
+    """
+    特徴ピックアップ分類のテストを実行
+    """
+    total_tests = 0
+    failed_tests = 0
+
+    # 期待値との比較
+    for features, expected_result in EXPECTED_CLASSIFICATIONS:
+        total_tests += 1
+        actual_result = classify_feature_pickup(features)
+        if actual_result != expected_result:
+            failed_tests += 1
+            LOGGER.info(f"  FAIL: {features}", color=["BOLD", "RED"])
+            LOGGER.info(f"    Expected: {expected_result}")
+            LOGGER.info(f"    Actual:   {actual_result}")
+
+    # 順次判定との比較
+    for feature in make_feature_corpus(size):
+        total_tests += 1
+        expected_result = _match_feature_pickup_rule_sequential(feature)
+        actual_result   = _match_feature_pickup_rule(feature)
+        if actual_result != expected_result:
+            failed_tests += 1
+            LOGGER.info(f"  FAIL: '{feature}'", color=["BOLD", "RED"])
+            LOGGER.info(f"    Expected: {expected_result}")
+            LOGGER.info(f"    Actual:   {actual_result}")
+
+    # 結果サマリー
+    passed_tests = total_tests - failed_tests
+    LOGGER.info(f"Test Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed",
+                color=["BOLD", "GREEN"] if failed_tests == 0 else ["BOLD", "RED"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=10000, help="キーワードを組み合わせた項目の件数")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # 特徴ピックアップ分類のテストを実行
+    run_feature_pickup_tests(size=args.size)
@@ -0,0 +1,184 @@
+"""
+test_file_manifest.py - 差分アップロード用のチェックサム・行ハッシュ（file_manifest）のテスト
+列の型の揺れに影響されないこと、同じ内容の行・チャンクに分けた場合の扱い、変更した行だけが差分になることを確認する
+reinfolib.py の upload_land_to_db は、チェックサムが前回の投入と同じファイルでも --store のパーティションを保存することを確認する
+"""
+
+import argparse
+import datetime
+import hashlib
+import importlib.util
+import os
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from kklogger import set_logger
+from kkestate.test.helpers import check
+from kkestate.util.file_manifest import file_checksum, row_hashes
+from kkestate.util.columnar_store import partition_path, read_store
+
+LOGGER = set_logger(__name__)
+
+# main/collect/reinfolib.py（パッケージではないためファイルから読み込む）
+REINFOLIB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "main", "collect", "reinfolib.py")
+
+class DummyDB:
+    """
+    reinfolib_file_manifest の SELECT には manifest の内容を返し、それ以外の SQL は記録だけする DB
+    """
+    manifest = {}
+    sqls     = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def select_sql(self, sql: str) -> pd.DataFrame:
+        self.sqls.append(sql)
+        return pd.DataFrame({"file_name": list(self.manifest.keys()), "checksum": list(self.manifest.values())})
+
+    def set_sql(self, sql: str):
+        self.sqls.append(sql)
+
+    def execute_sql(self, sql: str = None):
+        self.sqls.append(sql)
+
+def make_frame(size: int, seed: int = 0) -> pd.DataFrame:
+    """
+    reinfolib_land に近い列のランダムな DataFrame（欠損あり）
+    """
+    rnd = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "year":             2024,
+        "prefecture_code":  "13",
+        "reference_number": [f"港-{i}" for i in range(size)],
+        "survey_date":      [datetime.date(2024, 1, 1)] * size,
+        "price_per_sqm":    pd.array(rnd.integers(10000, 5000000, size), dtype="Int64"),
+        "front_road_width": rnd.choice([4.0, 12.5, np.nan], size),
+        "station_name":     rnd.choice(["六本木", "麻布十番", None], size),
+    })
+
+def write_land_csv(path: str, size: int):
+    """
+    地価公示・地価調査 CSV（1行目は読み込み時に skiprows=1 で除く行）
+    """
+    df = pd.DataFrame({
+        "標準地番号":   [f"港-{i}港-{i}" for i in range(size)],
+        "調査基準日":   "令和6年1月1日",
+        "所在及び地番": [f"東京都港区六本木{i % 7 + 1}-{i}" for i in range(size)],
+        "価格(円/㎡)":  [f"{1000 * (i + 1):,}(円/㎡)" for i in range(size)],
+        "距離":         "850m",
+        "地積(㎡)":     "101(㎡)",
+        "幅員":         "4.0m",
+        "建蔽率":       "60(%)",
+        "区分":         "地価公示",
+    })
+    for x in ["住居表示", "名称", "形状", "利用区分", "構造", "階層", "利用現況", "給排水", "周辺の土地の利用現況", "方位", "種類", "舗装"]:
+        df[x] = None
+    with open(path, "w", encoding="utf-8-sig") as f:
+        f.write("地価公示・地価調査\n")
+        df.to_csv(f, index=False)
+
+def run_file_manifest_tests(size: int = 200000):
+    """
+    チェックサム・行ハッシュのテストを実行
+    """
+    total_tests = 0
+    failed_tests = 0
+
+    # チェックサム
+    with tempfile.TemporaryDirectory() as dirname:
+        path = os.path.join(dirname, "reinfolib_land_2024_13.csv")
+        data = os.urandom(3 * 1024 * 1024 + 7)
+        with open(path, "wb") as f:
+            f.write(data)
+        checksum = file_checksum(path, chunksize=1024 * 1024)
+        with open(path, "ab") as f:
+            f.write(b"\n")
+        total_tests += 2
+        failed_tests += check("checksum", checksum == hashlib.sha256(data).hexdigest())
+        failed_tests += check("checksum changed", file_checksum(path) != checksum)
+
+    df      = make_frame(1000)
+    columns = df.columns.tolist()
+    hashes  = row_hashes(df, columns)
+
+    # 列の型の揺れ（Int64 / float64、object / str / category）では変わらない
+    dfwk = df.copy()
+    dfwk["price_per_sqm"] = dfwk["price_per_sqm"].astype(float)
+    dfwk["station_name"]  = dfwk["station_name"].astype("category")
+    dfwk["year"]          = dfwk["year"].astype(np.int16)
+    total_tests += 3
+    failed_tests += check("dtype", (row_hashes(dfwk, columns) == hashes).all())
+    failed_tests += check("int64", hashes.dtype == np.int64 and len(np.unique(hashes)) == len(df))
+    failed_tests += check("index", (row_hashes(df.set_axis(range(5000, 5000 + len(df))), columns) == hashes).all())
+
+    # 1行の1列を変えるとその行だけが変わる
+    dfwk = df.copy()
+    dfwk.loc[10, "price_per_sqm"] = dfwk.loc[10, "price_per_sqm"] + 1
+    dfwk.loc[20, "station_name"]  = None if dfwk.loc[20, "station_name"] is not None else "六本木"
+    total_tests += 1
+    failed_tests += check("changed rows", np.flatnonzero(row_hashes(dfwk, columns) != hashes).tolist() == [10, 20])
+
+    # 同じ内容の行は出現順で別のハッシュ、チャンクに分けても counts を渡せば全体と同じ
+    dfdup  = pd.concat([df, df.iloc[:100], df.iloc[:50]], ignore_index=True)
+    hashes_dup = row_hashes(dfdup, columns)
+    counts = {}
+    hashes_chunk = np.concatenate([row_hashes(dfdup.iloc[i:i + 300], columns, counts=counts) for i in range(0, len(dfdup), 300)])
+    total_tests += 3
+    failed_tests += check("duplicates", len(np.unique(hashes_dup)) == len(dfdup))
+    failed_tests += check("duplicates prefix", (hashes_dup[:len(df)] == hashes).all())
+    failed_tests += check("chunks", (hashes_chunk == hashes_dup).all())
+
+    # 差分: 既存の行（DB）と新しいファイルの行ハッシュの比較で、削除・追加・変更なしの行数が一致する
+    df_old = make_frame(size, seed=1)
+    df_new = df_old.drop(index=range(0, 100)).copy()
+    df_new.loc[1000:1049, "price_per_sqm"] = df_new.loc[1000:1049, "price_per_sqm"] * 2
+    df_new = pd.concat([df_new, make_frame(30, seed=2).assign(reference_number=lambda x: "新-" + x["reference_number"])], ignore_index=True)
+    time_start = time.perf_counter()
+    hashes_old = row_hashes(df_old, columns)
+    hashes_new = row_hashes(df_new, columns)
+    elapsed = time.perf_counter() - time_start
+    n_delete = int((~np.isin(hashes_old, hashes_new)).sum())
+    n_insert = int((~np.isin(hashes_new, hashes_old)).sum())
+    LOGGER.info(f"row_hashes: {len(df_old) + len(df_new)} rows, {elapsed:.3f}s, delete: {n_delete}, insert: {n_insert}")
+    total_tests += 1
+    failed_tests += check("delta", (n_delete, n_insert) == (150, 80), f"delete: {n_delete}, insert: {n_insert}")
+
+    # upload_land_to_db: チェックサムが前回の投入と同じファイルも --store のパーティションは保存し、DB は更新しない
+    spec      = importlib.util.spec_from_file_location("reinfolib", REINFOLIB_PATH)
+    reinfolib = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(reinfolib)
+    reinfolib.DBConnector = DummyDB
+    with tempfile.TemporaryDirectory() as dirname:
+        download_dir = os.path.join(dirname, "downloads")
+        os.makedirs(download_dir)
+        write_land_csv(os.path.join(download_dir, "reinfolib_land_2024_13.csv"), 50)
+        keys = {"year": 2024, "prefecture_code": "13"}
+        # 1回目: 前回の投入なし（ドライラン）
+        store_first = os.path.join(dirname, "store_first")
+        reinfolib.upload_land_to_db(download_dir, update=False, store=store_first)
+        # 2回目: 通常の投入（--update）の後に --update --store を実行（manifest のチェックサムが同じ）
+        DummyDB.manifest = {"reinfolib_land_2024_13.csv": file_checksum(os.path.join(download_dir, "reinfolib_land_2024_13.csv"))}
+        DummyDB.sqls.clear()
+        store_second = os.path.join(dirname, "store_second")
+        reinfolib.upload_land_to_db(download_dir, update=True, store=store_second)
+        n_second = len(read_store(store_second, "reinfolib_land", filters=keys)) if os.path.isdir(partition_path(store_second, "reinfolib_land", keys)) else 0
+        total_tests += 3
+        failed_tests += check("store first", os.path.isdir(partition_path(store_first, "reinfolib_land", keys)))
+        failed_tests += check("store unchanged", n_second == 50, f"rows: {n_second}")
+        failed_tests += check("store unchanged db", all(x.startswith("SELECT file_name") for x in DummyDB.sqls), f"{DummyDB.sqls}")
+
+    # 結果サマリー
+    passed_tests = total_tests - failed_tests
+    LOGGER.info(f"Test Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed",
+                color=["BOLD", "GREEN"] if failed_tests == 0 else ["BOLD", "RED"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=200000, help="差分のテストの行数")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # チェックサム・行ハッシュのテストを実行
+    run_file_manifest_tests(size=args.size)
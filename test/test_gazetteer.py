@@ -0,0 +1,109 @@
+"""
+test_gazetteer.py - ローカルの町丁目インデックス（gazetteer）のテスト
+住所の町丁目キーへの分割、取得済みの住所・位置参照情報 CSV からの登録、丁目・町名の最長前方一致を確認する
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import pandas as pd
+from kklogger import set_logger
+from kkestate.test.helpers import check
+from kkestate.util.gazetteer import Gazetteer, split_address_key
+
+LOGGER = set_logger(__name__)
+
+def run_gazetteer_tests(size: int = 100000):
+    """
+    町丁目インデックスのテストを実行
+    """
+    total_tests = 0
+    failed_tests = 0
+
+    # 町丁目キーへの分割
+    for address, expected in [
+        ("千葉県我孫子市柴崎台３-16-23",                ("千葉県我孫子市柴崎台", "3")),
+        ("東京都港区六本木一丁目2-3",                   ("東京都港区六本木", "1")),
+        ("東京都港区六本木",                            ("東京都港区六本木", "")),
+        ("北海道札幌市中央区南十二条西１５丁目4-25",    ("北海道札幌市中央区南十二条西", "15")),
+        ("北海道虻田郡倶知安町字山田",                  ("北海道虻田郡倶知安町山田", "")),
+        ("北海道北広島市栄町２-1",                      ("北海道北広島市栄町", "2")),
+        ("北海道札幌市中央区北1条西2丁目",              ("北海道札幌市中央区北1条西", "2")),
+        ("北海道札幌市中央区北１条東１５丁目3-1",       ("北海道札幌市中央区北1条東", "15")),
+        ("北海道旭川市4条通8丁目",                      ("北海道旭川市4条通", "8")),
+        ("岩手県岩手郡雫石町第1地割",                   ("岩手県岩手郡雫石町第1地割", "")),
+        ("東京都千代田区2番町",                         ("東京都千代田区2番町", "")),
+        ("北海道上川郡東神楽町14号北1線",               None),
+        ("東京都",                                      None),
+        ("",                                            None),
+    ]:
+        total_tests += 1
+        actual = split_address_key(address)
+        failed_tests += check(f"split: {address}", actual == expected, f"expected: {expected}, actual: {actual}")
+
+    # 取得済みの住所から登録（同じ丁目は中央値）
+    gazetteer = Gazetteer()
+    gazetteer.add_locations(pd.DataFrame([
+        ("千葉県我孫子市柴崎台３-16-23", 140.00, 35.80),
+        ("千葉県我孫子市柴崎台３-1-2",   140.02, 35.82),
+        ("千葉県我孫子市柴崎台3-5",      140.01, 35.81),
+        ("千葉県我孫子市柴崎台１-1",     140.10, 35.90),
+        ("東京都",                       139.00, 35.00),
+    ], columns=["location", "longitude", "latitude"]))
+    result = gazetteer.lookup("千葉県我孫子市柴崎台３-20")
+    total_tests += 4
+    failed_tests += check("chome", result is not None and result["source"] == "gazetteer" and (result["longitude"], result["latitude"]) == (140.01, 35.81), f"{result}")
+    failed_tests += check("chome miss", gazetteer.lookup("千葉県我孫子市柴崎台５-1") is None)
+    result = gazetteer.lookup("千葉県我孫子市柴崎台５-1", level="town")
+    failed_tests += check("town", result is not None and (result["longitude"], result["latitude"]) == (140.015, 35.815), f"{result}")
+    failed_tests += check("town miss", gazetteer.lookup("千葉県我孫子市柴崎台東１-1", level="town") is None and gazetteer.lookup("千葉県我孫子市", level="town") is None)
+
+    # 条の付く町名: 「北1条西」「北1条東」「北2条西」は別の町として一致させる
+    gazetteer_jo = Gazetteer()
+    gazetteer_jo.add_locations(pd.DataFrame([
+        ("北海道札幌市中央区北1条西2丁目1",  141.352, 43.063),
+        ("北海道札幌市中央区北1条西15丁目1", 141.337, 43.061),
+        ("北海道札幌市中央区北2条西2丁目1",  141.352, 43.064),
+    ], columns=["location", "longitude", "latitude"]))
+    total_tests += 3
+    failed_tests += check("jo chome miss", gazetteer_jo.lookup("北海道札幌市中央区北1条東15丁目") is None)
+    result = gazetteer_jo.lookup("北海道札幌市中央区北1条西15丁目3")
+    failed_tests += check("jo chome", result is not None and (result["longitude"], result["latitude"]) == (141.337, 43.061), f"{result}")
+    failed_tests += check("jo town miss", gazetteer_jo.lookup("北海道札幌市中央区北3条西2丁目", level="town") is None)
+
+    # 位置参照情報 CSV は取得済みの住所より優先、取得済みの住所は CSV を上書きしない
+    with tempfile.TemporaryDirectory() as dirname:
+        path = os.path.join(dirname, "12_2023.csv")
+        pd.DataFrame([
+            ("12", "千葉県", "12222", "我孫子市", "001", "柴崎台三丁目", 35.70, 140.30),
+            ("13", "東京都", "13103", "港区",     "002", "六本木一丁目", 35.66, 139.74),
+        ], columns=["都道府県コード", "都道府県名", "市区町村コード", "市区町村名", "大字町丁目コード", "大字町丁目名", "緯度", "経度"]).to_csv(path, index=False, encoding="cp932")
+        gazetteer.add_town_csv(path)
+    gazetteer.add_locations(pd.DataFrame([("東京都港区六本木一丁目9", 0.0, 0.0)], columns=["location", "longitude", "latitude"]))
+    total_tests += 2
+    failed_tests += check("csv overwrite", gazetteer.lookup("千葉県我孫子市柴崎台3-1")["longitude"] == 140.30)
+    failed_tests += check("csv kanji", gazetteer.lookup("東京都港区六本木１-5-1")["latitude"] == 35.66)
+
+    # 1件あたりの検索時間
+    list_address = [f"千葉県我孫子市柴崎台{i % 7 + 1}-{i}" for i in range(size)]
+    time_start = time.perf_counter()
+    n_hit = sum(gazetteer.lookup(x) is not None for x in list_address)
+    elapsed = time.perf_counter() - time_start
+    LOGGER.info(f"lookup: {size} addresses, {n_hit} hits, {elapsed / size * 1e6:.1f} us/address")
+    total_tests += 1
+    failed_tests += check("lookup count", n_hit == sum(i % 7 + 1 in [1, 3] for i in range(size)))
+
+    # 結果サマリー
+    passed_tests = total_tests - failed_tests
+    LOGGER.info(f"Test Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed",
+                color=["BOLD", "GREEN"] if failed_tests == 0 else ["BOLD", "RED"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=100000, help="検索時間を計測する住所の件数")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # 町丁目インデックスのテストを実行
+    run_gazetteer_tests(size=args.size)
@@ -0,0 +1,124 @@
+"""
+test_geocoder.py - 住所のジオコーディング（geocoder）のテスト
+ローカルの HTTP サーバーを AddressSearch API の代わりに使い、該当なし・リトライ・レート制限・並列処理の結果を確認する
+"""
+
+import argparse
+import json
+import threading
+import time
+import urllib.parse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from kklogger import set_logger
+from kkestate.test.helpers import check
+from kkestate.util.geocoder import GsiGeocoder
+
+LOGGER = set_logger(__name__)
+
+class DummyHandler(BaseHTTPRequestHandler):
+    """
+    q の内容に応じて応答する
+      - "notfound*": 空の配列
+      - "flaky*": 最初の1回は 503（Retry-After: 0）、2回目以降は座標
+      - "down*": 常に 500
+      - "malformed*": 200 で想定外の形式（配列でない、座標がない、座標が数値でない）
+      - それ以外: 座標（経度 = 139 + 番号 / 1000, 緯度 = 35）
+    """
+    counts = {}
+    lock   = threading.Lock()
+    times  = []
+
+    def do_GET(self):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)["q"][0]
+        with self.lock:
+            self.counts[query] = self.counts.get(query, 0) + 1
+            self.times.append(time.monotonic())
+            count = self.counts[query]
+        if query.startswith("notfound"):
+            self._send(200, [])
+        elif query.startswith("malformed"):
+            self._send(200, {"malformed1": {"error": "bad request"}, "malformed2": [{"geometry": {}}], "malformed3": [{"geometry": {"coordinates": ["a", "b"]}}]}.get(query, [{}]))
+        elif query.startswith("down") or (query.startswith("flaky") and count == 1):
+            self._send(503 if query.startswith("flaky") else 500, {}, {"Retry-After": "0"})
+        else:
+            number = int("".join(x for x in query if x.isdigit()) or 0)
+            self._send(200, [{"geometry": {"coordinates": [139 + number / 1000, 35.0]}, "properties": {"title": query}}])
+
+    def _send(self, status: int, data, headers: dict = {}):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for x, y in headers.items():
+            self.send_header(x, y)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def run_geocoder_tests(size: int = 200):
+    """
+    ジオコーディングのテストを実行
+    """
+    total_tests = 0
+    failed_tests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DummyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/AddressSearch"
+
+    # 並列処理の結果がすべての住所について揃う
+    locations = [f"東京都千代田区{i}" for i in range(size)] + ["notfound1", "flaky1", "down1"]
+    geocoder  = GsiGeocoder(workers=8, rate=0, retries=2, backoff=0.01, url=url)
+    results   = {x["location"]: x for x in geocoder.geocode_many(locations)}
+    total_tests += 5
+    failed_tests += check("all results", sorted(results.keys()) == sorted(locations))
+    failed_tests += check("ok", all(results[f"東京都千代田区{i}"]["status"] == "ok" and abs(results[f"東京都千代田区{i}"]["longitude"] - (139 + i / 1000)) < 1e-9 for i in range(size)))
+    failed_tests += check("notfound", results["notfound1"]["status"] == "notfound" and results["notfound1"]["longitude"] is None, f"{results['notfound1']}")
+    failed_tests += check("retry", results["flaky1"]["status"] == "ok" and results["flaky1"]["n_retry"] == 1, f"{results['flaky1']}")
+    failed_tests += check("error", results["down1"]["status"] == "error" and DummyHandler.counts["down1"] == 3, f"{results['down1']}")
+
+    # レート制限: 20件/秒 で 20件 のリクエストの間隔は合計で 0.95秒 以上
+    DummyHandler.times.clear()
+    geocoder = GsiGeocoder(workers=8, rate=20, url=url)
+    list(geocoder.geocode_many([f"rate{i}" for i in range(20)]))
+    elapsed = DummyHandler.times[-1] - DummyHandler.times[0]
+    total_tests += 1
+    failed_tests += check("rate limit", elapsed >= 0.95 * 19 / 20, f"elapsed: {elapsed:.3f}")
+
+    # 200 でも想定外の形式の応答は例外にせず error（リトライしない）、他の住所の結果は揃う
+    locations = [f"malformed{i}" for i in range(1, 5)] + [f"東京都港区{i}" for i in range(10)]
+    geocoder  = GsiGeocoder(workers=4, rate=0, retries=2, backoff=0.01, url=url)
+    try:
+        results = {x["location"]: x for x in geocoder.geocode_many(locations)}
+    except Exception as e:
+        results = {}
+        LOGGER.info(f"  geocode_many raised {type(e).__name__}: {e}")
+    total_tests += 2
+    failed_tests += check("malformed all results", sorted(results.keys()) == sorted(locations))
+    failed_tests += check(
+        "malformed error", all(x in results and results[x]["status"] == "error" and results[x]["error"].startswith("unexpected response") and DummyHandler.counts[x] == 1 for x in locations[:4]),
+        f"{[results.get(x) for x in locations[:4]]}"
+    )
+
+    # 接続できない場合は error
+    geocoder = GsiGeocoder(workers=1, rate=0, retries=1, backoff=0.01, timeout=1.0, url="http://127.0.0.1:1/AddressSearch")
+    result   = geocoder.geocode("東京都")
+    total_tests += 1
+    failed_tests += check("connection error", result["status"] == "error" and result["error"].startswith("ConnectionError"), f"{result}")
+    server.shutdown()
+
+    # 結果サマリー
+    passed_tests = total_tests - failed_tests
+    LOGGER.info(f"Test Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed",
+                color=["BOLD", "GREEN"] if failed_tests == 0 else ["BOLD", "RED"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=200, help="ジオコーディングする住所の件数")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # ジオコーディングのテストを実行
+    run_geocoder_tests(size=args.size)
@@ -0,0 +1,157 @@
+"""
+test_market_index.py - 取引価格（reinfolib）と掲載価格（suumo）の市区町村・種類・四半期ごとの集計（market_index）のテスト
+単価の計算（種類ごとの面積の列、対象外の行）、四半期の判定、groupby の集計が市区町村ごとのループの np.quantile と一致すること、2つのソースの外部結合を確認する
+"""
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from kklogger import set_logger
+from kkestate.test.helpers import check
+from kkestate.util.numeric_extract import make_numeric_frame
+from kkestate.util.market_index import (
+    MARKET_KEYS, MARKET_QUANTILES, MARKET_COLUMNS, to_transaction_frame, to_listing_frame, aggregate_market, make_market_index, quarter_range
+)
+
+LOGGER = set_logger(__name__)
+
+def make_estate_frame(size: int, seed: int = 0) -> pd.DataFrame:
+    """
+    reinfolib_estate に近い列のランダムな DataFrame（対象外の種類・欠損あり）
+    """
+    rnd = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "municipality_code": rnd.choice(["13101", "13103", "13104", "27100", None], size, p=[0.3, 0.3, 0.2, 0.15, 0.05]),
+        "property_type":     rnd.choice(["中古マンション等", "宅地(土地と建物)", "宅地(土地)", "農地", "林地"], size),
+        "year":              rnd.choice([2024, 2025], size),
+        "period":            rnd.integers(1, 5, size),
+        "transaction_price": pd.array(rnd.integers(1000000, 200000000, size), dtype="Int64"),
+        "area_sqm":          rnd.choice([45.5, 70.0, 120.0, 300.0, np.nan], size),
+        "floor_area_sqm":    rnd.choice([80.0, 105.0, np.nan], size),
+        "price_per_sqm":     pd.array(rnd.choice([500000, 1200000, None], size), dtype="Int64"),
+    })
+
+def make_listing_frame(size: int, seed: int = 0) -> pd.DataFrame:
+    """
+    make_numeric_frame で展開した suumo の run に近い列のランダムな DataFrame（価格未定（-1）・欠損あり）
+    """
+    rnd = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "citycode":      rnd.choice(["13101", "13103", "13104", "27100", None], size, p=[0.3, 0.3, 0.2, 0.15, 0.05]),
+        "building_type": rnd.choice(["mansion", "house", "land", "unknown"], size, p=[0.5, 0.25, 0.2, 0.05]),
+        "timestamp":     pd.Timestamp("2024-01-01") + pd.to_timedelta(rnd.integers(0, 730 * 24, size), unit="h"),
+        "price":         rnd.choice([3980.0, 5480.0, 12800.0, -1.0, np.nan], size),
+        "area_ms":       rnd.choice([55.0, 70.2, np.nan], size),
+        "area_land":     rnd.choice([100.0, 165.3, np.nan], size),
+        "area_building": rnd.choice([90.0, 110.5, np.nan], size),
+    })
+
+def aggregate_by_loop(df: pd.DataFrame, prefix: str) -> pd.DataFrame:
+    """
+    比較用: 集計のキーごとにループして np.quantile で計算
+    """
+    list_row = []
+    for keys, dfwk in df.groupby(MARKET_KEYS, sort=True):
+        values = dfwk["price_per_sqm"].to_numpy()
+        list_row.append(list(keys) + [len(values)] + np.quantile(values, list(MARKET_QUANTILES.values())).tolist())
+    return pd.DataFrame(list_row, columns=MARKET_KEYS + [f"n_{prefix}"] + [f"{prefix}_{x}" for x in MARKET_QUANTILES])
+
+def run_market_index_tests(size: int = 500000):
+    """
+    market_index の集計のテストを実行
+    """
+    total_tests = 0
+    failed_tests = 0
+
+    # reinfolib の単価: mansion は面積、house は延床面積、land は ㎡単価（ない場合は面積）で計算し、農地・林地・市区町村コードなしは除く
+    df = pd.DataFrame({
+        "municipality_code": ["13101", "13101", "13101", "13101", "13101", None, "13103"],
+        "property_type":     ["中古マンション等", "宅地(土地と建物)", "宅地(土地)", "宅地(土地)", "農地", "中古マンション等", "中古マンション等"],
+        "year": [2024] * 7, "period": [4] * 7,
+        "transaction_price": pd.array([50000000, 80000000, 30000000, 30000000, 1000000, 50000000, 50000000], dtype="Int64"),
+        "area_sqm":          [50.0, 200.0, 100.0, 100.0, 1000.0, 50.0, 0.0],
+        "floor_area_sqm":    [np.nan, 100.0, np.nan, np.nan, np.nan, np.nan, np.nan],
+        "price_per_sqm":     pd.array([None, None, 400000, None, None, None, None], dtype="Int64"),
+    })
+    dfwk = to_transaction_frame(df)
+    total_tests += 2
+    failed_tests += check("transaction types", dfwk["property_type"].tolist() == ["mansion", "house", "land", "land"], f"{dfwk['property_type'].tolist()}")
+    failed_tests += check("transaction price", dfwk["price_per_sqm"].tolist() == [1000000.0, 800000.0, 400000.0, 300000.0], f"{dfwk['price_per_sqm'].tolist()}")
+
+    # suumo の単価: 種類ごとの面積で割り、価格未定・面積なし・unknown は除く、四半期は timestamp から
+    df = pd.DataFrame({
+        "citycode":      ["13101", "13101", "13101", "13101", "13101", "13101"],
+        "building_type": ["mansion", "house", "land", "mansion", "mansion", "unknown"],
+        "timestamp":     pd.to_datetime(["2024-03-31 23:59:59", "2024-04-01 00:00:00", "2024-12-31 12:00:00", "2024-05-01 00:00:00", "2024-05-01 00:00:00", "2024-05-01 00:00:00"]),
+        "price":         [5000.0, 8000.0, 3000.0, -1.0, 5000.0, 5000.0],
+        "area_ms":       [50.0, np.nan, np.nan, 50.0, np.nan, 50.0],
+        "area_land":     [np.nan, 200.0, 100.0, np.nan, np.nan, np.nan],
+        "area_building": [np.nan, 100.0, np.nan, np.nan, np.nan, np.nan],
+    })
+    dfwk = to_listing_frame(df)
+    total_tests += 2
+    failed_tests += check("listing price", dfwk["price_per_sqm"].tolist() == [1000000.0, 800000.0, 300000.0], f"{dfwk['price_per_sqm'].tolist()}")
+    failed_tests += check("listing quarter", list(zip(dfwk["year"], dfwk["quarter"])) == [(2024, 1), (2024, 2), (2024, 4)])
+
+    # make_numeric_frame で展開した run からの単価（価格未定は -1 で除かれる）
+    df_run     = pd.DataFrame({"id_main": [1, 2], "id_run": [10, 20], "timestamp": pd.to_datetime(["2024-05-01", "2024-05-02"]), "citycode": ["13101", "13101"], "building_type": ["mansion", "mansion"]})
+    df_numeric = pd.DataFrame({
+        "id_run": [10, 10, 20, 20], "id_run_ref": [10, 10, 20, 20], "id_key": [3, 5, 3, 5], "name": ["価格", "専有面積", "価格", "専有面積"],
+        "price_man": [6000.0, np.nan, np.nan, np.nan], "area_sqm": [np.nan, 60.0, np.nan, 60.0], "is_undefined": [False, False, True, False],
+    })
+    dfwk = to_listing_frame(make_numeric_frame(df_numeric, df_run))
+    total_tests += 1
+    failed_tests += check("numeric frame", dfwk["price_per_sqm"].tolist() == [1000000.0], f"{dfwk['price_per_sqm'].tolist()}")
+
+    # 四半期の範囲
+    total_tests += 2
+    failed_tests += check("quarter range", quarter_range(2024, 4) == ("2024-10-01", "2025-01-01"))
+    failed_tests += check("quarter range 1", quarter_range(2025, 1) == ("2025-01-01", "2025-04-01"))
+
+    # groupby の集計が キーごとのループの np.quantile と一致
+    df_transaction = to_transaction_frame(make_estate_frame(size, seed=1))
+    df_listing     = to_listing_frame(make_listing_frame(size, seed=2))
+    for prefix, dfwk in [("transaction", df_transaction), ("listing", df_listing)]:
+        time_start = time.perf_counter()
+        df_agg  = aggregate_market(dfwk, prefix)
+        time_agg = time.perf_counter() - time_start
+        time_start = time.perf_counter()
+        df_ref  = aggregate_by_loop(dfwk, prefix)
+        time_ref = time.perf_counter() - time_start
+        LOGGER.info(f"aggregate_market {prefix}: {len(dfwk)} rows, {len(df_agg)} groups, groupby: {time_agg:.3f}s, loop: {time_ref:.3f}s")
+        columns = [f"{prefix}_{x}" for x in MARKET_QUANTILES]
+        total_tests += 3
+        failed_tests += check(f"{prefix} keys", df_agg[MARKET_KEYS].equals(df_ref[MARKET_KEYS]))
+        failed_tests += check(f"{prefix} counts", (df_agg[f"n_{prefix}"].to_numpy() == df_ref[f"n_{prefix}"].to_numpy()).all() and df_agg[f"n_{prefix}"].sum() == len(dfwk))
+        failed_tests += check(f"{prefix} quantiles", np.allclose(df_agg[columns].to_numpy(dtype=float), df_ref[columns].to_numpy(dtype=float), rtol=1e-12))
+
+    # 外部結合: 片方にしかないキーはもう片方の件数が0・分位点が NaN
+    df_market = make_market_index(df_transaction, df_listing.loc[df_listing["citycode"] != "27100"])
+    is_only   = df_market["citycode"] == "27100"
+    total_tests += 4
+    failed_tests += check("columns", df_market.columns.tolist() == MARKET_COLUMNS)
+    failed_tests += check("unique keys", not df_market.duplicated(MARKET_KEYS).any())
+    failed_tests += check("outer join", is_only.any() and (df_market.loc[is_only, "n_listing"] == 0).all() and df_market.loc[is_only, "listing_p50"].isna().all())
+    failed_tests += check(
+        "totals", df_market["n_transaction"].sum() == len(df_transaction) and df_market["n_listing"].sum() == int((df_listing["citycode"] != "27100").sum())
+    )
+
+    # 空の入力
+    df_market = make_market_index(to_transaction_frame(pd.DataFrame()), to_listing_frame(pd.DataFrame()))
+    total_tests += 1
+    failed_tests += check("empty", df_market.shape[0] == 0 and df_market.columns.tolist() == MARKET_COLUMNS)
+
+    # 結果サマリー
+    passed_tests = total_tests - failed_tests
+    LOGGER.info(f"Test Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed",
+                color=["BOLD", "GREEN"] if failed_tests == 0 else ["BOLD", "RED"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=500000, help="集計のテストの行数")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # market_index の集計のテストを実行
+    run_market_index_tests(size=args.size)
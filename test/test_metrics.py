@@ -0,0 +1,123 @@
+"""
+test_metrics.py - 処理段階ごとの計測（metrics）のテスト
+ヒストグラムによる p50/p95 の近似誤差、lap / timer による記録、メトリクスファイルの出力（途中の sys.exit・例外での終了を含む）を確認する
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from kklogger import set_logger
+from kkestate.test.helpers import check
+from kkestate.util.metrics import StageMetrics, LatencyHistogram
+
+LOGGER = set_logger(__name__)
+
+def run_metrics_tests(size: int = 10000, seed: int = 0):
+    """
+    計測のテストを実行
+    """
+    rnd = random.Random(seed)
+    total_tests = 0
+    failed_tests = 0
+
+    # 分位点の近似誤差（ビンの上端を返すため、真値以上かつ 10^(1/10) 倍以下）
+    for name, sampler in [
+        ("lognormal", lambda: rnd.lognormvariate(-4.0, 1.5)),
+        ("uniform",   lambda: rnd.uniform(0.001, 0.002)),
+        ("tiny",      lambda: rnd.uniform(0.0, 1e-6)),
+    ]:
+        values = [sampler() for _ in range(size)]
+        histogram = LatencyHistogram()
+        for x in values:
+            histogram.add(x)
+        values = sorted(values)
+        for q in [0.5, 0.95]:
+            total_tests += 1
+            expected = values[max(int(q * size) - 1, 0)]
+            actual   = histogram.quantile(q)
+            failed_tests += check(
+                f"quantile {name} q={q}", expected <= actual * (1 + 1e-9) and actual <= max(expected * 10 ** 0.1, 1e-6 * 10 ** 0.1),
+                f"expected: {expected}, actual: {actual}"
+            )
+        total_tests += 1
+        failed_tests += check(f"max {name}", histogram.max == values[-1])
+
+    # lap / timer / count の記録
+    metrics = StageMetrics("test", log_function=None)
+    watch = metrics.stopwatch()
+    for i in range(10):
+        watch.lap("read", n=i)
+        watch.lap("write")
+    try:
+        with metrics.timer("error", n=3):
+            raise ValueError("test")
+    except ValueError:
+        pass
+    metrics.count("success", 2)
+    metrics.count("success")
+    summary = metrics.summary()
+    total_tests += 4
+    failed_tests += check("lap calls", summary["stages"]["read"]["calls"] == 10 and summary["stages"]["write"]["calls"] == 10)
+    failed_tests += check("lap rows", summary["stages"]["read"]["rows"] == sum(range(10)))
+    failed_tests += check("timer with exception", summary["stages"]["error"]["calls"] == 1 and summary["stages"]["error"]["rows"] == 3)
+    failed_tests += check("counter", summary["counters"] == {"success": 3})
+
+    # サマリーの出力: report_if_due は interval 経過後のみ、close は1回のみ
+    list_lines = []
+    with tempfile.TemporaryDirectory() as dirname:
+        filepath = os.path.join(dirname, "metrics.jsonl")
+        metrics  = StageMetrics("test", log_function=list_lines.append, interval=3600)
+        metrics.configure(output=filepath)
+        metrics.add("read", 0.01, n=100)
+        is_reported = metrics.report_if_due()
+        metrics.configure(interval=0)
+        is_reported_due = metrics.report_if_due()
+        metrics.close()
+        metrics.close()
+        with open(filepath, "r", encoding="utf-8") as f:
+            list_json = [json.loads(x) for x in f]
+    total_tests += 4
+    failed_tests += check("report_if_due", (not is_reported) and is_reported_due)
+    failed_tests += check("metrics file", len(list_json) == 2 and [x["final"] for x in list_json] == [False, True])
+    failed_tests += check("metrics rows_per_sec", abs(list_json[-1]["stages"]["read"]["rows_per_sec"] - 10000) < 1e-6)
+    failed_tests += check("log lines", len(list_lines) > 0 and all(x.startswith("[METRICS]") for x in list_lines))
+
+    # configure した場合、close の前に sys.exit・例外で終了しても最終のサマリーをメトリクスファイルに出力する
+    with tempfile.TemporaryDirectory() as dirname:
+        for name, statement in [("sys.exit", "sys.exit(0)"), ("exception", "raise RuntimeError('stop')")]:
+            filepath = os.path.join(dirname, f"metrics_{name}.jsonl")
+            script   = (
+                "import sys\n"
+                "from kkestate.util.metrics import StageMetrics\n"
+                "metrics = StageMetrics('test', log_function=None)\n"
+                f"metrics.configure(output={filepath!r})\n"
+                "metrics.add('read', 0.01, n=5)\n"
+                f"{statement}\n"
+            )
+            subprocess.run([sys.executable, "-c", script], capture_output=True)
+            list_json = []
+            if os.path.exists(filepath):
+                with open(filepath, "r", encoding="utf-8") as f:
+                    list_json = [json.loads(x) for x in f]
+            total_tests += 1
+            failed_tests += check(
+                f"close at exit ({name})", len(list_json) == 1 and list_json[0]["final"] and list_json[0]["stages"]["read"]["rows"] == 5, f"{list_json}"
+            )
+
+    # 結果サマリー
+    passed_tests = total_tests - failed_tests
+    LOGGER.info(f"Test Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed",
+                color=["BOLD", "GREEN"] if failed_tests == 0 else ["BOLD", "RED"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=10000, help="分位点の確認に使う値の件数")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # 計測のテストを実行
+    run_metrics_tests(size=args.size)
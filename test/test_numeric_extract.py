@@ -0,0 +1,89 @@
+"""
+test_numeric_extract.py - 価格・面積の数値の取り出し（numeric_extract）のテスト
+testcases.py の価格・面積の期待値から取り出した数値が、従来の分析（value_cleaned の "value" と単位の確認）と一致することを確認する
+"""
+
+import argparse
+import json
+import pandas as pd
+from kklogger import set_logger
+from kkestate.test.helpers import check
+from kkestate.util.numeric_extract import extract_numeric_value, extract_numeric_frame
+from kkestate.test.testcases import TEST_CASES_PRICE, TEST_CASES_PRICE_MISC, TEST_CASES_AREA
+
+LOGGER = set_logger(__name__)
+
+def _legacy_value(value_cleaned: dict, unit: str):
+    """
+    従来の分析と同じ取り出し方（単位が一致する "value"、価格未定は -1）
+    """
+    if value_cleaned.get("is_undefined") == True:
+        return -1
+    value = value_cleaned.get("value")
+    if isinstance(value, (int, float)) and value_cleaned.get("unit") == unit:
+        return float(value)
+    return None
+
+def run_numeric_extract_tests():
+    """
+    数値の取り出しのテストを実行
+    """
+    total_tests = 0
+    failed_tests = 0
+
+    # 従来の分析との一致
+    for cleaned_name, unit, column, test_cases in [
+        ("価格",     "万円", "price_man", TEST_CASES_PRICE + TEST_CASES_PRICE_MISC),
+        ("専有面積", "m^2",  "area_sqm",  TEST_CASES_AREA),
+    ]:
+        for test_case in test_cases:
+            total_tests += 1
+            numeric  = extract_numeric_value(cleaned_name, test_case["expected"])
+            actual   = None if numeric is None else (-1 if numeric["is_undefined"] else numeric[column])
+            expected = _legacy_value(test_case["expected"], unit)
+            failed_tests += check(f"{cleaned_name}: {test_case['input']}", actual == expected, f"expected: {expected}, actual: {actual}")
+
+    # 単位の換算・JSON文字列・対象外の項目
+    for cleaned_name, value_cleaned, expected in [
+        ("価格",       {"value": 1.5, "unit": "億円"},              {"price_man": 15000.0, "area_sqm": None, "unit": "億円", "is_undefined": False}),
+        ("価格",       {"value": 29800000, "unit": "円"},           {"price_man": 2980.0,  "area_sqm": None, "unit": "円",   "is_undefined": False}),
+        ("土地面積",   '{"value": 121, "unit": "坪"}',              {"price_man": None, "area_sqm": 400.0, "unit": "坪",     "is_undefined": False}),
+        ("価格",       {"value": "応相談"},                         None),
+        ("価格",       {"type": "negotiable"},                      None),
+        ("その他面積", {"areas": [{"value": 3.0, "unit": "m^2"}]},  None),
+        ("建物面積",   "not json",                                  None),
+    ]:
+        total_tests += 1
+        actual = extract_numeric_value(cleaned_name, value_cleaned)
+        if actual is not None and expected is not None:
+            is_ok = all(abs(actual[x] - expected[x]) < 1e-9 if isinstance(expected[x], float) else actual[x] == expected[x] for x in expected)
+        else:
+            is_ok = actual == expected
+        failed_tests += check(f"{cleaned_name}: {value_cleaned}", is_ok, f"expected: {expected}, actual: {actual}")
+
+    # DataFrame 単位の変換（数値のない行・対象外の項目は含まない）
+    df = pd.DataFrame([
+        (1, 10, 1, "価格",       {"value": 2980.0, "unit": "万円"}),
+        (1, 11, 2, "専有面積",   json.dumps({"value": 65.5, "unit": "m^2"})),
+        (1, 12, 3, "その他面積", {"areas": []}),
+        (2, 10, 1, "価格",       {"value": None, "is_undefined": True}),
+        (2, 11, 2, "専有面積",   {"value": None}),
+    ], columns=["id_run", "id_key", "id_cleaned", "name", "value_cleaned"])
+    df_numeric = extract_numeric_frame(df)
+    total_tests += 3
+    failed_tests += check("frame rows", df_numeric[["id_run", "id_key"]].values.tolist() == [[1, 10], [1, 11], [2, 10]], f"{df_numeric}")
+    failed_tests += check("frame values", df_numeric["price_man"].fillna(-9).tolist() == [2980.0, -9, -9] and df_numeric["area_sqm"].fillna(-9).tolist() == [-9, 65.5, -9])
+    failed_tests += check("frame empty", extract_numeric_frame(df.iloc[:0]).shape == (0, 7))
+
+    # 結果サマリー
+    passed_tests = total_tests - failed_tests
+    LOGGER.info(f"Test Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed",
+                color=["BOLD", "GREEN"] if failed_tests == 0 else ["BOLD", "RED"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # 数値の取り出しのテストを実行
+    run_numeric_extract_tests()
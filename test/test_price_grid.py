@@ -0,0 +1,87 @@
+"""
+test_price_grid.py - 価格の格子集計（price_grid）のテスト
+np.bincount による集計が pandas の groupby と一致すること、レベル間の格子の対応、ファイルの保存・読込を確認する
+"""
+
+import argparse
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from kklogger import set_logger
+from kkestate.test.helpers import check
+from kkestate.util.price_grid import GRID_SIZES, GRID_COLUMNS, aggregate_grid, aggregate_grid_levels, grid_bounds, save_grid, load_grid
+
+LOGGER = set_logger(__name__)
+
+def run_price_grid_tests(size: int = 100000, seed: int = 0):
+    """
+    格子集計のテストを実行
+    """
+    rnd = np.random.default_rng(seed)
+    total_tests = 0
+    failed_tests = 0
+
+    df = pd.DataFrame({
+        "latitude":  35.6  + rnd.normal(0, 0.2, size),
+        "longitude": 139.7 + rnd.normal(0, 0.2, size),
+        "price":     rnd.lognormal(13, 0.5, size),
+    })
+    df.loc[::97,  "latitude"] = np.nan
+    df.loc[::101, "price"]    = -1
+
+    # pandas の groupby との一致
+    dfwk = df.loc[df["latitude"].notna() & (df["price"] > 0)]
+    for level in range(len(GRID_SIZES)):
+        df_grid = aggregate_grid(df["latitude"], df["longitude"], df["price"], level)
+        df_ref  = dfwk.groupby([np.floor(dfwk["latitude"] / GRID_SIZES[level]).astype(int).rename("iy"), np.floor(dfwk["longitude"] / GRID_SIZES[level]).astype(int).rename("ix")])["price"]
+        df_ref  = pd.DataFrame({"n": df_ref.size(), "mean": df_ref.mean(), "median": df_ref.median(), "std": df_ref.std(ddof=0)}).reset_index()
+        df_comp = pd.merge(df_ref, df_grid, how="outer", on=["iy", "ix"], suffixes=("_ref", ""))
+        total_tests += 2
+        failed_tests += check(f"level {level} cells", df_comp.shape[0] == df_ref.shape[0] == df_grid.shape[0] and (df_comp["n"] == df_comp["n_ref"]).all())
+        failed_tests += check(
+            f"level {level} values",
+            all(np.allclose(df_comp[x], df_comp[f"{x}_ref"].fillna(0.0), rtol=1e-9) for x in ["mean", "median", "std"]),
+        )
+
+    # 細かい格子の番号を2で割ると1つ粗いレベルの格子になる
+    df_grid = aggregate_grid_levels(df["latitude"], df["longitude"], df["price"])
+    for level in range(1, len(GRID_SIZES)):
+        df_fine   = df_grid.loc[df_grid["level"] == level]
+        df_coarse = df_grid.loc[df_grid["level"] == level - 1]
+        df_parent = df_fine.assign(iy=df_fine["iy"] // 2, ix=df_fine["ix"] // 2).groupby(["iy", "ix"])["n"].sum().reset_index()
+        df_parent = pd.merge(df_parent, df_coarse[["iy", "ix", "n"]], how="outer", on=["iy", "ix"])
+        total_tests += 1
+        failed_tests += check(f"level {level} nested", (df_parent["n_x"] == df_parent["n_y"]).all())
+
+    # 格子の範囲に元の点が含まれる
+    df_bounds = grid_bounds(df_grid.loc[df_grid["level"] == 3])
+    point     = dfwk.iloc[0]
+    df_hit    = df_bounds.loc[(df_bounds["lat_min"] <= point["latitude"]) & (point["latitude"] < df_bounds["lat_max"]) & (df_bounds["lng_min"] <= point["longitude"]) & (point["longitude"] < df_bounds["lng_max"])]
+    total_tests += 1
+    failed_tests += check("bounds", df_hit.shape[0] == 1)
+
+    # 空の入力・保存と読込
+    total_tests += 2
+    failed_tests += check("empty", aggregate_grid([np.nan], [139.0], [1.0], 0).shape == (0, len(GRID_COLUMNS)))
+    with tempfile.TemporaryDirectory() as dirname:
+        list_path = save_grid(df_grid, os.path.join(dirname, "grid_{level}.json"), code="13")
+        df_load   = pd.concat([load_grid(x) for x in list_path], ignore_index=True)
+    failed_tests += check(
+        "save/load", len(list_path) == len(GRID_SIZES) and (df_load[["level", "iy", "ix", "n"]].values == df_grid[["level", "iy", "ix", "n"]].values).all() and
+        np.allclose(df_load["median"], df_grid["median"], atol=0.05)
+    )
+
+    # 結果サマリー
+    passed_tests = total_tests - failed_tests
+    LOGGER.info(f"Test Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed",
+                color=["BOLD", "GREEN"] if failed_tests == 0 else ["BOLD", "RED"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=100000, help="集計する点の件数")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # 格子集計のテストを実行
+    run_price_grid_tests(size=args.size)
@@ -0,0 +1,91 @@
+"""
+test_profiler.py - スクリプト全体のプロファイリング（profiler）のテスト
+クレンジング関数を実行して cprofile / sampling の保存ファイルとモジュールごとのサマリーを確認する
+"""
+
+import argparse
+import os
+import pstats
+import tempfile
+from kklogger import set_logger
+from kkestate.test.helpers import check
+from kkestate.util.profiler import ScriptProfiler, get_module_group
+from kkestate.test.testcases import TEST_MAPPING
+
+LOGGER = set_logger(__name__)
+
+def _run_workload(number: int):
+    """
+    プロファイル対象の処理: testcases.py の入力値をクレンジング
+    """
+    for _ in range(number):
+        for test_mapping_item in TEST_MAPPING:
+            clean_function = test_mapping_item[2]
+            for test_case in test_mapping_item[1]:
+                try:
+                    if clean_function.__name__ in ['clean_units_to_json', 'clean_price_band_to_json', 'clean_management_fee_to_json']:
+                        clean_function(test_case["input"], raw_key=test_mapping_item[3] if len(test_mapping_item) == 4 else "総戸数")
+                    else:
+                        clean_function(test_case["input"])
+                except Exception:
+                    pass
+
+def run_profiler_tests(number: int = 20):
+    """
+    プロファイリングのテストを実行
+    """
+    total_tests = 0
+    failed_tests = 0
+
+    # モジュール名の判定
+    for filename, expected in [
+        (os.path.join(os.path.dirname(__file__), "..", "kkestate", "util", "json_cleaner.py"), ("json_cleaner", True)),
+        ("/usr/lib/python3.12/site-packages/pandas/core/frame.py", ("pandas", False)),
+        ("/usr/lib/python3.12/json/decoder.py", ("stdlib", False)),
+        ("~", ("<built-in>", False)),
+    ]:
+        total_tests += 1
+        failed_tests += check("module group", get_module_group(filename) == expected, f"{filename}: {get_module_group(filename)}")
+
+    with tempfile.TemporaryDirectory() as dirname:
+        # cprofile: pstats形式で保存され、自前のモジュールの関数がサマリーに含まれる
+        list_lines = []
+        filepath = os.path.join(dirname, "profile.prof")
+        profiler = ScriptProfiler(filepath, mode="cprofile", log_function=list_lines.append)
+        profiler.start()
+        _run_workload(number)
+        profiler.stop()
+        profiler.stop()
+        stats = pstats.Stats(filepath)
+        total_tests += 3
+        failed_tests += check("cprofile pstats", any(x[0].endswith("json_cleaner.py") for x in stats.stats.keys()))
+        failed_tests += check("cprofile summary", any("json_cleaner:" in x for x in list_lines), "\n".join(list_lines))
+        failed_tests += check("cprofile stop once", sum(x.startswith("[PROFILE] cprofile") for x in list_lines) == 1)
+
+        # sampling: collapsed stack 形式（"a;b;c count"）で保存される
+        list_lines = []
+        filepath = os.path.join(dirname, "profile.txt")
+        profiler = ScriptProfiler(filepath, mode="sampling", interval=0.001, log_function=list_lines.append)
+        profiler.start()
+        _run_workload(number)
+        profiler.stop()
+        with open(filepath, "r", encoding="utf-8") as f:
+            list_stack = [x.rstrip("\n").rsplit(" ", 1) for x in f]
+        total_tests += 3
+        failed_tests += check("sampling collapsed", len(list_stack) > 0 and all(x[1].isdigit() for x in list_stack))
+        failed_tests += check("sampling own module", any("json_cleaner:" in x[0] for x in list_stack))
+        failed_tests += check("sampling summary", any("json_cleaner:" in x for x in list_lines), "\n".join(list_lines))
+
+    # 結果サマリー
+    passed_tests = total_tests - failed_tests
+    LOGGER.info(f"Test Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed",
+                color=["BOLD", "GREEN"] if failed_tests == 0 else ["BOLD", "RED"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=20, help="プロファイル対象の処理の繰り返し回数")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # プロファイリングのテストを実行
+    run_profiler_tests(number=args.number)
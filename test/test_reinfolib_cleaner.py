@@ -0,0 +1,154 @@
+"""
+test_reinfolib_cleaner.py - 地価公示・地価調査 CSV のクレンジング（reinfolib_cleaner）のテスト
+列単位の関数の結果が1値ずつの関数を apply した結果と一致することを、境界となる値とランダムな CSV 全体で確認する
+"""
+
+import argparse
+import datetime
+import random
+import time
+import pandas as pd
+from kklogger import set_logger
+from kkestate.test.helpers import check
+from kkestate.util.reinfolib_cleaner import (
+    clean_price, clean_distance, clean_area, clean_width, clean_ratio, clean_reference_number, parse_survey_date,
+    clean_price_series, clean_distance_series, clean_area_series, clean_width_series, clean_ratio_series,
+    clean_reference_number_series, parse_survey_date_series, clean_land_frame
+)
+
+LOGGER = set_logger(__name__)
+
+# (1値ずつの関数, 列単位の関数, 境界となる値)
+TEST_FUNCTIONS = [
+    (clean_price, clean_price_series, [
+        "241,000(円/㎡)", "1,234,567(円/㎡)", "52,000(円/10a)", "241000", "０１２(円/㎡)", "-5(円/㎡)", " 12 ", "1.5(円/㎡)", "(円/㎡)", "", "-", None, float("nan"), 241000, 60.0,
+    ]),
+    (clean_distance, clean_distance_series, [
+        "1,300m", "850ｍ", "0m", "近接", "接面", "駅前広場接面", "近接（接面）", "１００m", "m", "", None, 1300,
+    ]),
+    (clean_area, clean_area_series, ["101(㎡)", "1,234(㎡)", "101.5(㎡)", "(㎡)", "１０１(㎡)", "", None]),
+    (clean_width, clean_width_series, ["4.0m", "12ｍ", "1,200.5m", ".5m", "4.m", "４.０m", "m", "", None, 6]),
+    (clean_ratio, clean_ratio_series, ["60(%)", "200(%)", "1,000(%)", "60", "(%)", "６０(%)", "", None, 80.0]),
+    (clean_reference_number, clean_reference_number_series, [
+        "春日-1春日-1", "春日-1", " 港-5港-5 ", "aa", "aaa", "abab", "", " ", "中央5-1中央5-1中央5-1中央5-1", None, 12,
+    ]),
+    (parse_survey_date, parse_survey_date_series, [
+        "令和6年7月1日", "平成30年1月1日", "昭和50年1月1日", "令和６年７月１日", "令和元年7月1日", "平成2年1月1日（平成）",
+        "平成30年1月1日 令和", "基準日 令和6年7月1日", "R6.7.1", "", None,
+    ]),
+]
+
+# CSV 全体のテストの列（日本語のカラム名 -> 値の候補）
+LAND_CSV_VALUES = {
+    "標準地番号":        ["春日-1春日-1", "港-5港-5", "中央5-1", "千代田5-2千代田5-2", None],
+    "調査基準日":        ["令和6年1月1日", "令和6年7月1日", "平成30年1月1日", "昭和60年1月1日", None],
+    "所在及び地番":      ["東京都港区六本木1-2-3", "千葉県我孫子市柴崎台3-16-23"],
+    "住居表示":          ["六本木1-2-3", None],
+    "価格(円/㎡)":       ["241,000(円/㎡)", "5,210,000(円/㎡)", "52,000(円/10a)", None],
+    "名称":              ["六本木", "我孫子"],
+    "距離":              ["1,300m", "850m", "近接", "接面", "駅前広場接面", None],
+    "地積(㎡)":          ["101(㎡)", "1,234(㎡)", "(㎡)", None],
+    "形状":              ["台形", "長方形"],
+    "利用区分":          ["建物などの敷地"],
+    "構造":              ["W", "RC"],
+    "階層":              ["2F", "5F1B"],
+    "利用現況":          ["住宅"],
+    "給排水":            ["水道、ガス、下水"],
+    "周辺の土地の利用現況": ["中規模一般住宅が多い住宅地域"],
+    "方位":              ["南", "北東"],
+    "幅員":              ["4.0m", "12.5m", "6m", None],
+    "種類":              ["市道"],
+    "舗装":              ["舗装"],
+    "方位.1":            ["西", None],
+    "区分.1":            ["側道", None],
+    "用途地域":          ["第一種低層住居専用地域"],
+    "高度地区":          [None],
+    "防火・準防火":      ["準防火"],
+    "建蔽率":            ["60(%)", "80(%)", None],
+    "容積率":            ["200(%)", "1,000(%)", None],
+    "都市計画区域区分":  ["市街化区域"],
+    "森林法、公園法、自然環境等": [None],
+    "鑑定評価書":        ["あり"],
+    "区分":              ["地価公示", "地価調査"],
+    "鑑定評価書URL":     ["https://example.com/a.pdf", None],
+}
+
+def _to_values(series: pd.Series) -> list:
+    """
+    比較用: 欠損を None にしたリスト（数値は float で比較する）
+    """
+    return [None if (x is None or (not isinstance(x, (str, datetime.date)) and pd.isna(x))) else (float(x) if isinstance(x, (int, float)) else x) for x in series.tolist()]
+
+def make_land_csv(size: int, seed: int = 0) -> pd.DataFrame:
+    """
+    地価公示・地価調査 CSV（skiprows=1 で読み込んだ後）と同じカラムのランダムな DataFrame
+    """
+    rnd = random.Random(seed)
+    return pd.DataFrame({x: [rnd.choice(y) for _ in range(size)] for x, y in LAND_CSV_VALUES.items()})
+
+def run_reinfolib_cleaner_tests(size: int = 100000):
+    """
+    地価公示・地価調査 CSV のクレンジングのテストを実行
+    """
+    total_tests = 0
+    failed_tests = 0
+
+    # 境界となる値（index は0始まりではない）
+    for clean_function, series_function, values in TEST_FUNCTIONS:
+        series   = pd.Series(values, index=range(10, 10 + len(values)), dtype=object)
+        expected = series.apply(clean_function)
+        actual   = series_function(series)
+        total_tests += 1
+        failed_tests += check(
+            f"{clean_function.__name__}", actual.index.equals(series.index) and _to_values(actual) == _to_values(expected),
+            f"\n    expected: {_to_values(expected)}\n    actual:   {_to_values(actual)}"
+        )
+
+    # すべて欠損・空の列
+    for clean_function, series_function, _ in TEST_FUNCTIONS:
+        for values in [[None, None], [float("nan")], []]:
+            series = pd.Series(values, dtype=object)
+            total_tests += 1
+            failed_tests += check(f"{clean_function.__name__} missing {values}", _to_values(series_function(series)) == _to_values(series.apply(clean_function)))
+
+    # 存在しない日付は1値ずつの関数と同じく ValueError
+    total_tests += 1
+    try:
+        parse_survey_date_series(pd.Series(["令和6年2月30日"]))
+        failed_tests += check("invalid date", False, "ValueError is not raised")
+    except ValueError:
+        pass
+
+    # 欠損がない整数の列は int64、欠損を含む場合は float64（apply と同じ）
+    total_tests += 2
+    failed_tests += check("dtype int", str(clean_price_series(pd.Series(["1(円/㎡)", "2(円/㎡)"])).dtype) == "int64")
+    failed_tests += check("dtype float", str(clean_price_series(pd.Series(["1(円/㎡)", None])).dtype) == "float64")
+
+    # CSV 全体
+    df = make_land_csv(size)
+    time_start = time.perf_counter()
+    df_legacy  = clean_land_frame(df, 2024, "13", is_vectorized=False)
+    time_legacy = time.perf_counter() - time_start
+    time_start = time.perf_counter()
+    df_vector  = clean_land_frame(df, 2024, "13")
+    time_vector = time.perf_counter() - time_start
+    LOGGER.info(f"clean_land_frame: {size} rows, apply: {time_legacy:.3f}s, vectorized: {time_vector:.3f}s ({time_legacy / max(time_vector, 1e-9):.1f}x)")
+    total_tests += 1
+    failed_tests += check("frame columns", df_legacy.columns.tolist() == df_vector.columns.tolist())
+    for column in df_legacy.columns:
+        total_tests += 1
+        failed_tests += check(f"frame {column}", _to_values(df_legacy[column]) == _to_values(df_vector[column]))
+
+    # 結果サマリー
+    passed_tests = total_tests - failed_tests
+    LOGGER.info(f"Test Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed",
+                color=["BOLD", "GREEN"] if failed_tests == 0 else ["BOLD", "RED"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=100000, help="CSV 全体のテストの行数")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # 地価公示・地価調査 CSV のクレンジングのテストを実行
+    run_reinfolib_cleaner_tests(size=args.size)
@@ -7,6 +7,7 @@ from kklogger import set_logger
 from kkestate.test.testcases import TEST_MAPPING, EXPECTED_KEY_PROCESSING
 from kkestate.util.key_mapper import get_processing_info_for_key
 from kkestate.master.json_schemas import SCHEMAS
+from kkestate.util.schema_validator import validate_cleaned_value, find_undefined_fields
 
 LOGGER = set_logger(__name__)
 
@@ -31,35 +32,14 @@ def validate_json_output_schema(output_json: dict, cleaned_name: str) -> tuple[b
     Returns:
         tuple[bool, str]: (検証結果, エラーメッセージ)
     """
-    if cleaned_name is None or cleaned_name not in SCHEMAS:
-        return True, ""  # スキーマが定義されていない場合は検証しない
-    
-    schema = SCHEMAS[cleaned_name]
-    expected_fields = set(schema.get("required_fields", []) + schema.get("optional_fields", []))
-    actual_fields = set(output_json.keys())
-    
     # 実際の出力にあるがスキーマに定義されていないフィールドをチェック
-    undefined_fields = actual_fields - expected_fields
+    undefined_fields = find_undefined_fields(output_json, cleaned_name)
     if undefined_fields:
-        LOGGER.warning(f"WARNING: {cleaned_name} - スキーマに未定義のフィールド: {sorted(undefined_fields)}")
+        LOGGER.warning(f"WARNING: {cleaned_name} - スキーマに未定義のフィールド: {undefined_fields}")
         LOGGER.warning(f"  実際の出力: {output_json}")
     
-    # 必須フィールドの確認
-    for field in schema["required_fields"]:
-        if field not in output_json:
-            return False, f"必須フィールド '{field}' が見つかりません"
-    
-    # フィールドの型確認
-    for field, value in output_json.items():
-        if field in schema["field_types"]:
-            expected_types = schema["field_types"][field]
-            if not isinstance(expected_types, list):
-                expected_types = [expected_types]
-            
-            if not any(isinstance(value, t) for t in expected_types):
-                return False, f"フィールド '{field}' の型が不正です。期待: {expected_types}, 実際: {type(value)}"
-    
-    return True, ""
+    # 必須フィールド・フィールドの型の確認（スキーマが定義されていない場合は検証しない）
+    return validate_cleaned_value(output_json, cleaned_name)
 
 def test_type_schema_consistency():
     """
@@ -0,0 +1,83 @@
+"""
+test_spatial_index.py - 空間インデックス（spatial_index）のテスト
+格子バケットによる k近傍・半径の検索結果が、全ての点との距離を計算した結果（総当たり）と一致することを確認する
+"""
+
+import argparse
+import time
+import numpy as np
+from kklogger import set_logger
+from kkestate.test.helpers import check
+from kkestate.util.spatial_index import GridIndex, haversine, summarize_neighbors
+
+LOGGER = set_logger(__name__)
+
+def run_spatial_index_tests(n_points: int = 5000, n_query: int = 1000, seed: int = 0):
+    """
+    空間インデックスのテストを実行
+    """
+    rnd = np.random.default_rng(seed)
+    total_tests = 0
+    failed_tests = 0
+
+    # 密集した点と疎な点、インデックスの範囲外の検索点（北海道・沖縄）を含む
+    lat = np.concatenate([35.6 + rnd.normal(0, 0.05, n_points // 2), 35.6 + rnd.uniform(-1, 1, n_points - n_points // 2)])
+    lng = np.concatenate([139.7 + rnd.normal(0, 0.05, n_points // 2), 139.7 + rnd.uniform(-1, 1, n_points - n_points // 2)])
+    lat[::53] = np.nan
+    val = rnd.lognormal(13, 0.5, n_points)
+    lat_q = np.concatenate([35.6 + rnd.normal(0, 0.3, n_query - 3), [43.06, 26.21, np.nan]])
+    lng_q = np.concatenate([139.7 + rnd.normal(0, 0.3, n_query - 3), [141.35, 127.68, 139.7]])
+    dist_all = haversine(lat_q[:, None], lng_q[:, None], lat[None, :], lng[None, :])
+    dist_all[np.isnan(dist_all)] = np.inf
+
+    for cell_size in [200.0, 1000.0, 5000.0]:
+        index = GridIndex(lat, lng, cell_size=cell_size, chunk_cells=20000)
+        # k近傍（総当たりの距離の小さい順と一致）
+        for k, max_radius in [(1, None), (5, None), (5, 2000.0)]:
+            time_start = time.perf_counter()
+            ids, dist  = index.query_knn(lat_q, lng_q, k=k, max_radius=max_radius)
+            elapsed    = time.perf_counter() - time_start
+            dist_ref   = np.sort(dist_all, axis=1)[:, :k]
+            if max_radius is not None:
+                dist_ref[dist_ref > max_radius] = np.inf
+            is_ok_ids  = np.allclose(np.where(ids >= 0, dist_all[np.arange(len(lat_q))[:, None], np.maximum(ids, 0)], np.inf), dist, equal_nan=True)
+            total_tests += 1
+            failed_tests += check(f"knn cell={cell_size} k={k} max_radius={max_radius}", np.allclose(dist, dist_ref) and is_ok_ids)
+            LOGGER.info(f"knn cell={cell_size} k={k} max_radius={max_radius}: {elapsed * 1e3:.1f} ms")
+        # 半径（総当たりで半径以内の点の集合と一致）
+        qid, ids, dist = index.query_radius(lat_q, lng_q, radius=1500.0)
+        qid_ref, ids_ref = np.where(dist_all <= 1500.0)
+        total_tests += 1
+        failed_tests += check(f"radius cell={cell_size}", set(zip(qid.tolist(), ids.tolist())) == set(zip(qid_ref.tolist(), ids_ref.tolist())) and np.all(np.diff(qid) >= 0))
+
+    # 近傍の値の集計
+    index = GridIndex(lat, lng, cell_size=500.0)
+    df    = summarize_neighbors(index, val, lat_q, lng_q, k=5, radius=1500.0)
+    order = np.argsort(dist_all, axis=1)[:, :5]
+    knn_median_ref = np.median(val[order], axis=1)
+    radius_n_ref   = (dist_all <= 1500.0).sum(axis=1)
+    total_tests += 3
+    failed_tests += check("summary shape", df.shape[0] == len(lat_q) and np.isnan(df["nearest_dist"].iloc[-1]) and df["knn_n"].iloc[-1] == 0)
+    failed_tests += check("summary knn_median", np.allclose(df["knn_median"].iloc[:-1], knn_median_ref[:-1]))
+    failed_tests += check("summary radius_n", (df["radius_n"].to_numpy() == radius_n_ref).all())
+
+    # 点のないインデックス
+    index = GridIndex([np.nan], [np.nan])
+    ids, dist = index.query_knn(lat_q, lng_q, k=2)
+    total_tests += 1
+    failed_tests += check("empty index", (ids == -1).all() and np.isinf(dist).all() and index.query_radius(lat_q, lng_q, 1000.0)[0].shape[0] == 0)
+
+    # 結果サマリー
+    passed_tests = total_tests - failed_tests
+    LOGGER.info(f"Test Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed",
+                color=["BOLD", "GREEN"] if failed_tests == 0 else ["BOLD", "RED"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", type=int, default=5000, help="インデックスの点の件数")
+    parser.add_argument("--query",  type=int, default=1000, help="検索点の件数")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # 空間インデックスのテストを実行
+    run_spatial_index_tests(n_points=args.points, n_query=args.query)
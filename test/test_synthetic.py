@@ -0,0 +1,80 @@
+"""
+test_synthetic.py - 負荷試験用の合成データ生成（synthetic）のテスト
+生成したデータが suumo.py の保存形式（id の連番、成功した run のみ estate_detail を持つ、直前と同じ値は保存しない）に従うことを確認する
+"""
+
+import argparse
+import pandas as pd
+from kklogger import set_logger
+from kkestate.test.helpers import check
+from kkestate.util.synthetic import generate_synthetic_chunks, make_synthetic_mst_key, get_synthetic_key_names
+from kkestate.util.key_mapper import map_key_to_processing_info
+
+LOGGER = set_logger(__name__)
+
+def run_synthetic_tests(n_estates: int = 5000, chunk_size: int = 1000, seed: int = 0):
+    """
+    合成データ生成のテストを実行
+    """
+    total_tests = 0
+    failed_tests = 0
+
+    # estate_mst_key: 登録済みのキーは除き、続きの id を割り当てる
+    df_key = pd.DataFrame({"id": [1, 5], "name": ["価格", "未使用のキー"]})
+    df_new = make_synthetic_mst_key(df_key)
+    total_tests += 2
+    failed_tests += check("mst_key registered", "価格" not in df_new["name"].tolist())
+    failed_tests += check("mst_key id", df_new["id"].tolist() == list(range(6, 6 + df_new.shape[0])))
+    for key_name in get_synthetic_key_names():
+        total_tests += 1
+        failed_tests += check("key mapping", map_key_to_processing_info(key_name)[1] is not None, key_name)
+
+    # 同じシードで同じデータになる
+    list_chunk = list(generate_synthetic_chunks(n_estates, chunk_size=chunk_size, seed=seed, id_main_from=101, id_run_from=1001))
+    list_chunk_again = list(generate_synthetic_chunks(n_estates, chunk_size=chunk_size, seed=seed, id_main_from=101, id_run_from=1001))
+    df_main   = pd.concat([x["estate_main"]   for x in list_chunk], ignore_index=True)
+    df_run    = pd.concat([x["estate_run"]    for x in list_chunk], ignore_index=True)
+    df_detail = pd.concat([x["estate_detail"] for x in list_chunk], ignore_index=True)
+    total_tests += 1
+    failed_tests += check("reproducible", df_detail.equals(pd.concat([x["estate_detail"] for x in list_chunk_again], ignore_index=True)))
+
+    # id は指定した値からの連番、url は一意
+    total_tests += 3
+    failed_tests += check("estate_main id", df_main["id"].tolist() == list(range(101, 101 + n_estates)))
+    failed_tests += check("estate_run id", df_run["id"].tolist() == list(range(1001, 1001 + df_run.shape[0])))
+    failed_tests += check("estate_main url", df_main["url"].is_unique)
+
+    # estate_detail は成功した run のみ、(id_run, id_key) は一意
+    total_tests += 2
+    failed_tests += check("detail run", df_detail["id_run"].isin(df_run.loc[df_run["is_success"], "id"]).all())
+    failed_tests += check("detail primary key", not df_detail.duplicated(["id_run", "id_key"]).any())
+
+    # 物件・キーごとに直前の run と同じ値は保存しない
+    df = pd.merge(df_detail, df_run[["id", "id_main"]].rename(columns={"id": "id_run"}), how="left", on="id_run")
+    df = df.sort_values(["id_main", "id_key", "id_run"])
+    n_same = (df.groupby(["id_main", "id_key"])["value"].shift() == df["value"]).sum()
+    total_tests += 1
+    failed_tests += check("detail delta", n_same == 0, f"{n_same} rows")
+
+    # 初回の成功した run は全てのキーを持ち、以降は変化した値のみ（初回より少ない）
+    df_count = df_detail.groupby("id_run").size()
+    df_first = df_run.loc[df_run["is_success"]].groupby("id_main")["id"].first()
+    total_tests += 1
+    failed_tests += check("detail first run", df_count.reindex(df_first.values).mean() > df_count.drop(df_first.values, errors="ignore").mean())
+
+    LOGGER.info(f"estate_main: {df_main.shape[0]}, estate_run: {df_run.shape[0]}, estate_detail: {df_detail.shape[0]}")
+
+    # 結果サマリー
+    passed_tests = total_tests - failed_tests
+    LOGGER.info(f"Test Summary: {passed_tests}/{total_tests} passed, {failed_tests} failed",
+                color=["BOLD", "GREEN"] if failed_tests == 0 else ["BOLD", "RED"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--estates",   type=int, default=5000, help="物件数")
+    parser.add_argument("--chunksize", type=int, default=1000, help="1チャンクあたりの物件数")
+    args = parser.parse_args()
+    LOGGER.info(f"{args}")
+
+    # 合成データ生成のテストを実行
+    run_synthetic_tests(n_estates=args.estates, chunk_size=args.chunksize)